@@ -0,0 +1,93 @@
+"""
+@Author = 'Michael Stanley'
+
+Compares finding carts in the list from LoadCartDataDump.load_carts by a linear scan against finding them with a 
+CartIndex, for lookups by cart and cut number, and queries by artist and group.
+
+Usage: python benchmarks/compare_cart_index.py [NUMBER_OF_CARTS] [NUMBER_OF_LOOKUPS]
+
+============ Change Log ============
+2026-Oct-18 = Created.
+
+============ License ============
+Copyright (C) 2026 Michael Stanley
+
+This file is part of wmul_rivendell.
+
+wmul_rivendell is free software: you can redistribute it and/or modify it
+under the terms of the GNU General Public License as published by the Free
+Software Foundation, either version 3 of the License, or (at your option) any
+later version.
+
+wmul_rivendell is distributed in the hope that it will be useful, but WITHOUT
+ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License along with
+wmul_rivendell. If not, see <https://www.gnu.org/licenses/>.
+"""
+import random
+import sys
+import tempfile
+import time
+
+from pathlib import Path
+from generate_cart_data_dump import generate_cart_data_dump
+from wmul_rivendell.CartIndex import CartIndex
+from wmul_rivendell.LoadCartDataDump import LoadCartDataDump
+
+
+def timed(function, *arguments):
+    start = time.perf_counter()
+    result = function(*arguments)
+    return time.perf_counter() - start, result
+
+
+def scan_for_cuts(rivendell_carts, cut_keys):
+    return [
+        next((cart for cart in rivendell_carts if cart.cart_number == cart_number and cart.cut_number == cut_number), 
+             None)
+        for cart_number, cut_number in cut_keys
+    ]
+
+
+def scan_for_artists(rivendell_carts, queries):
+    return [
+        [cart for cart in rivendell_carts if cart.artist == artist and cart.group_name == group_name]
+        for artist, group_name in queries
+    ]
+
+
+if __name__ == "__main__":
+    number_of_carts = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    number_of_lookups = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+    with tempfile.TemporaryDirectory() as temp_dir:
+        rivendell_cart_data_filename = Path(temp_dir) / "cart_data_dump.csv"
+        generate_cart_data_dump(rivendell_cart_data_filename, number_of_carts)
+        rivendell_carts = LoadCartDataDump(
+            rivendell_cart_data_filename=rivendell_cart_data_filename,
+            excluded_group_list=[],
+            include_macros=True,
+            include_all_cuts=True,
+            trusted_dump=True
+        ).load_carts()
+
+    randomizer = random.Random(0)
+    sample = randomizer.sample(rivendell_carts, number_of_lookups)
+    cut_keys = [(cart.cart_number, cart.cut_number) for cart in sample]
+    queries = [(cart.artist, cart.group_name) for cart in sample]
+
+    build_time, cart_index = timed(CartIndex.from_carts, rivendell_carts)
+    scan_cut_time, scanned_cuts = timed(scan_for_cuts, rivendell_carts, cut_keys)
+    index_cut_time, indexed_cuts = timed(lambda: [cart_index.get(*cut_key) for cut_key in cut_keys])
+    scan_artist_time, scanned_artists = timed(scan_for_artists, rivendell_carts, queries)
+    index_artist_time, indexed_artists = timed(
+        lambda: [cart_index.find(artist=artist, group_name=group_name) for artist, group_name in queries]
+    )
+
+    print(f"{len(rivendell_carts):,} cuts, {number_of_lookups} lookups of each kind")
+    print(f"build CartIndex                {build_time:8.3f}s")
+    print(f"cart and cut, linear scan      {scan_cut_time:8.3f}s")
+    print(f"cart and cut, CartIndex.get    {index_cut_time:8.5f}s  same result={indexed_cuts == scanned_cuts}")
+    print(f"artist and group, linear scan  {scan_artist_time:8.3f}s")
+    print(f"artist and group, find         {index_artist_time:8.5f}s  same result={indexed_artists == scanned_artists}")
@@ -0,0 +1,69 @@
+"""
+@Author = 'Michael Stanley'
+
+Compares loading the synthetic dumps of several stations one after another, with max_workers=1, against loading them
+in a process pool, with one worker per station. Each station has the same carts, so every cart of the later stations is
+removed as a duplicate.
+
+Usage: python benchmarks/compare_cart_sources.py [NUMBER_OF_STATIONS] [NUMBER_OF_CARTS]
+
+============ Change Log ============
+2026-Oct-18 = Created.
+
+============ License ============
+Copyright (C) 2026 Michael Stanley
+
+This file is part of wmul_rivendell.
+
+wmul_rivendell is free software: you can redistribute it and/or modify it
+under the terms of the GNU General Public License as published by the Free
+Software Foundation, either version 3 of the License, or (at your option) any
+later version.
+
+wmul_rivendell is distributed in the hope that it will be useful, but WITHOUT
+ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License along with
+wmul_rivendell. If not, see <https://www.gnu.org/licenses/>.
+"""
+import os
+import sys
+import tempfile
+import time
+
+from pathlib import Path
+from generate_cart_data_dump import generate_cart_data_dump
+from wmul_rivendell.LoadCartDataDump import LoadCartDataDump
+from wmul_rivendell.LoadCartSources import LoadCartSources
+
+
+def measure(cart_loaders, max_workers):
+    cart_sources = LoadCartSources(cart_loaders=cart_loaders, max_workers=max_workers)
+    start = time.perf_counter()
+    cart_table = cart_sources.load_cart_table()
+    return time.perf_counter() - start, len(cart_table.data)
+
+
+if __name__ == "__main__":
+    number_of_stations = int(sys.argv[1]) if len(sys.argv) > 1 else 4
+    number_of_carts = int(sys.argv[2]) if len(sys.argv) > 2 else 50_000
+    with tempfile.TemporaryDirectory() as temp_dir:
+        rivendell_cart_data_filename = Path(temp_dir) / "cart_data_dump.csv"
+        generate_cart_data_dump(rivendell_cart_data_filename, number_of_carts)
+        print(f"{number_of_stations} stations of {number_of_carts:,} carts, {os.cpu_count()} CPUs")
+        for trusted_dump in (False, True):
+            cart_loaders = {
+                f"station{station_number}": LoadCartDataDump(
+                    rivendell_cart_data_filename=rivendell_cart_data_filename,
+                    excluded_group_list=[],
+                    include_macros=True,
+                    include_all_cuts=True,
+                    trusted_dump=trusted_dump
+                )
+                for station_number in range(number_of_stations)
+            }
+            for max_workers in (1, number_of_stations):
+                elapsed, number_of_carts_kept = measure(cart_loaders, max_workers)
+                print(f"{'trusted' if trusted_dump else 'validated':9}  max_workers={max_workers}  "
+                      f"time={elapsed:.2f}s  carts kept={number_of_carts_kept:,}")
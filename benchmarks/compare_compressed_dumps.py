@@ -0,0 +1,74 @@
+"""
+@Author = 'Michael Stanley'
+
+Compares the size of a synthetic dump, and the time LoadCartDataDump.load_carts takes to load it, uncompressed and
+compressed with gzip, bzip2, and xz.
+
+Usage: python benchmarks/compare_compressed_dumps.py [NUMBER_OF_CARTS]
+
+============ Change Log ============
+2026-Oct-18 = Created.
+
+============ License ============
+Copyright (C) 2026 Michael Stanley
+
+This file is part of wmul_rivendell.
+
+wmul_rivendell is free software: you can redistribute it and/or modify it
+under the terms of the GNU General Public License as published by the Free
+Software Foundation, either version 3 of the License, or (at your option) any
+later version.
+
+wmul_rivendell is distributed in the hope that it will be useful, but WITHOUT
+ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License along with
+wmul_rivendell. If not, see <https://www.gnu.org/licenses/>.
+"""
+import bz2
+import gzip
+import lzma
+import sys
+import tempfile
+import time
+
+from pathlib import Path
+from generate_cart_data_dump import generate_cart_data_dump
+from wmul_rivendell.LoadCartDataDump import LoadCartDataDump
+
+COMPRESSORS = {"": None, ".gz": gzip.compress, ".bz2": bz2.compress, ".xz": lzma.compress}
+
+
+def measure(rivendell_cart_data_filename, trusted_dump):
+    lcdd = LoadCartDataDump(
+        rivendell_cart_data_filename=rivendell_cart_data_filename,
+        excluded_group_list=[],
+        include_macros=True,
+        include_all_cuts=True,
+        trusted_dump=trusted_dump
+    )
+    start = time.perf_counter()
+    rivendell_carts = lcdd.load_carts()
+    return time.perf_counter() - start, rivendell_carts
+
+
+if __name__ == "__main__":
+    number_of_carts = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    with tempfile.TemporaryDirectory() as temp_dir:
+        plain_filename = Path(temp_dir) / "cart_data_dump.csv"
+        generate_cart_data_dump(plain_filename, number_of_carts)
+        dump_contents = plain_filename.read_bytes()
+        print(f"Dump: {number_of_carts:,} carts")
+        for trusted_dump in (False, True):
+            _, expected_carts = measure(plain_filename, trusted_dump)
+            for suffix, compress in COMPRESSORS.items():
+                rivendell_cart_data_filename = plain_filename.with_name(plain_filename.name + suffix)
+                if compress is not None:
+                    rivendell_cart_data_filename.write_bytes(compress(dump_contents))
+                elapsed, rivendell_carts = measure(rivendell_cart_data_filename, trusted_dump)
+                print(f"{'trusted' if trusted_dump else 'validated':9}  {suffix or '.csv':4}  "
+                      f"size={rivendell_cart_data_filename.stat().st_size / 2**20:5.1f} MiB  time={elapsed:.2f}s  "
+                      f"same result={rivendell_carts == expected_carts}")
+                del rivendell_carts
+            del expected_carts
@@ -0,0 +1,71 @@
+"""
+@Author = 'Michael Stanley'
+
+Compares the time of LoadCartDataDump.load_carts and load_cart_table without a DumpCache, with an empty one (cold), 
+and with one that already holds the dump (warm), on a synthetic dump.
+
+Usage: python benchmarks/compare_dump_cache.py [NUMBER_OF_CARTS]
+
+============ Change Log ============
+2026-Oct-18 = Created.
+
+============ License ============
+Copyright (C) 2026 Michael Stanley
+
+This file is part of wmul_rivendell.
+
+wmul_rivendell is free software: you can redistribute it and/or modify it 
+under the terms of the GNU General Public License as published by the Free 
+Software Foundation, either version 3 of the License, or (at your option) any 
+later version.
+
+wmul_rivendell is distributed in the hope that it will be useful, but WITHOUT 
+ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS 
+FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License along with 
+wmul_rivendell. If not, see <https://www.gnu.org/licenses/>. 
+"""
+import shutil
+import sys
+import tempfile
+import time
+
+from pathlib import Path
+from generate_cart_data_dump import generate_cart_data_dump
+from wmul_rivendell.DumpCache import DumpCache
+from wmul_rivendell.LoadCartDataDump import LoadCartDataDump
+
+
+def measure(rivendell_cart_data_filename, trusted_dump, load_method_name, dump_cache):
+    lcdd = LoadCartDataDump(
+        rivendell_cart_data_filename=rivendell_cart_data_filename,
+        excluded_group_list=[],
+        include_macros=False,
+        include_all_cuts=False,
+        trusted_dump=trusted_dump,
+        dump_cache=dump_cache
+    )
+    start = time.perf_counter()
+    getattr(lcdd, load_method_name)()
+    return time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    number_of_carts = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    with tempfile.TemporaryDirectory() as temp_dir:
+        rivendell_cart_data_filename = Path(temp_dir) / "cart_data_dump.csv"
+        cache_directory = Path(temp_dir) / "cache"
+        generate_cart_data_dump(rivendell_cart_data_filename, number_of_carts)
+        print(f"Dump: {number_of_carts:,} carts, {rivendell_cart_data_filename.stat().st_size / 2**20:.1f} MiB")
+        for load_method_name, trusted_dump in (("load_carts", False), ("load_carts", True), ("load_cart_table", True)):
+            shutil.rmtree(cache_directory, ignore_errors=True)
+            dump_cache = DumpCache(cache_directory=cache_directory)
+            uncached = measure(rivendell_cart_data_filename, trusted_dump, load_method_name, None)
+            cold = measure(rivendell_cart_data_filename, trusted_dump, load_method_name, dump_cache)
+            warm = measure(rivendell_cart_data_filename, trusted_dump, load_method_name, dump_cache)
+            cache_size = sum(cache_file.stat().st_size for cache_file in cache_directory.iterdir())
+            print(
+                f"{load_method_name:15}  trusted_dump={trusted_dump!s:5}  uncached={uncached:.2f}s  "
+                f"cold={cold:.2f}s  warm={warm:.2f}s  cache size={cache_size / 2**20:.1f} MiB"
+            )
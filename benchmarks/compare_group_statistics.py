@@ -0,0 +1,93 @@
+"""
+@Author = 'Michael Stanley'
+
+Compares calculating the statistics of each group on its own, with RivendellGroupStatistics, against calculating the
+statistics of every group at once, with calculate_all_group_statistics, and with DatabaseStatistics spreading the
+groups over several processes, and checks that the results are the same. The groups are of very different sizes, as
+in a library where a few groups hold most of the songs.
+
+Usage: python benchmarks/compare_group_statistics.py [NUMBER_OF_CUTS] [NUMBER_OF_GROUPS]
+
+============ Change Log ============
+2026-Oct-18 = Created.
+
+============ License ============
+Copyright (C) 2026 Michael Stanley
+
+This file is part of wmul_rivendell.
+
+wmul_rivendell is free software: you can redistribute it and/or modify it
+under the terms of the GNU General Public License as published by the Free
+Software Foundation, either version 3 of the License, or (at your option) any
+later version.
+
+wmul_rivendell is distributed in the hope that it will be useful, but WITHOUT
+ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License along with
+wmul_rivendell. If not, see <https://www.gnu.org/licenses/>.
+"""
+import sys
+import time
+
+import numpy as np
+from wmul_rivendell.DatabaseStatistics import (
+    DatabaseStatistics, RivendellGroupStatistics, StatisticsLimits, calculate_all_group_statistics
+)
+
+
+def generate_lengths(number_of_cuts, number_of_groups, seed=0):
+    randomizer = np.random.default_rng(seed)
+    group_weights = randomizer.pareto(1.0, number_of_groups) + 1
+    group_codes = randomizer.choice(number_of_groups, number_of_cuts, p=group_weights / group_weights.sum())
+    typical_lengths = randomizer.uniform(30, 400, number_of_groups)[group_codes]
+    lengths = np.maximum(0, randomizer.normal(typical_lengths, typical_lengths / 4)).astype(np.int64)
+    return group_codes, lengths
+
+
+def per_group(organized_lengths, stats_limits):
+    return {
+        group_name: RivendellGroupStatistics(group_name=group_name, songs_in_group=lengths, stats_limits=stats_limits)
+        for group_name, lengths in organized_lengths.items()
+    }
+
+
+def main():
+    number_of_cuts = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    number_of_groups = int(sys.argv[2]) if len(sys.argv) > 2 else 300
+    group_codes, lengths = generate_lengths(number_of_cuts, number_of_groups)
+    group_names = [f"GROUP{group_code:04}" for group_code in range(number_of_groups)]
+    organized_lengths = {
+        group_names[group_code]: lengths[group_codes == group_code] for group_code in range(number_of_groups)
+    }
+    stats_limits = StatisticsLimits()
+    print(f"{number_of_cuts:,} cuts in {number_of_groups} groups, the largest has "
+          f"{max(lengths.size for lengths in organized_lengths.values()):,}")
+
+    start = time.perf_counter()
+    expected = per_group(organized_lengths, stats_limits)
+    print(f"RivendellGroupStatistics per group        {time.perf_counter() - start:7.3f}s")
+
+    start = time.perf_counter()
+    result = calculate_all_group_statistics(group_names, group_codes, lengths, stats_limits)
+    print(f"calculate_all_group_statistics            {time.perf_counter() - start:7.3f}s")
+
+    for statistics_workers in (1, 2, 4):
+        database_statistics = DatabaseStatistics(
+            rivendell_carts=[], output_filename=None, stats_limits=stats_limits, write_limits=False,
+            write_full_statistics=True, statistics_workers=statistics_workers
+        )
+        start = time.perf_counter()
+        organized_result = database_statistics._calculate_statistics_per_group(organized_lengths)
+        elapsed = time.perf_counter() - start
+        same_result = list(organized_result) == group_names and all(
+            vars(organized_result[group_name]) == vars(expected[group_name]) for group_name in group_names
+        )
+        print(f"DatabaseStatistics, {statistics_workers} statistics_workers   {elapsed:7.3f}s  same result={same_result}")
+
+    print("same result =", all(vars(result[group_name]) == vars(expected[group_name]) for group_name in group_names))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""
+@Author = 'Michael Stanley'
+
+Measures the memory held by the carts from LoadCartDataDump.load_carts with the repetitive fields interned, and without,
+on a synthetic dump.
+
+Usage: python benchmarks/compare_interning.py [NUMBER_OF_CARTS]
+
+============ Change Log ============
+2026-Oct-18 = Created.
+
+============ License ============
+Copyright (C) 2026 Michael Stanley
+
+This file is part of wmul_rivendell.
+
+wmul_rivendell is free software: you can redistribute it and/or modify it 
+under the terms of the GNU General Public License as published by the Free 
+Software Foundation, either version 3 of the License, or (at your option) any 
+later version.
+
+wmul_rivendell is distributed in the hope that it will be useful, but WITHOUT 
+ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS 
+FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License along with 
+wmul_rivendell. If not, see <https://www.gnu.org/licenses/>. 
+"""
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from pathlib import Path
+from generate_cart_data_dump import generate_cart_data_dump
+from wmul_rivendell import LoadCartDataDump as load_cart_data_dump_module
+from wmul_rivendell.LoadCartDataDump import LoadCartDataDump
+
+DESIRED_FIELDS = ["Cart_Number", "Group_Name", "Title", "Artist", "Album", "Year", "Length", "Sched_Codes"]
+
+INTERNED_FIELD_NAMES = load_cart_data_dump_module._INTERNED_FIELD_NAMES
+
+
+def measure(rivendell_cart_data_filename, trusted_dump, projected_fields, interned):
+    load_cart_data_dump_module._INTERNED_FIELD_NAMES = INTERNED_FIELD_NAMES if interned else ()
+    lcdd = LoadCartDataDump(
+        rivendell_cart_data_filename=rivendell_cart_data_filename,
+        excluded_group_list=[],
+        include_macros=True,
+        include_all_cuts=True,
+        trusted_dump=trusted_dump,
+        projected_fields=projected_fields
+    )
+    start = time.perf_counter()
+    rivendell_carts = lcdd.load_carts()
+    elapsed = time.perf_counter() - start
+    del rivendell_carts
+    # tracemalloc slows the load down, so the memory is measured on a second, untimed, load.
+    tracemalloc.start()
+    rivendell_carts = lcdd.load_carts()
+    held, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, held, peak, rivendell_carts
+
+
+if __name__ == "__main__":
+    number_of_carts = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    with tempfile.TemporaryDirectory() as temp_dir:
+        rivendell_cart_data_filename = Path(temp_dir) / "cart_data_dump.csv"
+        generate_cart_data_dump(rivendell_cart_data_filename, number_of_carts)
+        print(f"Dump: {number_of_carts:,} carts, {rivendell_cart_data_filename.stat().st_size / 2**20:.1f} MiB")
+        print(f"Interned fields: {', '.join(INTERNED_FIELD_NAMES)}")
+        for description, trusted_dump, projected_fields in (
+                ("validated", False, None), ("trusted", True, None), ("projected", False, DESIRED_FIELDS)):
+            _, plain_held, plain_peak, expected_carts = \
+                measure(rivendell_cart_data_filename, trusted_dump, projected_fields, interned=False)
+            plain_elapsed, _, _, _ = measure(rivendell_cart_data_filename, trusted_dump, projected_fields, interned=False)
+            elapsed, held, peak, rivendell_carts = \
+                measure(rivendell_cart_data_filename, trusted_dump, projected_fields, interned=True)
+            print(f"{description:9}  held={plain_held / 2**20:.0f} -> {held / 2**20:.0f} MiB  "
+                  f"peak={plain_peak / 2**20:.0f} -> {peak / 2**20:.0f} MiB  "
+                  f"time={plain_elapsed:.2f} -> {elapsed:.2f}s  same result={rivendell_carts == expected_carts}")
+            del expected_carts, rivendell_carts
@@ -0,0 +1,67 @@
+"""
+@Author = 'Michael Stanley'
+
+Compares converting LENGTH to seconds one cart at a time with the vectorized lengths_to_seconds, and compares re-parsing 
+the length on every read (the old computed field) with reading length_in_seconds, which parses each distinct length once.
+
+Usage: python benchmarks/compare_length_parsing.py [NUMBER_OF_ROWS]
+
+============ Change Log ============
+2026-Oct-18 = Created.
+
+============ License ============
+Copyright (C) 2026 Michael Stanley
+
+This file is part of wmul_rivendell.
+
+wmul_rivendell is free software: you can redistribute it and/or modify it 
+under the terms of the GNU General Public License as published by the Free 
+Software Foundation, either version 3 of the License, or (at your option) any 
+later version.
+
+wmul_rivendell is distributed in the hope that it will be useful, but WITHOUT 
+ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS 
+FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License along with 
+wmul_rivendell. If not, see <https://www.gnu.org/licenses/>. 
+"""
+import sys
+import tempfile
+import timeit
+
+from pathlib import Path
+from generate_cart_data_dump import generate_cart_data_dump
+from wmul_rivendell.LoadCartDataDump import LoadCartDataDump, lengths_to_seconds, _length_to_seconds
+
+
+def best_of(function, repeat=5):
+    return min(timeit.repeat(function, number=1, repeat=repeat))
+
+
+if __name__ == "__main__":
+    number_of_rows = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    with tempfile.TemporaryDirectory() as temp_dir:
+        rivendell_cart_data_filename = Path(temp_dir) / "cart_data_dump.csv"
+        # About one cart in five has a second cut.
+        generate_cart_data_dump(rivendell_cart_data_filename, number_of_rows * 5 // 6 + 1)
+        rivendell_carts = LoadCartDataDump(
+            rivendell_cart_data_filename=rivendell_cart_data_filename,
+            excluded_group_list=[],
+            include_macros=True,
+            include_all_cuts=True
+        ).load_carts()[:number_of_rows]
+
+    lengths = [rivendell_cart.length for rivendell_cart in rivendell_carts]
+    print(f"Rows: {len(lengths):,}")
+
+    per_item = best_of(lambda: [_length_to_seconds(length) for length in lengths])
+    vectorized = best_of(lambda: lengths_to_seconds(lengths))
+    print(f"Convert the LENGTH column:  per item {per_item * 1000:.1f} ms, "
+          f"lengths_to_seconds {vectorized * 1000:.1f} ms ({per_item / vectorized:.1f}x)")
+
+    # RivendellGroupStatistics reads length_in_seconds once per cart.
+    reparsed = best_of(lambda: [_length_to_seconds(rivendell_cart.length) for rivendell_cart in rivendell_carts])
+    cached = best_of(lambda: [rivendell_cart.length_in_seconds for rivendell_cart in rivendell_carts])
+    print(f"Read length_in_seconds:     re-parsed {reparsed * 1000:.1f} ms, "
+          f"cached {cached * 1000:.1f} ms ({reparsed / cached:.1f}x)")
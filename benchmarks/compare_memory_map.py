@@ -0,0 +1,67 @@
+"""
+@Author = 'Michael Stanley'
+
+Measures LoadCartDataDump.load_carts with memory_map against reading the dump in text mode, on a synthetic dump, and 
+checks that both give the same carts.
+
+Usage: python benchmarks/compare_memory_map.py [NUMBER_OF_CARTS]
+
+============ Change Log ============
+2026-Oct-18 = Created.
+
+============ License ============
+Copyright (C) 2026 Michael Stanley
+
+This file is part of wmul_rivendell.
+
+wmul_rivendell is free software: you can redistribute it and/or modify it 
+under the terms of the GNU General Public License as published by the Free 
+Software Foundation, either version 3 of the License, or (at your option) any 
+later version.
+
+wmul_rivendell is distributed in the hope that it will be useful, but WITHOUT 
+ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS 
+FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License along with 
+wmul_rivendell. If not, see <https://www.gnu.org/licenses/>. 
+"""
+import sys
+import tempfile
+import time
+
+from pathlib import Path
+from generate_cart_data_dump import generate_cart_data_dump
+from wmul_rivendell.LoadCartDataDump import LoadCartDataDump
+
+
+def measure(rivendell_cart_data_filename, trusted_dump, memory_map):
+    lcdd = LoadCartDataDump(
+        rivendell_cart_data_filename=rivendell_cart_data_filename,
+        excluded_group_list=[],
+        include_macros=True,
+        include_all_cuts=True,
+        trusted_dump=trusted_dump,
+        memory_map=memory_map
+    )
+    start = time.perf_counter()
+    rivendell_carts = lcdd.load_carts()
+    return time.perf_counter() - start, rivendell_carts
+
+
+if __name__ == "__main__":
+    number_of_carts = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    with tempfile.TemporaryDirectory() as temp_dir:
+        rivendell_cart_data_filename = Path(temp_dir) / "cart_data_dump.csv"
+        generate_cart_data_dump(rivendell_cart_data_filename, number_of_carts)
+        print(f"Dump: {number_of_carts:,} carts, {rivendell_cart_data_filename.stat().st_size / 2**20:.1f} MiB")
+        for trusted_dump in (False, True):
+            text_elapsed, expected_carts = measure(rivendell_cart_data_filename, trusted_dump, False)
+            del expected_carts
+            mapped_elapsed, rivendell_carts = measure(rivendell_cart_data_filename, trusted_dump, True)
+            del rivendell_carts
+            _, expected_carts = measure(rivendell_cart_data_filename, trusted_dump, False)
+            _, rivendell_carts = measure(rivendell_cart_data_filename, trusted_dump, True)
+            print(f"trusted_dump={trusted_dump!s:5}  text={text_elapsed:.2f}s  memory_map={mapped_elapsed:.2f}s  "
+                  f"speedup={text_elapsed / mapped_elapsed:.2f}x  same result={rivendell_carts == expected_carts}")
+            del expected_carts, rivendell_carts
@@ -0,0 +1,77 @@
+"""
+@Author = 'Michael Stanley'
+
+Measures how LoadCartDataDump.load_carts and load_cart_table scale with parse_workers on a synthetic dump, and checks 
+that every worker count gives the same result as parsing serially.
+
+Usage: python benchmarks/compare_parse_workers.py [NUMBER_OF_CARTS] [MAXIMUM_WORKERS]
+
+============ Change Log ============
+2026-Oct-18 = Created.
+
+============ License ============
+Copyright (C) 2026 Michael Stanley
+
+This file is part of wmul_rivendell.
+
+wmul_rivendell is free software: you can redistribute it and/or modify it 
+under the terms of the GNU General Public License as published by the Free 
+Software Foundation, either version 3 of the License, or (at your option) any 
+later version.
+
+wmul_rivendell is distributed in the hope that it will be useful, but WITHOUT 
+ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS 
+FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License along with 
+wmul_rivendell. If not, see <https://www.gnu.org/licenses/>. 
+"""
+import os
+import sys
+import tempfile
+import time
+
+from pathlib import Path
+from generate_cart_data_dump import generate_cart_data_dump
+from wmul_rivendell.LoadCartDataDump import LoadCartDataDump
+
+
+def measure(rivendell_cart_data_filename, load_method_name, trusted_dump, parse_workers):
+    lcdd = LoadCartDataDump(
+        rivendell_cart_data_filename=rivendell_cart_data_filename,
+        excluded_group_list=[],
+        include_macros=True,
+        include_all_cuts=True,
+        trusted_dump=trusted_dump,
+        parse_workers=parse_workers
+    )
+    start = time.perf_counter()
+    result = getattr(lcdd, load_method_name)()
+    return time.perf_counter() - start, result
+
+
+def same_result(result, serial_result):
+    if isinstance(result, list):
+        return result == serial_result
+    return result.data.equals(serial_result.data)
+
+
+if __name__ == "__main__":
+    number_of_carts = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    maximum_workers = int(sys.argv[2]) if len(sys.argv) > 2 else os.cpu_count()
+    worker_counts = sorted({1, 2, 4, maximum_workers} & set(range(1, maximum_workers + 1)))
+    with tempfile.TemporaryDirectory() as temp_dir:
+        rivendell_cart_data_filename = Path(temp_dir) / "cart_data_dump.csv"
+        generate_cart_data_dump(rivendell_cart_data_filename, number_of_carts)
+        print(f"Dump: {number_of_carts:,} carts, {rivendell_cart_data_filename.stat().st_size / 2**20:.1f} MiB, "
+              f"{os.cpu_count()} CPUs")
+        for load_method_name, trusted_dump in (("load_carts", False), ("load_carts", True), ("load_cart_table", True)):
+            serial_elapsed, serial_result = measure(rivendell_cart_data_filename, load_method_name, trusted_dump, 1)
+            print(f"{load_method_name:15}  trusted_dump={trusted_dump!s:5}  workers=1  time={serial_elapsed:.2f}s")
+            for parse_workers in worker_counts[1:]:
+                elapsed, result = measure(rivendell_cart_data_filename, load_method_name, trusted_dump, parse_workers)
+                print(f"{load_method_name:15}  trusted_dump={trusted_dump!s:5}  workers={parse_workers}  "
+                      f"time={elapsed:.2f}s  speedup={serial_elapsed / elapsed:.2f}x  "
+                      f"same result={same_result(result, serial_result)}")
+                del result
+            del serial_result
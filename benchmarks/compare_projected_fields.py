@@ -0,0 +1,78 @@
+"""
+@Author = 'Michael Stanley'
+
+Measures LoadCartDataDump.load_carts with projected_fields set to a typical music scheduler's desired fields, against 
+loading whole carts, on a synthetic dump. Reports the time and the peak memory of each load.
+
+Usage: python benchmarks/compare_projected_fields.py [NUMBER_OF_CARTS]
+
+============ Change Log ============
+2026-Oct-18 = Created.
+
+============ License ============
+Copyright (C) 2026 Michael Stanley
+
+This file is part of wmul_rivendell.
+
+wmul_rivendell is free software: you can redistribute it and/or modify it 
+under the terms of the GNU General Public License as published by the Free 
+Software Foundation, either version 3 of the License, or (at your option) any 
+later version.
+
+wmul_rivendell is distributed in the hope that it will be useful, but WITHOUT 
+ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS 
+FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License along with 
+wmul_rivendell. If not, see <https://www.gnu.org/licenses/>. 
+"""
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from pathlib import Path
+from generate_cart_data_dump import generate_cart_data_dump
+from wmul_rivendell.LoadCartDataDump import LoadCartDataDump
+
+DESIRED_FIELDS = ["Cart_Number", "Group_Name", "Title", "Artist", "Album", "Year", "Length", "Sched_Codes"]
+
+
+def measure(rivendell_cart_data_filename, trusted_dump, projected_fields):
+    lcdd = LoadCartDataDump(
+        rivendell_cart_data_filename=rivendell_cart_data_filename,
+        excluded_group_list=[],
+        include_macros=True,
+        include_all_cuts=True,
+        trusted_dump=trusted_dump,
+        projected_fields=projected_fields
+    )
+    start = time.perf_counter()
+    rivendell_carts = lcdd.load_carts()
+    elapsed = time.perf_counter() - start
+    del rivendell_carts
+    # tracemalloc slows the load down, so the peak memory is measured on a second, untimed, load.
+    tracemalloc.start()
+    rivendell_carts = lcdd.load_carts()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    same_fields = [
+        tuple(getattr(cart, field_name.lower()) for field_name in DESIRED_FIELDS) for cart in rivendell_carts
+    ]
+    return elapsed, peak, same_fields
+
+
+if __name__ == "__main__":
+    number_of_carts = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    with tempfile.TemporaryDirectory() as temp_dir:
+        rivendell_cart_data_filename = Path(temp_dir) / "cart_data_dump.csv"
+        generate_cart_data_dump(rivendell_cart_data_filename, number_of_carts)
+        print(f"Dump: {number_of_carts:,} carts, {rivendell_cart_data_filename.stat().st_size / 2**20:.1f} MiB")
+        projected_elapsed, projected_peak, projected_fields = \
+            measure(rivendell_cart_data_filename, False, DESIRED_FIELDS)
+        print(f"projected             time={projected_elapsed:.2f}s  peak={projected_peak / 2**20:.0f} MiB")
+        for trusted_dump in (False, True):
+            elapsed, peak, whole_fields = measure(rivendell_cart_data_filename, trusted_dump, None)
+            print(f"whole, trusted={trusted_dump!s:5}  time={elapsed:.2f}s  peak={peak / 2**20:.0f} MiB  "
+                  f"same fields={whole_fields == projected_fields}")
+            del whole_fields
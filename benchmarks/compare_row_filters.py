@@ -0,0 +1,87 @@
+"""
+@Author = 'Michael Stanley'
+
+Measures LoadCartDataDump.load_carts with the excluded groups and macro filters pushed down to the raw rows, against 
+building every cart and filtering the list afterwards, on a synthetic dump where three of the eight groups are 
+excluded.
+
+Usage: python benchmarks/compare_row_filters.py [NUMBER_OF_CARTS]
+
+============ Change Log ============
+2026-Oct-18 = Created.
+
+============ License ============
+Copyright (C) 2026 Michael Stanley
+
+This file is part of wmul_rivendell.
+
+wmul_rivendell is free software: you can redistribute it and/or modify it 
+under the terms of the GNU General Public License as published by the Free 
+Software Foundation, either version 3 of the License, or (at your option) any 
+later version.
+
+wmul_rivendell is distributed in the hope that it will be useful, but WITHOUT 
+ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS 
+FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License along with 
+wmul_rivendell. If not, see <https://www.gnu.org/licenses/>. 
+"""
+import gc
+import sys
+import tempfile
+import time
+
+from pathlib import Path
+from generate_cart_data_dump import generate_cart_data_dump
+from wmul_rivendell.LoadCartDataDump import CartType, LoadCartDataDump
+
+EXCLUDED_GROUPS = ["LEGAL", "PROMOS", "ASPERIORES"]
+
+
+def measure_pushed_down(rivendell_cart_data_filename, trusted_dump):
+    lcdd = LoadCartDataDump(
+        rivendell_cart_data_filename=rivendell_cart_data_filename,
+        excluded_group_list=EXCLUDED_GROUPS,
+        include_macros=False,
+        include_all_cuts=True,
+        trusted_dump=trusted_dump
+    )
+    start = time.perf_counter()
+    rivendell_carts = lcdd.load_carts()
+    return time.perf_counter() - start, rivendell_carts, lcdd.row_filter_counts
+
+
+def measure_filtered_afterwards(rivendell_cart_data_filename, trusted_dump):
+    lcdd = LoadCartDataDump(
+        rivendell_cart_data_filename=rivendell_cart_data_filename,
+        excluded_group_list=[],
+        include_macros=True,
+        include_all_cuts=True,
+        trusted_dump=trusted_dump
+    )
+    start = time.perf_counter()
+    rivendell_carts = [
+        rivendell_cart for rivendell_cart in lcdd.load_carts()
+        if rivendell_cart.group_name not in EXCLUDED_GROUPS and rivendell_cart.type != CartType.Macro
+    ]
+    return time.perf_counter() - start, rivendell_carts
+
+
+if __name__ == "__main__":
+    number_of_carts = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    with tempfile.TemporaryDirectory() as temp_dir:
+        rivendell_cart_data_filename = Path(temp_dir) / "cart_data_dump.csv"
+        generate_cart_data_dump(rivendell_cart_data_filename, number_of_carts)
+        for trusted_dump in (False, True):
+            afterwards_elapsed, expected_carts = measure_filtered_afterwards(rivendell_cart_data_filename, trusted_dump)
+            # So that the garbage collector does not scan the expected carts while the second load is timed.
+            gc.freeze()
+            pushed_down_elapsed, rivendell_carts, row_filter_counts = \
+                measure_pushed_down(rivendell_cart_data_filename, trusted_dump)
+            print(f"trusted_dump={trusted_dump!s:5}  filtered afterwards={afterwards_elapsed:.2f}s  "
+                  f"pushed down={pushed_down_elapsed:.2f}s  speedup={afterwards_elapsed / pushed_down_elapsed:.2f}x  "
+                  f"same result={rivendell_carts == expected_carts}")
+            print(f"    {row_filter_counts}, rows_kept={row_filter_counts.rows_kept}")
+            del expected_carts, rivendell_carts
+            gc.unfreeze()
@@ -0,0 +1,84 @@
+"""
+@Author = 'Michael Stanley'
+
+Measures selecting carts by scheduler code with a SchedulerCodeIndex, against splitting each cart's sched_codes for 
+every query, on a synthetic dump.
+
+Usage: python benchmarks/compare_sched_code_filter.py [NUMBER_OF_CARTS]
+
+============ Change Log ============
+2026-Oct-18 = Created.
+
+============ License ============
+Copyright (C) 2026 Michael Stanley
+
+This file is part of wmul_rivendell.
+
+wmul_rivendell is free software: you can redistribute it and/or modify it 
+under the terms of the GNU General Public License as published by the Free 
+Software Foundation, either version 3 of the License, or (at your option) any 
+later version.
+
+wmul_rivendell is distributed in the hope that it will be useful, but WITHOUT 
+ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS 
+FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License along with 
+wmul_rivendell. If not, see <https://www.gnu.org/licenses/>. 
+"""
+import sys
+import tempfile
+import time
+
+from itertools import compress
+from pathlib import Path
+from generate_cart_data_dump import generate_cart_data_dump
+from wmul_rivendell.LoadCartDataDump import LoadCartDataDump
+from wmul_rivendell.SchedulerCodes import SchedulerCodeIndex
+
+QUERIES = [
+    (["Rock"], []),
+    (["Rock", "Female"], ["Slow"]),
+    (["2000s"], ["Pop", "Male"]),
+    ([], ["Fast"])
+]
+
+
+def split_each_cart(rivendell_carts, required_codes, excluded_codes):
+    selected = []
+    for rivendell_cart in rivendell_carts:
+        codes = set(rivendell_cart.sched_codes.split())
+        if codes.issuperset(required_codes) and codes.isdisjoint(excluded_codes):
+            selected.append(rivendell_cart)
+    return selected
+
+
+if __name__ == "__main__":
+    number_of_carts = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    with tempfile.TemporaryDirectory() as temp_dir:
+        rivendell_cart_data_filename = Path(temp_dir) / "cart_data_dump.csv"
+        generate_cart_data_dump(rivendell_cart_data_filename, number_of_carts)
+        rivendell_carts = LoadCartDataDump(
+            rivendell_cart_data_filename=rivendell_cart_data_filename,
+            excluded_group_list=[],
+            include_macros=True,
+            include_all_cuts=True,
+            trusted_dump=True
+        ).load_carts()
+    print(f"Dump: {number_of_carts:,} carts, {len(rivendell_carts):,} cuts")
+
+    start = time.perf_counter()
+    expected_selections = [split_each_cart(rivendell_carts, *query) for query in QUERIES]
+    split_elapsed = time.perf_counter() - start
+
+    start = time.perf_counter()
+    sched_code_index = SchedulerCodeIndex.from_sched_codes([cart.sched_codes for cart in rivendell_carts])
+    build_elapsed = time.perf_counter() - start
+    start = time.perf_counter()
+    masks = [sched_code_index.select(*query) for query in QUERIES]
+    select_elapsed = time.perf_counter() - start
+    selections = [list(compress(rivendell_carts, mask.tolist())) for mask in masks]
+
+    print(f"{len(QUERIES)} queries, splitting each cart: {split_elapsed:.3f}s")
+    print(f"{len(QUERIES)} queries, SchedulerCodeIndex:  build={build_elapsed:.3f}s  select={select_elapsed:.4f}s  "
+          f"same result={selections == expected_selections}")
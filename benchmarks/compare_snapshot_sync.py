@@ -0,0 +1,183 @@
+"""
+@Author = 'Michael Stanley'
+
+Compares loading the carts with LoadCartDatabase, which reads every cart from the database on each run, against
+LoadCartSnapshot, which only fetches the carts that have changed since the previous run. One cart in a hundred is
+changed between the runs.
+
+There is no Rivendell database here, so it is stood in for by an SQLite file with the same tables. Reading from it
+costs much less than reading from a MySQL server over the network, so the number of rows, and of bytes of text,
+fetched from the database are reported as well as the time.
+
+Usage: python benchmarks/compare_snapshot_sync.py [NUMBER_OF_CARTS]
+
+============ Change Log ============
+2026-Oct-18 = Created.
+
+============ License ============
+Copyright (C) 2026 Michael Stanley
+
+This file is part of wmul_rivendell.
+
+wmul_rivendell is free software: you can redistribute it and/or modify it
+under the terms of the GNU General Public License as published by the Free
+Software Foundation, either version 3 of the License, or (at your option) any
+later version.
+
+wmul_rivendell is distributed in the hope that it will be useful, but WITHOUT
+ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License along with
+wmul_rivendell. If not, see <https://www.gnu.org/licenses/>.
+"""
+import random
+import sqlite3
+import sys
+import tempfile
+import time
+
+from pathlib import Path
+from unittest import mock
+from generate_cart_data_dump import GROUPS, SCHED_CODES, WORDS
+from wmul_rivendell.LoadCartDatabase import LoadCartDatabase
+from wmul_rivendell.LoadCartSnapshot import LoadCartSnapshot
+
+CART_COLUMNS = (
+    "NUMBER", "TYPE", "GROUP_NAME", "TITLE", "ARTIST", "ALBUM", "YEAR", "LABEL", "CLIENT", "AGENCY", "PUBLISHER",
+    "COMPOSER", "CONDUCTOR", "SONG_ID", "USER_DEFINED", "METADATA_DATETIME"
+)
+
+CUT_COLUMNS = (
+    "CUT_NAME", "CART_NUMBER", "DESCRIPTION", "OUTCUE", "ISRC", "ISCI", "LENGTH", "START_POINT", "END_POINT",
+    "SEGUE_START_POINT", "SEGUE_END_POINT", "HOOK_START_POINT", "HOOK_END_POINT", "TALK_START_POINT",
+    "TALK_END_POINT", "FADEUP_POINT", "FADEDOWN_POINT", "ORIGIN_DATETIME"
+)
+
+BEFORE_FIRST_RUN = "2000-01-01 00:00:00"
+AFTER_FIRST_RUN = "2999-01-01 00:00:00"
+
+
+class CountingCursor:
+    """Takes the mysql.connector paramstyle and cursor arguments, runs the queries on SQLite, and counts the rows and
+    bytes that are fetched."""
+    rows_fetched = 0
+    bytes_fetched = 0
+
+    def __init__(self, sqlite_cursor):
+        self.sqlite_cursor = sqlite_cursor
+
+    def execute(self, query, parameters=()):
+        self.sqlite_cursor.execute(query.replace("%s", "?"), parameters)
+
+    def fetchmany(self, size):
+        database_rows = self.sqlite_cursor.fetchmany(size)
+        CountingCursor.rows_fetched += len(database_rows)
+        CountingCursor.bytes_fetched += sum(
+            len(str(value)) for database_row in database_rows for value in database_row
+        )
+        return database_rows
+
+    def close(self):
+        self.sqlite_cursor.close()
+
+
+class StandInConnection:
+
+    def __init__(self, database_filename):
+        self.sqlite_connection = sqlite3.connect(database_filename)
+
+    def cursor(self, buffered=False):
+        return CountingCursor(self.sqlite_connection.cursor())
+
+    def close(self):
+        self.sqlite_connection.close()
+
+
+def _words(randomizer, count):
+    return " ".join(randomizer.choice(WORDS) for _ in range(count))
+
+
+def create_database(database_filename, number_of_carts, seed=0):
+    randomizer = random.Random(seed)
+    carts = []
+    cuts = []
+    sched_codes = []
+    for cart_number in range(1, number_of_carts + 1):
+        number_of_cuts = 1 if randomizer.random() >= 0.2 else 2
+        carts.append((
+            cart_number, 1, randomizer.choice(GROUPS), _words(randomizer, 3), _words(randomizer, 2),
+            _words(randomizer, 2), f"{randomizer.randint(1950, 2025)}-01-01", "", _words(randomizer, 3), "", "",
+            _words(randomizer, 3), "", "", "", BEFORE_FIRST_RUN
+        ))
+        for cut_number in range(1, number_of_cuts + 1):
+            length = randomizer.randint(5_000, 420_000)
+            cuts.append((
+                f"{cart_number:06d}_{cut_number:03d}", cart_number, _words(randomizer, 4), "", "", "", length, 0,
+                length, -1, -1, -1, -1, -1, -1, -1, -1, BEFORE_FIRST_RUN
+            ))
+        sched_codes.extend((cart_number, sched_code) for sched_code in randomizer.sample(SCHED_CODES, 2))
+    with sqlite3.connect(database_filename) as database:
+        database.execute(f"CREATE TABLE CART ({', '.join(CART_COLUMNS)})")
+        database.execute(f"CREATE TABLE CUTS ({', '.join(CUT_COLUMNS)})")
+        database.execute("CREATE TABLE CART_SCHED_CODES (CART_NUMBER, SCHED_CODE)")
+        database.execute("CREATE INDEX CUTS_CART_NUMBER ON CUTS (CART_NUMBER)")
+        database.executemany(f"INSERT INTO CART VALUES ({', '.join('?' * len(CART_COLUMNS))})", carts)
+        database.executemany(f"INSERT INTO CUTS VALUES ({', '.join('?' * len(CUT_COLUMNS))})", cuts)
+        database.executemany("INSERT INTO CART_SCHED_CODES VALUES (?, ?)", sched_codes)
+    return len(cuts)
+
+
+def change_one_cart_in_a_hundred(database_filename):
+    with sqlite3.connect(database_filename) as database:
+        database.execute(
+            "UPDATE CART SET TITLE = TITLE || ' (remastered)', METADATA_DATETIME = ? WHERE NUMBER % 100 = 0",
+            (AFTER_FIRST_RUN,)
+        )
+
+
+def measure(cart_loader, database_filename):
+    CountingCursor.rows_fetched = 0
+    CountingCursor.bytes_fetched = 0
+    with mock.patch(
+            "wmul_rivendell.LoadCartDatabase.mysql.connector.connect",
+            side_effect=lambda **connect_arguments: StandInConnection(database_filename)
+    ):
+        start = time.perf_counter()
+        rivendell_carts = cart_loader.load_carts()
+        elapsed = time.perf_counter() - start
+    return elapsed, CountingCursor.rows_fetched, CountingCursor.bytes_fetched, len(rivendell_carts)
+
+
+def print_measurement(description, elapsed, rows_fetched, bytes_fetched, number_of_rivendell_carts):
+    print(f"{description:<30} {elapsed:7.2f}s {rows_fetched:>8} rows {bytes_fetched / 2 ** 20:7.1f} MiB fetched "
+          f"{number_of_rivendell_carts:>8} carts")
+
+
+def main():
+    number_of_carts = int(sys.argv[1]) if len(sys.argv) > 1 else 125_000
+    options = dict(excluded_group_list=["LEGAL", "PROMOS"], include_macros=False, include_all_cuts=True,
+                   trusted_dump=True)
+    with tempfile.TemporaryDirectory() as temporary_directory:
+        database_filename = str(Path(temporary_directory) / "rivendell.sqlite")
+        number_of_cuts = create_database(database_filename, number_of_carts)
+        print(f"{number_of_carts} carts, {number_of_cuts} cuts")
+        database_loader = LoadCartDatabase(**options)
+        snapshot_loader = LoadCartSnapshot(snapshot_filename=Path(temporary_directory) / "snapshot.sqlite", **options)
+
+        runs = [
+            ("LoadCartDatabase", database_loader),
+            ("LoadCartSnapshot, first run", snapshot_loader),
+            ("LoadCartSnapshot, unchanged", snapshot_loader),
+        ]
+        for description, cart_loader in runs:
+            print_measurement(description, *measure(cart_loader, database_filename))
+
+        change_one_cart_in_a_hundred(database_filename)
+        for description, cart_loader in [("LoadCartDatabase, 1% changed", database_loader),
+                                         ("LoadCartSnapshot, 1% changed", snapshot_loader)]:
+            print_measurement(description, *measure(cart_loader, database_filename))
+
+
+if __name__ == "__main__":
+    main()
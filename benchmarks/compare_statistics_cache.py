@@ -0,0 +1,76 @@
+"""
+@Author = 'Michael Stanley'
+
+Compares calculating the statistics of every group, as database-statistics does without a statistics cache, against
+running with a StatisticsCache, first empty and then with two of the groups changed since the previous run.
+
+Usage: python benchmarks/compare_statistics_cache.py [NUMBER_OF_CUTS] [NUMBER_OF_GROUPS]
+
+============ Change Log ============
+2026-Oct-18 = Created.
+
+============ License ============
+Copyright (C) 2026 Michael Stanley
+
+This file is part of wmul_rivendell.
+
+wmul_rivendell is free software: you can redistribute it and/or modify it
+under the terms of the GNU General Public License as published by the Free
+Software Foundation, either version 3 of the License, or (at your option) any
+later version.
+
+wmul_rivendell is distributed in the hope that it will be useful, but WITHOUT
+ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License along with
+wmul_rivendell. If not, see <https://www.gnu.org/licenses/>.
+"""
+import sys
+import tempfile
+import time
+
+import numpy as np
+from pathlib import Path
+from wmul_rivendell.DatabaseStatistics import DatabaseStatistics, StatisticsLimits
+from wmul_rivendell.StatisticsCache import StatisticsCache
+
+
+def generate_organized_lengths(number_of_cuts, number_of_groups, seed=0):
+    randomizer = np.random.default_rng(seed)
+    group_codes = randomizer.integers(0, number_of_groups, number_of_cuts)
+    typical_lengths = randomizer.uniform(30, 400, number_of_groups)[group_codes]
+    lengths = np.maximum(0, randomizer.normal(typical_lengths, typical_lengths / 4)).astype(np.int64)
+    return {f"GROUP{group_code:04}": lengths[group_codes == group_code] for group_code in range(number_of_groups)}
+
+
+def measure(description, organized_lengths, statistics_cache):
+    database_statistics = DatabaseStatistics(
+        rivendell_carts=[], output_filename=None, stats_limits=StatisticsLimits(), write_limits=False,
+        write_full_statistics=True, statistics_cache=statistics_cache
+    )
+    start = time.perf_counter()
+    statistics_per_group = database_statistics._calculate_statistics_per_group(organized_carts=organized_lengths)
+    print(f"{description:<32} {time.perf_counter() - start:7.3f}s")
+    return {group_name: vars(group_statistics) for group_name, group_statistics in statistics_per_group.items()}
+
+
+def main():
+    number_of_cuts = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    number_of_groups = int(sys.argv[2]) if len(sys.argv) > 2 else 80
+    organized_lengths = generate_organized_lengths(number_of_cuts, number_of_groups)
+    print(f"{number_of_cuts:,} cuts in {number_of_groups} groups")
+    with tempfile.TemporaryDirectory() as temporary_directory:
+        cache_filename = Path(temporary_directory) / "statistics_cache.json"
+        expected = measure("no cache", organized_lengths, None)
+        same_result = measure("empty cache", organized_lengths, StatisticsCache(cache_filename)) == expected
+        same_result &= measure("unchanged", organized_lengths, StatisticsCache(cache_filename)) == expected
+        for group_name in list(organized_lengths)[:2]:
+            organized_lengths[group_name] = np.append(organized_lengths[group_name], 240)
+        expected = measure("no cache, 2 groups changed", organized_lengths, None)
+        same_result &= measure("2 groups changed", organized_lengths, StatisticsCache(cache_filename)) == expected
+        print(f"same result={same_result}")
+
+
+if __name__ == "__main__":
+    main()
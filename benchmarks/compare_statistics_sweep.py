@@ -0,0 +1,89 @@
+"""
+@Author = 'Michael Stanley'
+
+Compares calculating the statistics of every group once for each StatisticsLimits of a grid, as a separate
+database-statistics run with each would, against sweeping the whole grid in one pass with sweep_all_group_statistics.
+
+Usage: python benchmarks/compare_statistics_sweep.py [NUMBER_OF_CUTS] [NUMBER_OF_GROUPS]
+
+============ Change Log ============
+2026-Oct-18 = Created.
+
+============ License ============
+Copyright (C) 2026 Michael Stanley
+
+This file is part of wmul_rivendell.
+
+wmul_rivendell is free software: you can redistribute it and/or modify it
+under the terms of the GNU General Public License as published by the Free
+Software Foundation, either version 3 of the License, or (at your option) any
+later version.
+
+wmul_rivendell is distributed in the hope that it will be useful, but WITHOUT
+ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License along with
+wmul_rivendell. If not, see <https://www.gnu.org/licenses/>.
+"""
+import itertools
+import sys
+import time
+
+import numpy as np
+from wmul_rivendell.DatabaseStatistics import DatabaseStatistics, StatisticsLimits
+
+STATS_LIMITS_GRID = [
+    StatisticsLimits(
+        smallest_stdev=smallest_stdev, minimum_population_for_outliers=minimum_population_for_outliers, 
+        lower_bound_multiple=lower_bound_multiple, upper_bound_multiple=upper_bound_multiple
+    )
+    for smallest_stdev, minimum_population_for_outliers, lower_bound_multiple, upper_bound_multiple in 
+    itertools.product([10, 15, 20, 30], [4, 10], [1.0, 1.5, 2.0], [2.0, 2.5, 3.0])
+]
+
+
+def generate_organized_lengths(number_of_cuts, number_of_groups, seed=0):
+    randomizer = np.random.default_rng(seed)
+    group_codes = randomizer.integers(0, number_of_groups, number_of_cuts)
+    typical_lengths = randomizer.uniform(30, 400, number_of_groups)[group_codes]
+    lengths = np.maximum(0, randomizer.normal(typical_lengths, typical_lengths / 4)).astype(np.int64)
+    return {f"GROUP{group_code:04}": lengths[group_codes == group_code] for group_code in range(number_of_groups)}
+
+
+def make_database_statistics(stats_limits, stats_limits_grid=None):
+    return DatabaseStatistics(
+        rivendell_carts=[], output_filename=None, stats_limits=stats_limits, write_limits=True,
+        write_full_statistics=True, stats_limits_grid=stats_limits_grid
+    )
+
+
+def main():
+    number_of_cuts = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    number_of_groups = int(sys.argv[2]) if len(sys.argv) > 2 else 300
+    organized_lengths = generate_organized_lengths(number_of_cuts, number_of_groups)
+    print(f"{number_of_cuts:,} cuts in {number_of_groups} groups, {len(STATS_LIMITS_GRID)} statistics limits")
+
+    start = time.perf_counter()
+    expected = [
+        make_database_statistics(stats_limits)._calculate_statistics_per_group(organized_carts=organized_lengths)
+        for stats_limits in STATS_LIMITS_GRID
+    ]
+    print(f"{'one run per limits':<20} {time.perf_counter() - start:7.3f}s")
+
+    start = time.perf_counter()
+    result = make_database_statistics(StatisticsLimits(), STATS_LIMITS_GRID)._sweep_statistics_limits(
+        organized_carts=organized_lengths
+    )
+    print(f"{'sweep':<20} {time.perf_counter() - start:7.3f}s")
+
+    same_result = all(
+        {group_name: vars(group_statistics) for group_name, group_statistics in result_per_group.items()} ==
+        {group_name: vars(group_statistics) for group_name, group_statistics in expected_per_group.items()}
+        for result_per_group, expected_per_group in zip(result, expected)
+    )
+    print(f"same result={same_result}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""
+@Author = 'Michael Stanley'
+
+Compares the peak memory and time of database-statistics with the carts loaded into memory, as a list and as a
+CartTable, against streaming them into a LengthHistograms, and checks that the statistics are the same. The memory is
+traced with tracemalloc, which slows the loads down several times over, so the times are only comparable to each other.
+
+Usage: python benchmarks/compare_streaming_statistics.py [NUMBER_OF_CARTS]
+
+============ Change Log ============
+2026-Oct-18 = Created.
+
+============ License ============
+Copyright (C) 2026 Michael Stanley
+
+This file is part of wmul_rivendell.
+
+wmul_rivendell is free software: you can redistribute it and/or modify it
+under the terms of the GNU General Public License as published by the Free
+Software Foundation, either version 3 of the License, or (at your option) any
+later version.
+
+wmul_rivendell is distributed in the hope that it will be useful, but WITHOUT
+ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License along with
+wmul_rivendell. If not, see <https://www.gnu.org/licenses/>.
+"""
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from pathlib import Path
+from generate_cart_data_dump import generate_cart_data_dump
+from wmul_rivendell.DatabaseStatistics import DatabaseStatistics, LengthHistograms, StatisticsLimits
+from wmul_rivendell.LoadCartDataDump import LoadCartDataDump
+
+
+def calculate_statistics(rivendell_carts):
+    database_statistics = DatabaseStatistics(
+        rivendell_carts=rivendell_carts, output_filename=None, stats_limits=StatisticsLimits(), write_limits=False,
+        write_full_statistics=True
+    )
+    organized_carts = database_statistics._organize_by_rivendell_group(unorganized_carts=rivendell_carts)
+    return database_statistics._calculate_statistics_per_group(organized_carts=organized_carts)
+
+
+def measure(description, load):
+    tracemalloc.start()
+    start = time.perf_counter()
+    statistics_per_group = calculate_statistics(load())
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{description:<32} {elapsed:6.2f}s  peak={peak / 2 ** 20:7.1f} MiB")
+    return {group_name: vars(group_statistics) for group_name, group_statistics in statistics_per_group.items()}
+
+
+def main():
+    number_of_carts = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    with tempfile.TemporaryDirectory() as temporary_directory:
+        rivendell_cart_data_filename = Path(temporary_directory) / "cart_data_dump.csv"
+        generate_cart_data_dump(rivendell_cart_data_filename, number_of_carts)
+        cart_loader = LoadCartDataDump(
+            rivendell_cart_data_filename=rivendell_cart_data_filename,
+            excluded_group_list=["LEGAL", "PROMOS"],
+            include_macros=False,
+            include_all_cuts=True,
+            trusted_dump=True
+        )
+        print(f"Dump: {number_of_carts:,} carts")
+        expected = measure("load_carts", cart_loader.load_carts)
+        same_as_table = measure("load_cart_table", cart_loader.load_cart_table) == expected
+        same_as_streamed = measure(
+            "iter_carts into LengthHistograms", lambda: LengthHistograms().add_carts(cart_loader.iter_carts())
+        ) == expected
+        print(f"same result={same_as_table and same_as_streamed}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""
+@Author = 'Michael Stanley'
+
+Compares the time and peak memory of LoadCartDataDump.load_carts with and without trusted_dump on a synthetic dump.
+
+Usage: python benchmarks/compare_trusted_dump.py [NUMBER_OF_CARTS]
+
+============ Change Log ============
+2026-Oct-18 = Created.
+
+============ License ============
+Copyright (C) 2026 Michael Stanley
+
+This file is part of wmul_rivendell.
+
+wmul_rivendell is free software: you can redistribute it and/or modify it 
+under the terms of the GNU General Public License as published by the Free 
+Software Foundation, either version 3 of the License, or (at your option) any 
+later version.
+
+wmul_rivendell is distributed in the hope that it will be useful, but WITHOUT 
+ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS 
+FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License along with 
+wmul_rivendell. If not, see <https://www.gnu.org/licenses/>. 
+"""
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from pathlib import Path
+from generate_cart_data_dump import generate_cart_data_dump
+from wmul_rivendell.LoadCartDataDump import LoadCartDataDump
+
+
+def measure(rivendell_cart_data_filename, trusted_dump):
+    lcdd = LoadCartDataDump(
+        rivendell_cart_data_filename=rivendell_cart_data_filename,
+        excluded_group_list=[],
+        include_macros=True,
+        include_all_cuts=True,
+        trusted_dump=trusted_dump
+    )
+    tracemalloc.start()
+    start = time.perf_counter()
+    rivendell_carts = lcdd.load_carts()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    # Time again without tracemalloc, which slows down allocation-heavy code.
+    start = time.perf_counter()
+    lcdd.load_carts()
+    untraced_elapsed = time.perf_counter() - start
+    return len(rivendell_carts), untraced_elapsed, elapsed, peak
+
+
+if __name__ == "__main__":
+    number_of_carts = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    with tempfile.TemporaryDirectory() as temp_dir:
+        rivendell_cart_data_filename = Path(temp_dir) / "cart_data_dump.csv"
+        generate_cart_data_dump(rivendell_cart_data_filename, number_of_carts)
+        print(f"Dump: {number_of_carts:,} carts, {rivendell_cart_data_filename.stat().st_size / 2**20:.1f} MiB")
+        for trusted_dump in (False, True):
+            count, elapsed, traced_elapsed, peak = measure(rivendell_cart_data_filename, trusted_dump)
+            print(
+                f"trusted_dump={trusted_dump!s:5}  rows={count:,}  time={elapsed:.2f}s  "
+                f"peak memory={peak / 2**20:.1f} MiB ({traced_elapsed:.2f}s under tracemalloc)"
+            )
@@ -0,0 +1,126 @@
+"""
+@Author = 'Michael Stanley'
+
+Generates a synthetic Rivendell Cart Data Dump for benchmarking. The same seed always produces the same dump.
+
+Usage: python benchmarks/generate_cart_data_dump.py OUTPUT_FILENAME [--carts NUMBER_OF_CARTS] [--seed SEED]
+
+============ Change Log ============
+2026-Oct-18 = Created.
+              Carts may have up to four cuts, outcues may be broken across lines, and some lengths are over an 
+              hour.
+              Parse the arguments with argparse, so that --help prints the usage instead of being taken as the 
+              output filename.
+
+============ License ============
+Copyright (C) 2026 Michael Stanley
+
+This file is part of wmul_rivendell.
+
+wmul_rivendell is free software: you can redistribute it and/or modify it 
+under the terms of the GNU General Public License as published by the Free 
+Software Foundation, either version 3 of the License, or (at your option) any 
+later version.
+
+wmul_rivendell is distributed in the hope that it will be useful, but WITHOUT 
+ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS 
+FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License along with 
+wmul_rivendell. If not, see <https://www.gnu.org/licenses/>. 
+"""
+import argparse
+import csv
+import random
+import sys
+
+from pathlib import Path
+
+HEADER = [
+    "CART_NUMBER", "CUT_NUMBER", "TYPE", "GROUP_NAME", "TITLE", "ARTIST", "ALBUM", "YEAR", "ISRC", "ISCI", "LABEL", 
+    "CLIENT", "AGENCY", "PUBLISHER", "COMPOSER", "CONDUCTOR", "SONG_ID", "USER_DEFINED", "DESCRIPTION", "OUTCUE", 
+    "FILENAME", "LENGTH", "START_POINT", "END_POINT", "SEGUE_START_POINT", "SEGUE_END_POINT", "HOOK_START_POINT", 
+    "HOOK_END_POINT", "TALK_START_POINT", "TALK_END_POINT", "FADEUP_POINT", "FADEDOWN_POINT", "SCHED_CODES"
+]
+
+WORDS = [
+    "perferendis", "optio", "adipisci", "odit", "nesciunt", "repellendus", "saepe", "architecto", "sequi", "alias", 
+    "facere", "magnam", "pariatur", "eligendi", "dolorem", "recusandae", "deleniti", "laborum", "quisquam", "natus", 
+    "aperiam", "totam", "reiciendis", "tempora", "libero", "earum", "repudiandae", "modi", "aliquam", "omnis", "enim"
+]
+
+GROUPS = ["TEMPORIBUS", "VOLUPTATIB", "ALIQUAM", "LAUDANTIUM", "ASPERIORES", "MUSIC", "LEGAL", "PROMOS"]
+
+SCHED_CODES = ["2010s", "2000s", "1990s", "Rock", "Pop", "Slow", "Fast", "Female", "Male"]
+
+
+def _words(randomizer, count):
+    return " ".join(randomizer.choice(WORDS) for _ in range(count))
+
+
+def _length(randomizer):
+    if randomizer.random() < 0.01:
+        # A long-form cart, such as a recorded show, written as H:MM:SS.
+        seconds = randomizer.randint(3600, 3 * 3600)
+        return f"{seconds // 3600}:{seconds // 60 % 60:02d}:{seconds % 60:02d}"
+    seconds = randomizer.randint(5, 420)
+    return f"{seconds // 60}:{seconds % 60:02d}"
+
+
+def _number_of_cuts(randomizer, is_macro):
+    if is_macro or randomizer.random() >= 0.2:
+        return 1
+    return randomizer.choice([2, 2, 2, 3, 4])
+
+
+def _break_line(text):
+    return text.replace(" ", "\n", 1)
+
+
+def generate_cart_data_dump(output_filename, number_of_carts, seed=0):
+    """Writes a dump with number_of_carts carts. About one cart in five has two to four cuts, one in fifty is a macro, 
+    and one in a hundred cuts is over an hour long. One cut in a hundred has a description, and one in two hundred an 
+    outcue, broken across lines, as Rivendell writes them."""
+    randomizer = random.Random(seed)
+    with open(output_filename, "wt", newline="") as output_file:
+        writer = csv.writer(output_file, lineterminator="\r\n")
+        writer.writerow(HEADER)
+        for cart_number in range(1, number_of_carts + 1):
+            is_macro = randomizer.random() < 0.02
+            number_of_cuts = _number_of_cuts(randomizer, is_macro)
+            group_name = randomizer.choice(GROUPS)
+            title = _words(randomizer, randomizer.randint(2, 5))
+            artist = _words(randomizer, 2)
+            for cut_number in range(1, number_of_cuts + 1):
+                description = _words(randomizer, 4)
+                if randomizer.random() < 0.01:
+                    description = _break_line(description)
+                outcue = _words(randomizer, 3) if randomizer.random() < 0.1 else ""
+                if outcue and randomizer.random() < 0.05:
+                    outcue = _break_line(outcue)
+                row = [
+                    str(cart_number), str(cut_number), "macro" if is_macro else "audio", group_name, title, artist, 
+                    _words(randomizer, 2), str(randomizer.randint(1950, 2025)), "", "", "", _words(randomizer, 3), "", 
+                    "", _words(randomizer, 3), "", "", "", description, outcue, 
+                    "" if is_macro else f"{cart_number:06d}_{cut_number:03d}.wav", 
+                    ":00" if is_macro else _length(randomizer), "", "", "", "", "", "", "", "", "", "",
+                    " ".join(randomizer.sample(SCHED_CODES, 2))
+                ]
+                if "\n" in description or "\n" in outcue:
+                    # Rivendell does not quote the broken field, it writes the line break as-is.
+                    output_file.write(",".join(row) + "\r\n")
+                else:
+                    writer.writerow(row)
+
+
+def main(arguments=None):
+    parser = argparse.ArgumentParser(description="Generates a synthetic Rivendell Cart Data Dump for benchmarking.")
+    parser.add_argument("output_filename", type=Path, help="The file to write the dump to.")
+    parser.add_argument("--carts", type=int, default=100_000, help="The number of carts in the dump.")
+    parser.add_argument("--seed", type=int, default=0, help="The same seed always produces the same dump.")
+    arguments = parser.parse_args(arguments)
+    generate_cart_data_dump(arguments.output_filename, arguments.carts, arguments.seed)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
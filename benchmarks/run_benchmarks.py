@@ -0,0 +1,257 @@
+"""
+@Author = 'Michael Stanley'
+
+Runs the loader stages against synthetic Cart Data Dumps from generate_cart_data_dump, and records the throughput 
+(dump rows per second) and the peak memory of each. The same seed always gives the same dumps, and nothing is 
+fetched from the network.
+
+Each stage is timed on its own, with its input prepared beforehand, and the best of --repeat runs is kept. The peak 
+memory is measured by tracemalloc in one more run, since tracing slows the stage down. The results can be saved with 
+--write_baseline, and compared against a saved baseline with --baseline. A stage whose throughput has dropped, or 
+whose peak memory has grown, by more than --tolerance (plus MEMORY_SLACK_MIB) is reported as a regression, and the 
+exit code is 1.
+
+The throughput depends on the machine, so only compare against a baseline from the same machine. The peak memory 
+does not.
+
+Usage: python benchmarks/run_benchmarks.py [--carts NUMBER ...] [--repeat NUMBER] [--stage NAME ...] 
+                                           [--baseline FILENAME] [--write_baseline FILENAME] [--tolerance FRACTION]
+
+============ Change Log ============
+2026-Oct-18 = Created.
+
+============ License ============
+Copyright (C) 2026 Michael Stanley
+
+This file is part of wmul_rivendell.
+
+wmul_rivendell is free software: you can redistribute it and/or modify it
+under the terms of the GNU General Public License as published by the Free
+Software Foundation, either version 3 of the License, or (at your option) any
+later version.
+
+wmul_rivendell is distributed in the hope that it will be useful, but WITHOUT
+ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License along with
+wmul_rivendell. If not, see <https://www.gnu.org/licenses/>.
+"""
+import argparse
+import json
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from pathlib import Path
+from generate_cart_data_dump import generate_cart_data_dump
+from wmul_rivendell.LoadCartDataDump import LoadCartDataDump, RivendellCart, _fix_rivendell_csv_file, \
+    _iter_row_dicts, _iter_text_rows
+
+BASELINE_FORMAT_VERSION = 1
+DEFAULT_NUMBERS_OF_CARTS = [1_000, 10_000, 100_000]
+DEFAULT_TOLERANCE = 0.25
+# Peaks of a few hundred KiB vary by more than the tolerance from run to run.
+MEMORY_SLACK_MIB = 1.0
+
+
+def _make_cart_loader(rivendell_cart_data_filename, **options):
+    return LoadCartDataDump(
+        rivendell_cart_data_filename=rivendell_cart_data_filename,
+        excluded_group_list=[],
+        include_macros=True,
+        include_all_cuts=True,
+        **options
+    )
+
+
+def _read_rows(rivendell_cart_data_filename):
+    with open(rivendell_cart_data_filename, newline="", mode="rt", errors="replace") as rivendell_source_file:
+        return list(_iter_text_rows(rivendell_source_file))
+
+
+# Each stage takes the dump's filename and returns a function that runs the stage and returns the number of dump rows 
+# that it handled. Whatever the stage needs, other than the dump itself, is prepared before the function is returned, 
+# so that it is not timed.
+
+def _repair_lines(rivendell_cart_data_filename):
+    def run():
+        with open(rivendell_cart_data_filename, newline="", mode="rt", errors="replace") as rivendell_source_file:
+            # Less the header.
+            return sum(1 for _ in _fix_rivendell_csv_file(rivendell_source_file)) - 1
+    return run
+
+
+def _csv_rows(rivendell_cart_data_filename):
+    def run():
+        return len(_read_rows(rivendell_cart_data_filename)) - 1
+    return run
+
+
+def _from_dict(rivendell_cart_data_filename):
+    row_dicts = list(_iter_row_dicts(iter(_read_rows(rivendell_cart_data_filename))))
+
+    def run():
+        interned_values = {}
+        rivendell_carts = [RivendellCart.from_dict(row_dict, interned_values) for row_dict in row_dicts]
+        return len(rivendell_carts)
+    return run
+
+
+def _trusted_records(rivendell_cart_data_filename):
+    rows = _read_rows(rivendell_cart_data_filename)
+    cart_loader = _make_cart_loader(rivendell_cart_data_filename, trusted_dump=True)
+
+    def run():
+        return len(list(cart_loader._iter_trusted_records(iter(rows))))
+    return run
+
+
+def _remove_extra_cuts(rivendell_cart_data_filename):
+    cart_loader = _make_cart_loader(rivendell_cart_data_filename)
+    rivendell_carts = cart_loader.load_carts()
+
+    def run():
+        list(cart_loader._remove_extra_cuts(rivendell_carts))
+        return len(rivendell_carts)
+    return run
+
+
+def _load_carts(rivendell_cart_data_filename, **options):
+    def run():
+        return len(_make_cart_loader(rivendell_cart_data_filename, **options).load_carts())
+    return run
+
+
+def _load_cart_table(rivendell_cart_data_filename):
+    def run():
+        return len(_make_cart_loader(rivendell_cart_data_filename).load_cart_table())
+    return run
+
+
+STAGES = {
+    "repair_lines": _repair_lines,
+    "csv_rows": _csv_rows,
+    "from_dict": _from_dict,
+    "trusted_records": _trusted_records,
+    "remove_extra_cuts": _remove_extra_cuts,
+    "load_carts_validated": _load_carts,
+    "load_carts_trusted": lambda rivendell_cart_data_filename: _load_carts(rivendell_cart_data_filename, 
+                                                                           trusted_dump=True),
+    "load_cart_table": _load_cart_table,
+}
+
+
+def measure_stage(stage, rivendell_cart_data_filename, repeat):
+    """Returns the number of rows, the best time of repeat runs, and the peak memory in MiB, of one stage."""
+    best_time = None
+    for _ in range(repeat):
+        run = stage(rivendell_cart_data_filename)
+        start = time.perf_counter()
+        number_of_rows = run()
+        elapsed = time.perf_counter() - start
+        best_time = elapsed if best_time is None else min(best_time, elapsed)
+        del run
+
+    run = stage(rivendell_cart_data_filename)
+    tracemalloc.start()
+    run()
+    _, peak_memory = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return number_of_rows, best_time, peak_memory / 2 ** 20
+
+
+def run_benchmarks(numbers_of_carts, stage_names, repeat, seed=0):
+    results = {}
+    with tempfile.TemporaryDirectory() as temp_dir:
+        for number_of_carts in numbers_of_carts:
+            rivendell_cart_data_filename = Path(temp_dir) / f"cart_data_dump_{number_of_carts}.csv"
+            generate_cart_data_dump(rivendell_cart_data_filename, number_of_carts, seed)
+            results[str(number_of_carts)] = size_results = {}
+            for stage_name in stage_names:
+                number_of_rows, elapsed, peak_mib = measure_stage(
+                    STAGES[stage_name], rivendell_cart_data_filename, repeat
+                )
+                size_results[stage_name] = {
+                    "rows": number_of_rows,
+                    "seconds": round(elapsed, 4),
+                    "rows_per_second": round(number_of_rows / elapsed),
+                    "peak_mib": round(peak_mib, 2)
+                }
+                print(f"{number_of_carts:>9,} carts  {stage_name:<22} {number_of_rows:>9,} rows  {elapsed:8.3f}s  "
+                      f"{number_of_rows / elapsed:>11,.0f} rows/s  {peak_mib:8.1f} MiB peak", flush=True)
+            rivendell_cart_data_filename.unlink()
+    return results
+
+
+def compare_to_baseline(results, baseline_results, tolerance):
+    """Prints each stage's change from the baseline, and returns the regressions. Stages or sizes that are only in one 
+    of them are skipped."""
+    regressions = []
+    for number_of_carts, size_results in results.items():
+        for stage_name, result in size_results.items():
+            baseline = baseline_results.get(number_of_carts, {}).get(stage_name)
+            if baseline is None:
+                continue
+            throughput_ratio = result["rows_per_second"] / baseline["rows_per_second"]
+            memory_ratio = result["peak_mib"] / baseline["peak_mib"] if baseline["peak_mib"] else 1.0
+            problems = []
+            if throughput_ratio < 1 - tolerance:
+                problems.append("throughput")
+            if result["peak_mib"] > baseline["peak_mib"] * (1 + tolerance) + MEMORY_SLACK_MIB:
+                problems.append("peak memory")
+            print(f"{int(number_of_carts):>9,} carts  {stage_name:<22} throughput {throughput_ratio:6.2f}x  "
+                  f"peak memory {memory_ratio:6.2f}x  {'REGRESSION: ' + ', '.join(problems) if problems else 'ok'}")
+            if problems:
+                regressions.append((number_of_carts, stage_name, problems))
+    return regressions
+
+
+def _machine():
+    return {"python": platform.python_version(), "platform": platform.platform(), "processor": platform.processor()}
+
+
+def main(arguments=None):
+    parser = argparse.ArgumentParser(description="Benchmarks the Cart Data Dump loader stages.")
+    parser.add_argument("--carts", type=int, nargs="+", default=DEFAULT_NUMBERS_OF_CARTS,
+                        help="The numbers of carts in the synthetic dumps.")
+    parser.add_argument("--stage", choices=list(STAGES), nargs="+", default=list(STAGES), 
+                        help="The stages to run. Defaults to all of them.")
+    parser.add_argument("--repeat", type=int, default=3, help="The number of timed runs of each stage.")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--baseline", type=Path, help="A baseline file to compare the results against.")
+    parser.add_argument("--write_baseline", type=Path, help="Save the results to this baseline file.")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE,
+                        help="The fraction by which a stage may get slower, or use more memory, before it is reported "
+                        "as a regression.")
+    arguments = parser.parse_args(arguments)
+
+    results = run_benchmarks(arguments.carts, arguments.stage, arguments.repeat, arguments.seed)
+
+    if arguments.write_baseline is not None:
+        baseline_contents = {
+            "format_version": BASELINE_FORMAT_VERSION, 
+            "seed": arguments.seed, 
+            "machine": _machine(), 
+            "results": results
+        }
+        arguments.write_baseline.write_text(json.dumps(baseline_contents, indent=2) + "\n")
+
+    if arguments.baseline is None:
+        return 0
+    baseline_contents = json.loads(arguments.baseline.read_text())
+    if baseline_contents.get("format_version") != BASELINE_FORMAT_VERSION or \
+            baseline_contents.get("seed") != arguments.seed:
+        print(f"{arguments.baseline} was made with a different format or seed, and can not be compared.")
+        return 2
+    if baseline_contents.get("machine") != _machine():
+        print(f"{arguments.baseline} was made on a different machine, the throughput may not be comparable.")
+    regressions = compare_to_baseline(results, baseline_contents["results"], arguments.tolerance)
+    print(f"{len(regressions)} regressions.")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,196 @@
+"""
+@Author = 'Michael Stanley'
+
+An in-memory index of loaded carts, for looking carts up without scanning the whole list. It has a hash index by cart 
+number and cut number, secondary indexes by group, artist, and scheduler code, and a sorted array of cart numbers for 
+range queries.
+
+============ Change Log ============
+2026-Oct-18 = Created.
+              A cut number that is empty or not a number, such as that of a cart without cuts, is indexed as 0.
+
+============ License ============
+Copyright (C) 2026 Michael Stanley
+
+This file is part of wmul_rivendell.
+
+wmul_rivendell is free software: you can redistribute it and/or modify it
+under the terms of the GNU General Public License as published by the Free
+Software Foundation, either version 3 of the License, or (at your option) any
+later version.
+
+wmul_rivendell is distributed in the hope that it will be useful, but WITHOUT
+ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License along with
+wmul_rivendell. If not, see <https://www.gnu.org/licenses/>.
+"""
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass
+
+import wmul_logger
+
+from wmul_rivendell.LoadCartDataDump import CartTable
+from wmul_rivendell.SchedulerCodes import split_sched_codes
+
+_logger = wmul_logger.get_logger()
+
+
+def _number_key(number) -> int:
+    """Cart and cut numbers are kept as strings, and may be given with or without leading zeros. A number that is 
+    empty or not a number, such as the cut number of a cart without cuts, is 0."""
+    try:
+        return int(number)
+    except (TypeError, ValueError):
+        return 0
+
+
+def _text_key(text: str | None) -> str:
+    """Groups and artists are matched without regard to case or surrounding whitespace."""
+    return (text or "").strip().casefold()
+
+
+@dataclass
+class CartIndex:
+    """carts are the indexed carts, in the order in which they were loaded. They may be RivendellCarts, 
+    RivendellCartRecords, or projected records, as long as they have the cart_number, cut_number, group_name, artist, 
+    and sched_codes fields. The indexes hold the positions of the carts in carts, in order."""
+    carts: list
+    positions_by_cut: dict[tuple[int, int], int]
+    positions_by_group: dict[str, list[int]]
+    positions_by_artist: dict[str, list[int]]
+    positions_by_sched_code: dict[str, list[int]]
+    # The cart number of every cut, sorted, and the position of each of those cuts in carts.
+    sorted_cart_numbers: list[int]
+    sorted_positions: list[int]
+
+    @classmethod
+    def from_carts(cls, rivendell_carts):
+        carts = list(rivendell_carts)
+        positions_by_cut = {}
+        positions_by_group = {}
+        positions_by_artist = {}
+        positions_by_sched_code = {}
+        split_codes = {}
+        duplicate_cuts = 0
+        for position, cart in enumerate(carts):
+            cut_key = (_number_key(cart.cart_number), _number_key(cart.cut_number))
+            if positions_by_cut.setdefault(cut_key, position) != position:
+                duplicate_cuts += 1
+            positions_by_group.setdefault(_text_key(cart.group_name), []).append(position)
+            positions_by_artist.setdefault(_text_key(cart.artist), []).append(position)
+            # Most carts share their sched_codes with many others, so each distinct string is only split once.
+            codes = split_codes.get(cart.sched_codes)
+            if codes is None:
+                codes = split_codes[cart.sched_codes] = split_sched_codes(cart.sched_codes)
+            for code in codes:
+                positions_by_sched_code.setdefault(code, []).append(position)
+        if duplicate_cuts:
+            _logger.warning(f"{duplicate_cuts} cuts have the same cart number and cut number as an earlier cut. Only "
+                            f"the earliest is found by get.")
+
+        # sorted is stable, so the cuts of each cart stay in the order in which they were loaded.
+        sorted_positions = sorted(range(len(carts)), key=lambda position: _number_key(carts[position].cart_number))
+        sorted_cart_numbers = [_number_key(carts[position].cart_number) for position in sorted_positions]
+        return cls(
+            carts=carts,
+            positions_by_cut=positions_by_cut,
+            positions_by_group=positions_by_group,
+            positions_by_artist=positions_by_artist,
+            positions_by_sched_code=positions_by_sched_code,
+            sorted_cart_numbers=sorted_cart_numbers,
+            sorted_positions=sorted_positions
+        )
+
+    @classmethod
+    def from_cart_table(cls, cart_table: CartTable):
+        return cls.from_carts(cart_table.to_records())
+
+    def __len__(self):
+        return len(self.carts)
+
+    def get(self, cart_number, cut_number):
+        """Returns the cut cut_number of cart cart_number, or None if there is no such cut."""
+        position = self.positions_by_cut.get((_number_key(cart_number), _number_key(cut_number)))
+        return None if position is None else self.carts[position]
+
+    def _positions_in_range(self, first_cart_number=None, last_cart_number=None) -> list[int]:
+        start = 0 if first_cart_number is None else bisect_left(self.sorted_cart_numbers, 
+                                                                _number_key(first_cart_number))
+        end = len(self.sorted_cart_numbers) if last_cart_number is None else \
+            bisect_right(self.sorted_cart_numbers, _number_key(last_cart_number))
+        return self.sorted_positions[start:end]
+
+    def in_range(self, first_cart_number=None, last_cart_number=None) -> list:
+        """Returns every cut of the carts numbered from first_cart_number to last_cart_number, inclusive, in order of 
+        cart number. Either end may be None, for no limit."""
+        return [self.carts[position] for position in self._positions_in_range(first_cart_number, last_cart_number)]
+
+    def cuts_of(self, cart_number) -> list:
+        """Returns every cut of cart cart_number."""
+        return self.in_range(cart_number, cart_number)
+
+    def in_group(self, group_name: str) -> list:
+        return [self.carts[position] for position in self.positions_by_group.get(_text_key(group_name), [])]
+
+    def by_artist(self, artist: str) -> list:
+        return [self.carts[position] for position in self.positions_by_artist.get(_text_key(artist), [])]
+
+    def with_sched_code(self, sched_code: str) -> list:
+        return [self.carts[position] for position in self.positions_by_sched_code.get(sched_code, [])]
+
+    def find(self, cart_number=None, cut_number=None, first_cart_number=None, last_cart_number=None, 
+             group_name: str | None = None, artist: str | None = None, sched_codes=()) -> list:
+        """Returns the carts that match every one of the given criteria, in the order in which they were loaded. 
+        cut_number needs cart_number. The carts must have every one of the sched_codes. With no criteria, every cart 
+        is returned."""
+        if cut_number is not None and cart_number is None:
+            raise ValueError("A cut number can only be looked up along with its cart number.")
+        # Each criterion is the positions of the carts that meet it, from an index, and a test of a single cart.
+        criteria = []
+        if cut_number is not None:
+            cut_key = (_number_key(cart_number), _number_key(cut_number))
+            position = self.positions_by_cut.get(cut_key)
+            criteria.append((
+                [] if position is None else [position],
+                lambda cart: (_number_key(cart.cart_number), _number_key(cart.cut_number)) == cut_key
+            ))
+        elif cart_number is not None:
+            criteria.append(self._range_criterion(cart_number, cart_number))
+        if first_cart_number is not None or last_cart_number is not None:
+            criteria.append(self._range_criterion(first_cart_number, last_cart_number))
+        if group_name is not None:
+            group_key = _text_key(group_name)
+            criteria.append((
+                self.positions_by_group.get(group_key, []), lambda cart: _text_key(cart.group_name) == group_key
+            ))
+        if artist is not None:
+            artist_key = _text_key(artist)
+            criteria.append((
+                self.positions_by_artist.get(artist_key, []), lambda cart: _text_key(cart.artist) == artist_key
+            ))
+        if sched_codes:
+            required_codes = set(sched_codes)
+            criteria.append((
+                min((self.positions_by_sched_code.get(code, []) for code in required_codes), key=len),
+                lambda cart: required_codes <= set(split_sched_codes(cart.sched_codes))
+            ))
+
+        if not criteria:
+            return list(self.carts)
+        # Only the carts found by the most selective index are tested against the other criteria.
+        positions, _ = min(criteria, key=lambda criterion: len(criterion[0]))
+        tests = [test for _, test in criteria]
+        carts = self.carts
+        return [carts[position] for position in sorted(positions) if all(test(carts[position]) for test in tests)]
+
+    def _range_criterion(self, first_cart_number, last_cart_number):
+        first_key = None if first_cart_number is None else _number_key(first_cart_number)
+        last_key = None if last_cart_number is None else _number_key(last_cart_number)
+
+        def is_in_range(cart):
+            cart_key = _number_key(cart.cart_number)
+            return (first_key is None or first_key <= cart_key) and (last_key is None or cart_key <= last_key)
+
+        return self._positions_in_range(first_cart_number, last_cart_number), is_in_range
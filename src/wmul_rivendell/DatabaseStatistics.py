@@ -4,6 +4,28 @@
 This script takes the "Cart Data Dump (CSV)" from RD Library and generates statistics about each group.
 
 ============ Change Log ============
+2026-Oct-18 = Accept a CartTable as rivendell_carts. RivendellGroupStatistics accepts the lengths of the songs in the 
+              group as a NumPy array.
+
+              Add calculate_all_group_statistics, which calculates the statistics of every group at once, from one 
+              array of lengths and one array of group codes, with the same results as RivendellGroupStatistics. 
+              DatabaseStatistics uses it instead of calculating each group on its own.
+
+              Add DatabaseStatistics.statistics_workers, which spreads the groups over a process pool.
+
+              Add LengthHistograms, which counts the songs of each length in each group as the carts stream past, so 
+              that the statistics can be calculated without holding the carts in memory. Accept a LengthHistograms 
+              as rivendell_carts.
+
+              Add DatabaseStatistics.statistics_cache. The statistics of the groups that are unchanged since an 
+              earlier run are taken from the StatisticsCache instead of being calculated again.
+
+              Add sweep_all_group_statistics and DatabaseStatistics.stats_limits_grid, which calculate the statistics 
+              for many StatisticsLimits in one pass and write one table for each.
+
+              Leave out the carts whose length_in_seconds is UNPARSEABLE_LENGTH_IN_SECONDS, as a trusted load gives 
+              a LENGTH that cannot be parsed.
+
 2025-Jun-18 = Make zero lower bound for outliers.
               Make the process of identifying out of bounds songs more straight-forward. 
               Add adjusted mean for the mean after the outliers and out-of-bounds songs have been removed.
@@ -51,7 +73,7 @@ This script takes the "Cart Data Dump (CSV)" from RD Library and generates stati
 2025-Jan-03 = Created.
 
 ============ License ============
-Copyright (C) 2025 Michael Stanley
+Copyright (C) 2025-2026 Michael Stanley
 
 This file is part of wmul_rivendell.
 
@@ -70,10 +92,13 @@ wmul_rivendell. If not, see <https://www.gnu.org/licenses/>.
 import math
 import numpy as np
 import pandas as pd
-from collections import defaultdict
-from dataclasses import dataclass
+from collections import Counter, defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
 from datetime import timedelta
 from pathlib import Path
+from wmul_rivendell.LoadCartDataDump import CartTable, UNPARSEABLE_LENGTH_IN_SECONDS
+from wmul_rivendell.StatisticsCache import StatisticsCache, group_key
 
 import wmul_logger
 
@@ -102,10 +127,14 @@ class StatisticsLimits:
 
 class RivendellGroupStatistics:
 
-    def __init__(self, group_name: str, songs_in_group: list, stats_limits: StatisticsLimits):
+    def __init__(self, group_name: str, songs_in_group: list | np.ndarray, stats_limits: StatisticsLimits):
+        """songs_in_group is either a list of carts or an array of their lengths in seconds."""
         self.group_name = group_name
         self.stats_limits = stats_limits
-        times_of_this_group = np.array([this_item.length_in_seconds for this_item in songs_in_group])
+        if isinstance(songs_in_group, np.ndarray):
+            times_of_this_group = songs_in_group.copy()
+        else:
+            times_of_this_group = np.array([this_item.length_in_seconds for this_item in songs_in_group])
         times_of_this_group.sort()
         
         self.number_of_songs = times_of_this_group.size
@@ -168,6 +197,16 @@ class RivendellGroupStatistics:
             self.percentage_of_songs_excluded = 0
             self.adjusted_mean = self._nearest_15(self.mean)
     
+    @classmethod
+    def _from_calculated(cls, group_name: str, stats_limits: StatisticsLimits, **statistics):
+        """Creates the statistics of a group from values that were already calculated, by 
+        calculate_all_group_statistics."""
+        group_statistics = cls.__new__(cls)
+        group_statistics.group_name = group_name
+        group_statistics.stats_limits = stats_limits
+        vars(group_statistics).update(statistics)
+        return group_statistics
+
     @staticmethod
     def _nearest_15(input_number):
         input_number = round(input_number)
@@ -229,36 +268,643 @@ def _remove_outliers(times_of_this_group: np.ndarray, stats_limits: StatisticsLi
         return times_of_this_group, 0, _MAX_TIME
 
 
+# Two sums of the same floats, added in a different order, can differ in their last few bits. A standard deviation 
+# that is within this relative distance of a rounding or comparison boundary is re-calculated by 
+# RivendellGroupStatistics, so that the result is always the same as its.
+_BOUNDARY_TOLERANCE = 1e-9
+
+
+def _sum_per_group(values: np.ndarray, counts: np.ndarray | None, group_starts: np.ndarray) -> np.ndarray:
+    """The sum of the values of each group, each value counted counts times."""
+    if counts is None:
+        return np.add.reduceat(values, group_starts)
+    return np.add.reduceat(values * counts, group_starts)
+
+
+def _population_stdev_per_group(times: np.ndarray, counts: np.ndarray | None, included: np.ndarray, 
+                                means: np.ndarray, numbers_included: np.ndarray, group_starts: np.ndarray, 
+                                group_entries: np.ndarray) -> np.ndarray:
+    """The population standard deviation of the included times of each group, like np.ndarray.std."""
+    deviations = times - np.repeat(means, group_entries)
+    squared_deviations = np.where(included, deviations * deviations, 0.0)
+    return np.sqrt(_sum_per_group(squared_deviations, counts, group_starts) / numbers_included)
+
+
+def _percentile_of_sorted_groups(times: np.ndarray, counts: np.ndarray | None, group_starts: np.ndarray, 
+                                 group_sizes: np.ndarray, quantile: float) -> np.ndarray:
+    """np.percentile, with the default linear method, of each group of the sorted times."""
+    virtual_indexes = group_sizes * quantile + (1 - quantile) - 1
+    previous_indexes = np.floor(virtual_indexes)
+    gamma = virtual_indexes - previous_indexes
+    previous_indexes = previous_indexes.astype(np.int64)
+    next_indexes = np.minimum(previous_indexes + 1, group_sizes - 1)
+    if counts is None:
+        previous_positions = group_starts + previous_indexes
+        next_positions = group_starts + next_indexes
+    else:
+        # The time of the song with a given index in its group is that of the first entry whose songs, with those 
+        # of every entry before it, are more than the index.
+        cumulative_counts = np.cumsum(counts)
+        songs_before_group = cumulative_counts[group_starts] - counts[group_starts]
+        previous_positions = np.searchsorted(cumulative_counts, songs_before_group + previous_indexes, side="right")
+        next_positions = np.searchsorted(cumulative_counts, songs_before_group + next_indexes, side="right")
+    below = times[previous_positions].astype(np.float64)
+    above = times[next_positions].astype(np.float64)
+    difference = above - below
+    return np.where(gamma >= 0.5, above - difference * (1 - gamma), below + difference * gamma)
+
+
+def _nearest_15_of_each(input_numbers: np.ndarray) -> np.ndarray:
+    """RivendellGroupStatistics._nearest_15 of each of the input_numbers."""
+    input_numbers = np.rint(input_numbers)
+    mod_15 = input_numbers % 15
+    return np.where(mod_15 < 8, input_numbers - mod_15, input_numbers + (15 - mod_15))
+
+
+def _is_near(values: np.ndarray, boundaries: np.ndarray | float) -> np.ndarray:
+    return np.abs(values - boundaries) <= _BOUNDARY_TOLERANCE * np.maximum(np.abs(values), 1)
+
+
+def _is_near_half(values: np.ndarray) -> np.ndarray:
+    return _is_near(values, np.floor(values) + 0.5)
+
+
+@dataclass
+class _SortedGroups:
+    """Every song, sorted by group and then by length, with one sort of a combined key. With counts, an entry of 
+    times can stand for several songs. group_codes, group_starts, and group_ends have one value for each group."""
+    times: np.ndarray
+    counts: np.ndarray | None
+    sorted_keys: np.ndarray
+    key_base: int
+    shortest_length: int
+    group_codes: np.ndarray
+    group_starts: np.ndarray
+    group_ends: np.ndarray
+
+    @classmethod
+    def sort(cls, group_codes: np.ndarray, lengths: np.ndarray, counts: np.ndarray | None) -> "_SortedGroups | None":
+        """None if there are no songs."""
+        lengths = np.asarray(lengths, dtype=np.int64)
+        group_codes = np.asarray(group_codes, dtype=np.int64)
+        if counts is not None:
+            counts = np.asarray(counts, dtype=np.int64)
+            has_songs = counts > 0
+            lengths, group_codes, counts = lengths[has_songs], group_codes[has_songs], counts[has_songs]
+        if lengths.size == 0:
+            return None
+
+        shortest_length = int(lengths.min())
+        key_base = int(lengths.max() - shortest_length) + 1
+        keys = group_codes * key_base + (lengths - shortest_length)
+        if counts is None:
+            sorted_keys = np.sort(keys)
+        else:
+            order = np.argsort(keys)
+            sorted_keys = keys[order]
+            counts = counts[order]
+        sorted_codes = sorted_keys // key_base
+        times = sorted_keys - sorted_codes * key_base + shortest_length
+
+        group_starts = np.flatnonzero(np.concatenate(([True], sorted_codes[1:] != sorted_codes[:-1])))
+        group_ends = np.append(group_starts[1:], times.size)
+        return cls(
+            times=times, counts=counts, sorted_keys=sorted_keys, key_base=key_base, shortest_length=shortest_length, 
+            group_codes=sorted_codes[group_starts], group_starts=group_starts, group_ends=group_ends
+        )
+
+    def songs_of_group(self, index: int) -> np.ndarray:
+        start, end = self.group_starts[index], self.group_ends[index]
+        if self.counts is None:
+            return self.times[start:end]
+        return np.repeat(self.times[start:end], self.counts[start:end])
+
+    def first_entries_at_least(self, thresholds: np.ndarray) -> np.ndarray:
+        """The index of the first entry of each group whose time is at least its threshold, or the end of the group 
+        if there is none, by a binary search of the sorted keys."""
+        offsets = np.clip(np.nan_to_num(thresholds) - self.shortest_length, 0, self.key_base).astype(np.int64)
+        return np.searchsorted(self.sorted_keys, self.group_codes * self.key_base + offsets, side="left")
+
+
+def _needs_recalculation(stats_limits: StatisticsLimits, large_enough: np.ndarray, group_stdevs: np.ndarray, 
+                         stdevs: np.ndarray, has_bounds: np.ndarray, unrounded_lower_bounds: np.ndarray, 
+                         unrounded_upper_bounds: np.ndarray, not_outlier_counts: np.ndarray, 
+                         within_counts: np.ndarray) -> np.ndarray:
+    """The groups that RivendellGroupStatistics calculates on its own: those where a standard deviation is too near a 
+    boundary to be sure of which side of it RivendellGroupStatistics is on, and those that have no songs left to 
+    average, for which RivendellGroupStatistics raises an error."""
+    return (
+        (large_enough & _is_near(group_stdevs, stats_limits.smallest_stdev)) |
+        _is_near(stdevs, stats_limits.smallest_stdev) | _is_near_half(stdevs) |
+        (has_bounds & (
+            _is_near(unrounded_lower_bounds, 0) | _is_near_half(unrounded_lower_bounds) | 
+            _is_near_half(unrounded_upper_bounds)
+        )) |
+        (not_outlier_counts == 0) | (has_bounds & (within_counts == 0))
+    )
+
+
+def _assemble_group_statistics(group_names: list[str], stats_limits: StatisticsLimits, sorted_groups: _SortedGroups, 
+                               recalculated: np.ndarray, group_sizes: np.ndarray, outlier_lower_limits: np.ndarray, 
+                               outlier_upper_limits: np.ndarray, means: np.ndarray, stdevs: np.ndarray, 
+                               has_bounds: np.ndarray, lower_bounds: np.ndarray, upper_bounds: np.ndarray, 
+                               numbers_shorter: np.ndarray, numbers_longer: np.ndarray, 
+                               adjusted_means: np.ndarray) -> dict[str, RivendellGroupStatistics]:
+    """The RivendellGroupStatistics of each group, from the statistics calculated for all of them."""
+    times = sorted_groups.times
+    shortest = times[sorted_groups.group_starts]
+    longest = times[sorted_groups.group_ends - 1]
+    adjusted_means = _nearest_15_of_each(np.where(recalculated, 0, adjusted_means))
+
+    statistics_per_group = dict()
+    for index, group_code in enumerate(sorted_groups.group_codes.tolist()):
+        group_name = group_names[group_code]
+        if recalculated[index]:
+            statistics_per_group[group_name] = RivendellGroupStatistics(
+                group_name=group_name, songs_in_group=sorted_groups.songs_of_group(index), stats_limits=stats_limits
+            )
+            continue
+        number_of_songs = int(group_sizes[index])
+        if has_bounds[index]:
+            number_excluded = int(numbers_shorter[index] + numbers_longer[index])
+            percentage_of_songs_excluded = round((number_excluded / number_of_songs) * 100, 1)
+        else:
+            percentage_of_songs_excluded = 0
+        statistics_per_group[group_name] = RivendellGroupStatistics._from_calculated(
+            group_name=group_name,
+            stats_limits=stats_limits,
+            number_of_songs=number_of_songs,
+            shortest_song_length=shortest[index],
+            longest_song_length=longest[index],
+            outlier_limits=(round(outlier_lower_limits[index]), round(outlier_upper_limits[index])),
+            mean=int(means[index]),
+            stdev=int(np.rint(stdevs[index])),
+            lower_bound=int(lower_bounds[index]),
+            upper_bound=int(upper_bounds[index]),
+            number_of_songs_shorter_than_lower_bound=int(numbers_shorter[index]),
+            number_of_songs_longer_than_upper_bound=int(numbers_longer[index]),
+            percentage_of_songs_excluded=percentage_of_songs_excluded,
+            adjusted_mean=int(adjusted_means[index])
+        )
+    return statistics_per_group
+
+
+@np.errstate(invalid="ignore", divide="ignore")
+def calculate_all_group_statistics(group_names: list[str], group_codes: np.ndarray, lengths: np.ndarray, 
+                                   stats_limits: StatisticsLimits, 
+                                   counts: np.ndarray | None = None) -> dict[str, RivendellGroupStatistics]:
+    """Calculates the statistics of every group at once. lengths are the lengths, in whole seconds, of every song, 
+    and group_codes are the index in group_names of the group of each of those songs. If counts is given, each 
+    length stands for that many songs of its group, as in a LengthHistograms.
+    
+    The results are the same as those of RivendellGroupStatistics for each group. Rather than looping over the songs 
+    of each group, the songs are sorted by group and length, and every statistic is calculated for all of the groups 
+    by whole-array operations over the sorted songs."""
+    sorted_groups = _SortedGroups.sort(group_codes, lengths, counts)
+    if sorted_groups is None:
+        return dict()
+    times, counts = sorted_groups.times, sorted_groups.counts
+    group_starts, group_ends = sorted_groups.group_starts, sorted_groups.group_ends
+    group_entries = group_ends - group_starts
+    group_sizes = group_entries if counts is None else _sum_per_group(counts, None, group_starts)
+    all_songs = np.ones(times.size, dtype=bool)
+
+    # _remove_outliers
+    group_means = _sum_per_group(times, counts, group_starts) / group_sizes
+    group_stdevs = _population_stdev_per_group(
+        times, counts, all_songs, group_means, group_sizes, group_starts, group_entries
+    )
+    large_enough = group_sizes > stats_limits.minimum_population_for_outliers
+    removes_outliers = large_enough & (group_stdevs >= stats_limits.smallest_stdev)
+    q25 = _percentile_of_sorted_groups(times, counts, group_starts, group_sizes, 0.25)
+    q75 = _percentile_of_sorted_groups(times, counts, group_starts, group_sizes, 0.75)
+    iqr_times_1_point_5 = (q75 - q25) * 1.5
+    outlier_lower_limits = np.where(removes_outliers, np.maximum(q25 - iqr_times_1_point_5, 0), 0)
+    outlier_upper_limits = np.where(removes_outliers, q75 + iqr_times_1_point_5, _MAX_TIME)
+    not_outliers = (
+        ~np.repeat(removes_outliers, group_entries) |
+        (
+            (np.repeat(outlier_lower_limits, group_entries) < times) & 
+            (times < np.repeat(outlier_upper_limits, group_entries))
+        )
+    )
+
+    # Mean and standard deviation of the songs that are not outliers. The sums of whole seconds are exact, so the 
+    # means are exactly those of np.ndarray.mean.
+    not_outlier_counts = _sum_per_group(not_outliers.astype(np.int64), counts, group_starts)
+    unrounded_means = _sum_per_group(np.where(not_outliers, times, 0), counts, group_starts) / not_outlier_counts
+    means = np.rint(unrounded_means)
+    stdevs = _population_stdev_per_group(
+        times, counts, not_outliers, unrounded_means, not_outlier_counts, group_starts, group_entries
+    )
+    has_bounds = stdevs > stats_limits.smallest_stdev
+
+    # Bounds
+    unrounded_lower_bounds = means - (stats_limits.lower_bound_multiple * stdevs)
+    unrounded_upper_bounds = means + (stats_limits.upper_bound_multiple * stdevs)
+    lower_bounds = np.where(
+        has_bounds & (unrounded_lower_bounds >= 0), _nearest_15_of_each(unrounded_lower_bounds), 0
+    )
+    upper_bounds = np.where(has_bounds, _nearest_15_of_each(unrounded_upper_bounds), _MAX_TIME)
+    shorter_than_lower_bound = times < np.repeat(lower_bounds, group_entries)
+    longer_than_upper_bound = ~shorter_than_lower_bound & (times > np.repeat(upper_bounds, group_entries))
+    within_bounds = ~(shorter_than_lower_bound | longer_than_upper_bound)
+    numbers_shorter = np.where(
+        has_bounds, _sum_per_group(shorter_than_lower_bound.astype(np.int64), counts, group_starts), 0
+    )
+    numbers_longer = np.where(
+        has_bounds, _sum_per_group(longer_than_upper_bound.astype(np.int64), counts, group_starts), 0
+    )
+    within_counts = _sum_per_group(within_bounds.astype(np.int64), counts, group_starts)
+    within_means = _sum_per_group(np.where(within_bounds, times, 0), counts, group_starts) / within_counts
+    adjusted_means = np.where(has_bounds, within_means, means)
+
+    recalculated = _needs_recalculation(
+        stats_limits, large_enough, group_stdevs, stdevs, has_bounds, unrounded_lower_bounds, unrounded_upper_bounds, 
+        not_outlier_counts, within_counts
+    )
+    return _assemble_group_statistics(
+        group_names=group_names, stats_limits=stats_limits, sorted_groups=sorted_groups, recalculated=recalculated, 
+        group_sizes=group_sizes, outlier_lower_limits=outlier_lower_limits, 
+        outlier_upper_limits=outlier_upper_limits, means=means, stdevs=stdevs, has_bounds=has_bounds, 
+        lower_bounds=lower_bounds, upper_bounds=upper_bounds, numbers_shorter=numbers_shorter, 
+        numbers_longer=numbers_longer, adjusted_means=adjusted_means
+    )
+
+
+def _population_stdev_from_sums(numbers: np.ndarray, sums: np.ndarray, sums_of_squares: np.ndarray) -> np.ndarray:
+    """The population standard deviation of each group, from the number of its songs, the sum of their lengths, and 
+    the sum of their squares. The variance, (n * sum of squares - sum ** 2) / n ** 2, is worked out with Python's 
+    exact integers, so that it does not lose precision to cancellation, and is exactly 0 when every length is the 
+    same."""
+    variances = [
+        (number * sum_of_squares - total * total) / (number * number) if number else math.nan
+        for number, total, sum_of_squares in zip(numbers.tolist(), sums.tolist(), sums_of_squares.tolist())
+    ]
+    return np.sqrt(np.array(variances, dtype=np.float64))
+
+
+@np.errstate(invalid="ignore", divide="ignore")
+def sweep_all_group_statistics(group_names: list[str], group_codes: np.ndarray, lengths: np.ndarray, 
+                               stats_limits_grid: list[StatisticsLimits], 
+                               counts: np.ndarray | None = None) -> list[dict[str, RivendellGroupStatistics]]:
+    """Calculates the statistics of every group for each StatisticsLimits of stats_limits_grid, with the same 
+    arguments as calculate_all_group_statistics. Returns the statistics per group of each StatisticsLimits, in the 
+    order of stats_limits_grid.
+
+    The songs are sorted, and the statistics that do not depend on the limits are calculated, once. Since the songs 
+    of a group are sorted, those between any two lengths are a run of entries, found by binary search, and their 
+    number, sum of lengths, and sum of squared lengths are differences of prefix sums. So each StatisticsLimits takes 
+    a few operations per group, rather than a pass over every song."""
+    sorted_groups = _SortedGroups.sort(group_codes, lengths, counts)
+    if sorted_groups is None:
+        return [dict() for _ in stats_limits_grid]
+    times, counts = sorted_groups.times, sorted_groups.counts
+    group_starts, group_ends = sorted_groups.group_starts, sorted_groups.group_ends
+    group_entries = group_ends - group_starts
+    songs_per_entry = np.ones(times.size, dtype=np.int64) if counts is None else counts
+    # The number of songs, the sum of their lengths, and the sum of their squared lengths, before each entry. Exact, 
+    # in 64 bits, for up to a billion songs.
+    songs_before = np.concatenate(([0], np.cumsum(songs_per_entry)))
+    sums_before = np.concatenate(([0], np.cumsum(times * songs_per_entry)))
+    squares_before = np.concatenate(([0], np.cumsum(times * times * songs_per_entry)))
+
+    def songs_between(firsts, lasts):
+        return songs_before[lasts] - songs_before[firsts]
+
+    group_sizes = songs_between(group_starts, group_ends)
+    group_means = _sum_per_group(times, counts, group_starts) / group_sizes
+    group_stdevs = _population_stdev_per_group(
+        times, counts, np.ones(times.size, dtype=bool), group_means, group_sizes, group_starts, group_entries
+    )
+    q25 = _percentile_of_sorted_groups(times, counts, group_starts, group_sizes, 0.25)
+    q75 = _percentile_of_sorted_groups(times, counts, group_starts, group_sizes, 0.75)
+    iqr_times_1_point_5 = (q75 - q25) * 1.5
+    iqr_lower_limits = np.maximum(q25 - iqr_times_1_point_5, 0)
+    iqr_upper_limits = q75 + iqr_times_1_point_5
+    # The lengths are whole seconds, so those strictly between the outlier limits run from the first entry of at 
+    # least the next whole second above the lower limit, to the last entry below the upper limit.
+    first_above_iqr_lower_limits = sorted_groups.first_entries_at_least(np.floor(iqr_lower_limits) + 1)
+    first_at_iqr_upper_limits = sorted_groups.first_entries_at_least(np.ceil(iqr_upper_limits))
+
+    statistics_per_limits = []
+    for stats_limits in stats_limits_grid:
+        # _remove_outliers
+        large_enough = group_sizes > stats_limits.minimum_population_for_outliers
+        removes_outliers = large_enough & (group_stdevs >= stats_limits.smallest_stdev)
+        outlier_lower_limits = np.where(removes_outliers, iqr_lower_limits, 0)
+        outlier_upper_limits = np.where(removes_outliers, iqr_upper_limits, _MAX_TIME)
+        first_not_outliers = np.where(removes_outliers, first_above_iqr_lower_limits, group_starts)
+        ends_of_not_outliers = np.where(removes_outliers, first_at_iqr_upper_limits, group_ends)
+        ends_of_not_outliers = np.maximum(ends_of_not_outliers, first_not_outliers)
+
+        # Mean and standard deviation of the songs that are not outliers.
+        not_outlier_counts = songs_between(first_not_outliers, ends_of_not_outliers)
+        not_outlier_sums = sums_before[ends_of_not_outliers] - sums_before[first_not_outliers]
+        unrounded_means = not_outlier_sums / not_outlier_counts
+        means = np.rint(unrounded_means)
+        stdevs = _population_stdev_from_sums(
+            not_outlier_counts, not_outlier_sums, 
+            squares_before[ends_of_not_outliers] - squares_before[first_not_outliers]
+        )
+        has_bounds = stdevs > stats_limits.smallest_stdev
+
+        # Bounds. The songs within them run from the first at least the lower bound to the last at most the upper.
+        unrounded_lower_bounds = means - (stats_limits.lower_bound_multiple * stdevs)
+        unrounded_upper_bounds = means + (stats_limits.upper_bound_multiple * stdevs)
+        lower_bounds = np.where(
+            has_bounds & (unrounded_lower_bounds >= 0), _nearest_15_of_each(unrounded_lower_bounds), 0
+        )
+        upper_bounds = np.where(has_bounds, _nearest_15_of_each(unrounded_upper_bounds), _MAX_TIME)
+        first_within_bounds = sorted_groups.first_entries_at_least(lower_bounds)
+        first_longer_than_upper_bounds = np.maximum(
+            sorted_groups.first_entries_at_least(upper_bounds + 1), first_within_bounds
+        )
+        numbers_shorter = np.where(has_bounds, songs_between(group_starts, first_within_bounds), 0)
+        numbers_longer = np.where(has_bounds, songs_between(first_longer_than_upper_bounds, group_ends), 0)
+        within_counts = songs_between(first_within_bounds, first_longer_than_upper_bounds)
+        within_means = (
+            (sums_before[first_longer_than_upper_bounds] - sums_before[first_within_bounds]) / within_counts
+        )
+        adjusted_means = np.where(has_bounds, within_means, means)
+
+        recalculated = _needs_recalculation(
+            stats_limits, large_enough, group_stdevs, stdevs, has_bounds, unrounded_lower_bounds, 
+            unrounded_upper_bounds, not_outlier_counts, within_counts
+        )
+        statistics_per_limits.append(_assemble_group_statistics(
+            group_names=group_names, stats_limits=stats_limits, sorted_groups=sorted_groups, 
+            recalculated=recalculated, group_sizes=group_sizes, outlier_lower_limits=outlier_lower_limits, 
+            outlier_upper_limits=outlier_upper_limits, means=means, stdevs=stdevs, has_bounds=has_bounds, 
+            lower_bounds=lower_bounds, upper_bounds=upper_bounds, numbers_shorter=numbers_shorter, 
+            numbers_longer=numbers_longer, adjusted_means=adjusted_means
+        ))
+    return statistics_per_limits
+
+
+@dataclass
+class LengthHistograms:
+    """The number of songs of each length, in whole seconds, in each group. The carts are added one at a time, as 
+    they are loaded, and then dropped, so the memory used depends on the number of groups and of distinct lengths in 
+    each, not on the number of carts. Histograms of the carts of different files or stations are merged by adding 
+    their counts.
+
+    Since the lengths are whole seconds, the histograms are exact, not an approximation: the statistics calculated 
+    from them are the same as those calculated from the carts themselves."""
+    histograms: dict[str, Counter] = field(default_factory=dict)
+
+    def add(self, group_name: str, length_in_seconds: int, count: int = 1):
+        histogram = self.histograms.get(group_name)
+        if histogram is None:
+            histogram = self.histograms[group_name] = Counter()
+        histogram[length_in_seconds] += count
+
+    def add_carts(self, rivendell_carts) -> "LengthHistograms":
+        """Adds each of rivendell_carts, which may be an iterator, such as that of LoadCartDataDump.iter_carts."""
+        for rivendell_cart in rivendell_carts:
+            length_in_seconds = rivendell_cart.length_in_seconds
+            if length_in_seconds != UNPARSEABLE_LENGTH_IN_SECONDS:
+                self.add(rivendell_cart.group_name, length_in_seconds)
+        return self
+
+    def merge(self, other: "LengthHistograms") -> "LengthHistograms":
+        """Adds the counts of other to these histograms."""
+        for group_name, other_histogram in other.histograms.items():
+            histogram = self.histograms.get(group_name)
+            if histogram is None:
+                histogram = self.histograms[group_name] = Counter()
+            histogram.update(other_histogram)
+        return self
+
+    def number_of_songs(self) -> int:
+        return sum(histogram.total() for histogram in self.histograms.values())
+
+    def to_arrays(self) -> tuple[list[str], np.ndarray, np.ndarray, np.ndarray]:
+        """The group names, and the group code, length, and count of each entry of the histograms, as taken by 
+        calculate_all_group_statistics."""
+        group_names = list(self.histograms)
+        group_codes = np.repeat(
+            np.arange(len(group_names)), [len(histogram) for histogram in self.histograms.values()]
+        )
+        lengths = np.fromiter(
+            (length for histogram in self.histograms.values() for length in histogram.keys()), dtype=np.int64
+        )
+        counts = np.fromiter(
+            (count for histogram in self.histograms.values() for count in histogram.values()), dtype=np.int64
+        )
+        return group_names, group_codes, lengths, counts
+
+    def calculate_statistics(self, stats_limits: StatisticsLimits) -> dict[str, RivendellGroupStatistics]:
+        group_names, group_codes, lengths, counts = self.to_arrays()
+        return calculate_all_group_statistics(
+            group_names=group_names, group_codes=group_codes, lengths=lengths, stats_limits=stats_limits, 
+            counts=counts
+        )
+
+
+def _calculate_batch_statistics(batch):
+    """Calculates the statistics of one batch of groups, in a worker process."""
+    group_names, group_codes, lengths, stats_limits = batch
+    return calculate_all_group_statistics(
+        group_names=group_names, group_codes=group_codes, lengths=lengths, stats_limits=stats_limits
+    )
+
+
+def _split_into_batches(group_names: list[str], lengths_per_group: list[np.ndarray], number_of_batches: int, 
+                        stats_limits: StatisticsLimits) -> list[tuple]:
+    """Splits the groups into batches with about the same number of songs in each, by giving each group, largest 
+    first, to the batch with the fewest songs so far. Each batch is a list of group names and two compact arrays, one 
+    of group codes and one of lengths, which are cheap to send to a worker process. The batches are returned largest 
+    first."""
+    batch_indexes = [[] for _ in range(number_of_batches)]
+    batch_sizes = [0] * number_of_batches
+    for group_index in sorted(range(len(group_names)), key=lambda index: -lengths_per_group[index].size):
+        smallest_batch = batch_sizes.index(min(batch_sizes))
+        batch_indexes[smallest_batch].append(group_index)
+        batch_sizes[smallest_batch] += lengths_per_group[group_index].size
+
+    batches = []
+    for indexes_of_batch in sorted(batch_indexes, key=lambda indexes: -sum(
+            lengths_per_group[index].size for index in indexes)):
+        if not indexes_of_batch:
+            continue
+        group_codes = np.repeat(
+            np.arange(len(indexes_of_batch), dtype=np.int32), 
+            [lengths_per_group[index].size for index in indexes_of_batch]
+        )
+        lengths = np.concatenate([lengths_per_group[index] for index in indexes_of_batch]).astype(np.int32)
+        batches.append(([group_names[index] for index in indexes_of_batch], group_codes, lengths, stats_limits))
+    return batches
+
+
+_CACHED_STATISTICS = (
+    "number_of_songs", "shortest_song_length", "longest_song_length", "outlier_limits", "mean", "stdev", 
+    "lower_bound", "upper_bound", "number_of_songs_shorter_than_lower_bound", "number_of_songs_longer_than_upper_bound", 
+    "percentage_of_songs_excluded", "adjusted_mean"
+)
+
+
+def _to_cached_statistics(group_statistics: RivendellGroupStatistics) -> dict:
+    """The statistics of the group, as plain Python values that can be written as JSON."""
+    cached_statistics = dict()
+    for statistic_name in _CACHED_STATISTICS:
+        value = getattr(group_statistics, statistic_name)
+        if isinstance(value, tuple):
+            value = [limit.item() if isinstance(limit, np.generic) else limit for limit in value]
+        elif isinstance(value, np.generic):
+            value = value.item()
+        cached_statistics[statistic_name] = value
+    return cached_statistics
+
+
+def _from_cached_statistics(group_name: str, stats_limits: StatisticsLimits, 
+                            cached_statistics: dict) -> RivendellGroupStatistics:
+    statistics = {statistic_name: cached_statistics[statistic_name] for statistic_name in _CACHED_STATISTICS}
+    statistics["outlier_limits"] = tuple(statistics["outlier_limits"])
+    return RivendellGroupStatistics._from_calculated(group_name=group_name, stats_limits=stats_limits, **statistics)
+
+
+def _lengths_of_group(songs_in_group) -> np.ndarray:
+    if isinstance(songs_in_group, np.ndarray):
+        return songs_in_group
+    return np.array([this_item.length_in_seconds for this_item in songs_in_group], dtype=np.int64)
+
+
 @dataclass
 class DatabaseStatistics:
-    rivendell_carts: list
+    """statistics_workers is the number of processes over which the groups are spread. The statistics are the same 
+    either way. It does not apply to a LengthHistograms, whose statistics take very little time. 
+    
+    If there is a statistics_cache, only the groups whose lengths have changed since an earlier run with the same 
+    stats_limits are calculated. The others are taken from the cache.
+    
+    If there is a stats_limits_grid, the statistics are calculated for each of its StatisticsLimits, in one pass, 
+    instead of for stats_limits, and the output has one table for each, with its limits. statistics_workers and 
+    statistics_cache do not apply to it."""
+    rivendell_carts: list | CartTable | LengthHistograms
     output_filename: Path
     stats_limits: StatisticsLimits
     write_limits: bool
     write_full_statistics: bool
+    statistics_workers: int = 1
+    statistics_cache: StatisticsCache | None = None
+    stats_limits_grid: list[StatisticsLimits] | None = None
 
     def _organize_by_rivendell_group(self, unorganized_carts):
+        if isinstance(unorganized_carts, LengthHistograms):
+            return unorganized_carts
+        if isinstance(unorganized_carts, CartTable):
+            return unorganized_carts.lengths_by_group()
+
         organized_by_rivendell_group = defaultdict(list)
 
         for rivendell_cart in unorganized_carts:
-            organized_by_rivendell_group[rivendell_cart.group_name].append(rivendell_cart)
+            if rivendell_cart.length_in_seconds != UNPARSEABLE_LENGTH_IN_SECONDS:
+                organized_by_rivendell_group[rivendell_cart.group_name].append(rivendell_cart)
         
         return organized_by_rivendell_group
     
     def _calculate_statistics_per_group(self, organized_carts):
+        if self.statistics_cache is not None:
+            return self._calculate_changed_statistics(organized_carts)
+        return self._calculate_statistics(organized_carts)
+
+    def _calculate_changed_statistics(self, organized_carts):
+        """Takes the statistics of the unchanged groups from the statistics_cache, and calculates the others."""
+        if isinstance(organized_carts, LengthHistograms):
+            group_keys = {
+                group_name: group_key(
+                    np.array(sorted(histogram)), np.array([histogram[length] for length in sorted(histogram)]), 
+                    self.stats_limits
+                )
+                for group_name, histogram in organized_carts.histograms.items()
+            }
+        else:
+            organized_carts = {
+                group_name: _lengths_of_group(songs_in_group) for group_name, songs_in_group in organized_carts.items()
+            }
+            group_keys = {
+                group_name: group_key(*np.unique(lengths_of_group, return_counts=True), self.stats_limits)
+                for group_name, lengths_of_group in organized_carts.items()
+            }
+
+        cached_statistics = self.statistics_cache.load(group_keys.values())
+        changed_group_names = [
+            group_name for group_name, key in group_keys.items() if key not in cached_statistics
+        ]
+        if isinstance(organized_carts, LengthHistograms):
+            changed_carts = LengthHistograms(
+                histograms={group_name: organized_carts.histograms[group_name] for group_name in changed_group_names}
+            )
+        else:
+            changed_carts = {group_name: organized_carts[group_name] for group_name in changed_group_names}
+        calculated_statistics = self._calculate_statistics(changed_carts)
+        self.statistics_cache.store({
+            group_keys[group_name]: _to_cached_statistics(calculated_statistics[group_name]) 
+            for group_name in changed_group_names
+        })
+
+        return {
+            group_name: calculated_statistics[group_name] if group_name in calculated_statistics 
+            else _from_cached_statistics(group_name, self.stats_limits, cached_statistics[key])
+            for group_name, key in group_keys.items()
+        }
+
+    def _calculate_statistics(self, organized_carts):
+        if isinstance(organized_carts, LengthHistograms):
+            _logger.debug(f"Working on {len(organized_carts.histograms)} groups of length histograms")
+            return organized_carts.calculate_statistics(self.stats_limits)
+        _logger.debug(f"Working on {len(organized_carts)} groups")
+        group_names = list(organized_carts)
+        lengths_per_group = [_lengths_of_group(songs_in_group) for songs_in_group in organized_carts.values()]
+        if not lengths_per_group:
+            return dict()
+        number_of_workers = min(self.statistics_workers, len(group_names))
+        if number_of_workers > 1:
+            return self._calculate_statistics_in_parallel(group_names, lengths_per_group, number_of_workers)
+        group_codes = np.repeat(
+            np.arange(len(group_names)), [lengths_of_group.size for lengths_of_group in lengths_per_group]
+        )
+        return calculate_all_group_statistics(
+            group_names=group_names,
+            group_codes=group_codes,
+            lengths=np.concatenate(lengths_per_group),
+            stats_limits=self.stats_limits
+        )
+
+    def _calculate_statistics_in_parallel(self, group_names, lengths_per_group, number_of_workers):
+        batches = _split_into_batches(group_names, lengths_per_group, number_of_workers, self.stats_limits)
+        _logger.debug(f"Calculating the statistics of {len(group_names)} groups in {len(batches)} processes")
         statistics_per_group = dict()
-        for group_name, songs_in_group in organized_carts.items():
-            _logger.debug(f"Working on {group_name}")
-            statistics_per_group[group_name] = RivendellGroupStatistics(
-                group_name=group_name, 
-                songs_in_group=songs_in_group,
-                stats_limits=self.stats_limits
+        with ProcessPoolExecutor(max_workers=number_of_workers) as executor:
+            for statistics_of_batch in executor.map(_calculate_batch_statistics, batches):
+                statistics_per_group.update(statistics_of_batch)
+        # In the same order as when the groups are calculated in one process.
+        return {group_name: statistics_per_group[group_name] for group_name in group_names}
+
+    def _sweep_statistics_limits(self, organized_carts):
+        """The statistics per group for each StatisticsLimits of stats_limits_grid."""
+        if isinstance(organized_carts, LengthHistograms):
+            group_names, group_codes, lengths, counts = organized_carts.to_arrays()
+        else:
+            group_names = list(organized_carts)
+            lengths_per_group = [_lengths_of_group(songs_in_group) for songs_in_group in organized_carts.values()]
+            group_codes = np.repeat(
+                np.arange(len(group_names)), [lengths_of_group.size for lengths_of_group in lengths_per_group]
             )
-        return statistics_per_group
+            lengths = np.concatenate(lengths_per_group) if lengths_per_group else np.empty(0, dtype=np.int64)
+            counts = None
+        _logger.debug(f"Sweeping {len(self.stats_limits_grid)} statistics limits over {len(group_names)} groups")
+        return sweep_all_group_statistics(
+            group_names=group_names, group_codes=group_codes, lengths=lengths, 
+            stats_limits_grid=self.stats_limits_grid, counts=counts
+        )
 
-    def _generate_pandas_data(self, statistics_per_group):
+    def _generate_pandas_data(self, statistics_per_group, stats_limits=None):
+        if stats_limits is None:
+            stats_limits = self.stats_limits
         df_limits = pd.DataFrame(
-            { "Statistics Limits": self.stats_limits.to_pandas_series() }
+            { "Statistics Limits": stats_limits.to_pandas_series() }
         )
         df_limits = df_limits.T
 
@@ -285,17 +931,51 @@ class DatabaseStatistics:
             if self.write_limits:
                 df_limits.to_excel(writer, sheet_name="Limits")
 
+    def _write_sweep_csv(self, statistics_per_limits):
+        """Writes the limits and the table of each StatisticsLimits of stats_limits_grid, one after the other."""
+        with open(str(self.output_filename), newline="", mode="wt", errors="replace") as statistics_output:
+            for stats_limits, statistics_per_group in zip(self.stats_limits_grid, statistics_per_limits):
+                df_limits, df_data = self._generate_pandas_data(
+                    statistics_per_group=statistics_per_group, stats_limits=stats_limits
+                )
+                df_limits.to_csv(statistics_output)
+                df_data.to_csv(statistics_output, index_label="Group Name")
+
+    def _write_sweep_excel(self, statistics_per_limits):
+        """Writes the table of each StatisticsLimits of stats_limits_grid to its own sheet, Data 1, Data 2, and so on, 
+        and the limits of each sheet to the Limits sheet."""
+        with pd.ExcelWriter(self.output_filename) as writer:
+            for number, (stats_limits, statistics_per_group) in enumerate(
+                    zip(self.stats_limits_grid, statistics_per_limits), start=1):
+                _, df_data = self._generate_pandas_data(
+                    statistics_per_group=statistics_per_group, stats_limits=stats_limits
+                )
+                df_data.to_excel(writer, sheet_name=f"Data {number}")
+            df_limits = pd.DataFrame(
+                { f"Data {number}": stats_limits.to_pandas_series() 
+                  for number, stats_limits in enumerate(self.stats_limits_grid, start=1) }
+            )
+            df_limits.T.to_excel(writer, sheet_name="Limits")
+
     def run_script(self):
         _logger.debug(f"Starting DatabaseStatistics.run_script()")
         organized_by_rivendell_group = self._organize_by_rivendell_group(unorganized_carts=self.rivendell_carts)
-        statistics_per_group = self._calculate_statistics_per_group(organized_carts=organized_by_rivendell_group)
+        if self.stats_limits_grid:
+            statistics_per_limits = self._sweep_statistics_limits(organized_carts=organized_by_rivendell_group)
+        else:
+            statistics_per_group = self._calculate_statistics_per_group(organized_carts=organized_by_rivendell_group)
         output_filename = self.output_filename
         if output_filename.exists():
             new_filename = (output_filename.parent / 
                 (output_filename.stem + "_old" + output_filename.suffix))
             new_filename.unlink(missing_ok=True)
             output_filename.rename(new_filename)
-        if output_filename.suffix == '.xlsx':
+        if self.stats_limits_grid:
+            if output_filename.suffix == '.xlsx':
+                self._write_sweep_excel(statistics_per_limits=statistics_per_limits)
+            else:
+                self._write_sweep_csv(statistics_per_limits=statistics_per_limits)
+        elif output_filename.suffix == '.xlsx':
             self._write_excel(statistics_per_group=statistics_per_group)
         else:
             self._write_csv(statistics_per_group=statistics_per_group)
@@ -0,0 +1,216 @@
+"""
+@Author = 'Michael Stanley'
+
+Keeps the parsed contents of Cart Data Dumps on disk, so that later runs against an unchanged dump do not have to parse
+it again.
+
+Each entry is two files in the cache directory, both named with a hash of the dump's full path. The .json file records
+the dump's path, size, modification time, and content hash, and when the entry was last used. The .pickle file holds
+the parsed data, pickled with protocol 5.
+
+An entry is used when the dump's size and modification time still match. If only the modification time has changed,
+the content hash is checked instead, so a dump that was re-exported without changes still uses its entry. Loading a
+pickle can run arbitrary code, so only use a cache directory that only you can write to.
+
+============ Change Log ============
+2026-Oct-18 = Created.
+              evict decides whether an entry is stale with _is_current, as load does, so an entry whose dump was only 
+              touched is kept.
+
+============ License ============
+Copyright (C) 2026 Michael Stanley
+
+This file is part of wmul_rivendell.
+
+wmul_rivendell is free software: you can redistribute it and/or modify it
+under the terms of the GNU General Public License as published by the Free
+Software Foundation, either version 3 of the License, or (at your option) any
+later version.
+
+wmul_rivendell is distributed in the hope that it will be useful, but WITHOUT
+ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License along with
+wmul_rivendell. If not, see <https://www.gnu.org/licenses/>.
+"""
+import hashlib
+import json
+import os
+import pickle
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+import wmul_logger
+
+_logger = wmul_logger.get_logger()
+
+# Bump when the layout of the cached data changes, so that older entries are treated as stale.
+CACHE_FORMAT_VERSION = 1
+
+DEFAULT_SIZE_LIMIT = 1024 * 1024 * 1024
+
+_HASH_CHUNK_SIZE = 1024 * 1024
+
+
+@dataclass(frozen=True)
+class DumpFingerprint:
+    source_path: str
+    size: int
+    mtime_ns: int
+    content_hash: str
+
+
+def _content_hash(source_path: Path) -> str:
+    digest = hashlib.blake2b(digest_size=32)
+    with open(source_path, "rb") as source_file:
+        while chunk := source_file.read(_HASH_CHUNK_SIZE):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _write_atomically(destination: Path, write_contents):
+    temporary_path = destination.with_name(destination.name + ".tmp")
+    try:
+        with open(temporary_path, "wb") as temporary_file:
+            write_contents(temporary_file)
+        os.replace(temporary_path, destination)
+    finally:
+        temporary_path.unlink(missing_ok=True)
+
+
+@dataclass
+class DumpCache:
+    cache_directory: Path
+    size_limit: int = DEFAULT_SIZE_LIMIT
+
+    def _entry_paths(self, source_path: Path) -> tuple[Path, Path]:
+        key = hashlib.blake2b(str(source_path).encode("utf-8", errors="surrogateescape"), digest_size=16).hexdigest()
+        cache_directory = Path(self.cache_directory)
+        return cache_directory / f"{key}.json", cache_directory / f"{key}.pickle"
+
+    def fingerprint(self, rivendell_cart_data_filename) -> DumpFingerprint:
+        """Fingerprints the dump as it is now. Take the fingerprint before parsing, so that a dump that changes while
+        it is being parsed is stored under its old fingerprint and is re-parsed next time."""
+        source_path = Path(rivendell_cart_data_filename).resolve()
+        source_stat = source_path.stat()
+        return DumpFingerprint(
+            source_path=str(source_path),
+            size=source_stat.st_size,
+            mtime_ns=source_stat.st_mtime_ns,
+            content_hash=_content_hash(source_path)
+        )
+
+    def load(self, rivendell_cart_data_filename):
+        """Returns the data stored for this dump, or None if there is no current entry for it."""
+        source_path = Path(rivendell_cart_data_filename).resolve()
+        metadata_path, data_path = self._entry_paths(source_path)
+        try:
+            with open(metadata_path, "rt") as metadata_file:
+                metadata = json.load(metadata_file)
+        except FileNotFoundError:
+            _logger.info(f"Dump cache miss for {source_path}: no entry.")
+            return None
+        except (OSError, ValueError) as e:
+            _logger.warning(f"Dump cache entry for {source_path} is unreadable, removing it: {e}")
+            self._remove_entry(metadata_path, data_path)
+            return None
+
+        source_stat = source_path.stat()
+        if not self._is_current(metadata, source_path, source_stat):
+            _logger.info(f"Dump cache miss for {source_path}: the dump has changed.")
+            self._remove_entry(metadata_path, data_path)
+            return None
+
+        try:
+            with open(data_path, "rb") as data_file:
+                data = pickle.load(data_file)
+        except Exception as e:
+            _logger.warning(f"Dump cache entry for {source_path} is unreadable, removing it: {e}")
+            self._remove_entry(metadata_path, data_path)
+            return None
+
+        metadata["mtime_ns"] = source_stat.st_mtime_ns
+        metadata["last_used"] = time.time_ns()
+        self._write_metadata(metadata_path, metadata)
+        _logger.info(f"Dump cache hit for {source_path}.")
+        return data
+
+    def _is_current(self, metadata: dict, source_path: Path, source_stat: os.stat_result) -> bool:
+        if metadata.get("format_version") != CACHE_FORMAT_VERSION:
+            return False
+        if metadata.get("source_path") != str(source_path):
+            return False
+        if metadata.get("size") != source_stat.st_size:
+            return False
+        if metadata.get("mtime_ns") == source_stat.st_mtime_ns:
+            return True
+        return metadata.get("content_hash") == _content_hash(source_path)
+
+    def store(self, fingerprint: DumpFingerprint, data):
+        """Stores the data parsed from the dump with this fingerprint, then evicts entries to stay within the size
+        limit."""
+        metadata_path, data_path = self._entry_paths(Path(fingerprint.source_path))
+        Path(self.cache_directory).mkdir(parents=True, exist_ok=True)
+        _write_atomically(data_path, lambda data_file: pickle.dump(data, data_file, protocol=5))
+        metadata = {
+            "format_version": CACHE_FORMAT_VERSION,
+            "source_path": fingerprint.source_path,
+            "size": fingerprint.size,
+            "mtime_ns": fingerprint.mtime_ns,
+            "content_hash": fingerprint.content_hash,
+            "data_size": data_path.stat().st_size,
+            "last_used": time.time_ns()
+        }
+        self._write_metadata(metadata_path, metadata)
+        _logger.info(f"Stored dump cache entry for {fingerprint.source_path}.")
+        self.evict()
+
+    def _write_metadata(self, metadata_path: Path, metadata: dict):
+        _write_atomically(metadata_path, lambda metadata_file: metadata_file.write(json.dumps(metadata).encode()))
+
+    def _remove_entry(self, metadata_path: Path, data_path: Path):
+        metadata_path.unlink(missing_ok=True)
+        data_path.unlink(missing_ok=True)
+
+    def evict(self):
+        """Removes stale entries, whose dump is gone or has changed, and then removes the least recently used entries
+        until the cache is within its size limit. An entry is stale when load would not use it."""
+        cache_directory = Path(self.cache_directory)
+        if not cache_directory.is_dir():
+            return
+
+        current_entries = []
+        for metadata_path in cache_directory.glob("*.json"):
+            data_path = metadata_path.with_suffix(".pickle")
+            try:
+                with open(metadata_path, "rt") as metadata_file:
+                    metadata = json.load(metadata_file)
+                source_path = Path(metadata["source_path"])
+                source_stat = source_path.stat()
+                is_stale = not data_path.exists() or not self._is_current(metadata, source_path, source_stat)
+                if not is_stale and metadata["mtime_ns"] != source_stat.st_mtime_ns:
+                    # Only touched, so that the content hash is not checked again next time.
+                    metadata["mtime_ns"] = source_stat.st_mtime_ns
+                    self._write_metadata(metadata_path, metadata)
+            except (OSError, ValueError, KeyError, TypeError):
+                is_stale = True
+            if is_stale:
+                _logger.info(f"Evicting stale dump cache entry {metadata_path.stem}.")
+                self._remove_entry(metadata_path, data_path)
+            else:
+                current_entries.append((metadata["last_used"], metadata["data_size"], metadata_path, data_path))
+
+        # Data files without metadata are left over from interrupted writes.
+        for data_path in cache_directory.glob("*.pickle"):
+            if not data_path.with_suffix(".json").exists():
+                data_path.unlink(missing_ok=True)
+
+        total_size = sum(data_size for _, data_size, _, _ in current_entries)
+        for _, data_size, metadata_path, data_path in sorted(current_entries):
+            if total_size <= self.size_limit:
+                break
+            _logger.info(f"Evicting dump cache entry {metadata_path.stem} to stay within the size limit.")
+            self._remove_entry(metadata_path, data_path)
+            total_size -= data_size
@@ -0,0 +1,206 @@
+"""
+@Author = 'Michael Stanley'
+
+Compares two Cart Data Dumps and reports which cuts were added, which were removed, and which were modified, with the
+names of the fields that changed.
+
+Each cut is reduced to a fingerprint: the CRC-32 of every field, keyed by cart and cut number. The previous dump is
+only needed as a FingerprintIndex, which can be saved after each run and loaded on the next, so memory is proportional
+to the number of cuts rather than to the size of the dumps. The current dump is streamed.
+
+============ Change Log ============
+2026-Oct-18 = Created.
+              When a cart number and cut number appear more than once in a dump, only the earliest cut is used, and
+              the number of repeated cuts is logged once, rather than once for each.
+
+============ License ============
+Copyright (C) 2026 Michael Stanley
+
+This file is part of wmul_rivendell.
+
+wmul_rivendell is free software: you can redistribute it and/or modify it
+under the terms of the GNU General Public License as published by the Free
+Software Foundation, either version 3 of the License, or (at your option) any
+later version.
+
+wmul_rivendell is distributed in the hope that it will be useful, but WITHOUT
+ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License along with
+wmul_rivendell. If not, see <https://www.gnu.org/licenses/>.
+"""
+import base64
+import csv
+import json
+import zlib
+from array import array
+from dataclasses import dataclass, field
+from operator import attrgetter
+from pathlib import Path
+
+import wmul_logger
+
+from wmul_rivendell.LoadCartDataDump import RivendellCartRecord
+
+_logger = wmul_logger.get_logger()
+
+INDEX_FORMAT_VERSION = 1
+
+# length_in_seconds is derived from length, so it is not compared separately.
+FINGERPRINT_FIELD_NAMES = RivendellCartRecord._fields[:-1]
+
+_FINGERPRINT_FIELD_COUNT = len(FINGERPRINT_FIELD_NAMES)
+
+_TYPE_POSITION = FINGERPRINT_FIELD_NAMES.index("type")
+
+_get_fingerprint_fields = attrgetter(*FINGERPRINT_FIELD_NAMES)
+
+
+def _fingerprint(values) -> bytes:
+    """values are the fingerprint fields of a cut, in order. Every field is a string except type, which is a 
+    CartType."""
+    values = list(values)
+    values[_TYPE_POSITION] = values[_TYPE_POSITION].name
+    # Most fields of most cuts are empty, and the CRC-32 of an empty field is 0, so those are not hashed at all.
+    crc32 = zlib.crc32
+    return array(
+        "I", 
+        [crc32(value.encode("utf-8", errors="surrogateescape")) if value else 0 for value in values]
+    ).tobytes()
+
+
+def _changed_field_names(previous_fingerprint: bytes, current_fingerprint: bytes) -> list[str]:
+    return [
+        field_name
+        for field_name, previous_digest, current_digest
+        in zip(FINGERPRINT_FIELD_NAMES, array("I", previous_fingerprint), array("I", current_fingerprint))
+        if previous_digest != current_digest
+    ]
+
+
+def _log_duplicate_cuts(duplicate_cuts: int):
+    if duplicate_cuts:
+        _logger.warning(f"{duplicate_cuts} cuts have the same cart number and cut number as an earlier cut in the "
+                        f"dump. Only the earliest is compared.")
+
+
+@dataclass
+class FingerprintIndex:
+    """The fingerprint of every cut in a dump, keyed by (cart_number, cut_number)."""
+    fingerprints: dict[tuple[str, str], bytes] = field(default_factory=dict)
+
+    def add(self, rivendell_cart):
+        """Returns the key and fingerprint of the cut, or None if a cut with the same key was already added. The 
+        earlier cut is kept."""
+        key = (rivendell_cart.cart_number, rivendell_cart.cut_number)
+        if key in self.fingerprints:
+            return None
+        if isinstance(rivendell_cart, RivendellCartRecord):
+            # The fingerprint fields are the leading fields of the record, so a slice is much faster than attrgetter.
+            fingerprint = _fingerprint(rivendell_cart[:_FINGERPRINT_FIELD_COUNT])
+        else:
+            fingerprint = _fingerprint(_get_fingerprint_fields(rivendell_cart))
+        self.fingerprints[key] = fingerprint
+        return key, fingerprint
+
+    @classmethod
+    def from_carts(cls, rivendell_carts):
+        fingerprint_index = cls()
+        duplicate_cuts = 0
+        for rivendell_cart in rivendell_carts:
+            if fingerprint_index.add(rivendell_cart) is None:
+                duplicate_cuts += 1
+        _log_duplicate_cuts(duplicate_cuts)
+        return fingerprint_index
+
+    def __len__(self):
+        return len(self.fingerprints)
+
+    def save(self, index_filename: Path):
+        contents = {
+            "format_version": INDEX_FORMAT_VERSION,
+            "field_names": list(FINGERPRINT_FIELD_NAMES),
+            "fingerprints": [
+                [cart_number, cut_number, base64.b64encode(fingerprint).decode("ascii")]
+                for (cart_number, cut_number), fingerprint in self.fingerprints.items()
+            ]
+        }
+        with open(str(index_filename), mode="wt") as index_file:
+            json.dump(contents, index_file)
+
+    @classmethod
+    def load(cls, index_filename: Path):
+        with open(str(index_filename), mode="rt") as index_file:
+            contents = json.load(index_file)
+        if contents.get("format_version") != INDEX_FORMAT_VERSION or \
+                contents.get("field_names") != list(FINGERPRINT_FIELD_NAMES):
+            raise ValueError(f"The fingerprint index: {index_filename}, was written by an incompatible version. "
+                             f"Diff against the previous dump instead.")
+        return cls(
+            fingerprints={
+                (cart_number, cut_number): base64.b64decode(fingerprint)
+                for cart_number, cut_number, fingerprint in contents["fingerprints"]
+            }
+        )
+
+
+@dataclass
+class DumpDifferences:
+    added: list[tuple[str, str]] = field(default_factory=list)
+    modified: dict[tuple[str, str], list[str]] = field(default_factory=dict)
+    removed: list[tuple[str, str]] = field(default_factory=list)
+
+
+def diff_dump(previous_index: FingerprintIndex, current_carts) -> tuple[DumpDifferences, FingerprintIndex]:
+    """Compares the current carts, which may be a generator, against the fingerprints of the previous dump. Returns
+    the differences and the FingerprintIndex of the current carts, to be saved for the next comparison."""
+    differences = DumpDifferences()
+    current_index = FingerprintIndex()
+    previous_fingerprints = previous_index.fingerprints
+    duplicate_cuts = 0
+    for rivendell_cart in current_carts:
+        added_cut = current_index.add(rivendell_cart)
+        if added_cut is None:
+            duplicate_cuts += 1
+            continue
+        key, current_fingerprint = added_cut
+        previous_fingerprint = previous_fingerprints.get(key)
+        if previous_fingerprint is None:
+            differences.added.append(key)
+        elif previous_fingerprint != current_fingerprint:
+            differences.modified[key] = _changed_field_names(previous_fingerprint, current_fingerprint)
+    _log_duplicate_cuts(duplicate_cuts)
+    current_fingerprints = current_index.fingerprints
+    differences.removed = [key for key in previous_fingerprints if key not in current_fingerprints]
+    return differences, current_index
+
+
+@dataclass
+class DiffDumps:
+    previous_index: FingerprintIndex
+    current_carts: object
+    output_filename: Path
+    index_output_filename: Path | None = None
+
+    def _write_differences(self, differences: DumpDifferences):
+        with open(str(self.output_filename), newline="", mode="wt", errors="replace") as differences_output:
+            writer = csv.writer(differences_output)
+            writer.writerow(["CHANGE", "CART_NUMBER", "CUT_NUMBER", "CHANGED_FIELDS"])
+            for cart_number, cut_number in differences.added:
+                writer.writerow(["added", cart_number, cut_number, ""])
+            for (cart_number, cut_number), changed_field_names in differences.modified.items():
+                changed_fields = ";".join(field_name.upper() for field_name in changed_field_names)
+                writer.writerow(["modified", cart_number, cut_number, changed_fields])
+            for cart_number, cut_number in differences.removed:
+                writer.writerow(["removed", cart_number, cut_number, ""])
+
+    def run_script(self) -> DumpDifferences:
+        _logger.debug(f"Starting DiffDumps.run_script()")
+        differences, current_index = diff_dump(previous_index=self.previous_index, current_carts=self.current_carts)
+        _logger.info(f"{len(differences.added)} added, {len(differences.modified)} modified, "
+                     f"{len(differences.removed)} removed.")
+        self._write_differences(differences)
+        if self.index_output_filename:
+            current_index.save(self.index_output_filename)
+        return differences
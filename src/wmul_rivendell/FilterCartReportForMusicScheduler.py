@@ -5,6 +5,8 @@ This script takes the "Cart Data Dump (CSV)" from RD Library and eliminates data
 cannot use. It does this because some music schedulers, such as Natural Music 5, cannot import the full data dump.
 
 ============ Change Log ============
+2026-Oct-18 = Accept a CartTable as rivendell_carts. The desired fields are selected as DataFrame columns.
+
 2025-Jun-18 = Rework FilterCartReport and add ConvertDatabaseToExcel.
 
 2025-Jan-03 = Change the way the trailing comma is added. Python 3.13 doesn't allow a comma to be included in the line 
@@ -32,7 +34,7 @@ cannot use. It does this because some music schedulers, such as Natural Music 5,
 2020-Jun-25 = Created.
 
 ============ License ============
-Copyright (C) 2020-2023, 2025 Michael Stanley
+Copyright (C) 2020-2023, 2025-2026 Michael Stanley
 
 This file is part of wmul_rivendell.
 
@@ -53,7 +55,7 @@ import pandas as pd
 from collections import OrderedDict
 from dataclasses import dataclass
 from pathlib import Path
-from wmul_rivendell.LoadCartDataDump import RivendellCart
+from wmul_rivendell.LoadCartDataDump import CartTable, RivendellCart
 
 
 import wmul_logger
@@ -63,11 +65,13 @@ _logger = wmul_logger.get_logger()
 
 @dataclass
 class ConvertDatabaseBase:
-    rivendell_carts: list[RivendellCart]
+    rivendell_carts: list[RivendellCart] | CartTable
     output_filename: Path
     desired_field_list: list[str]
 
     def _remove_unwanted_fields(self, rivendell_carts):
+        if isinstance(rivendell_carts, CartTable):
+            return rivendell_carts.select_fields(self.desired_field_list)
         trimmed_carts = []
         for cart in rivendell_carts:
             this_trimmed_cart  = OrderedDict()
@@ -90,6 +94,9 @@ class ConvertDatabaseToCSV(ConvertDatabaseBase):
     use_trailing_comma: bool
 
     def _export_carts(self, trimmed_carts):
+        if isinstance(trimmed_carts, pd.DataFrame):
+            self._export_cart_table(trimmed_carts)
+            return
         fieldnames = list(trimmed_carts[0].keys())
         if self.use_trailing_comma:
             fieldnames.append("Placeholder")
@@ -98,9 +105,15 @@ class ConvertDatabaseToCSV(ConvertDatabaseBase):
                                                   dialect="excel")
             natural_music_writer.writerows(trimmed_carts)
 
+    def _export_cart_table(self, trimmed_carts: pd.DataFrame):
+        if self.use_trailing_comma:
+            trimmed_carts = trimmed_carts.assign(Placeholder="")
+        with open(str(self.output_filename), newline="", mode="wt", errors="replace") as music_scheduler_file:
+            trimmed_carts.to_csv(music_scheduler_file, header=False, index=False, lineterminator="\r\n")
+
     @classmethod
     def get_factory(cls, use_trailing_comma):
-        def inner(rivendell_carts: list[RivendellCart], output_filename: Path, desired_field_list:  list[str]):
+        def inner(rivendell_carts: list[RivendellCart] | CartTable, output_filename: Path, desired_field_list:  list[str]):
             return cls(rivendell_carts, output_filename, desired_field_list, use_trailing_comma)
         return inner
 
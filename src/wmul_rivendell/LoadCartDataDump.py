@@ -6,6 +6,66 @@ into Python data.
 
 
 ============ Change Log ============
+2026-Oct-18 = Rewrite _fix_rivendell_csv_file as a single-pass generator. It tracks the quote and field state of a 
+              broken record incrementally, instead of re-parsing the growing record on every extra line, and yields 
+              the repaired records straight to the DictReader instead of copying the whole file into a StringIO.
+
+              Add iter_carts, a generator that yields the filtered carts as they are parsed. Only the cuts of the 
+              current cart are buffered when removing the extra cuts.
+
+              Add RivendellCartRecord, a compact tuple-backed cart record, and the trusted_dump option of 
+              LoadCartDataDump, which builds RivendellCartRecords without per-field validation. A length that cannot 
+              be parsed is UNPARSEABLE_LENGTH_IN_SECONDS in its record.
+
+              Add CartTable, a columnar table of carts backed by a pandas DataFrame, and load_cart_table, which 
+              filters it with vectorized masks. A length that cannot be parsed is UNPARSEABLE_LENGTH_IN_SECONDS in 
+              the table, and is left out of lengths_by_group.
+
+              length_in_seconds parses each distinct length once, and re-uses it for every cart with that length, 
+              instead of re-parsing the length on every read. It is still derived from length, and a length that 
+              cannot be parsed is still only rejected when length_in_seconds is read. An empty length is 0 seconds. 
+              Add lengths_to_seconds, which converts a whole column of lengths in one vectorized call. The trusted 
+              loader uses it on batches of rows. With unparseable_seconds, a length that cannot be parsed is 
+              converted to that, instead of failing the whole column.
+
+              Add the dump_cache option of LoadCartDataDump. load_carts and load_cart_table keep the unfiltered 
+              carts of each dump in a DumpCache and re-use them while the dump is unchanged. Add CartTable.to_records, 
+              to_carts, compact, and from_compact.
+
+              Add the parse_workers option of LoadCartDataDump. load_carts and load_cart_table split the dump into 
+              byte ranges at the start of a line and parse them in a process pool. A range that ends part-way 
+              through a record means the split was wrong, and the dump is parsed serially instead.
+
+              Push the excluded groups and macro filters down to the raw rows, so that no cart is built for a row 
+              that would be removed anyway, unless the unfiltered carts are being stored in dump_cache. The rows 
+              each filter rejected are logged and kept in LoadCartDataDump.row_filter_counts.
+
+              Add the projected_fields option of LoadCartDataDump. load_carts and iter_carts build lightweight 
+              named tuples with only those fields and the fields the filters use, instead of whole carts.
+
+              With instrumentation, a memory mapped dump is read as the scan_rows stage, in place of repair_records 
+              and csv_rows, and the time and rows of each chunk parsed in parallel are recorded as parse_chunk_1, 
+              parse_chunk_2, and so on.
+
+              Add _iter_scanned_rows and the memory_map option of LoadCartDataDump. The dump is read through a 
+              memory map, and complete lines without quotes are split straight from the bytes. Every other line 
+              still goes through _fix_rivendell_csv_file, so the rows are the same as in text mode.
+
+              Intern the repetitive fields in _INTERNED_FIELD_NAMES. The carts, records, and projected records of a 
+              load share a single string for each distinct value of those fields.
+
+              Add the required_sched_codes and excluded_sched_codes options of LoadCartDataDump, and 
+              CartTable.sched_code_index. The carts are selected with a SchedulerCodeIndex, so each distinct 
+              sched_codes is only split once.
+
+              _iter_dump_rows is the only place the dump file is read, so that LoadCartDatabase can replace it.
+
+              Read Cart Data Dumps compressed with gzip, bzip2, or xz, by their .gz, .bz2, or .xz suffix. They are 
+              decompressed as a stream into the same repair and parsing, serially and without a memory map.
+
+              Add the instrumentation option of LoadCartDataDump. With a LoadInstrumentation, load_carts, 
+              load_cart_table, and iter_carts record the time, rows, and peak memory of each of their stages.
+
 2025-Jun-18 = Rework RivendellCart to be a Pydantic model.
               Improve type hinting.
               Make certain load_carts returns a list.
@@ -32,7 +92,7 @@ into Python data.
                 module so that DatabaseStatistics could re-use the code.
 
 ============ License ============
-Copyright (C) 2020-2023, 2025 Michael Stanley
+Copyright (C) 2020-2023, 2025-2026 Michael Stanley
 
 This file is part of wmul_rivendell.
 
@@ -48,17 +108,36 @@ FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
 You should have received a copy of the GNU General Public License along with 
 wmul_rivendell. If not, see <https://www.gnu.org/licenses/>. 
 """
+import bz2
 import csv
-from dataclasses import dataclass
+import gc
+import gzip
+import io
+import locale
+import lzma
+import mmap
+import numpy as np
+import os
+import pandas as pd
+import re
+import time
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field, replace
 from enum import Enum
-from io import StringIO
-from os import SEEK_SET
+from functools import lru_cache
+from itertools import chain, compress, islice, repeat
+from operator import itemgetter
 from pathlib import Path
 from pydantic import BaseModel, computed_field, model_serializer
-from typing import Generator, ValuesView
+from typing import Generator, NamedTuple, ValuesView
 
 import wmul_logger
 
+from wmul_rivendell.DumpCache import DumpCache
+from wmul_rivendell.LoadInstrumentation import LoadInstrumentation
+from wmul_rivendell.SchedulerCodes import SchedulerCodeIndex, make_sched_codes_predicate
+
 _logger = wmul_logger.get_logger()
 
 
@@ -71,27 +150,121 @@ class CartType(Enum):
         return f"{self.__class__.__name__}.{self.name}"
 
 
+def _length_to_seconds(length: str) -> int:
+    if length.count(":") > 1:
+        hours, minutes, seconds = length.split(":")
+        hours = int(hours)
+    else:
+        minutes, seconds = length.split(":")
+        hours = 0
+
+    if minutes:
+        minutes = int(minutes)
+    else:
+        minutes = 0
+    seconds = int(seconds)
+
+    return (hours * 3600) + (minutes * 60) + seconds
+
+
+_LENGTH_BATCH_SIZE = 4096
+
+# The length_in_seconds of a CartTable row, or of a RivendellCartRecord, whose LENGTH cannot be parsed.
+UNPARSEABLE_LENGTH_IN_SECONDS = -1
+
+_DIGIT_ZERO = ord("0")
+_DIGIT_NINE = ord("9")
+_COLON = ord(":")
+
+
+def lengths_to_seconds(lengths, unparseable_seconds: int | None = None) -> np.ndarray:
+    """Converts a whole column of LENGTH strings ("H:MM:SS", "MM:SS", or ":SS") into an int64 array of seconds in one 
+    call. An empty length is 0 seconds. Any length that is not just digits and one or two colons is handed to the 
+    same per-item conversion that RivendellCart uses, so it is converted, or rejected, in exactly the same way. 
+    
+    A length that is rejected raises ValueError, unless unparseable_seconds is given, in which case that length alone 
+    is converted to unparseable_seconds."""
+    # A cart data dump has far fewer distinct lengths than cuts, so each distinct length is only converted once.
+    length_codes, distinct_lengths = pd.factorize(np.asarray(lengths, dtype=object).reshape(-1))
+    return _distinct_lengths_to_seconds(distinct_lengths, unparseable_seconds)[length_codes]
+
+
+def _count_unparseable_lengths(lengths_in_seconds: np.ndarray) -> int:
+    return int(np.count_nonzero(lengths_in_seconds == UNPARSEABLE_LENGTH_IN_SECONDS))
+
+
+def _log_unparseable_lengths(number_of_unparseable: int):
+    if number_of_unparseable:
+        _logger.warning(f"{number_of_unparseable} cuts have a LENGTH that cannot be parsed. Their length_in_seconds "
+                        f"is {UNPARSEABLE_LENGTH_IN_SECONDS}.")
+
+
+def _distinct_lengths_to_seconds(lengths, unparseable_seconds: int | None = None) -> np.ndarray:
+    lengths = np.asarray(lengths, dtype=str).reshape(-1)
+    number_of_lengths = lengths.size
+    seconds = np.zeros(number_of_lengths, dtype=np.int64)
+    width = lengths.dtype.itemsize // 4
+    if number_of_lengths == 0 or width == 0:
+        return seconds
+
+    # One row per character position, one column per length. Lengths are padded on the right with zeros. Lengths are 
+    # short, so the loop below runs only a few times, and each step works on every length at once.
+    code_points = np.ascontiguousarray(lengths.view(np.uint32).reshape(number_of_lengths, width).T)
+    place_value = np.ones(number_of_lengths, dtype=np.int64)
+    segment_value = np.ones(number_of_lengths, dtype=np.int64)
+    number_of_colons = np.zeros(number_of_lengths, dtype=np.int64)
+    digits_in_segment = np.zeros(number_of_lengths, dtype=np.int64)
+    is_irregular = np.zeros(number_of_lengths, dtype=bool)
+    is_in_text = np.zeros(number_of_lengths, dtype=bool)
+
+    # Scanning from the right, each colon moves from seconds to minutes to hours.
+    for characters in code_points[::-1]:
+        is_digit = (characters >= _DIGIT_ZERO) & (characters <= _DIGIT_NINE)
+        is_colon = characters == _COLON
+        is_padding = characters == 0
+        is_irregular |= ~(is_digit | is_colon | is_padding) | (is_padding & is_in_text)
+        # The seconds must have at least one digit.
+        is_irregular |= is_colon & (number_of_colons == 0) & (digits_in_segment == 0)
+        is_in_text |= ~is_padding
+
+        seconds += np.where(is_digit, (characters.astype(np.int64) - _DIGIT_ZERO) * place_value * segment_value, 0)
+        place_value = np.where(is_colon, 1, np.where(is_digit, place_value * 10, place_value))
+        digits_in_segment = np.where(is_colon, 0, digits_in_segment + is_digit)
+        segment_value = np.where(is_colon, segment_value * 60, segment_value)
+        number_of_colons += is_colon
+        is_irregular |= digits_in_segment > 15
+
+    # The minutes may be empty, but the hours may not.
+    is_irregular |= is_in_text & ((number_of_colons == 0) | (number_of_colons > 2))
+    is_irregular |= (number_of_colons == 2) & (digits_in_segment == 0)
+
+    for irregular_position in np.flatnonzero(is_irregular):
+        try:
+            seconds[irregular_position] = _length_to_seconds(str(lengths[irregular_position]))
+        except ValueError:
+            if unparseable_seconds is None:
+                raise
+            seconds[irregular_position] = unparseable_seconds
+    return seconds
+
+
+@lru_cache(maxsize=65_536)
+def _cached_length_to_seconds(length: str) -> int:
+    # A library has few distinct lengths, so each is only parsed once, however many carts have it.
+    if not length:
+        return 0
+    return _length_to_seconds(length)
+
+
 class LengthInSecondsProperty(BaseModel):
     length: str
 
     @computed_field(return_type=int)
     @property
     def length_in_seconds(self):
-        length = self.length
-        if length.count(":") > 1:
-            hours, minutes, seconds = length.split(":")
-            hours = int(hours)
-        else:
-            minutes, seconds = self.length.split(":")
-            hours = 0
-
-        if minutes:
-            minutes = int(minutes)
-        else:
-            minutes = 0
-        seconds = int(seconds)
-
-        return (hours * 3600) + (minutes * 60) + seconds
+        # Derived from length when it is read, so that a length that cannot be parsed only fails the commands that 
+        # use the lengths.
+        return _cached_length_to_seconds(self.length)
 
 
 class RivendellCart(LengthInSecondsProperty):
@@ -129,7 +302,8 @@ class RivendellCart(LengthInSecondsProperty):
     sched_codes: str
 
     @classmethod
-    def from_dict(cls, source_dict):
+    def from_dict(cls, source_dict, interned_values: dict | None = None):
+        """interned_values, if given, is the table that _intern_fields shares between the carts of a load."""
         _logger.debug(source_dict)
         if source_dict["TYPE"] == "audio":
             cart_type = CartType.Audio
@@ -144,7 +318,7 @@ class RivendellCart(LengthInSecondsProperty):
         if isinstance(outcue, str):
             outcue = outcue.strip()
 
-        return cls(
+        cart_fields = dict(
             cart_number=source_dict["CART_NUMBER"],
             cut_number=source_dict["CUT_NUMBER"],
             type=cart_type,
@@ -179,39 +353,660 @@ class RivendellCart(LengthInSecondsProperty):
             fadedown_point=source_dict["FADEDOWN_POINT"],
             sched_codes=source_dict["SCHED_CODES"]
         )
+        if interned_values is not None:
+            _intern_fields(cart_fields, interned_values)
+        return cls(**cart_fields)
+
+
+# Fields that repeat a few values across a whole library. The carts of a load share a single copy of each value of 
+# these fields, instead of holding a separate string for every cut. type is already a shared CartType.
+_INTERNED_FIELD_NAMES = ("group_name", "artist", "album", "label", "publisher", "sched_codes")
+
+
+def _intern_fields(cart_fields: dict, interned_values: dict):
+    """Replaces each value of the _INTERNED_FIELD_NAMES in cart_fields with the equal value already in 
+    interned_values, adding it if there is none."""
+    for field_name in _INTERNED_FIELD_NAMES:
+        value = cart_fields[field_name]
+        cart_fields[field_name] = interned_values.setdefault(value, value)
+
+
+_DUMP_FIELD_NAMES = (
+    "CART_NUMBER", "CUT_NUMBER", "TYPE", "GROUP_NAME", "TITLE", "ARTIST", "ALBUM", "YEAR", "ISRC", "ISCI", "LABEL", 
+    "CLIENT", "AGENCY", "PUBLISHER", "COMPOSER", "CONDUCTOR", "SONG_ID", "USER_DEFINED", "DESCRIPTION", "OUTCUE", 
+    "FILENAME", "LENGTH", "START_POINT", "END_POINT", "SEGUE_START_POINT", "SEGUE_END_POINT", "HOOK_START_POINT", 
+    "HOOK_END_POINT", "TALK_START_POINT", "TALK_END_POINT", "FADEUP_POINT", "FADEDOWN_POINT", "SCHED_CODES"
+)
+
+# The same fields that RivendellCart.from_dict strips.
+_STRIPPED_DUMP_FIELD_NAMES = (
+    "TITLE", "ARTIST", "ALBUM", "YEAR", "ISRC", "ISCI", "LABEL", "CLIENT", "AGENCY", "PUBLISHER", "COMPOSER", 
+    "CONDUCTOR", "SONG_ID", "USER_DEFINED", "DESCRIPTION", "OUTCUE"
+)
+
+
+class RivendellCartRecord(NamedTuple):
+    """A compact, tuple-backed alternative to RivendellCart, for cart data dumps that can be trusted.
+
+    It has the same attribute names as RivendellCart, but none of the fields are validated. It is built by 
+    LoadCartDataDump when trusted_dump is set.
+    """
+    cart_number: str
+    cut_number: str
+    type: CartType
+    group_name: str
+    title: str
+    artist: str
+    album: str
+    year: str
+    isrc: str
+    isci: str
+    label: str
+    client: str
+    agency: str
+    publisher: str
+    composer: str
+    conductor: str
+    song_id: str
+    user_defined: str
+    description: str
+    outcue: str
+    filename: str
+    length: str
+    start_point: str
+    end_point: str
+    segue_start_point: str
+    segue_end_point: str
+    hook_start_point: str
+    hook_end_point: str
+    talk_start_point: str
+    talk_end_point: str
+    fadeup_point: str
+    fadedown_point: str
+    sched_codes: str
+    length_in_seconds: int
+
+
+def _make_record_factory(header: list[str]):
+    """Returns a function that turns a row from csv.reader into a RivendellCartRecord, for the given header. The 
+    records it makes share their values of the _INTERNED_FIELD_NAMES."""
+    # In _DUMP_FIELD_NAMES, the four identifying fields come first, then the stripped fields, then the rest.
+    first_stripped = _DUMP_FIELD_NAMES.index(_STRIPPED_DUMP_FIELD_NAMES[0])
+    last_stripped = first_stripped + len(_STRIPPED_DUMP_FIELD_NAMES)
+    positions = [header.index(field_name) for field_name in _DUMP_FIELD_NAMES]
+    identity_getter = itemgetter(*positions[:first_stripped])
+    stripped_getter = itemgetter(*positions[first_stripped:last_stripped])
+    remaining_getter = itemgetter(*positions[last_stripped:])
+    interned_positions = [RivendellCartRecord._fields.index(field_name) for field_name in _INTERNED_FIELD_NAMES]
+    intern = {}.setdefault
+    strip = str.strip
+    new_record = tuple.__new__
+
+    def make_record(row, length_in_seconds):
+        cart_number, cut_number, cart_type, group_name = identity_getter(row)
+        if cart_type == "audio":
+            cart_type = CartType.Audio
+        else:
+            cart_type = CartType.Macro
+        values = [
+            cart_number, cut_number, cart_type, group_name, *map(strip, stripped_getter(row)), 
+            *remaining_getter(row), length_in_seconds
+        ]
+        for position in interned_positions:
+            value = values[position]
+            values[position] = intern(value, value)
+        return new_record(RivendellCartRecord, values)
+
+    return make_record
+
+
+# The fields of RivendellCartRecord that the filters of LoadCartDataDump use. Every projection keeps them.
+_FILTER_FIELD_NAMES = ("cart_number", "cut_number", "type", "group_name")
+
+
+def _projected_field_names(field_names) -> tuple[str, ...]:
+    """Returns the fields of RivendellCartRecord, in order, that a projection onto field_names keeps: the filter 
+    fields, and every field name that matches a field of RivendellCartRecord, case-insensitively."""
+    kept_field_names = {field_name.lower() for field_name in field_names}.union(_FILTER_FIELD_NAMES)
+    return tuple(field_name for field_name in RivendellCartRecord._fields if field_name in kept_field_names)
+
+
+@lru_cache(maxsize=None)
+def _projected_record_type(field_names: tuple[str, ...]):
+    """Returns a named tuple type with only the given fields of RivendellCartRecord."""
+    return namedtuple("ProjectedCartRecord", field_names)
+
+
+def _make_projected_record_factory(header: list[str], field_names: tuple[str, ...]):
+    """Like _make_record_factory, but the records only have the given fields of RivendellCartRecord, which come from 
+    _projected_field_names."""
+    record_type = _projected_record_type(field_names)
+    has_length_in_seconds = field_names[-1] == "length_in_seconds"
+    dump_field_names = [field_name.upper() for field_name in field_names]
+    if has_length_in_seconds:
+        del dump_field_names[-1]
+    get_fields = itemgetter(*[header.index(dump_field_name) for dump_field_name in dump_field_names])
+    type_position = dump_field_names.index("TYPE")
+    stripped_positions = [
+        position for position, dump_field_name in enumerate(dump_field_names) 
+        if dump_field_name in _STRIPPED_DUMP_FIELD_NAMES
+    ]
+    interned_positions = [
+        position for position, field_name in enumerate(field_names) if field_name in _INTERNED_FIELD_NAMES
+    ]
+    intern = {}.setdefault
+    new_record = tuple.__new__
+
+    def make_record(row, length_in_seconds):
+        values = list(get_fields(row))
+        if values[type_position] == "audio":
+            values[type_position] = CartType.Audio
+        else:
+            values[type_position] = CartType.Macro
+        for position in stripped_positions:
+            values[position] = values[position].strip()
+        for position in interned_positions:
+            value = values[position]
+            values[position] = intern(value, value)
+        if has_length_in_seconds:
+            values.append(length_in_seconds)
+        return new_record(record_type, values)
+
+    return make_record
+
+
+@dataclass
+class CartTable:
+    """A columnar table of carts, one row per cut.
+
+    data has a column for each field of RivendellCartRecord. group_name and type are categorical, and 
+    length_in_seconds is int64. A length that cannot be parsed is UNPARSEABLE_LENGTH_IN_SECONDS.
+    """
+    data: pd.DataFrame
+
+    @classmethod
+    def from_records(cls, rivendell_carts):
+        return cls._from_data(pd.DataFrame.from_records(rivendell_carts, columns=RivendellCartRecord._fields))
+
+    @classmethod
+    def _from_data(cls, data: pd.DataFrame):
+        data["group_name"] = data["group_name"].astype("category")
+        data["type"] = data["type"].astype(pd.CategoricalDtype([CartType.Audio, CartType.Macro]))
+        data["length_in_seconds"] = data["length_in_seconds"].astype(np.int64)
+        return cls(data=data)
+
+    @classmethod
+    def from_carts(cls, rivendell_carts):
+        """Builds a CartTable from RivendellCarts, or anything else with the same attributes."""
+        # length_in_seconds is derived from length here, so that a length that cannot be parsed does not raise.
+        field_names = RivendellCartRecord._fields[:-1]
+        data = pd.DataFrame.from_records(
+            (tuple(getattr(rivendell_cart, field_name) for field_name in field_names) 
+             for rivendell_cart in rivendell_carts),
+            columns=field_names
+        )
+        data["length_in_seconds"] = lengths_to_seconds(
+            data["length"].to_numpy(dtype=object), unparseable_seconds=UNPARSEABLE_LENGTH_IN_SECONDS
+        )
+        _log_unparseable_lengths(_count_unparseable_lengths(data["length_in_seconds"].to_numpy()))
+        return cls._from_data(data)
+
+    def __len__(self):
+        return len(self.data)
+
+    def to_records(self) -> list[RivendellCartRecord]:
+        columns = [self.data[field_name].to_numpy(dtype=object) for field_name in RivendellCartRecord._fields]
+        new_record = tuple.__new__
+        return [new_record(RivendellCartRecord, row) for row in zip(*columns)]
+
+    def to_projected_records(self, field_names: tuple[str, ...]) -> list:
+        """Returns a record with only the given fields for every row. field_names come from _projected_field_names."""
+        record_type = _projected_record_type(field_names)
+        columns = [self.data[field_name].to_numpy(dtype=object) for field_name in field_names]
+        new_record = tuple.__new__
+        return [new_record(record_type, row) for row in zip(*columns)]
+
+    def to_carts(self) -> list[RivendellCart]:
+        # length_in_seconds is derived from length.
+        field_names = RivendellCartRecord._fields[:-1]
+        columns = [self.data[field_name].to_numpy(dtype=object) for field_name in field_names]
+        return [RivendellCart(**dict(zip(field_names, row))) for row in zip(*columns)]
+
+    def compact(self) -> pd.DataFrame:
+        """Returns the data with every text column dictionary-encoded as a categorical. Most of the columns repeat a 
+        few values, so this is much smaller and much faster to pickle. from_compact reverses it."""
+        compacted = self.data.copy()
+        for column_name in compacted.columns:
+            column = compacted[column_name]
+            if isinstance(column.dtype, pd.CategoricalDtype) or pd.api.types.is_numeric_dtype(column):
+                continue
+            # factorize and from_codes are several times faster than astype("category"), which sorts the values.
+            codes, categories = pd.factorize(column)
+            compacted[column_name] = pd.Categorical.from_codes(codes, categories=categories)
+        return compacted
+
+    @classmethod
+    def from_compact(cls, compacted: pd.DataFrame):
+        data = compacted.copy()
+        for column_name in data.columns:
+            if column_name in ("group_name", "type"):
+                continue
+            column_dtype = data[column_name].dtype
+            if isinstance(column_dtype, pd.CategoricalDtype):
+                data[column_name] = data[column_name].astype(column_dtype.categories.dtype)
+        return cls(data=data)
+
+    def select_fields(self, field_names: list[str]) -> pd.DataFrame:
+        """Returns a DataFrame with one column per field name, in the given order. Field names are case-insensitive 
+        and keep the case they were given in. Unknown field names are filled in the same way as 
+        ConvertDatabaseBase._remove_unwanted_fields."""
+        selected = pd.DataFrame(index=self.data.index)
+        for field_name in field_names:
+            column_name = field_name.lower()
+            if column_name in self.data.columns:
+                selected[field_name] = self.data[column_name]
+            else:
+                selected[field_name] = "INVALID FIELD NAME IN DESIRED FIELDS FILE"
+        return selected
+
+    def sched_code_index(self) -> SchedulerCodeIndex:
+        return SchedulerCodeIndex.from_sched_codes(self.data["sched_codes"])
+
+    def lengths_by_group(self) -> dict[str, np.ndarray]:
+        """Returns the length_in_seconds of every cut, grouped by group_name, in order of first appearance. The cuts 
+        whose length cannot be parsed are left out."""
+        data = self.data[self.data["length_in_seconds"] != UNPARSEABLE_LENGTH_IN_SECONDS]
+        grouped = data.groupby("group_name", observed=True, sort=False)["length_in_seconds"]
+        return {group_name: lengths.to_numpy() for group_name, lengths in grouped}
 
 
-def _fix_rivendell_csv_file(rivendell_source_file):
-    text_buffer = StringIO()
+_START_FIELD = 0
+_IN_FIELD = 1
+_IN_QUOTED_FIELD = 2
+_QUOTE_IN_QUOTED_FIELD = 3
 
+
+class _CsvFieldCounter:
+    """Tracks the quote and field state of a csv record that is fed to it one physical line at a time.
+
+    Mirrors the state machine of csv.reader with the excel dialect (non-strict), so that the number of fields 
+    counted here is the number of fields that csv.reader would find in the concatenated text. Each piece of text is 
+    only scanned once, so the work is linear in the length of the record no matter how many lines it is split across.
+    """
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.field_count = 1
+        self._state = _START_FIELD
+
+    def feed(self, text):
+        state = self._state
+        if state != _IN_QUOTED_FIELD and state != _QUOTE_IN_QUOTED_FIELD and '"' not in text:
+            # Fast path for the common case. Without any quotes, every comma is a delimiter.
+            if text:
+                self.field_count += text.count(",")
+                self._state = _START_FIELD if text[-1] == "," else _IN_FIELD
+            return
+
+        field_count = self.field_count
+        position = 0
+        text_length = len(text)
+        while position < text_length:
+            if state == _IN_FIELD:
+                next_delimiter = text.find(",", position)
+                if next_delimiter == -1:
+                    break
+                field_count += 1
+                state = _START_FIELD
+                position = next_delimiter + 1
+            elif state == _IN_QUOTED_FIELD:
+                next_quote = text.find('"', position)
+                if next_quote == -1:
+                    break
+                state = _QUOTE_IN_QUOTED_FIELD
+                position = next_quote + 1
+            else:
+                this_char = text[position]
+                if state == _START_FIELD and this_char == '"':
+                    state = _IN_QUOTED_FIELD
+                elif this_char == ",":
+                    field_count += 1
+                    state = _START_FIELD
+                elif state == _QUOTE_IN_QUOTED_FIELD and this_char == '"':
+                    state = _IN_QUOTED_FIELD
+                else:
+                    state = _IN_FIELD
+                position += 1
+        self._state = state
+        self.field_count = field_count
+
+
+def _strip_pieces(pieces):
+    """Strips the whitespace from both ends of the text held in pieces, in place. 
+
+    Returns True if any leading whitespace was removed."""
+    while pieces:
+        stripped_piece = pieces[-1].rstrip()
+        if stripped_piece:
+            pieces[-1] = stripped_piece
+            break
+        pieces.pop()
+
+    leading_whitespace_removed = False
+    while pieces:
+        stripped_piece = pieces[0].lstrip()
+        if len(stripped_piece) != len(pieces[0]):
+            leading_whitespace_removed = True
+        if stripped_piece:
+            pieces[0] = stripped_piece
+            break
+        pieces.pop(0)
+    return leading_whitespace_removed
+
+
+class _SingleLineFeeder:
+    """Lets one csv.reader parse many independent lines. Each line is handed to the reader exactly once."""
+
+    def __init__(self):
+        self.line = None
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        line = self.line
+        if line is None:
+            raise StopIteration
+        self.line = None
+        return line
+
+
+class _IncompleteRecordError(Exception):
+    pass
+
+
+def _fix_rivendell_csv_file(rivendell_source_file, 
+                            raise_on_incomplete_record: bool = False) -> Generator[str, None, None]:
+    """Yields the records of the cart data dump, re-joining any records that were broken by un-escaped newlines.
+
+    A record that has fewer fields than the header is continued onto the next line. The line break is replaced by a 
+    single space. Each line is parsed only once.
+
+    If the text ends part-way through a record, that record is dropped with a warning. If raise_on_incomplete_record 
+    is set, _IncompleteRecordError is raised instead, even if the rest of the record is only whitespace.
+    """
     file_iterator = iter(rivendell_source_file)
-    expected_fields = next(file_iterator)
-    text_buffer.write(expected_fields)
+    expected_fields = next(file_iterator, None)
+    if expected_fields is None:
+        return
+    yield expected_fields
 
-    line_buffer = StringIO(expected_fields)
-    line_parsed_as_csv = list(csv.reader(line_buffer))[0]
+    line_feeder = _SingleLineFeeder()
+    line_reader = csv.reader(line_feeder)
+    line_feeder.line = expected_fields
+    count_of_expected_fields = len(next(line_reader))
 
-    count_of_expected_fields = len(line_parsed_as_csv)
+    field_counter = _CsvFieldCounter()
 
-    try:
+    for text_line in file_iterator:
+        if '"' in text_line:
+            line_feeder.line = text_line
+            count_of_fields = len(next(line_reader, ()))
+        elif text_line.rstrip("\r\n"):
+            count_of_fields = text_line.count(",") + 1
+        else:
+            count_of_fields = 0
+
+        if count_of_fields >= count_of_expected_fields:
+            yield text_line
+            continue
+
+        # This record is broken across lines. Switch to the incremental counter, which carries the quote state from 
+        # one line to the next.
+        pieces = [text_line]
+        field_counter.reset()
+        field_counter.feed(text_line)
+        while True:
+            next_line = next(file_iterator, None)
+            if next_line is None:
+                incomplete_record = "".join(pieces)
+                if raise_on_incomplete_record:
+                    raise _IncompleteRecordError(incomplete_record)
+                if incomplete_record.strip():
+                    _logger.warning(f"The final record of the csv file is incomplete and was dropped. "
+                                    f"{incomplete_record}")
+                return
+            if _strip_pieces(pieces):
+                # Leading whitespace can change how a quote at the start of the record is parsed, re-count the 
+                # record the way it will be parsed. This can only happen until the record starts with a 
+                # non-whitespace character.
+                field_counter.reset()
+                for piece in pieces:
+                    field_counter.feed(piece)
+            pieces.append(" ")
+            pieces.append(next_line)
+            field_counter.feed(" ")
+            field_counter.feed(next_line)
+
+            if field_counter.field_count > count_of_expected_fields:
+                raise ValueError(f"There are errors in the csv file that cannot be automatically fixed. "
+                                 f"{''.join(pieces)}")
+            if field_counter.field_count == count_of_expected_fields:
+                break
+        yield "".join(pieces)
+
+
+# A carriage return that is not part of a line break. Text mode splits lines there, which the scanner does not.
+_BARE_CARRIAGE_RETURN = re.compile(rb"\r(?!\n)")
+
+
+def _iter_text_rows(text_lines, raise_on_incomplete_record: bool = False, 
+                    instrumentation: LoadInstrumentation | None = None):
+    records = _fix_rivendell_csv_file(text_lines, raise_on_incomplete_record=raise_on_incomplete_record)
+    if instrumentation is None:
+        return csv.reader(records)
+    return instrumentation.stream("csv_rows", csv.reader(instrumentation.stream("repair_records", records)))
+
+
+def _iter_row_dicts(rows) -> Generator[dict, None, None]:
+    """Turns the header and rows from csv.reader into dicts, the same way as csv.DictReader."""
+    header = next(rows, None)
+    if header is None:
+        return
+    count_of_fields = len(header)
+    for row in rows:
+        if not row:
+            continue
+        row_dict = dict(zip(header, row))
+        if count_of_fields < len(row):
+            row_dict[None] = row[count_of_fields:]
+        elif count_of_fields > len(row):
+            for field_name in header[len(row):]:
+                row_dict[field_name] = None
+        yield row_dict
+
+
+def _iter_scanned_rows(dump_map: mmap.mmap, start: int = 0, end: int | None = None, 
+                       raise_on_incomplete_record: bool = False) -> Generator[list[str], None, None]:
+    """Yields the header of the cart data dump in dump_map, then the rows from the byte range start to end, which 
+    must begin at the start of a line. The rows are the same as csv.reader yields from _fix_rivendell_csv_file for 
+    the dump opened in text mode with errors="replace".
+
+    Most lines are complete records without quotes. Those are found and split without the csv module or the text 
+    layer. Every other line goes through _fix_rivendell_csv_file as usual."""
+    if end is None:
+        end = len(dump_map)
+    # The same encoding that open() uses in text mode.
+    encoding = locale.getpreferredencoding(False)
+    if start == 0 and _BARE_CARRIAGE_RETURN.search(dump_map, 0, end):
+        yield from _iter_text_rows(
+            io.TextIOWrapper(io.BytesIO(dump_map[:end]), newline="", errors="replace"), 
+            raise_on_incomplete_record
+        )
+        return
+
+    dump_map.seek(0)
+    header_line = dump_map.readline().decode(encoding, errors="replace")
+    start = max(start, dump_map.tell())
+
+    def iter_text_rows_from(offset):
+        text_lines = io.TextIOWrapper(io.BytesIO(dump_map[offset:end]), newline="", errors="replace")
+        text_rows = _iter_text_rows(chain([header_line], text_lines), raise_on_incomplete_record)
+        next(text_rows, None)
+        return text_rows
+
+    header = next(csv.reader([header_line]), None)
+    if header is None:
+        return
+    yield header
+    if '"' in header_line or _BARE_CARRIAGE_RETURN.search(dump_map, start, end):
+        yield from iter_text_rows_from(start)
+        return
+
+    count_of_expected_fields = len(header)
+    readline = dump_map.readline
+    tell = dump_map.tell
+
+    def read_text_line():
+        if tell() >= end:
+            return ""
+        return readline().decode(encoding, errors="replace")
+
+    line_feeder = _SingleLineFeeder()
+    line_reader = csv.reader(line_feeder)
+    field_counter = _CsvFieldCounter()
+    dump_map.seek(start)
+    while (line_start := tell()) < end:
+        line = readline()
+        if b'"' not in line:
+            fields = line.decode(encoding, errors="replace").split(",")
+            if len(fields) == count_of_expected_fields:
+                fields[-1] = fields[-1].rstrip("\r\n")
+                yield fields
+                continue
+
+        # Quoted fields, records broken across lines, and blank lines are left to _fix_rivendell_csv_file, which 
+        # reads the rest of the record from dump_map.
+        text_line = line.decode(encoding, errors="replace")
+        record_fixer = _fix_rivendell_csv_file(
+            chain([header_line, text_line], iter(read_text_line, "")), 
+            raise_on_incomplete_record=raise_on_incomplete_record
+        )
+        next(record_fixer)
+        record = next(record_fixer, None)
+        if record is None:
+            return
+        if '"' in record:
+            field_counter.reset()
+            field_counter.feed(record)
+            if field_counter._state == _IN_QUOTED_FIELD:
+                # csv.reader would carry on reading the next record into the open quoted field. Leave the rest of 
+                # the dump to it.
+                yield from iter_text_rows_from(line_start)
+                return
+        line_feeder.line = record
+        yield next(line_reader)
+
+
+# Chunks smaller than this are not worth sending to another process.
+_MINIMUM_CHUNK_SIZE = 4 * 1024 * 1024
+
+# The start of a line that begins a record: the cart number and the cut number.
+_RECORD_START = re.compile(rb"\d+,\d+,")
+
+
+def _find_chunk_boundaries(rivendell_source_file, number_of_chunks: int) -> list[int]:
+    """Splits the binary file into at most number_of_chunks byte ranges and returns their boundaries, from 0 to the 
+    size of the file. Every boundary after 0 is the start of a line that looks like the start of a record. Whether 
+    it really is one is only known once the previous chunk has been parsed."""
+    file_size = rivendell_source_file.seek(0, os.SEEK_END)
+    number_of_chunks = min(number_of_chunks, file_size // _MINIMUM_CHUNK_SIZE)
+    rivendell_source_file.seek(0)
+    rivendell_source_file.readline()
+    header_end = rivendell_source_file.tell()
+
+    boundaries = [0]
+    for chunk_index in range(1, number_of_chunks):
+        rivendell_source_file.seek(max(file_size * chunk_index // number_of_chunks, header_end, boundaries[-1]))
+        # Skip the rest of the line that the offset fell in.
+        rivendell_source_file.readline()
         while True:
-            text_line = next(file_iterator)
-            text_line_buffer = StringIO(text_line)
-            text_line_parsed_as_csv = list(csv.reader(text_line_buffer))[0]
-            
-            while len(text_line_parsed_as_csv) < count_of_expected_fields:
-                text_line = text_line.strip()
-                next_line = next(file_iterator)
-                text_line = text_line + " " + next_line
-                text_line_buffer = StringIO(text_line)
-                text_line_parsed_as_csv = list(csv.reader(text_line_buffer))[0]
-
-                if len(text_line_parsed_as_csv) > count_of_expected_fields:
-                    raise ValueError(f"There are errors in the csv file that cannot be automatically fixed. {text_line_buffer.getvalue()}")
-            text_buffer.write(text_line_buffer.getvalue())
-    except StopIteration:
-        text_buffer.seek(0, SEEK_SET)
-        return text_buffer
+            line_start = rivendell_source_file.tell()
+            line = rivendell_source_file.readline()
+            if not line:
+                break
+            if _RECORD_START.match(line):
+                boundaries.append(line_start)
+                break
+    if boundaries[-1] < file_size:
+        boundaries.append(file_size)
+    return boundaries
+
+
+def _parse_chunk(load_cart_data_dump, header_line: str, start: int, end: int, is_final_chunk: bool, 
+                 filter_rows: bool):
+    """Parses the carts in one byte range of the cart data dump, in a worker process. Returns the parsed carts, the 
+    RowFilterCounts of the range, which is None unless filter_rows, and the seconds that parsing the range took.
+
+    Returns None if the range ends part-way through a record, because then the next range did not start at the start 
+    of a record."""
+    started_at = time.perf_counter()
+    load_cart_data_dump.row_filter_counts = RowFilterCounts() if filter_rows else None
+    try:
+        with open(str(load_cart_data_dump.rivendell_cart_data_filename), mode="rb") as rivendell_source_file:
+            if load_cart_data_dump.memory_map:
+                with mmap.mmap(rivendell_source_file.fileno(), 0, access=mmap.ACCESS_READ) as dump_map:
+                    rows = _iter_scanned_rows(dump_map, start, end, raise_on_incomplete_record=not is_final_chunk)
+                    chunk_result = _parse_chunk_rows(load_cart_data_dump, rows)
+                    return chunk_result, load_cart_data_dump.row_filter_counts, time.perf_counter() - started_at
+            rivendell_source_file.seek(start)
+            chunk_data = rivendell_source_file.read(end - start)
+        # Decoded the same way as the serial loader's open().
+        chunk_text = io.TextIOWrapper(io.BytesIO(chunk_data), newline="", errors="replace")
+        if start > 0:
+            chunk_text = chain([header_line], chunk_text)
+        rows = _iter_text_rows(chunk_text, raise_on_incomplete_record=not is_final_chunk)
+        chunk_result = _parse_chunk_rows(load_cart_data_dump, rows)
+        return chunk_result, load_cart_data_dump.row_filter_counts, time.perf_counter() - started_at
+    except _IncompleteRecordError:
+        return None
+
+
+def _parse_chunk_rows(load_cart_data_dump, rows):
+    if load_cart_data_dump.trusted_dump:
+        # A compact table is many times faster to send back to the parent process than a list of records.
+        return CartTable.from_records(load_cart_data_dump._parse_rows(rows)).compact()
+    return list(load_cart_data_dump._parse_rows(rows))
+
+
+# The functions that open a compressed cart data dump, by its suffix. The dump is decompressed as it is read.
+_DECOMPRESSING_OPENERS = {".gz": gzip.open, ".bz2": bz2.open, ".xz": lzma.open}
+
+
+def _decompressing_opener(rivendell_cart_data_filename):
+    """Returns the function that opens the cart data dump with streaming decompression, or None if the dump is not 
+    compressed."""
+    return _DECOMPRESSING_OPENERS.get(Path(rivendell_cart_data_filename).suffix.lower())
+
+
+@dataclass
+class RowFilterCounts:
+    """How many rows of the cart data dump were read, and how many of them the excluded groups and macro filters 
+    rejected before a cart was built from the row."""
+    rows_read: int = 0
+    excluded_group_rows: int = 0
+    macro_rows: int = 0
+
+    @property
+    def rows_kept(self) -> int:
+        return self.rows_read - self.excluded_group_rows - self.macro_rows
+
+    def add(self, other: "RowFilterCounts"):
+        self.rows_read += other.rows_read
+        self.excluded_group_rows += other.excluded_group_rows
+        self.macro_rows += other.macro_rows
 
 
 @dataclass
@@ -220,14 +1015,260 @@ class LoadCartDataDump:
     excluded_group_list: list
     include_macros: bool
     include_all_cuts: bool
+    trusted_dump: bool = False
+    dump_cache: DumpCache | None = None
+    parse_workers: int = 1
+    # The names of the only fields that load_carts and iter_carts need. See _projection.
+    projected_fields: list[str] | None = None
+    # Read the dump through a memory map and _iter_scanned_rows, instead of in text mode.
+    memory_map: bool = False
+    # Only keep the carts that have every one of these scheduler codes, and none of the excluded ones.
+    required_sched_codes: list[str] | None = None
+    excluded_sched_codes: list[str] | None = None
+    # Records the time, rows, and peak memory of each stage of load_carts, load_cart_table, and iter_carts.
+    instrumentation: LoadInstrumentation | None = field(default=None, repr=False, compare=False)
+    # The RowFilterCounts of the latest load, or None if its filters were not pushed down to the raw rows.
+    row_filter_counts: RowFilterCounts | None = field(default=None, init=False, repr=False, compare=False)
+
+    def _iter_dump_rows(self) -> Generator[list[str], None, None]:
+        """Yields the header and then the rows of the cart data dump, with any broken records repaired."""
+        decompressing_opener = _decompressing_opener(self.rivendell_cart_data_filename)
+        if decompressing_opener is not None:
+            if self.memory_map:
+                _logger.info("A compressed cart data dump can not be memory mapped. Reading it as a stream instead.")
+            with decompressing_opener(str(self.rivendell_cart_data_filename), newline="", mode="rt", 
+                                      errors="replace") as rivendell_source_file:
+                yield from _iter_text_rows(rivendell_source_file, instrumentation=self.instrumentation)
+            return
+        if self.memory_map:
+            with open(str(self.rivendell_cart_data_filename), mode="rb") as rivendell_source_file:
+                # An empty file can not be memory mapped.
+                if os.fstat(rivendell_source_file.fileno()).st_size == 0:
+                    return
+                with mmap.mmap(rivendell_source_file.fileno(), 0, access=mmap.ACCESS_READ) as dump_map:
+                    # Scanning both repairs the broken records and splits the rows.
+                    yield from self._stream_stage("scan_rows", _iter_scanned_rows(dump_map))
+            return
+        with open(str(self.rivendell_cart_data_filename), newline="", mode="rt", errors="replace") as \
+                rivendell_source_file:
+            yield from _iter_text_rows(rivendell_source_file, instrumentation=self.instrumentation)
+
+    def _stream_stage(self, stage_name: str, rows):
+        if self.instrumentation is None:
+            return rows
+        return self.instrumentation.stream(stage_name, rows)
+
+    def _filter_stage(self, stage_name: str, filter_function, rows):
+        if self.instrumentation is None:
+            return filter_function(rows)
+        return self.instrumentation.stream_filter(stage_name, filter_function, rows)
+
+    def _measure_stage(self, stage_name: str, function, *arguments):
+        if self.instrumentation is None:
+            return function(*arguments)
+        return self.instrumentation.measure(stage_name, function, *arguments)
+
+    def _start_instrumentation(self, method_name: str):
+        if self.instrumentation is not None:
+            description = f"{type(self).__name__}.{method_name}"
+            if self.rivendell_cart_data_filename is not None:
+                description = f"{description} {self.rivendell_cart_data_filename}"
+            self.instrumentation.start(description)
+
+    def _finish_instrumentation(self):
+        if self.instrumentation is not None:
+            self.instrumentation.finish(self.row_filter_counts)
+
+    def _iter_rivendell_carts(self) -> Generator[RivendellCart, None, None]:
+        yield from self._parse_rows(self._stream_stage("read_rows", self._iter_dump_rows()))
+
+    def _projection(self) -> tuple[str, ...] | None:
+        """Returns the fields of the lightweight records that load_carts and iter_carts build when projected_fields 
+        is given, or None to build whole carts. The records are named tuples with the fields that are in 
+        projected_fields, plus the fields that the filters use, and are built without validation, like with 
+        trusted_dump. Whole carts are always built with dump_cache, because it keeps whole carts."""
+        if self.projected_fields is None or self.dump_cache is not None:
+            return None
+        if self._has_sched_code_filter():
+            return _projected_field_names([*self.projected_fields, "sched_codes"])
+        return _projected_field_names(self.projected_fields)
+
+    def _parse_rows(self, rows) -> Generator[RivendellCart, None, None]:
+        """Builds the carts from the header and rows of the cart data dump."""
+        projection = self._projection()
+        if self.trusted_dump or projection is not None:
+            yield from self._stream_stage("build_records", self._iter_trusted_records(rows, projection))
+            return
+        rivendell_reader = self._stream_stage("row_dicts", _iter_row_dicts(iter(rows)))
+        if self.row_filter_counts is not None:
+            rivendell_reader = self._filter_stage(
+                "raw_row_filters",
+                lambda row_dicts: self._filter_raw_rows(
+                    row_dicts, 
+                    get_group_name=itemgetter("GROUP_NAME"), 
+                    get_type=itemgetter("TYPE")
+                ),
+                rivendell_reader
+            )
+        interned_values = {}
+        rivendell_carts = (
+            RivendellCart.from_dict(rivendell_cart, interned_values) for rivendell_cart in rivendell_reader
+        )
+        yield from self._stream_stage("validate_carts", rivendell_carts)
+
+    def _filter_raw_rows(self, rows, get_group_name, get_type):
+        """Applies the excluded groups and macro filters to the rows as they come from the csv reader, so that no cart 
+        is built for a row that would be removed anyway. The rows are counted in row_filter_counts."""
+        row_filter_counts = self.row_filter_counts
+        excluded_groups = set(self.excluded_group_list)
+        include_macros = self.include_macros
+        rows_read = excluded_group_rows = macro_rows = 0
+        try:
+            for row in rows:
+                rows_read += 1
+                if get_group_name(row) in excluded_groups:
+                    excluded_group_rows += 1
+                elif not include_macros and get_type(row) != "audio":
+                    macro_rows += 1
+                else:
+                    yield row
+        finally:
+            row_filter_counts.rows_read += rows_read
+            row_filter_counts.excluded_group_rows += excluded_group_rows
+            row_filter_counts.macro_rows += macro_rows
+
+    def _filter_raw_row_batch(self, rows: list, group_name_position: int, type_position: int) -> list:
+        """Like _filter_raw_rows, for a batch of rows from csv.reader. Building a RivendellCartRecord is cheap, so the 
+        filters have to be cheaper still to pay for themselves."""
+        row_filter_counts = self.row_filter_counts
+        row_filter_counts.rows_read += len(rows)
+        if self.excluded_group_list:
+            excluded_groups = set(self.excluded_group_list)
+            number_of_rows = len(rows)
+            rows = [row for row in rows if row[group_name_position] not in excluded_groups]
+            row_filter_counts.excluded_group_rows += number_of_rows - len(rows)
+        if not self.include_macros:
+            number_of_rows = len(rows)
+            rows = [row for row in rows if row[type_position] == "audio"]
+            row_filter_counts.macro_rows += number_of_rows - len(rows)
+        return rows
+
+    def _iter_trusted_records(self, rows, projection: tuple[str, ...] | None = None) -> \
+            Generator[RivendellCartRecord, None, None]:
+        rivendell_reader = iter(rows)
+        header = next(rivendell_reader, None)
+        if header is None:
+            return
+        if projection is None:
+            make_record = _make_record_factory(header)
+        else:
+            make_record = _make_projected_record_factory(header, projection)
+        needs_lengths = projection is None or "length_in_seconds" in projection
+        length_position = header.index("LENGTH")
+        group_name_position = header.index("GROUP_NAME")
+        type_position = header.index("TYPE")
+        non_blank_rows = filter(None, rivendell_reader)
+        unparseable_lengths = 0
+        # The lengths are converted a batch of rows at a time, so that each batch is a single vectorized call. A 
+        # length that cannot be parsed only affects its own row.
+        while rows := list(islice(non_blank_rows, _LENGTH_BATCH_SIZE)):
+            if self.row_filter_counts is not None:
+                rows = self._filter_raw_row_batch(rows, group_name_position, type_position)
+            if needs_lengths:
+                lengths_in_seconds = lengths_to_seconds(
+                    [row[length_position] for row in rows], unparseable_seconds=UNPARSEABLE_LENGTH_IN_SECONDS
+                )
+                unparseable_lengths += _count_unparseable_lengths(lengths_in_seconds)
+                lengths_in_seconds = lengths_in_seconds.tolist()
+            else:
+                lengths_in_seconds = repeat(None)
+            yield from map(make_record, rows, lengths_in_seconds)
+        _log_unparseable_lengths(unparseable_lengths)
 
     def _load_rivendell_carts(self) -> list[RivendellCart]:
+        if self.parse_workers > 1:
+            rivendell_carts = self._measure_stage("parse_in_parallel", self._load_rivendell_carts_in_parallel)
+            if rivendell_carts is not None:
+                return rivendell_carts
+        return list(self._iter_rivendell_carts())
+
+    def _parse_chunks_in_parallel(self) -> list | None:
+        """Parses byte ranges of the cart data dump in parse_workers processes and returns the result of each range, 
+        in order. Returns None if the dump is too small to split, or if a range turns out not to start at the start 
+        of a record, in which case the caller parses serially. A compressed dump can not be split, and is always 
+        parsed serially."""
+        if _decompressing_opener(self.rivendell_cart_data_filename) is not None:
+            _logger.info("A compressed cart data dump can not be parsed in parallel. Parsing serially.")
+            return None
+        with open(str(self.rivendell_cart_data_filename), mode="rb") as rivendell_source_file:
+            boundaries = _find_chunk_boundaries(rivendell_source_file, self.parse_workers)
+        if len(boundaries) <= 2:
+            _logger.debug("The cart data dump is too small to parse in parallel.")
+            return None
+
         with open(str(self.rivendell_cart_data_filename), newline="", mode="rt", errors="replace") as \
                 rivendell_source_file:
-            rivendell_fixed_data = _fix_rivendell_csv_file(rivendell_source_file)
-            rivendell_reader = csv.DictReader(rivendell_fixed_data)
-            rivendell_carts = [RivendellCart.from_dict(rivendell_cart) for rivendell_cart in rivendell_reader]
-        return rivendell_carts
+            header_line = next(rivendell_source_file, "")
+
+        starts = boundaries[:-1]
+        ends = boundaries[1:]
+        is_final_chunk = [end == boundaries[-1] for end in ends]
+        filter_rows = self.row_filter_counts is not None
+        # The workers can not share the instrumentation of this process. The time each chunk took is recorded below.
+        chunk_parser = replace(self, dump_cache=None, parse_workers=1, instrumentation=None)
+        # Unpickling the results creates millions of objects, none of them in reference cycles. Without pausing the 
+        # cyclic garbage collector, it would repeatedly scan them all while they are being created.
+        garbage_collector_was_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            with ProcessPoolExecutor(max_workers=self.parse_workers) as executor:
+                chunk_results = list(
+                    executor.map(
+                        _parse_chunk, 
+                        repeat(chunk_parser), repeat(header_line), starts, ends, is_final_chunk, repeat(filter_rows)
+                    )
+                )
+        finally:
+            if garbage_collector_was_enabled:
+                gc.enable()
+
+        if any(chunk_result is None for chunk_result in chunk_results):
+            _logger.info("A chunk of the cart data dump did not start at the start of a record. Parsing serially.")
+            return None
+        if filter_rows:
+            for _, chunk_row_filter_counts, _ in chunk_results:
+                self.row_filter_counts.add(chunk_row_filter_counts)
+        if self.instrumentation is not None:
+            for chunk_number, (chunk_result, _, chunk_seconds) in enumerate(chunk_results, start=1):
+                self.instrumentation.record(f"parse_chunk_{chunk_number}", chunk_seconds, len(chunk_result))
+        return [chunk_result for chunk_result, _, _ in chunk_results]
+
+    def _load_cart_table_in_parallel(self) -> CartTable | None:
+        trusted_loader = replace(self, trusted_dump=True, projected_fields=None)
+        trusted_loader.row_filter_counts = self.row_filter_counts
+        compacted_chunks = trusted_loader._parse_chunks_in_parallel()
+        if compacted_chunks is None:
+            return None
+        data = pd.concat(
+            [CartTable.from_compact(compacted_chunk).data for compacted_chunk in compacted_chunks], 
+            ignore_index=True
+        )
+        # Each chunk has its own group_name categories, re-build them across the whole table.
+        data["group_name"] = data["group_name"].astype(str).astype("category")
+        return CartTable(data=data)
+
+    def _load_rivendell_carts_in_parallel(self) -> list[RivendellCart] | None:
+        projection = self._projection()
+        if self.trusted_dump or projection is not None:
+            cart_table = self._load_cart_table_in_parallel()
+            if cart_table is None:
+                return None
+            if projection is None:
+                return cart_table.to_records()
+            # The records are built here because the record types of projections can not be sent between processes.
+            return cart_table.to_projected_records(projection)
+        chunk_results = self._parse_chunks_in_parallel()
+        return None if chunk_results is None else list(chain.from_iterable(chunk_results))
 
     def _remove_excluded_groups(self, rivendell_carts) -> Generator[RivendellCart, None, None]:
         return (rivendell_cart for rivendell_cart in rivendell_carts if
@@ -236,6 +1277,29 @@ class LoadCartDataDump:
     def _remove_macro_carts(self, rivendell_carts) -> Generator[RivendellCart, None, None]:
         return (rivendell_cart for rivendell_cart in rivendell_carts if not rivendell_cart.type == CartType.Macro)
 
+    def _has_sched_code_filter(self) -> bool:
+        return bool(self.required_sched_codes or self.excluded_sched_codes)
+
+    def _select_by_sched_codes(self, rivendell_carts: list) -> list:
+        sched_code_index = SchedulerCodeIndex.from_sched_codes([cart.sched_codes for cart in rivendell_carts])
+        selected = self._sched_code_mask(sched_code_index)
+        return list(compress(rivendell_carts, selected.tolist()))
+
+    def _iter_selected_by_sched_codes(self, rivendell_carts) -> Generator[RivendellCart, None, None]:
+        has_sched_codes = make_sched_codes_predicate(
+            required_codes=self.required_sched_codes or (), 
+            excluded_codes=self.excluded_sched_codes or ()
+        )
+        return (rivendell_cart for rivendell_cart in rivendell_carts if has_sched_codes(rivendell_cart.sched_codes))
+
+    def _sched_code_mask(self, sched_code_index: SchedulerCodeIndex) -> np.ndarray:
+        selected = sched_code_index.select(
+            required_codes=self.required_sched_codes or (), 
+            excluded_codes=self.excluded_sched_codes or ()
+        )
+        _logger.info(f"Scheduler code filter: {int(selected.sum())} of {len(selected)} carts kept.")
+        return selected
+
     def _remove_extra_cuts(self, rivendell_carts) -> ValuesView[RivendellCart]:
         carts_grouped_by_cart_number = dict()
         for cart in rivendell_carts:
@@ -246,15 +1310,179 @@ class LoadCartDataDump:
                 carts_grouped_by_cart_number[cart.cart_number] = cart
         return carts_grouped_by_cart_number.values()
 
+    def _iter_lowest_cuts(self, rivendell_carts) -> Generator[RivendellCart, None, None]:
+        # The cart data dump is ordered by cart number, so only the cuts of the current cart need to be held.
+        lowest_cut = None
+        for cart in rivendell_carts:
+            if lowest_cut is None:
+                lowest_cut = cart
+            elif cart.cart_number == lowest_cut.cart_number:
+                if cart.cut_number < lowest_cut.cut_number:
+                    lowest_cut = cart
+            elif int(cart.cart_number) < int(lowest_cut.cart_number):
+                raise ValueError(f"The cart data dump is not ordered by cart number. Cart {cart.cart_number} came "
+                                 f"after cart {lowest_cut.cart_number}. Use load_carts instead.")
+            else:
+                yield lowest_cut
+                lowest_cut = cart
+        if lowest_cut is not None:
+            yield lowest_cut
+
+    def _remove_excluded_groups_from_table(self, data: pd.DataFrame) -> pd.DataFrame:
+        return data.loc[~data["group_name"].isin(self.excluded_group_list)]
+
+    def _remove_macro_carts_from_table(self, data: pd.DataFrame) -> pd.DataFrame:
+        return data.loc[data["type"] != CartType.Macro]
+
+    def _remove_extra_cuts_from_table(self, data: pd.DataFrame) -> pd.DataFrame:
+        # Like _remove_extra_cuts, cut numbers are compared as strings, the first of any tied cuts is kept, and the 
+        # carts stay in the order in which each cart number first appears.
+        cart_codes, _ = pd.factorize(data["cart_number"])
+        cut_ranks, _ = pd.factorize(data["cut_number"], sort=True)
+        # lexsort is stable, so within each cart the lowest cut, then the earliest row, comes first.
+        ordered = np.lexsort((cut_ranks, cart_codes))
+        ordered_cart_codes = cart_codes[ordered]
+        is_first_of_cart = np.ones(len(ordered), dtype=bool)
+        is_first_of_cart[1:] = ordered_cart_codes[1:] != ordered_cart_codes[:-1]
+        return data.iloc[ordered[is_first_of_cart]]
+
+    def _start_row_filter_counts(self):
+        """Pushes the excluded groups and macro filters down to the raw rows of the next parse, unless the unfiltered 
+        carts are going to be stored in dump_cache, or there is nothing to filter."""
+        if self.dump_cache is None and (self.excluded_group_list or not self.include_macros):
+            self.row_filter_counts = RowFilterCounts()
+        else:
+            self.row_filter_counts = None
+
+    def _log_row_filter_counts(self):
+        row_filter_counts = self.row_filter_counts
+        if row_filter_counts is not None:
+            _logger.info(f"Row filters: {row_filter_counts.rows_read} rows read, "
+                         f"{row_filter_counts.excluded_group_rows} in excluded groups, "
+                         f"{row_filter_counts.macro_rows} macros, {row_filter_counts.rows_kept} kept.")
+
+    def _filter_cart_table(self, cart_table: CartTable) -> CartTable:
+        data = cart_table.data
+        if self.excluded_group_list:
+            data = self._remove_excluded_groups_from_table(data)
+        if not self.include_macros:
+            data = self._remove_macro_carts_from_table(data)
+        if self._has_sched_code_filter():
+            data = data.loc[self._sched_code_mask(SchedulerCodeIndex.from_sched_codes(data["sched_codes"]))]
+        if not self.include_all_cuts:
+            data = self._remove_extra_cuts_from_table(data)
+        data = data.reset_index(drop=True)
+        # So that the categories are the same whether the rows were filtered here or before the table was built.
+        data["group_name"] = data["group_name"].cat.remove_unused_categories()
+        return CartTable(data=data)
+
+    def _load_cached_cart_table(self) -> CartTable | None:
+        """Returns the unfiltered CartTable stored in dump_cache for this dump, or None if there is no cache or no 
+        current entry."""
+        if self.dump_cache is None:
+            return None
+        compacted = self._measure_stage("load_dump_cache", self.dump_cache.load, self.rivendell_cart_data_filename)
+        if compacted is None:
+            return None
+        return CartTable.from_compact(compacted)
+
+    def _fingerprint_dump(self):
+        # Taken before parsing, so that a dump that changes while it is being parsed is parsed again next time.
+        if self.dump_cache is None:
+            return None
+        return self.dump_cache.fingerprint(self.rivendell_cart_data_filename)
+
+    def _store_cart_table(self, fingerprint, cart_table: CartTable):
+        if fingerprint is not None:
+            self._measure_stage("store_dump_cache", lambda: self.dump_cache.store(fingerprint, cart_table.compact()))
+
+    def load_cart_table(self) -> CartTable:
+        """Loads the carts into a CartTable. The rows are built the same way as with trusted_dump."""
+        _logger.debug(f"Starting load_cart_table with {self}")
+        self._start_instrumentation("load_cart_table")
+        try:
+            return self._load_cart_table()
+        finally:
+            self._finish_instrumentation()
+
+    def _load_cart_table(self) -> CartTable:
+        self.row_filter_counts = None
+        cart_table = self._load_cached_cart_table()
+        if cart_table is None:
+            self._start_row_filter_counts()
+            fingerprint = self._fingerprint_dump()
+            if self.parse_workers > 1:
+                cart_table = self._measure_stage("parse_in_parallel", self._load_cart_table_in_parallel)
+            if cart_table is None:
+                trusted_records = self._stream_stage(
+                    "build_records", 
+                    self._iter_trusted_records(self._stream_stage("read_rows", self._iter_dump_rows()))
+                )
+                cart_table = self._measure_stage("build_cart_table", CartTable.from_records, trusted_records)
+            self._store_cart_table(fingerprint, cart_table)
+            self._log_row_filter_counts()
+
+        return self._measure_stage("filter_cart_table", self._filter_cart_table, cart_table)
+
     def load_carts(self) -> list[RivendellCart]:
         _logger.debug(f"Starting load_carts with {self}")
+        self._start_instrumentation("load_carts")
+        try:
+            return self._load_carts()
+        finally:
+            self._finish_instrumentation()
+
+    def _load_carts(self) -> list[RivendellCart]:
+        self.row_filter_counts = None
+        cart_table = self._load_cached_cart_table()
+        if cart_table is not None:
+            cart_table = self._measure_stage("filter_cart_table", self._filter_cart_table, cart_table)
+            if self.trusted_dump:
+                return self._measure_stage("build_records", cart_table.to_records)
+            return self._measure_stage("validate_carts", cart_table.to_carts)
+
+        self._start_row_filter_counts()
+        fingerprint = self._fingerprint_dump()
         rivendell_carts = self._load_rivendell_carts()
+        self._log_row_filter_counts()
+        if fingerprint is not None:
+            if self.trusted_dump:
+                self._store_cart_table(fingerprint, CartTable.from_records(rivendell_carts))
+            else:
+                self._store_cart_table(fingerprint, CartTable.from_carts(rivendell_carts))
 
         if self.excluded_group_list:
-            rivendell_carts = self._remove_excluded_groups(rivendell_carts)
+            rivendell_carts = self._filter_stage("excluded_groups", self._remove_excluded_groups, rivendell_carts)
         if not self.include_macros:
-            rivendell_carts = self._remove_macro_carts(rivendell_carts)
+            rivendell_carts = self._filter_stage("macros", self._remove_macro_carts, rivendell_carts)
+        if self._has_sched_code_filter():
+            rivendell_carts = self._filter_stage(
+                "sched_codes", lambda carts: self._select_by_sched_codes(list(carts)), rivendell_carts
+            )
         if not self.include_all_cuts:
-            rivendell_carts = self._remove_extra_cuts(rivendell_carts)
+            rivendell_carts = self._filter_stage("extra_cuts", self._remove_extra_cuts, rivendell_carts)
 
         return list(rivendell_carts)
+
+    def iter_carts(self) -> Generator[RivendellCart, None, None]:
+        """Yields the filtered carts as they are parsed, without holding the whole cart data dump in memory."""
+        _logger.debug(f"Starting iter_carts with {self}")
+        self._start_instrumentation("iter_carts")
+        self._start_row_filter_counts()
+        rivendell_carts = self._iter_rivendell_carts()
+
+        if self.excluded_group_list:
+            rivendell_carts = self._filter_stage("excluded_groups", self._remove_excluded_groups, rivendell_carts)
+        if not self.include_macros:
+            rivendell_carts = self._filter_stage("macros", self._remove_macro_carts, rivendell_carts)
+        if self._has_sched_code_filter():
+            rivendell_carts = self._filter_stage("sched_codes", self._iter_selected_by_sched_codes, rivendell_carts)
+        if not self.include_all_cuts:
+            rivendell_carts = self._filter_stage("extra_cuts", self._iter_lowest_cuts, rivendell_carts)
+
+        try:
+            yield from rivendell_carts
+        finally:
+            # Also when the caller stops early, so that what was measured is not lost.
+            self._finish_instrumentation()
+        self._log_row_filter_counts()
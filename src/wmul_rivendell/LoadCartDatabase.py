@@ -0,0 +1,227 @@
+"""
+@Author = 'Michael Stanley'
+
+Loads the carts straight from the CART, CUTS, and CART_SCHED_CODES tables of the Rivendell database, so that the
+"Cart Data Dump (CSV)" does not have to be exported from RD Library first.
+
+LoadCartDatabase is a LoadCartDataDump whose rows come from the database instead of from a file. Each row is
+formatted the way RD Library writes it into the Cart Data Dump, so the carts are parsed, validated, and filtered by the
+same code, and are the same RivendellCarts. The rows are streamed from an unbuffered cursor, fetch_size at a time.
+
+============ Change Log ============
+2026-Oct-18 = Created.
+              A cart without cuts, such as a macro cart, is written as cut 1 with a length of :00, as in the Cart 
+              Data Dump.
+              SCHED_CODES is written in the fixed width format of the Cart Data Dump, each code padded to 11 
+              characters and followed by a ".", instead of joined with "|".
+
+============ License ============
+Copyright (C) 2026 Michael Stanley
+
+This file is part of wmul_rivendell.
+
+wmul_rivendell is free software: you can redistribute it and/or modify it
+under the terms of the GNU General Public License as published by the Free
+Software Foundation, either version 3 of the License, or (at your option) any
+later version.
+
+wmul_rivendell is distributed in the hope that it will be useful, but WITHOUT
+ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License along with
+wmul_rivendell. If not, see <https://www.gnu.org/licenses/>.
+"""
+import configparser
+from collections import defaultdict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Generator
+
+import mysql.connector
+import wmul_logger
+
+from wmul_rivendell.LoadCartDataDump import LoadCartDataDump, _DUMP_FIELD_NAMES
+
+_logger = wmul_logger.get_logger()
+
+DEFAULT_FETCH_SIZE = 5000
+
+# Rivendell's cart types. Any other type is written as a macro, as RivendellCart.from_dict reads it.
+_AUDIO_CART_TYPE = 1
+
+_SCHED_CODES_QUERY = "SELECT CART_NUMBER, SCHED_CODE FROM CART_SCHED_CODES"
+
+# Every cart, with one row per cut. A cart without cuts, such as a macro cart, has a single row whose cut fields are
+# NULL. Ordered by cart number, like the Cart Data Dump, so that iter_carts can remove the extra cuts as it goes.
+_CARTS_QUERY = \
+    "SELECT CART.NUMBER, CUTS.CUT_NAME, CART.TYPE, CART.GROUP_NAME, CART.TITLE, CART.ARTIST, CART.ALBUM, CART.YEAR, " \
+    "CUTS.ISRC, CUTS.ISCI, CART.LABEL, CART.CLIENT, CART.AGENCY, CART.PUBLISHER, CART.COMPOSER, CART.CONDUCTOR, " \
+    "CART.SONG_ID, CART.USER_DEFINED, CUTS.DESCRIPTION, CUTS.OUTCUE, CUTS.LENGTH, CUTS.START_POINT, " \
+    "CUTS.END_POINT, CUTS.SEGUE_START_POINT, CUTS.SEGUE_END_POINT, CUTS.HOOK_START_POINT, CUTS.HOOK_END_POINT, " \
+    "CUTS.TALK_START_POINT, CUTS.TALK_END_POINT, CUTS.FADEUP_POINT, CUTS.FADEDOWN_POINT " \
+    "FROM CART LEFT JOIN CUTS ON CART.NUMBER = CUTS.CART_NUMBER"
+
+_CARTS_ORDER = " ORDER BY CART.NUMBER, CUTS.CUT_NAME"
+
+
+def database_settings_from_rd_conf(rd_conf_filename) -> dict:
+    """Reads the database connection settings from the [mySQL] section of a Rivendell configuration file, usually
+    /etc/rd.conf. Returns them as the sql_ keyword arguments of LoadCartDatabase."""
+    rd_conf = configparser.ConfigParser(interpolation=None, strict=False)
+    with open(str(rd_conf_filename), mode="rt", errors="replace") as rd_conf_file:
+        rd_conf.read_file(rd_conf_file)
+    if not rd_conf.has_section("mySQL"):
+        raise ValueError(f"The Rivendell configuration file: {rd_conf_filename}, does not have a [mySQL] section.")
+    mysql_settings = rd_conf["mySQL"]
+    return {
+        "sql_host": mysql_settings.get("Hostname", "localhost"),
+        "sql_user": mysql_settings.get("Loginname", "rduser"),
+        "sql_pass": mysql_settings.get("Password", "letmein"),
+        "sql_database_name": mysql_settings.get("Database", "Rivendell")
+    }
+
+
+def _length_text(milliseconds: int | None) -> str:
+    """Formats a length in milliseconds the way RD Library writes it into the Cart Data Dump: ":SS", "M:SS", or
+    "H:MM:SS"."""
+    if milliseconds is None:
+        return ""
+    hours, remainder = divmod(int(milliseconds) // 1000, 3600)
+    minutes, seconds = divmod(remainder, 60)
+    if hours:
+        return f"{hours}:{minutes:02d}:{seconds:02d}"
+    if minutes:
+        return f"{minutes}:{seconds:02d}"
+    return f":{seconds:02d}"
+
+
+def _sched_codes_text(codes) -> str:
+    """Formats the scheduler codes of a cart the way RD Library writes them into the Cart Data Dump: each code padded 
+    on the right to 11 characters, then a ".". A cart without codes is just "."."""
+    return "".join(code.ljust(11) for code in codes) + "."
+
+
+def _year_text(year) -> str:
+    # CART.YEAR is a DATE, of which the dump only has the year.
+    if year is None:
+        return ""
+    if hasattr(year, "year"):
+        return str(year.year)
+    return str(year)[:4]
+
+
+def _text(value) -> str:
+    if value is None:
+        return ""
+    if isinstance(value, (bytes, bytearray)):
+        return value.decode("utf-8", errors="replace")
+    return str(value)
+
+
+def _format_row(database_row, sched_codes: dict) -> list[str]:
+    """Turns a row of _CARTS_QUERY into a row of the Cart Data Dump, in the order of _DUMP_FIELD_NAMES."""
+    cart_number, cut_name, cart_type, group_name, *cart_fields, length = database_row[:21]
+    (title, artist, album, year, isrc, isci, label, client, agency, publisher, composer, conductor, song_id,
+     user_defined, description, outcue) = cart_fields
+    points = database_row[21:]
+    if cut_name is None:
+        # A cart without cuts, such as a macro cart, is in the Cart Data Dump as cut 1, with no file and no length.
+        cut_number, filename, length_text = "1", "", ":00"
+    else:
+        cut_name = _text(cut_name)
+        cut_number = str(int(cut_name.rsplit("_", 1)[-1]))
+        filename = f"{cut_name}.wav"
+        length_text = _length_text(length)
+    return [
+        str(cart_number), cut_number, "audio" if cart_type == _AUDIO_CART_TYPE else "macro", _text(group_name),
+        _text(title), _text(artist), _text(album), _year_text(year), _text(isrc), _text(isci), _text(label),
+        _text(client), _text(agency), _text(publisher), _text(composer), _text(conductor), _text(song_id),
+        _text(user_defined), _text(description), _text(outcue), filename, length_text,
+        *[_text(point) for point in points],
+        _sched_codes_text(sched_codes.get(cart_number, ()))
+    ]
+
+
+@dataclass(kw_only=True)
+class LoadCartDatabase(LoadCartDataDump):
+    """Takes the same options as LoadCartDataDump, except for the ones that are about the dump file:
+    rivendell_cart_data_filename, dump_cache, parse_workers, and memory_map.
+
+    The excluded groups and macro carts are left out by the query, so row_filter_counts is always None. The database
+    compares group names with its own collation, which in Rivendell ignores case."""
+    rivendell_cart_data_filename: Path | None = None
+    sql_host: str = "localhost"
+    sql_user: str = "rduser"
+    sql_pass: str = field(default="letmein", repr=False)
+    sql_database_name: str = "Rivendell"
+    fetch_size: int = DEFAULT_FETCH_SIZE
+
+    def __post_init__(self):
+        if self.dump_cache is not None or self.parse_workers != 1 or self.memory_map:
+            raise ValueError("dump_cache, parse_workers, and memory_map only apply to a Cart Data Dump, not to "
+                             "LoadCartDatabase.")
+
+    def _connect(self):
+        return mysql.connector.connect(
+            host=self.sql_host,
+            database=self.sql_database_name,
+            user=self.sql_user,
+            password=self.sql_pass,
+            # So that closing the connection does not fail when iter_carts is not read to the end.
+            consume_results=True
+        )
+
+    def _carts_query(self) -> tuple[str, list]:
+        conditions = []
+        parameters = []
+        if self.excluded_group_list:
+            conditions.append(f"CART.GROUP_NAME NOT IN ({', '.join(['%s'] * len(self.excluded_group_list))})")
+            parameters.extend(self.excluded_group_list)
+        if not self.include_macros:
+            conditions.append("CART.TYPE = %s")
+            parameters.append(_AUDIO_CART_TYPE)
+        where = f" WHERE {' AND '.join(conditions)}" if conditions else ""
+        return _CARTS_QUERY + where + _CARTS_ORDER, parameters
+
+    def _fetch_batches(self, cursor) -> Generator[list, None, None]:
+        while database_rows := cursor.fetchmany(self.fetch_size):
+            yield database_rows
+
+    def _load_sched_codes(self, connection) -> dict:
+        sched_codes = defaultdict(list)
+        cursor = connection.cursor(buffered=False)
+        try:
+            cursor.execute(_SCHED_CODES_QUERY)
+            for database_rows in self._fetch_batches(cursor):
+                for cart_number, sched_code in database_rows:
+                    sched_codes[cart_number].append(_text(sched_code).strip())
+        finally:
+            cursor.close()
+        return sched_codes
+
+    def _iter_dump_rows(self) -> Generator[list[str], None, None]:
+        """Yields the header of the Cart Data Dump, and then a row of the dump for each cut in the database."""
+        _logger.info(f"Loading the carts from the database {self.sql_database_name} on {self.sql_host}.")
+        connection = self._connect()
+        try:
+            # An unbuffered cursor has to be read to the end before the next query, so the scheduler codes, which
+            # are few, are read first.
+            sched_codes = self._load_sched_codes(connection)
+            query, parameters = self._carts_query()
+            cursor = connection.cursor(buffered=False)
+            try:
+                cursor.execute(query, parameters)
+                yield list(_DUMP_FIELD_NAMES)
+                for database_rows in self._fetch_batches(cursor):
+                    for database_row in database_rows:
+                        yield _format_row(database_row, sched_codes)
+            finally:
+                cursor.close()
+        finally:
+            connection.close()
+            _logger.debug("MySQL connection is closed")
+
+    def _start_row_filter_counts(self):
+        # The query already leaves out the excluded groups and the macro carts.
+        self.row_filter_counts = None
@@ -0,0 +1,254 @@
+"""
+@Author = 'Michael Stanley'
+
+Keeps a snapshot of the carts of the Rivendell database in a local SQLite file, so that each run only has to fetch the
+carts that have changed since the previous one, instead of the whole library.
+
+The snapshot holds a row of the Cart Data Dump for each cut, as LoadCartDatabase formats it, in columns named after
+the fields of RivendellCart. Every cart is kept, whatever its group or type, so that one snapshot serves every set of
+filters.
+
+A sync first asks the database for its current time, which is recorded when the sync is done and is the starting
+point of the next one. Then it refreshes:
+    - Every cart whose CART.METADATA_DATETIME, or the ORIGIN_DATETIME of one of whose cuts, is at or after the previous
+      sync.
+    - Every cart whose cuts in the database are not the ones in the snapshot. This includes the new carts, and the
+      carts that have had cuts added or deleted.
+The carts that are no longer in the database are deleted, and the scheduler codes, which are few, are compared for
+every cart. Changes that touch neither timestamp nor the cuts of a cart, such as moving a cut's markers, are only
+picked up by a full sync. Deleting the snapshot file forces one.
+
+============ Change Log ============
+2026-Oct-18 = Created.
+              Bump SNAPSHOT_FORMAT_VERSION, since the carts without cuts are now written as cut 1.
+              Bump SNAPSHOT_FORMAT_VERSION again, since sched_codes is now in the fixed width format of the Cart 
+              Data Dump.
+
+============ License ============
+Copyright (C) 2026 Michael Stanley
+
+This file is part of wmul_rivendell.
+
+wmul_rivendell is free software: you can redistribute it and/or modify it
+under the terms of the GNU General Public License as published by the Free
+Software Foundation, either version 3 of the License, or (at your option) any
+later version.
+
+wmul_rivendell is distributed in the hope that it will be useful, but WITHOUT
+ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License along with
+wmul_rivendell. If not, see <https://www.gnu.org/licenses/>.
+"""
+import sqlite3
+from collections import defaultdict
+from contextlib import closing
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Generator
+
+import wmul_logger
+
+from wmul_rivendell.LoadCartDataDump import _DUMP_FIELD_NAMES
+from wmul_rivendell.LoadCartDatabase import LoadCartDatabase, _CARTS_QUERY, _format_row, _sched_codes_text, _text
+
+_logger = wmul_logger.get_logger()
+
+# Bump when the layout of the snapshot changes, so that older snapshots are rebuilt with a full sync.
+SNAPSHOT_FORMAT_VERSION = 3
+
+# The fields of RivendellCart, in the order of _DUMP_FIELD_NAMES.
+_SNAPSHOT_COLUMNS = tuple(field_name.lower() for field_name in _DUMP_FIELD_NAMES)
+
+# cart_key and cut_name identify a cut. A cart without cuts has a single row, whose cut_name is "". group_name
+# ignores case, like Rivendell's collation, so the excluded groups are the same as with LoadCartDatabase.
+_CREATE_CUTS_TABLE = \
+    "CREATE TABLE IF NOT EXISTS cuts (cart_key INTEGER NOT NULL, cut_name TEXT NOT NULL, " + \
+    ", ".join(
+        f"{column} TEXT COLLATE NOCASE" if column == "group_name" else f"{column} TEXT"
+        for column in _SNAPSHOT_COLUMNS
+    ) + \
+    ", PRIMARY KEY (cart_key, cut_name)) WITHOUT ROWID"
+
+_CREATE_SYNC_STATE_TABLE = "CREATE TABLE IF NOT EXISTS sync_state (name TEXT PRIMARY KEY, value TEXT NOT NULL)"
+
+_INSERT_CUT = f"INSERT INTO cuts VALUES ({', '.join('?' * (len(_SNAPSHOT_COLUMNS) + 2))})"
+
+_CURRENT_TIMESTAMP_QUERY = "SELECT CURRENT_TIMESTAMP"
+
+_CUT_KEYS_QUERY = "SELECT CART.NUMBER, CUTS.CUT_NAME FROM CART LEFT JOIN CUTS ON CART.NUMBER = CUTS.CART_NUMBER"
+
+_CHANGED_CARTS_QUERY = \
+    "SELECT DISTINCT CART.NUMBER FROM CART LEFT JOIN CUTS ON CART.NUMBER = CUTS.CART_NUMBER " \
+    "WHERE CART.METADATA_DATETIME >= %s OR CUTS.ORIGIN_DATETIME >= %s"
+
+# The number of carts that are fetched, or deleted, by each query of a sync.
+_CART_BATCH_SIZE = 1000
+
+
+@dataclass
+class SnapshotSyncCounts:
+    full_sync: bool = False
+    carts_refreshed: int = 0
+    carts_deleted: int = 0
+    sched_codes_updated: int = 0
+
+
+def _batches(items: list, batch_size: int = _CART_BATCH_SIZE) -> Generator[list, None, None]:
+    for start in range(0, len(items), batch_size):
+        yield items[start:start + batch_size]
+
+
+def _snapshot_row(database_row, sched_codes: dict) -> tuple:
+    cut_name = database_row[1]
+    return int(database_row[0]), "" if cut_name is None else _text(cut_name), *_format_row(database_row, sched_codes)
+
+
+@dataclass(kw_only=True)
+class LoadCartSnapshot(LoadCartDatabase):
+    """A LoadCartDatabase that syncs the snapshot in snapshot_filename with the database, and then loads the carts
+    from the snapshot. The filters are applied by the query of the snapshot."""
+    snapshot_filename: Path
+
+    def _open_snapshot(self) -> sqlite3.Connection:
+        snapshot = sqlite3.connect(str(self.snapshot_filename))
+        snapshot.execute(_CREATE_SYNC_STATE_TABLE)
+        snapshot.execute(_CREATE_CUTS_TABLE)
+        snapshot.commit()
+        return snapshot
+
+    def _snapshot_identity(self) -> dict:
+        return {
+            "format_version": str(SNAPSHOT_FORMAT_VERSION),
+            "database": f"{self.sql_database_name} on {self.sql_host}"
+        }
+
+    def _previous_sync(self, snapshot: sqlite3.Connection) -> str | None:
+        """Returns the database time at which the previous sync started, or None if the snapshot has to be rebuilt
+        with a full sync."""
+        sync_state = dict(snapshot.execute("SELECT name, value FROM sync_state"))
+        for name, value in self._snapshot_identity().items():
+            if sync_state.get(name) != value:
+                return None
+        return sync_state.get("last_sync")
+
+    def sync(self) -> SnapshotSyncCounts:
+        """Brings the snapshot up to date with the database, creating it if need be."""
+        with closing(self._open_snapshot()) as snapshot:
+            previous_sync = self._previous_sync(snapshot)
+            connection = self._connect()
+            try:
+                sync_started = str(self._fetch_all(connection, _CURRENT_TIMESTAMP_QUERY)[0][0])
+                sched_codes = self._load_sched_codes(connection)
+                # A single transaction, so that a sync that fails part way leaves the snapshot as it was.
+                with snapshot:
+                    if previous_sync is None:
+                        sync_counts = self._full_sync(connection, snapshot, sched_codes)
+                    else:
+                        sync_counts = self._incremental_sync(connection, snapshot, sched_codes, previous_sync)
+                    snapshot.executemany(
+                        "INSERT OR REPLACE INTO sync_state VALUES (?, ?)",
+                        [*self._snapshot_identity().items(), ("last_sync", sync_started)]
+                    )
+            finally:
+                connection.close()
+                _logger.debug("MySQL connection is closed")
+        _logger.info(f"Synced the cart snapshot {self.snapshot_filename}: {sync_counts}")
+        return sync_counts
+
+    def _fetch_all(self, connection, query: str, parameters=()) -> list:
+        cursor = connection.cursor(buffered=False)
+        try:
+            cursor.execute(query, parameters)
+            return [database_row for database_rows in self._fetch_batches(cursor) for database_row in database_rows]
+        finally:
+            cursor.close()
+
+    def _store_carts(self, connection, snapshot: sqlite3.Connection, sched_codes: dict, where: str = "",
+                     parameters=()) -> int:
+        """Fetches the cuts of the carts that match where, and inserts them into the snapshot. Returns the number of
+        carts."""
+        cursor = connection.cursor(buffered=False)
+        cart_numbers = set()
+        try:
+            cursor.execute(_CARTS_QUERY + where, parameters)
+            for database_rows in self._fetch_batches(cursor):
+                snapshot_rows = [_snapshot_row(database_row, sched_codes) for database_row in database_rows]
+                snapshot.executemany(_INSERT_CUT, snapshot_rows)
+                cart_numbers.update(snapshot_row[0] for snapshot_row in snapshot_rows)
+        finally:
+            cursor.close()
+        return len(cart_numbers)
+
+    def _full_sync(self, connection, snapshot: sqlite3.Connection, sched_codes: dict) -> SnapshotSyncCounts:
+        _logger.info(f"Rebuilding the cart snapshot {self.snapshot_filename} from the whole database.")
+        snapshot.execute("DELETE FROM cuts")
+        return SnapshotSyncCounts(full_sync=True, carts_refreshed=self._store_carts(connection, snapshot, sched_codes))
+
+    def _incremental_sync(self, connection, snapshot: sqlite3.Connection, sched_codes: dict,
+                          previous_sync: str) -> SnapshotSyncCounts:
+        database_cuts = defaultdict(set)
+        for cart_number, cut_name in self._fetch_all(connection, _CUT_KEYS_QUERY):
+            database_cuts[int(cart_number)].add("" if cut_name is None else _text(cut_name))
+        snapshot_cuts = defaultdict(set)
+        for cart_key, cut_name in snapshot.execute("SELECT cart_key, cut_name FROM cuts"):
+            snapshot_cuts[cart_key].add(cut_name)
+
+        changed_carts = {
+            int(cart_number)
+            for cart_number, in self._fetch_all(connection, _CHANGED_CARTS_QUERY, (previous_sync, previous_sync))
+        }
+        changed_carts.update(
+            cart_number for cart_number, cut_names in database_cuts.items()
+            if snapshot_cuts.get(cart_number) != cut_names
+        )
+        deleted_carts = sorted(snapshot_cuts.keys() - database_cuts.keys())
+
+        for cart_numbers in _batches(deleted_carts + sorted(changed_carts)):
+            snapshot.execute(
+                f"DELETE FROM cuts WHERE cart_key IN ({', '.join('?' * len(cart_numbers))})",
+                cart_numbers
+            )
+        carts_refreshed = 0
+        for cart_numbers in _batches(sorted(changed_carts)):
+            carts_refreshed += self._store_carts(
+                connection, snapshot, sched_codes,
+                f" WHERE CART.NUMBER IN ({', '.join(['%s'] * len(cart_numbers))})", cart_numbers
+            )
+
+        # The scheduler codes of the other carts are compared directly.
+        changed_sched_codes = [
+            (current_sched_codes, cart_key)
+            for cart_key, snapshot_sched_codes in snapshot.execute("SELECT DISTINCT cart_key, sched_codes FROM cuts")
+            if cart_key not in changed_carts
+            if (current_sched_codes := _sched_codes_text(sched_codes.get(cart_key, ()))) != snapshot_sched_codes
+        ]
+        snapshot.executemany("UPDATE cuts SET sched_codes = ? WHERE cart_key = ?", changed_sched_codes)
+
+        return SnapshotSyncCounts(
+            carts_refreshed=carts_refreshed,
+            carts_deleted=len(deleted_carts),
+            sched_codes_updated=len(changed_sched_codes)
+        )
+
+    def _snapshot_query(self) -> tuple[str, list]:
+        conditions = []
+        parameters = []
+        if self.excluded_group_list:
+            conditions.append(f"group_name NOT IN ({', '.join('?' * len(self.excluded_group_list))})")
+            parameters.extend(self.excluded_group_list)
+        if not self.include_macros:
+            conditions.append("type = 'audio'")
+        where = f" WHERE {' AND '.join(conditions)}" if conditions else ""
+        query = f"SELECT {', '.join(_SNAPSHOT_COLUMNS)} FROM cuts{where} ORDER BY cart_key, cut_name"
+        return query, parameters
+
+    def _iter_dump_rows(self) -> Generator[list[str], None, None]:
+        """Syncs the snapshot, and then yields the header of the Cart Data Dump and a row of the dump for each cut in
+        the snapshot."""
+        self.sync()
+        query, parameters = self._snapshot_query()
+        with closing(sqlite3.connect(str(self.snapshot_filename))) as snapshot:
+            yield list(_DUMP_FIELD_NAMES)
+            yield from snapshot.execute(query, parameters)
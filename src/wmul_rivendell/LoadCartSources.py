@@ -0,0 +1,103 @@
+"""
+@Author = 'Michael Stanley'
+
+Loads the carts of several Rivendell stations at once, each from its own Cart Data Dump or database, and merges them
+into a single CartTable.
+
+Each station is loaded by its own LoadCartDataDump, LoadCartDatabase, or LoadCartSnapshot, with that loader's filters,
+in a process pool. The merged table has a source_station column with the name of the station each cart came from.
+A cart that is the same at several stations, with the same cart number and the same content hash, is kept once,
+from the first of those stations.
+
+============ Change Log ============
+2026-Oct-18 = Created.
+
+============ License ============
+Copyright (C) 2026 Michael Stanley
+
+This file is part of wmul_rivendell.
+
+wmul_rivendell is free software: you can redistribute it and/or modify it
+under the terms of the GNU General Public License as published by the Free
+Software Foundation, either version 3 of the License, or (at your option) any
+later version.
+
+wmul_rivendell is distributed in the hope that it will be useful, but WITHOUT
+ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License along with
+wmul_rivendell. If not, see <https://www.gnu.org/licenses/>.
+"""
+import os
+import pandas as pd
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, replace
+
+import wmul_logger
+
+from wmul_rivendell.DumpDiff import FINGERPRINT_FIELD_NAMES
+from wmul_rivendell.LoadCartDataDump import CartTable, LoadCartDataDump
+
+_logger = wmul_logger.get_logger()
+
+
+def _load_station_cart_table(cart_loader: LoadCartDataDump) -> pd.DataFrame:
+    """Loads the carts of one station and returns them as a compact CartTable, which is many times faster to send
+    back to the parent process than a list of carts."""
+    if cart_loader.trusted_dump:
+        cart_table = cart_loader.load_cart_table()
+    else:
+        # So that the carts are validated, as they are by load_carts.
+        cart_table = CartTable.from_carts(replace(cart_loader, projected_fields=None).load_carts())
+    return cart_table.compact()
+
+
+@dataclass
+class LoadCartSources:
+    """cart_loaders maps the name of each station to the loader of its carts. max_workers is the number of stations
+    that are loaded at once, by default one per station, up to the number of CPUs. If dedupe is False, the carts
+    that are the same at several stations are kept once for each of them."""
+    cart_loaders: dict[str, LoadCartDataDump]
+    dedupe: bool = True
+    max_workers: int | None = None
+
+    def _number_of_workers(self) -> int:
+        if self.max_workers is not None:
+            return max(1, min(self.max_workers, len(self.cart_loaders)))
+        return max(1, min(os.cpu_count() or 1, len(self.cart_loaders)))
+
+    def _load_station_tables(self) -> list[pd.DataFrame]:
+        cart_loaders = list(self.cart_loaders.values())
+        number_of_workers = self._number_of_workers()
+        if number_of_workers == 1:
+            return [_load_station_cart_table(cart_loader) for cart_loader in cart_loaders]
+        with ProcessPoolExecutor(max_workers=number_of_workers) as executor:
+            return list(executor.map(_load_station_cart_table, cart_loaders))
+
+    def _remove_duplicates(self, data: pd.DataFrame) -> pd.DataFrame:
+        """Removes every cart whose cart number and content hash are the same as those of an earlier cart."""
+        content_hashes = pd.util.hash_pandas_object(data[list(FINGERPRINT_FIELD_NAMES)], index=False)
+        is_duplicate = pd.DataFrame(
+            {"cart_number": data["cart_number"].to_numpy(), "content_hash": content_hashes.to_numpy()}
+        ).duplicated().to_numpy()
+        _logger.info(f"Removed {is_duplicate.sum()} carts that are the same at more than one station.")
+        return data.loc[~is_duplicate].reset_index(drop=True)
+
+    def load_cart_table(self) -> CartTable:
+        """Loads the carts of every station into a single CartTable, in the order of cart_loaders."""
+        _logger.debug(f"Starting load_cart_table with {self}")
+        station_names = list(self.cart_loaders)
+        station_tables = []
+        for station_name, compacted in zip(station_names, self._load_station_tables()):
+            station_data = CartTable.from_compact(compacted).data
+            _logger.info(f"Loaded {len(station_data)} carts from {station_name}.")
+            station_data["source_station"] = station_name
+            station_tables.append(station_data)
+        data = pd.concat(station_tables, ignore_index=True)
+        # Each station has its own group_name categories, re-build them across the whole table.
+        data["group_name"] = data["group_name"].astype(str).astype("category")
+        data["source_station"] = pd.Categorical(data["source_station"], categories=station_names)
+        if self.dedupe:
+            data = self._remove_duplicates(data)
+        return CartTable(data=data)
@@ -0,0 +1,200 @@
+"""
+@Author = 'Michael Stanley'
+
+Opt-in instrumentation of the stages of loading the carts, such as repairing broken records, parsing the csv rows, 
+validating the carts, and each of the filters. For each stage it records the wall time, the rows that went in and came 
+out, and the peak of the memory traced by tracemalloc while the stage was running.
+
+============ Change Log ============
+2026-Oct-18 = Created.
+              Add record, for the stages that run in worker processes.
+
+============ License ============
+Copyright (C) 2026 Michael Stanley
+
+This file is part of wmul_rivendell.
+
+wmul_rivendell is free software: you can redistribute it and/or modify it
+under the terms of the GNU General Public License as published by the Free
+Software Foundation, either version 3 of the License, or (at your option) any
+later version.
+
+wmul_rivendell is distributed in the hope that it will be useful, but WITHOUT
+ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License along with
+wmul_rivendell. If not, see <https://www.gnu.org/licenses/>.
+"""
+import json
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Callable, Generator, Iterable
+
+import wmul_logger
+
+_logger = wmul_logger.get_logger()
+
+
+@dataclass
+class StageMetrics:
+    """The measurements of one stage of a load. seconds only includes the time spent in the stage itself, not in the 
+    stages that feed it. rows_in is None for a stage whose input is not counted. peak_mib is the largest amount of 
+    traced memory in use while the stage was running, or None if memory was not traced."""
+    stage: str
+    seconds: float = 0.0
+    rows_in: int | None = None
+    rows_out: int = 0
+    peak_mib: float | None = None
+
+    @property
+    def rows_dropped(self) -> int | None:
+        if self.rows_in is None:
+            return None
+        return self.rows_in - self.rows_out
+
+    def to_dict(self) -> dict:
+        return {
+            **asdict(self), 
+            "seconds": round(self.seconds, 6), 
+            "peak_mib": None if self.peak_mib is None else round(self.peak_mib, 3),
+            "rows_dropped": self.rows_dropped
+        }
+
+
+@dataclass
+class LoadInstrumentation:
+    """Records the StageMetrics of each stage of a load, when given to a LoadCartDataDump as its instrumentation. When 
+    the load finishes, the summary is logged at info level and, if json_filename is given, appended to it as a line of 
+    JSON. Each load starts a new summary.
+
+    Time is charged to whichever stage is running. A stage that pulls rows from another is not charged for the time 
+    the other one takes to produce them. With trace_memory, tracemalloc is started for the load, which makes it several 
+    times slower."""
+    json_filename: Path | None = None
+    trace_memory: bool = True
+    description: str = field(default="", init=False)
+    stages: dict[str, StageMetrics] = field(default_factory=dict, init=False)
+    total_seconds: float = field(default=0.0, init=False)
+    peak_mib: float | None = field(default=None, init=False)
+    row_filter_counts: dict | None = field(default=None, init=False)
+    _running_stage: StageMetrics | None = field(default=None, init=False, repr=False)
+    _switched_at: float = field(default=0.0, init=False, repr=False)
+    _started_at: float = field(default=0.0, init=False, repr=False)
+    _started_tracing: bool = field(default=False, init=False, repr=False)
+
+    def start(self, description: str):
+        self.description = description
+        self.stages = {}
+        self.total_seconds = 0.0
+        self.peak_mib = None
+        self.row_filter_counts = None
+        self._running_stage = None
+        self._started_tracing = self.trace_memory and not tracemalloc.is_tracing()
+        if self._started_tracing:
+            tracemalloc.start()
+        if self.trace_memory:
+            tracemalloc.reset_peak()
+            self.peak_mib = 0.0
+        self._started_at = self._switched_at = time.perf_counter()
+
+    def _stage(self, stage_name: str) -> StageMetrics:
+        if stage_name not in self.stages:
+            self.stages[stage_name] = StageMetrics(stage=stage_name)
+        return self.stages[stage_name]
+
+    def _switch_to(self, stage_metrics: StageMetrics | None) -> StageMetrics | None:
+        """Charges the time, and the memory peak, since the previous switch to the stage that was running, then makes 
+        stage_metrics the running stage. Returns the stage that was running."""
+        now = time.perf_counter()
+        previous_stage = self._running_stage
+        if self.trace_memory:
+            peak_mib = tracemalloc.get_traced_memory()[1] / 2 ** 20
+            tracemalloc.reset_peak()
+            self.peak_mib = max(self.peak_mib, peak_mib)
+            if previous_stage is not None:
+                previous_stage.peak_mib = max(previous_stage.peak_mib or 0.0, peak_mib)
+        if previous_stage is not None:
+            previous_stage.seconds += now - self._switched_at
+        self._running_stage = stage_metrics
+        self._switched_at = now
+        return previous_stage
+
+    def stream(self, stage_name: str, rows: Iterable) -> Generator:
+        """Yields the rows, charging the time it takes to produce each one to stage_name, and counting them."""
+        stage_metrics = self._stage(stage_name)
+        rows = iter(rows)
+        while True:
+            calling_stage = self._switch_to(stage_metrics)
+            try:
+                row = next(rows)
+            except StopIteration:
+                return
+            finally:
+                self._switch_to(calling_stage)
+            stage_metrics.rows_out += 1
+            yield row
+
+    def stream_filter(self, stage_name: str, filter_function: Callable[[Iterable], Iterable], 
+                      rows: Iterable) -> Generator:
+        """Yields the rows that filter_function keeps, counting both the rows that go into it and the ones that it 
+        keeps."""
+        stage_metrics = self._stage(stage_name)
+        stage_metrics.rows_in = 0
+
+        def count_rows_in(rows_to_count):
+            for row in rows_to_count:
+                stage_metrics.rows_in += 1
+                yield row
+
+        def run_filter():
+            # So that filter_function itself runs inside the stage, even if it consumes all of its rows at once.
+            yield from filter_function(count_rows_in(rows))
+
+        return self.stream(stage_name, run_filter())
+
+    def measure(self, stage_name: str, function: Callable, *arguments):
+        """Calls function with arguments as stage_name, and counts the rows of the result, if it has a length."""
+        stage_metrics = self._stage(stage_name)
+        calling_stage = self._switch_to(stage_metrics)
+        try:
+            result = function(*arguments)
+        finally:
+            self._switch_to(calling_stage)
+        if hasattr(result, "__len__"):
+            stage_metrics.rows_out += len(result)
+        return result
+
+    def record(self, stage_name: str, seconds: float, rows_out: int = 0):
+        """Records a stage that was measured somewhere else, such as a chunk parsed in a worker process. Its time is 
+        spent in parallel with the stages of this process, so it is not part of their total."""
+        stage_metrics = self._stage(stage_name)
+        stage_metrics.seconds += seconds
+        stage_metrics.rows_out += rows_out
+
+    def finish(self, row_filter_counts=None):
+        """Ends the load, then logs the summary and writes it to json_filename. row_filter_counts is the 
+        RowFilterCounts of the load, if its filters were pushed down to the raw rows."""
+        self._switch_to(None)
+        self.total_seconds = time.perf_counter() - self._started_at
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+        if row_filter_counts is not None:
+            self.row_filter_counts = {**asdict(row_filter_counts), "rows_kept": row_filter_counts.rows_kept}
+        summary = self.summary()
+        _logger.info(f"Load instrumentation: {json.dumps(summary)}")
+        if self.json_filename is not None:
+            with open(self.json_filename, mode="at") as json_file:
+                json_file.write(json.dumps(summary) + "\n")
+
+    def summary(self) -> dict:
+        return {
+            "load": self.description,
+            "total_seconds": round(self.total_seconds, 6),
+            "peak_mib": None if self.peak_mib is None else round(self.peak_mib, 3),
+            "stages": [stage_metrics.to_dict() for stage_metrics in self.stages.values()],
+            "row_filter_counts": self.row_filter_counts
+        }
@@ -0,0 +1,114 @@
+"""
+@Author = 'Michael Stanley'
+
+Parses the scheduler codes of a set of carts once, into a table of every distinct code and a boolean matrix with a row
+for each cart and a column for each code. Carts can then be selected or counted by their scheduler codes with
+vectorized operations, instead of splitting each cart's sched_codes again for every query.
+
+Rivendell keeps each cart's scheduler codes in a single string. The codes are separated by spaces or by "|", and the
+list may end with a lone ".".
+
+============ Change Log ============
+2026-Oct-18 = Created.
+
+============ License ============
+Copyright (C) 2026 Michael Stanley
+
+This file is part of wmul_rivendell.
+
+wmul_rivendell is free software: you can redistribute it and/or modify it
+under the terms of the GNU General Public License as published by the Free
+Software Foundation, either version 3 of the License, or (at your option) any
+later version.
+
+wmul_rivendell is distributed in the hope that it will be useful, but WITHOUT
+ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License along with
+wmul_rivendell. If not, see <https://www.gnu.org/licenses/>.
+"""
+import numpy as np
+import pandas as pd
+from dataclasses import dataclass
+
+import wmul_logger
+
+_logger = wmul_logger.get_logger()
+
+
+def split_sched_codes(sched_codes: str | None) -> list[str]:
+    """Returns the scheduler codes in a cart's sched_codes, in order, without duplicates. A missing sched_codes has no 
+    codes."""
+    if not isinstance(sched_codes, str):
+        return []
+    codes = sched_codes.replace("|", " ").split()
+    return list(dict.fromkeys(code for code in codes if code != "."))
+
+
+@dataclass
+class SchedulerCodeIndex:
+    """codes is the table of every distinct scheduler code, in order of first appearance. has_code has a row for each
+    cart and a column for each code, and is True where the cart has the code."""
+    codes: list[str]
+    has_code: np.ndarray
+
+    @classmethod
+    def from_sched_codes(cls, sched_codes):
+        """sched_codes is the sched_codes of each cart, in order. Most carts share their sched_codes with many others,
+        so each distinct string is split only once."""
+        cart_rows, distinct_sched_codes = pd.factorize(pd.Series(sched_codes, dtype=object), use_na_sentinel=False)
+        code_positions = {}
+        distinct_code_positions = [
+            [code_positions.setdefault(code, len(code_positions)) for code in split_sched_codes(distinct_value)]
+            for distinct_value in distinct_sched_codes
+        ]
+        distinct_has_code = np.zeros((len(distinct_sched_codes), len(code_positions)), dtype=bool)
+        for distinct_row, positions in enumerate(distinct_code_positions):
+            distinct_has_code[distinct_row, positions] = True
+        return cls(codes=list(code_positions), has_code=distinct_has_code[cart_rows])
+
+    def __len__(self):
+        return len(self.has_code)
+
+    def code_counts(self) -> dict[str, int]:
+        """Returns the number of carts that have each code."""
+        return dict(zip(self.codes, self.has_code.sum(axis=0).tolist()))
+
+    def select(self, required_codes=(), excluded_codes=()) -> np.ndarray:
+        """Returns a boolean mask of the carts that have every one of the required_codes and none of the
+        excluded_codes."""
+        code_positions = {code: position for position, code in enumerate(self.codes)}
+        selected = np.ones(len(self.has_code), dtype=bool)
+        for code in required_codes:
+            position = code_positions.get(code)
+            if position is None:
+                _logger.warning(f"No cart has the required scheduler code: {code}.")
+                selected[:] = False
+            else:
+                selected &= self.has_code[:, position]
+        for code in excluded_codes:
+            position = code_positions.get(code)
+            if position is None:
+                _logger.info(f"No cart has the excluded scheduler code: {code}.")
+            else:
+                selected &= ~self.has_code[:, position]
+        return selected
+
+
+def make_sched_codes_predicate(required_codes=(), excluded_codes=()):
+    """Returns a function that takes a cart's sched_codes and returns whether the cart has every one of the
+    required_codes and none of the excluded_codes, like SchedulerCodeIndex.select, for carts that arrive one at a
+    time. Each distinct sched_codes is only split once."""
+    required_codes = set(required_codes)
+    excluded_codes = set(excluded_codes)
+    results = {}
+
+    def has_sched_codes(sched_codes: str | None) -> bool:
+        result = results.get(sched_codes)
+        if result is None:
+            codes = set(split_sched_codes(sched_codes))
+            result = results[sched_codes] = required_codes <= codes and codes.isdisjoint(excluded_codes)
+        return result
+
+    return has_sched_codes
@@ -0,0 +1,121 @@
+"""
+@Author = 'Michael Stanley'
+
+Keeps the statistics of each group from earlier runs of database-statistics on disk, so that the groups that have not
+changed since do not have to be calculated again.
+
+The entries are kept in a single JSON file. Each is keyed by a hash of the group's lengths, sorted, and of the
+statistics limits, so an entry is only used when the group has exactly the same lengths and the same limits. Entries
+that have not been used in a while are evicted once there are more than max_entries of them.
+
+============ Change Log ============
+2026-Oct-18 = Created.
+
+============ License ============
+Copyright (C) 2026 Michael Stanley
+
+This file is part of wmul_rivendell.
+
+wmul_rivendell is free software: you can redistribute it and/or modify it
+under the terms of the GNU General Public License as published by the Free
+Software Foundation, either version 3 of the License, or (at your option) any
+later version.
+
+wmul_rivendell is distributed in the hope that it will be useful, but WITHOUT
+ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License along with
+wmul_rivendell. If not, see <https://www.gnu.org/licenses/>.
+"""
+import hashlib
+import json
+import time
+import numpy as np
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+
+import wmul_logger
+
+from wmul_rivendell.DumpCache import _write_atomically
+
+_logger = wmul_logger.get_logger()
+
+# Bump when the statistics, or how they are calculated, change, so that older entries are no longer used.
+CACHE_FORMAT_VERSION = 1
+
+DEFAULT_MAX_ENTRIES = 10_000
+
+
+def group_key(distinct_lengths: np.ndarray, counts: np.ndarray, stats_limits) -> str:
+    """Returns the key of a group whose songs have the distinct_lengths, in ascending order, each counts times, with 
+    these stats_limits."""
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(json.dumps([CACHE_FORMAT_VERSION, asdict(stats_limits)], sort_keys=True).encode())
+    digest.update(np.ascontiguousarray(distinct_lengths, dtype=np.int64).tobytes())
+    digest.update(np.ascontiguousarray(counts, dtype=np.int64).tobytes())
+    return digest.hexdigest()
+
+
+@dataclass
+class StatisticsCache:
+    """If bypass is True, no entries are used, every group is calculated again, and the new results are stored."""
+    cache_filename: Path
+    bypass: bool = False
+    max_entries: int = DEFAULT_MAX_ENTRIES
+    _entries: dict = field(default_factory=dict, init=False, repr=False)
+
+    def _read_entries(self) -> dict:
+        try:
+            with open(self.cache_filename, "rt") as cache_file:
+                contents = json.load(cache_file)
+        except FileNotFoundError:
+            return dict()
+        except (OSError, ValueError) as e:
+            _logger.warning(f"Statistics cache {self.cache_filename} is unreadable, starting a new one: {e}")
+            return dict()
+        if not isinstance(contents, dict) or contents.get("format_version") != CACHE_FORMAT_VERSION:
+            _logger.info(f"Statistics cache {self.cache_filename} is from another version, starting a new one.")
+            return dict()
+        return contents.get("entries", dict())
+
+    def load(self, keys) -> dict[str, dict]:
+        """Returns the cached statistics of each of the keys that has an entry, and logs the number of hits and 
+        misses."""
+        self._entries = self._read_entries()
+        keys = list(keys)
+        if self.bypass:
+            _logger.info(f"Statistics cache bypassed, calculating all {len(keys)} groups.")
+            return dict()
+        now = time.time_ns()
+        cached_statistics = dict()
+        for key in keys:
+            entry = self._entries.get(key)
+            if entry is not None:
+                entry["last_used"] = now
+                cached_statistics[key] = entry["statistics"]
+        _logger.info(f"Statistics cache: {len(cached_statistics)} hits, {len(keys) - len(cached_statistics)} misses.")
+        return cached_statistics
+
+    def store(self, new_statistics: dict[str, dict]):
+        """Adds the statistics of each key in new_statistics, evicts the least recently used entries to stay within 
+        max_entries, and writes the cache file."""
+        now = time.time_ns()
+        for key, statistics in new_statistics.items():
+            self._entries[key] = {"last_used": now, "statistics": statistics}
+        if len(self._entries) > self.max_entries:
+            most_recently_used = sorted(
+                self._entries.items(), key=lambda key_and_entry: key_and_entry[1]["last_used"], reverse=True
+            )
+            _logger.info(f"Evicting {len(self._entries) - self.max_entries} statistics cache entries.")
+            self._entries = dict(most_recently_used[:self.max_entries])
+        cache_filename = Path(self.cache_filename)
+        cache_filename.parent.mkdir(parents=True, exist_ok=True)
+        contents = {"format_version": CACHE_FORMAT_VERSION, "entries": self._entries}
+        _write_atomically(cache_filename, lambda cache_file: cache_file.write(json.dumps(contents).encode()))
+
+    def clear(self):
+        """Removes every entry."""
+        self._entries = dict()
+        Path(self.cache_filename).unlink(missing_ok=True)
+        _logger.info(f"Cleared the statistics cache {self.cache_filename}.")
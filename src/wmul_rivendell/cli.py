@@ -4,6 +4,27 @@
 Command-Line-Interface for the various modules in this package.
 
 ============ Change Log ============
+2026-Oct-18 = Add --trusted_dump to database_statistics, convert_to_csv, convert_to_excel, and filter_cart_report.
+              Add --cache_directory and --cache_size_limit to the same commands.
+              Add diff_dumps.
+              Add --parse_workers to database_statistics, convert_to_csv, convert_to_excel, and filter_cart_report.
+              convert_cart_database passes the desired fields to LoadCartDataDump as its projected_fields.
+              Add --memory_map to database_statistics, convert_to_csv, convert_to_excel, and filter_cart_report.
+              Add --required_sched_code and --excluded_sched_code to the same commands.
+              Add --from_database to the same commands, and get_cart_loader.
+              Add --snapshot_file to the same commands.
+              RIVENDELL_CART_FILENAME of the same commands takes several files, which are loaded together by
+              LoadCartSources. Add get_cart_sources_loader and load_rivendell_carts.
+              Add --instrument_loading and --instrumentation_file, which give every cart loader a LoadInstrumentation.
+              Each call of wmul_rivendell_cli resets the LoadInstrumentation.
+              Add the lookup command, which finds carts with a CartIndex.
+              Add --statistics_workers to database_statistics.
+              Add --streaming to database_statistics, and stream_length_histograms.
+              Add --statistics_cache_file, --bypass_statistics_cache, and --clear_statistics_cache to 
+              database_statistics, and get_statistics_cache.
+              Add --sweep_smallest_stdev, --sweep_minimum_population, --sweep_lower_bound_multiple, and 
+              --sweep_upper_bound_multiple to database_statistics, and get_stats_limits_grid.
+
 2025-Jun-18 = Add convert-to-excel and convert-to-csv.
               Refactor filter-cart-report.
 
@@ -38,7 +59,7 @@ Command-Line-Interface for the various modules in this package.
 2020-Jun-26 = Created.
 
 ============ License ============
-Copyright (C) 2020, 2022-2023, 2025 Michael Stanley
+Copyright (C) 2020, 2022-2023, 2025-2026 Michael Stanley
 
 This file is part of wmul_rivendell.
 
@@ -55,16 +76,28 @@ You should have received a copy of the GNU General Public License along with
 wmul_rivendell. If not, see <https://www.gnu.org/licenses/>. 
 """
 import click
+import csv
 import datetime
+import itertools
+import re
+import sys
 
 from pathlib import Path
 from wmul_rivendell import __version__
-from wmul_rivendell.DatabaseStatistics import DatabaseStatistics, StatisticsLimits
+from wmul_rivendell.CartIndex import CartIndex
+from wmul_rivendell.DatabaseStatistics import DatabaseStatistics, LengthHistograms, StatisticsLimits
+from wmul_rivendell.DumpCache import DumpCache
+from wmul_rivendell.DumpDiff import DiffDumps, FingerprintIndex
 from wmul_rivendell.FilterCartReportForMusicScheduler import ConvertDatabaseToCSV, ConvertDatabaseToExcel
 from wmul_rivendell.LoadCartDataDump import LoadCartDataDump
+from wmul_rivendell.LoadCartDatabase import LoadCartDatabase, database_settings_from_rd_conf
+from wmul_rivendell.LoadCartSnapshot import LoadCartSnapshot
+from wmul_rivendell.LoadCartSources import LoadCartSources
+from wmul_rivendell.LoadInstrumentation import LoadInstrumentation
 from wmul_rivendell.LoadCurrentLogLine import LoadCurrentLogLineArguments, run_script as load_current_log_lines
 from wmul_rivendell.RivendellAudioImporter import \
     ImportRivendellFileWithFileSystemMetadataArguments, run_script as import_rivendell_file
+from wmul_rivendell.StatisticsCache import StatisticsCache
 from wmul_click_utils import RequiredIf, MXWith
 
 import wmul_emailer
@@ -72,6 +105,8 @@ import wmul_logger
 
 
 _logger = wmul_logger.get_logger()
+# Set by --instrument_loading and --instrumentation_file, and given to every cart loader.
+_load_instrumentation = None
 
 
 @click.group()
@@ -83,17 +118,30 @@ _logger = wmul_logger.get_logger()
                    "Intermediate values (E.G. 32) are permitted, but will essentially be rounded up (E.G. Entering 32 "
                    "is the same as entering 40. Logging messages lower than the log level will not be written to the "
                    "log. E.G. If 30 is input, then all Debug, Info, and Verbose messages will be silenced.")
-def wmul_rivendell_cli(log_name, log_level):
+@click.option('--instrument_loading', is_flag=True,
+              help="Log the time, rows, and peak memory of each stage of loading the carts, as a line of JSON at the "
+              "Info log level. Loading is several times slower, because the memory is traced.")
+@click.option('--instrumentation_file', type=click.Path(exists=False, file_okay=True, dir_okay=False, writable=True),
+              default=None, help="Also append the measurements of --instrument_loading to this file, one line of "
+              "JSON for each load. Implies --instrument_loading.")
+def wmul_rivendell_cli(log_name, log_level, instrument_loading, instrumentation_file):
     if log_name:
         global _logger
         _logger = wmul_logger.setup_logger(file_name=log_name, log_level=log_level)
         _logger.warning(f"Version: {__version__}")
         _logger.warning("In command_line_interface")
+    # Reset on every call, so that an earlier call with the flags, in the same process, is not measured again.
+    global _load_instrumentation
+    _load_instrumentation = None
+    if instrument_loading or instrumentation_file:
+        _load_instrumentation = LoadInstrumentation(
+            json_filename=Path(instrumentation_file) if instrumentation_file else None
+        )
 
 
 @wmul_rivendell_cli.command()
-@click.argument('rivendell_cart_filename', type=click.Path(exists=True, file_okay=True, dir_okay=False, readable=True),
-                nargs=1)
+@click.argument('rivendell_cart_filenames', metavar="RIVENDELL_CART_FILENAME...",
+                type=click.Path(exists=True, file_okay=True, dir_okay=False, readable=True), nargs=-1, required=True)
 @click.argument('output_filename', type=click.Path(exists=False, file_okay=True, dir_okay=False, writable=True),
                 nargs=1)
 @click.option('--include_all_cuts', is_flag=True,
@@ -120,9 +168,72 @@ def wmul_rivendell_cli(log_name, log_level):
               "minimum_population, lower_bound_multiple, and upper_bound_multiple) to the file.")
 @click.option("--write_full_statistics", is_flag=True, help="If true, the full set of statistics will be written. " 
               "If false, only the summary statistics (Number of Songs, Lower Bound, Upper Bound) will be written.")
-def database_statistics(rivendell_cart_filename, output_filename, include_all_cuts, excluded_groups_file_name, 
+@click.option('--trusted_dump', is_flag=True,
+              help="Load the cart data dump into compact cart records, without validating each field. Faster and "
+              "uses less memory, but should only be used with cart data dumps from a known-good Rivendell system.")
+@click.option('--cache_directory', type=click.Path(exists=False, file_okay=False, dir_okay=True, writable=True),
+              help="Directory in which to cache the parsed cart data dump. Later runs against the same, unchanged dump "
+              "load it from the cache instead of parsing it again. Only use a directory that other users cannot write "
+              "to.")
+@click.option('--cache_size_limit', type=click.IntRange(min=0), default=1024,
+              help="The largest size, in MiB, that the cache directory may grow to. The least recently used entries "
+              "are evicted first. Defaults to 1024.")
+@click.option('--parse_workers', type=click.IntRange(min=1), default=1,
+              help="The number of processes with which to parse the cart data dump. Large dumps are split into "
+              "chunks that are parsed in parallel. Defaults to 1.")
+@click.option('--memory_map', is_flag=True,
+              help="Read the cart data dump through a memory map, and split the lines without quotes directly from "
+              "the bytes. Faster, especially from a network share. The carts are the same either way.")
+@click.option('--required_sched_code', type=str, multiple=True,
+              help="Only use the carts that have this scheduler code. May be given more than once, in which case the "
+              "carts must have every one of the codes.")
+@click.option('--excluded_sched_code', type=str, multiple=True,
+              help="Leave out the carts that have this scheduler code. May be given more than once.")
+@click.option('--from_database', is_flag=True,
+              help="Read the carts straight from the Rivendell database instead of from a Cart Data Dump. "
+              "RIVENDELL_CART_FILENAME is then the Rivendell configuration file, usually /etc/rd.conf, from which the "
+              "database settings are read. --cache_directory, --parse_workers, and --memory_map are ignored.")
+@click.option('--snapshot_file', type=click.Path(exists=False, file_okay=True, dir_okay=False, writable=True),
+              help="With --from_database, keep a snapshot of the carts in this SQLite file. Each run then only fetches "
+              "the carts that have changed since the previous one. Delete the file to fetch every cart again. With several "
+              "RIVENDELL_CART_FILENAMEs, each station has its own snapshot file, named after this one and the station.")
+@click.option('--statistics_workers', type=click.IntRange(min=1), default=1,
+              help="The number of processes over which to spread the groups when calculating their statistics. The "
+              "largest groups are started first. The statistics are the same either way. Defaults to 1.")
+@click.option('--streaming', is_flag=True,
+              help="Count the songs of each length in each group as the carts are loaded, instead of holding every "
+              "cart in memory. The statistics are the same, but with several RIVENDELL_CART_FILENAMEs, a cart that is "
+              "the same at several stations is counted once for each of them.")
+@click.option('--statistics_cache_file', type=click.Path(exists=False, file_okay=True, dir_okay=False, writable=True),
+              help="Keep the statistics of each group in this JSON file. Later runs only calculate the groups whose "
+              "lengths, or the statistics limits, have changed, and take the others from the file.")
+@click.option('--bypass_statistics_cache', is_flag=True,
+              help="With --statistics_cache_file, calculate every group instead of taking any from the file. The new "
+              "statistics are still stored in it.")
+@click.option('--clear_statistics_cache', is_flag=True,
+              help="With --statistics_cache_file, remove every entry from the file before calculating.")
+@click.option("--sweep_smallest_stdev", type=int, multiple=True, 
+              help="Calculate the statistics with each of these smallest standard deviations, instead of only with "
+              "--smallest_stdev. May be given more than once. See --sweep_upper_bound_multiple.")
+@click.option("--sweep_minimum_population", type=int, multiple=True, 
+              help="Calculate the statistics with each of these minimum populations, instead of only with "
+              "--minimum_population. May be given more than once. See --sweep_upper_bound_multiple.")
+@click.option("--sweep_lower_bound_multiple", type=float, multiple=True, 
+              help="Calculate the statistics with each of these lower bound multiples, instead of only with "
+              "--lower_bound_multiple. May be given more than once. See --sweep_upper_bound_multiple.")
+@click.option("--sweep_upper_bound_multiple", type=float, multiple=True, 
+              help="Calculate the statistics with each of these upper bound multiples, instead of only with "
+              "--upper_bound_multiple. May be given more than once. If any of the --sweep options are given, the "
+              "statistics are calculated for every combination of the limits, in one pass, and the output file has "
+              "one table for each combination, with its limits. --statistics_workers and --statistics_cache_file "
+              "do not apply to the sweep.")
+def database_statistics(rivendell_cart_filenames, output_filename, include_all_cuts, excluded_groups_file_name, 
                         smallest_stdev, minimum_population, lower_bound_multiple, upper_bound_multiple, write_limits,
-                        write_full_statistics):
+                        write_full_statistics, trusted_dump, cache_directory, cache_size_limit, 
+                        parse_workers, memory_map, required_sched_code, excluded_sched_code, from_database, 
+                        snapshot_file, statistics_workers, streaming, statistics_cache_file, bypass_statistics_cache,
+                        clear_statistics_cache, sweep_smallest_stdev, sweep_minimum_population, 
+                        sweep_lower_bound_multiple, sweep_upper_bound_multiple):
     _logger.debug(f"With {locals()}")
 
     stats_limits = StatisticsLimits(
@@ -135,28 +246,52 @@ def database_statistics(rivendell_cart_filename, output_filename, include_all_cu
     excluded_groups = get_items_from_file(file_name=excluded_groups_file_name)
     output_filename = Path(output_filename)
 
-    lcdd = LoadCartDataDump(
-        rivendell_cart_data_filename=rivendell_cart_filename,
+    lcdd = get_cart_sources_loader(
+        rivendell_cart_filenames=rivendell_cart_filenames,
+        from_database=from_database,
+        snapshot_file=snapshot_file,
+        dump_cache=get_dump_cache(cache_directory=cache_directory, cache_size_limit=cache_size_limit),
+        parse_workers=parse_workers,
+        memory_map=memory_map,
         include_all_cuts=include_all_cuts,
         include_macros=False,
-        excluded_group_list=excluded_groups
+        excluded_group_list=excluded_groups,
+        trusted_dump=trusted_dump,
+        required_sched_codes=list(required_sched_code),
+        excluded_sched_codes=list(excluded_sched_code)
     )
 
-    rivendell_carts = lcdd.load_carts()
+    if streaming:
+        rivendell_carts = stream_length_histograms(lcdd)
+    else:
+        rivendell_carts = load_rivendell_carts(lcdd)
 
     x = DatabaseStatistics(
         rivendell_carts=rivendell_carts,
         output_filename=output_filename,
         stats_limits=stats_limits,
         write_limits=write_limits,
-        write_full_statistics=write_full_statistics
+        write_full_statistics=write_full_statistics,
+        statistics_workers=statistics_workers,
+        statistics_cache=get_statistics_cache(
+            statistics_cache_file=statistics_cache_file, 
+            bypass=bypass_statistics_cache, 
+            clear=clear_statistics_cache
+        ),
+        stats_limits_grid=get_stats_limits_grid(
+            stats_limits=stats_limits,
+            sweep_smallest_stdev=sweep_smallest_stdev,
+            sweep_minimum_population=sweep_minimum_population,
+            sweep_lower_bound_multiple=sweep_lower_bound_multiple,
+            sweep_upper_bound_multiple=sweep_upper_bound_multiple
+        )
     )
     x.run_script()
 
 
 @wmul_rivendell_cli.command()
-@click.argument('rivendell_cart_filename', type=click.Path(exists=True, file_okay=True, dir_okay=False, readable=True),
-                nargs=1)
+@click.argument('rivendell_cart_filenames', metavar="RIVENDELL_CART_FILENAME...",
+                type=click.Path(exists=True, file_okay=True, dir_okay=False, readable=True), nargs=-1, required=True)
 @click.argument('output_filename', type=click.Path(exists=False, file_okay=True, dir_okay=False, writable=True),
                 nargs=1)
 @click.option('--desired_fields_filename', type=click.Path(exists=True, file_okay=True, dir_okay=False, readable=True),
@@ -173,24 +308,63 @@ def database_statistics(rivendell_cart_filename, output_filename, include_all_cu
 @click.option('--use_trailing_comma', is_flag=True,
               help="Include a comma at the end of each line. Required by some scheduling software, such as Natural "
                    "Music, to see the final field.")
-def convert_to_csv(rivendell_cart_filename, output_filename, desired_fields_filename, include_macros,
-                       include_all_cuts, excluded_groups_file_name, use_trailing_comma):
+@click.option('--trusted_dump', is_flag=True,
+              help="Load the cart data dump into compact cart records, without validating each field. Faster and "
+              "uses less memory, but should only be used with cart data dumps from a known-good Rivendell system.")
+@click.option('--cache_directory', type=click.Path(exists=False, file_okay=False, dir_okay=True, writable=True),
+              help="Directory in which to cache the parsed cart data dump. Later runs against the same, unchanged dump "
+              "load it from the cache instead of parsing it again. Only use a directory that other users cannot write "
+              "to.")
+@click.option('--cache_size_limit', type=click.IntRange(min=0), default=1024,
+              help="The largest size, in MiB, that the cache directory may grow to. The least recently used entries "
+              "are evicted first. Defaults to 1024.")
+@click.option('--parse_workers', type=click.IntRange(min=1), default=1,
+              help="The number of processes with which to parse the cart data dump. Large dumps are split into "
+              "chunks that are parsed in parallel. Defaults to 1.")
+@click.option('--memory_map', is_flag=True,
+              help="Read the cart data dump through a memory map, and split the lines without quotes directly from "
+              "the bytes. Faster, especially from a network share. The carts are the same either way.")
+@click.option('--required_sched_code', type=str, multiple=True,
+              help="Only use the carts that have this scheduler code. May be given more than once, in which case the "
+              "carts must have every one of the codes.")
+@click.option('--excluded_sched_code', type=str, multiple=True,
+              help="Leave out the carts that have this scheduler code. May be given more than once.")
+@click.option('--from_database', is_flag=True,
+              help="Read the carts straight from the Rivendell database instead of from a Cart Data Dump. "
+              "RIVENDELL_CART_FILENAME is then the Rivendell configuration file, usually /etc/rd.conf, from which the "
+              "database settings are read. --cache_directory, --parse_workers, and --memory_map are ignored.")
+@click.option('--snapshot_file', type=click.Path(exists=False, file_okay=True, dir_okay=False, writable=True),
+              help="With --from_database, keep a snapshot of the carts in this SQLite file. Each run then only fetches "
+              "the carts that have changed since the previous one. Delete the file to fetch every cart again. With several "
+              "RIVENDELL_CART_FILENAMEs, each station has its own snapshot file, named after this one and the station.")
+def convert_to_csv(rivendell_cart_filenames, output_filename, desired_fields_filename, include_macros,
+                       include_all_cuts, excluded_groups_file_name, use_trailing_comma, trusted_dump, cache_directory,
+                       cache_size_limit, parse_workers, memory_map, required_sched_code, excluded_sched_code, 
+                       from_database, snapshot_file):
     _logger.debug(f"With {locals()}")
     converter = ConvertDatabaseToCSV.get_factory(use_trailing_comma=use_trailing_comma)
     convert_cart_database(
-        rivendell_cart_filename=rivendell_cart_filename,
+        rivendell_cart_filenames=rivendell_cart_filenames,
         output_filename=output_filename,
         desired_fields_filename=desired_fields_filename,
         include_macros=include_macros,
         include_all_cuts=include_all_cuts,
         excluded_groups_file_name=excluded_groups_file_name,
+        trusted_dump=trusted_dump,
+        dump_cache=get_dump_cache(cache_directory=cache_directory, cache_size_limit=cache_size_limit),
+        parse_workers=parse_workers,
+        memory_map=memory_map,
+        required_sched_codes=list(required_sched_code),
+        excluded_sched_codes=list(excluded_sched_code),
+        from_database=from_database,
+        snapshot_file=snapshot_file,
         converter=converter
     )
 
 
 @wmul_rivendell_cli.command()
-@click.argument('rivendell_cart_filename', type=click.Path(exists=True, file_okay=True, dir_okay=False, readable=True),
-                nargs=1)
+@click.argument('rivendell_cart_filenames', metavar="RIVENDELL_CART_FILENAME...",
+                type=click.Path(exists=True, file_okay=True, dir_okay=False, readable=True), nargs=-1, required=True)
 @click.argument('output_filename', type=click.Path(exists=False, file_okay=True, dir_okay=False, writable=True),
                 nargs=1)
 @click.option('--desired_fields_filename', type=click.Path(exists=True, file_okay=True, dir_okay=False, readable=True),
@@ -204,22 +378,61 @@ def convert_to_csv(rivendell_cart_filename, output_filename, desired_fields_file
 @click.option('--excluded_groups_file_name', type=click.Path(exists=True, file_okay=True, dir_okay=False, readable=True),
               help="File path to a text file containing a list of groups to be exluded. The file should have one "
               "group name on each line. A group name may be present in this file but not in the cart data dump.")
-def convert_to_excel(rivendell_cart_filename, output_filename, desired_fields_filename, include_macros, include_all_cuts, excluded_groups_file_name):
+@click.option('--trusted_dump', is_flag=True,
+              help="Load the cart data dump into compact cart records, without validating each field. Faster and "
+              "uses less memory, but should only be used with cart data dumps from a known-good Rivendell system.")
+@click.option('--cache_directory', type=click.Path(exists=False, file_okay=False, dir_okay=True, writable=True),
+              help="Directory in which to cache the parsed cart data dump. Later runs against the same, unchanged dump "
+              "load it from the cache instead of parsing it again. Only use a directory that other users cannot write "
+              "to.")
+@click.option('--cache_size_limit', type=click.IntRange(min=0), default=1024,
+              help="The largest size, in MiB, that the cache directory may grow to. The least recently used entries "
+              "are evicted first. Defaults to 1024.")
+@click.option('--parse_workers', type=click.IntRange(min=1), default=1,
+              help="The number of processes with which to parse the cart data dump. Large dumps are split into "
+              "chunks that are parsed in parallel. Defaults to 1.")
+@click.option('--memory_map', is_flag=True,
+              help="Read the cart data dump through a memory map, and split the lines without quotes directly from "
+              "the bytes. Faster, especially from a network share. The carts are the same either way.")
+@click.option('--required_sched_code', type=str, multiple=True,
+              help="Only use the carts that have this scheduler code. May be given more than once, in which case the "
+              "carts must have every one of the codes.")
+@click.option('--excluded_sched_code', type=str, multiple=True,
+              help="Leave out the carts that have this scheduler code. May be given more than once.")
+@click.option('--from_database', is_flag=True,
+              help="Read the carts straight from the Rivendell database instead of from a Cart Data Dump. "
+              "RIVENDELL_CART_FILENAME is then the Rivendell configuration file, usually /etc/rd.conf, from which the "
+              "database settings are read. --cache_directory, --parse_workers, and --memory_map are ignored.")
+@click.option('--snapshot_file', type=click.Path(exists=False, file_okay=True, dir_okay=False, writable=True),
+              help="With --from_database, keep a snapshot of the carts in this SQLite file. Each run then only fetches "
+              "the carts that have changed since the previous one. Delete the file to fetch every cart again. With several "
+              "RIVENDELL_CART_FILENAMEs, each station has its own snapshot file, named after this one and the station.")
+def convert_to_excel(rivendell_cart_filenames, output_filename, desired_fields_filename, include_macros, include_all_cuts, 
+                     excluded_groups_file_name, trusted_dump, cache_directory, cache_size_limit, parse_workers, 
+                     memory_map, required_sched_code, excluded_sched_code, from_database, snapshot_file):
     _logger.debug(f"With {locals()}")
     convert_cart_database(
-        rivendell_cart_filename=rivendell_cart_filename,
+        rivendell_cart_filenames=rivendell_cart_filenames,
         output_filename=output_filename,
         desired_fields_filename=desired_fields_filename,
         include_macros=include_macros,
         include_all_cuts=include_all_cuts,
         excluded_groups_file_name=excluded_groups_file_name,
+        trusted_dump=trusted_dump,
+        dump_cache=get_dump_cache(cache_directory=cache_directory, cache_size_limit=cache_size_limit),
+        parse_workers=parse_workers,
+        memory_map=memory_map,
+        required_sched_codes=list(required_sched_code),
+        excluded_sched_codes=list(excluded_sched_code),
+        from_database=from_database,
+        snapshot_file=snapshot_file,
         converter=ConvertDatabaseToExcel
     )
 
 
 @wmul_rivendell_cli.command()
-@click.argument('rivendell_cart_filename', type=click.Path(exists=True, file_okay=True, dir_okay=False, readable=True),
-                nargs=1)
+@click.argument('rivendell_cart_filenames', metavar="RIVENDELL_CART_FILENAME...",
+                type=click.Path(exists=True, file_okay=True, dir_okay=False, readable=True), nargs=-1, required=True)
 @click.argument('output_filename', type=click.Path(exists=False, file_okay=True, dir_okay=False, writable=True),
                 nargs=1)
 @click.argument('desired_fields_filename', type=click.Path(exists=True, file_okay=True, dir_okay=False, readable=True),
@@ -235,21 +448,185 @@ def convert_to_excel(rivendell_cart_filename, output_filename, desired_fields_fi
 @click.option('--use_trailing_comma', is_flag=True,
               help="Include a comma at the end of each line. Required by some scheduling software, such as Natural "
                    "Music, to see the final field.")
-def filter_cart_report(rivendell_cart_filename, output_filename, desired_fields_filename, include_macros,
-                       include_all_cuts, excluded_groups_file_name, use_trailing_comma):
+@click.option('--trusted_dump', is_flag=True,
+              help="Load the cart data dump into compact cart records, without validating each field. Faster and "
+              "uses less memory, but should only be used with cart data dumps from a known-good Rivendell system.")
+@click.option('--cache_directory', type=click.Path(exists=False, file_okay=False, dir_okay=True, writable=True),
+              help="Directory in which to cache the parsed cart data dump. Later runs against the same, unchanged dump "
+              "load it from the cache instead of parsing it again. Only use a directory that other users cannot write "
+              "to.")
+@click.option('--cache_size_limit', type=click.IntRange(min=0), default=1024,
+              help="The largest size, in MiB, that the cache directory may grow to. The least recently used entries "
+              "are evicted first. Defaults to 1024.")
+@click.option('--parse_workers', type=click.IntRange(min=1), default=1,
+              help="The number of processes with which to parse the cart data dump. Large dumps are split into "
+              "chunks that are parsed in parallel. Defaults to 1.")
+@click.option('--memory_map', is_flag=True,
+              help="Read the cart data dump through a memory map, and split the lines without quotes directly from "
+              "the bytes. Faster, especially from a network share. The carts are the same either way.")
+@click.option('--required_sched_code', type=str, multiple=True,
+              help="Only use the carts that have this scheduler code. May be given more than once, in which case the "
+              "carts must have every one of the codes.")
+@click.option('--excluded_sched_code', type=str, multiple=True,
+              help="Leave out the carts that have this scheduler code. May be given more than once.")
+@click.option('--from_database', is_flag=True,
+              help="Read the carts straight from the Rivendell database instead of from a Cart Data Dump. "
+              "RIVENDELL_CART_FILENAME is then the Rivendell configuration file, usually /etc/rd.conf, from which the "
+              "database settings are read. --cache_directory, --parse_workers, and --memory_map are ignored.")
+@click.option('--snapshot_file', type=click.Path(exists=False, file_okay=True, dir_okay=False, writable=True),
+              help="With --from_database, keep a snapshot of the carts in this SQLite file. Each run then only fetches "
+              "the carts that have changed since the previous one. Delete the file to fetch every cart again. With several "
+              "RIVENDELL_CART_FILENAMEs, each station has its own snapshot file, named after this one and the station.")
+def filter_cart_report(rivendell_cart_filenames, output_filename, desired_fields_filename, include_macros,
+                       include_all_cuts, excluded_groups_file_name, use_trailing_comma, trusted_dump, cache_directory,
+                       cache_size_limit, parse_workers, memory_map, required_sched_code, excluded_sched_code, 
+                       from_database, snapshot_file):
     _logger.debug(f"With {locals()}")
     converter = ConvertDatabaseToCSV.get_factory(use_trailing_comma=use_trailing_comma)
     convert_cart_database(
-        rivendell_cart_filename=rivendell_cart_filename,
+        rivendell_cart_filenames=rivendell_cart_filenames,
         output_filename=output_filename,
         desired_fields_filename=desired_fields_filename,
         include_macros=include_macros,
         include_all_cuts=include_all_cuts,
         excluded_groups_file_name=excluded_groups_file_name,
+        trusted_dump=trusted_dump,
+        dump_cache=get_dump_cache(cache_directory=cache_directory, cache_size_limit=cache_size_limit),
+        parse_workers=parse_workers,
+        memory_map=memory_map,
+        required_sched_codes=list(required_sched_code),
+        excluded_sched_codes=list(excluded_sched_code),
+        from_database=from_database,
+        snapshot_file=snapshot_file,
         converter=converter
     )
 
 
+@wmul_rivendell_cli.command()
+@click.argument('rivendell_cart_filename', type=click.Path(exists=True, file_okay=True, dir_okay=False, readable=True),
+                nargs=1)
+@click.argument('output_filename', type=click.Path(exists=False, file_okay=True, dir_okay=False, writable=True),
+                nargs=1)
+@click.option('--previous_dump', type=click.Path(exists=True, file_okay=True, dir_okay=False, readable=True),
+              cls=MXWith, mx_with="previous_index", help="The Cart Data Dump to compare against.")
+@click.option('--previous_index', type=click.Path(exists=True, file_okay=True, dir_okay=False, readable=True),
+              cls=MXWith, mx_with="previous_dump", 
+              help="A fingerprint index, written by --write_index on an earlier run, to compare against. If neither "
+              "this nor --previous_dump is given, every cut is reported as added.")
+@click.option('--write_index', type=click.Path(exists=False, file_okay=True, dir_okay=False, writable=True),
+              help="Write the fingerprint index of RIVENDELL_CART_FILENAME to this file, for use with "
+              "--previous_index on the next run.")
+@click.option('--trusted_dump', is_flag=True,
+              help="Load the cart data dumps into compact cart records, without validating each field. Faster and "
+              "uses less memory, but should only be used with cart data dumps from a known-good Rivendell system.")
+def diff_dumps(rivendell_cart_filename, output_filename, previous_dump, previous_index, write_index, trusted_dump):
+    _logger.debug(f"With {locals()}")
+
+    def iter_all_carts(cart_data_filename):
+        lcdd = LoadCartDataDump(
+            rivendell_cart_data_filename=cart_data_filename,
+            include_all_cuts=True,
+            include_macros=True,
+            excluded_group_list=[],
+            trusted_dump=trusted_dump,
+            instrumentation=_load_instrumentation
+        )
+        return lcdd.iter_carts()
+
+    if previous_index:
+        previous_fingerprint_index = FingerprintIndex.load(Path(previous_index))
+    elif previous_dump:
+        previous_fingerprint_index = FingerprintIndex.from_carts(iter_all_carts(previous_dump))
+    else:
+        previous_fingerprint_index = FingerprintIndex()
+
+    x = DiffDumps(
+        previous_index=previous_fingerprint_index,
+        current_carts=iter_all_carts(rivendell_cart_filename),
+        output_filename=Path(output_filename),
+        index_output_filename=Path(write_index) if write_index else None
+    )
+    x.run_script()
+
+
+LOOKUP_FIELDS = ["Cart_Number", "Cut_Number", "Group_Name", "Title", "Artist", "Length", "Sched_Codes"]
+
+
+@wmul_rivendell_cli.command()
+@click.argument('rivendell_cart_filename', type=click.Path(exists=True, file_okay=True, dir_okay=False, readable=True),
+                nargs=1)
+@click.option('--cart_number', type=click.IntRange(min=0), cls=RequiredIf, required_if="cut_number",
+              help="Find the cuts of this cart.")
+@click.option('--cut_number', type=click.IntRange(min=0), help="Find only this cut of the cart.")
+@click.option('--first_cart_number', type=click.IntRange(min=0), 
+              help="Find the carts numbered from this one, inclusive.")
+@click.option('--last_cart_number', type=click.IntRange(min=0), 
+              help="Find the carts numbered up to this one, inclusive.")
+@click.option('--group_name', type=str, help="Find the carts in this group. Not case-sensitive.")
+@click.option('--artist', type=str, help="Find the carts by this artist. Not case-sensitive.")
+@click.option('--sched_code', type=str, multiple=True,
+              help="Find the carts that have this scheduler code. May be given more than once, in which case the carts "
+              "must have every one of the codes.")
+@click.option('--desired_fields_filename', type=click.Path(exists=True, file_okay=True, dir_okay=False, readable=True),
+              help="File path to a text file containing a list of the fields to print, one per line. Defaults to "
+              f"{', '.join(LOOKUP_FIELDS)}.")
+@click.option('--trusted_dump', is_flag=True,
+              help="Load the cart data dump into compact cart records, without validating each field. Faster and "
+              "uses less memory, but should only be used with cart data dumps from a known-good Rivendell system.")
+@click.option('--cache_directory', type=click.Path(exists=False, file_okay=False, dir_okay=True, writable=True),
+              help="Directory in which to cache the parsed cart data dump. Later runs against the same, unchanged dump "
+              "load it from the cache instead of parsing it again. Only use a directory that other users cannot write "
+              "to.")
+@click.option('--cache_size_limit', type=click.IntRange(min=0), default=1024,
+              help="The largest size, in MiB, that the cache directory may grow to. The least recently used entries "
+              "are evicted first. Defaults to 1024.")
+@click.option('--from_database', is_flag=True,
+              help="Read the carts straight from the Rivendell database instead of from a Cart Data Dump. "
+              "RIVENDELL_CART_FILENAME is then the Rivendell configuration file, usually /etc/rd.conf, from which the "
+              "database settings are read. --cache_directory is ignored.")
+@click.option('--snapshot_file', type=click.Path(exists=False, file_okay=True, dir_okay=False, writable=True),
+              help="With --from_database, keep a snapshot of the carts in this SQLite file. Each run then only fetches "
+              "the carts that have changed since the previous one. Delete the file to fetch every cart again.")
+def lookup(rivendell_cart_filename, cart_number, cut_number, first_cart_number, last_cart_number, group_name, artist,
+           sched_code, desired_fields_filename, trusted_dump, cache_directory, cache_size_limit, from_database, 
+           snapshot_file):
+    _logger.debug(f"With {locals()}")
+    desired_fields = get_items_from_file(file_name=desired_fields_filename) if desired_fields_filename else \
+        LOOKUP_FIELDS
+
+    lcdd = get_cart_loader(
+        rivendell_cart_filename=rivendell_cart_filename,
+        from_database=from_database,
+        snapshot_file=snapshot_file,
+        dump_cache=get_dump_cache(cache_directory=cache_directory, cache_size_limit=cache_size_limit),
+        parse_workers=1,
+        memory_map=False,
+        include_all_cuts=True,
+        include_macros=True,
+        excluded_group_list=[],
+        trusted_dump=trusted_dump
+    )
+    cart_index = CartIndex.from_carts(lcdd.load_carts())
+    found_carts = cart_index.find(
+        cart_number=cart_number,
+        cut_number=cut_number,
+        first_cart_number=first_cart_number,
+        last_cart_number=last_cart_number,
+        group_name=group_name,
+        artist=artist,
+        sched_codes=sched_code
+    )
+    _logger.info(f"Found {len(found_carts)} of {len(cart_index)} cuts.")
+
+    output_writer = csv.writer(sys.stdout, lineterminator="\n")
+    output_writer.writerow(desired_fields)
+    for cart in found_carts:
+        output_writer.writerow(
+            [getattr(cart, field_name.lower(), "INVALID FIELD NAME IN DESIRED FIELDS FILE") 
+             for field_name in desired_fields]
+        )
+
+
 @wmul_rivendell_cli.command()
 @click.argument('log_name_format', type=str, nargs=1)
 @click.argument('rivendell_host', type=str, nargs=1)
@@ -385,20 +762,154 @@ def get_items_from_file(file_name):
     return items
 
 
-def convert_cart_database(rivendell_cart_filename, output_filename, desired_fields_filename, include_macros, 
-                          include_all_cuts, excluded_groups_file_name, converter):
+def get_dump_cache(cache_directory, cache_size_limit):
+    if not cache_directory:
+        return None
+    return DumpCache(cache_directory=Path(cache_directory), size_limit=cache_size_limit * 1024 * 1024)
+
+
+def get_statistics_cache(statistics_cache_file, bypass, clear):
+    if not statistics_cache_file:
+        if bypass or clear:
+            _logger.warning("--bypass_statistics_cache and --clear_statistics_cache only apply with "
+                            "--statistics_cache_file, and are ignored.")
+        return None
+    statistics_cache = StatisticsCache(cache_filename=Path(statistics_cache_file), bypass=bypass)
+    if clear:
+        statistics_cache.clear()
+    return statistics_cache
+
+
+def get_stats_limits_grid(stats_limits, sweep_smallest_stdev, sweep_minimum_population, sweep_lower_bound_multiple, 
+                          sweep_upper_bound_multiple):
+    """Returns a StatisticsLimits for every combination of the swept values, each of which defaults to its value in 
+    stats_limits, or None if no values are swept."""
+    if not (sweep_smallest_stdev or sweep_minimum_population or sweep_lower_bound_multiple or 
+            sweep_upper_bound_multiple):
+        return None
+    return [
+        StatisticsLimits(
+            smallest_stdev=smallest_stdev,
+            minimum_population_for_outliers=minimum_population,
+            lower_bound_multiple=lower_bound_multiple,
+            upper_bound_multiple=upper_bound_multiple
+        )
+        for smallest_stdev, minimum_population, lower_bound_multiple, upper_bound_multiple in itertools.product(
+            sweep_smallest_stdev or [stats_limits.smallest_stdev],
+            sweep_minimum_population or [stats_limits.minimum_population_for_outliers],
+            sweep_lower_bound_multiple or [stats_limits.lower_bound_multiple],
+            sweep_upper_bound_multiple or [stats_limits.upper_bound_multiple]
+        )
+    ]
+
+
+def get_cart_loader(rivendell_cart_filename, from_database, dump_cache, parse_workers, memory_map, 
+                    snapshot_file=None, **loader_options):
+    """Returns a LoadCartDatabase for the database in the Rivendell configuration file rivendell_cart_filename if 
+    from_database is set, or a LoadCartSnapshot if snapshot_file is also given. Otherwise returns a LoadCartDataDump 
+    for the Cart Data Dump rivendell_cart_filename."""
+    if from_database:
+        if dump_cache is not None or parse_workers != 1 or memory_map:
+            _logger.warning("--cache_directory, --parse_workers, and --memory_map only apply to a Cart Data Dump, and "
+                            "are ignored with --from_database.")
+        database_settings = database_settings_from_rd_conf(rivendell_cart_filename)
+        if snapshot_file:
+            return LoadCartSnapshot(
+                snapshot_filename=Path(snapshot_file), 
+                instrumentation=_load_instrumentation, 
+                **database_settings, 
+                **loader_options
+            )
+        return LoadCartDatabase(instrumentation=_load_instrumentation, **database_settings, **loader_options)
+    if snapshot_file:
+        _logger.warning("--snapshot_file only applies with --from_database, and is ignored.")
+    return LoadCartDataDump(
+        rivendell_cart_data_filename=rivendell_cart_filename,
+        dump_cache=dump_cache,
+        parse_workers=parse_workers,
+        memory_map=memory_map,
+        instrumentation=_load_instrumentation,
+        **loader_options
+    )
+
+
+def get_cart_sources_loader(rivendell_cart_filenames, snapshot_file=None, **cart_loader_options):
+    """Returns the loader from get_cart_loader if there is a single file in rivendell_cart_filenames. Otherwise 
+    returns a LoadCartSources with a loader from get_cart_loader for each file, named after the station whose carts 
+    it has. The station name is the file name up to its first ".", or the whole path if two files have the same 
+    name."""
+    if len(rivendell_cart_filenames) == 1:
+        return get_cart_loader(
+            rivendell_cart_filename=rivendell_cart_filenames[0], snapshot_file=snapshot_file, **cart_loader_options
+        )
+    station_names = [Path(rivendell_cart_filename).name.split(".", 1)[0]
+                     for rivendell_cart_filename in rivendell_cart_filenames]
+    if len(set(station_names)) < len(station_names):
+        station_names = [str(rivendell_cart_filename) for rivendell_cart_filename in rivendell_cart_filenames]
+    cart_loaders = {}
+    for station_name, rivendell_cart_filename in zip(station_names, rivendell_cart_filenames):
+        station_snapshot_file = None
+        if snapshot_file:
+            # Each station's database has its own snapshot.
+            snapshot_path = Path(snapshot_file)
+            station_suffix = re.sub(r"[^\w-]+", "_", station_name)
+            station_snapshot_file = snapshot_path.with_name(
+                f"{snapshot_path.stem}_{station_suffix}{snapshot_path.suffix}"
+            )
+        cart_loaders[station_name] = get_cart_loader(
+            rivendell_cart_filename=rivendell_cart_filename, snapshot_file=station_snapshot_file,
+            **cart_loader_options
+        )
+    return LoadCartSources(cart_loaders=cart_loaders)
+
+
+def load_rivendell_carts(cart_loader):
+    """Returns the carts of a single station as a list, or those of several stations as a CartTable, which keeps the 
+    source_station of each cart."""
+    if isinstance(cart_loader, LoadCartSources):
+        return cart_loader.load_cart_table()
+    return cart_loader.load_carts()
+
+
+def stream_length_histograms(cart_loader):
+    """Streams the carts of a single station, or of each of several stations in turn, into a LengthHistograms, 
+    without holding them in memory. A cart that is the same at several stations is counted once for each of them."""
+    if isinstance(cart_loader, LoadCartSources):
+        station_loaders = list(cart_loader.cart_loaders.values())
+    else:
+        station_loaders = [cart_loader]
+    length_histograms = LengthHistograms()
+    for station_loader in station_loaders:
+        length_histograms.merge(LengthHistograms().add_carts(station_loader.iter_carts()))
+    return length_histograms
+
+
+def convert_cart_database(rivendell_cart_filenames, output_filename, desired_fields_filename, include_macros, 
+                          include_all_cuts, excluded_groups_file_name, converter, trusted_dump=False, 
+                          dump_cache=None, parse_workers=1, memory_map=False, required_sched_codes=None, 
+                          excluded_sched_codes=None, from_database=False, 
+                          snapshot_file=None):
     desired_fields = get_items_from_file(file_name=desired_fields_filename)
     excluded_groups = get_items_from_file(file_name=excluded_groups_file_name)
     output_filename = Path(output_filename)
 
-    lcdd = LoadCartDataDump(
-        rivendell_cart_data_filename=rivendell_cart_filename,
+    lcdd = get_cart_sources_loader(
+        rivendell_cart_filenames=rivendell_cart_filenames,
+        from_database=from_database,
+        snapshot_file=snapshot_file,
+        dump_cache=dump_cache,
+        parse_workers=parse_workers,
+        memory_map=memory_map,
         include_all_cuts=include_all_cuts,
         include_macros=include_macros,
-        excluded_group_list=excluded_groups
+        excluded_group_list=excluded_groups,
+        trusted_dump=trusted_dump,
+        projected_fields=desired_fields,
+        required_sched_codes=required_sched_codes,
+        excluded_sched_codes=excluded_sched_codes
     )
 
-    rivendell_carts = lcdd.load_carts()
+    rivendell_carts = load_rivendell_carts(lcdd)
 
     x = converter(
         rivendell_carts=rivendell_carts,
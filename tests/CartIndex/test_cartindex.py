@@ -0,0 +1,152 @@
+"""
+@Author = 'Michael Stanley'
+
+============ Change Log ============
+2026-Oct-18 = Created.
+
+============ License ============
+Copyright (C) 2026 Michael Stanley
+
+This file is part of wmul_rivendell.
+
+wmul_rivendell is free software: you can redistribute it and/or modify it
+under the terms of the GNU General Public License as published by the Free
+Software Foundation, either version 3 of the License, or (at your option) any
+later version.
+
+wmul_rivendell is distributed in the hope that it will be useful, but WITHOUT
+ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License along with
+wmul_rivendell. If not, see <https://www.gnu.org/licenses/>.
+"""
+import logging
+import pytest
+
+from wmul_rivendell.CartIndex import CartIndex
+from wmul_rivendell.LoadCartDataDump import CartTable, CartType, RivendellCart, RivendellCartRecord, _DUMP_FIELD_NAMES
+from wmul_rivendell.LoadCartDatabase import _format_row
+
+RECORD_DEFAULTS = {field_name: "" for field_name in RivendellCartRecord._fields}
+
+
+def _record(cart_number, cut_number, group_name="MUSIC", artist="Artist", sched_codes="2010s Rock"):
+    return RivendellCartRecord(**{
+        **RECORD_DEFAULTS,
+        "cart_number": str(cart_number),
+        "cut_number": str(cut_number),
+        "type": CartType.Audio,
+        "group_name": group_name,
+        "title": f"Title {cart_number}",
+        "artist": artist,
+        "sched_codes": sched_codes,
+        "length_in_seconds": 180
+    })
+
+
+@pytest.fixture(scope="function")
+def setup_index():
+    rivendell_carts = [
+        _record(12, 1, artist="The Band"),
+        _record(12, 2, artist="The Band"),
+        _record(12, 3, artist="The Band"),
+        _record(3, 1, group_name="TALK", artist="Host", sched_codes="Talk"),
+        _record(250, 1, artist="the band ", sched_codes="1990s Rock"),
+        _record(100, 1, group_name="LEGAL", artist="", sched_codes=""),
+        _record(45, 1, artist="Other Band", sched_codes="2010s Pop"),
+    ]
+    return rivendell_carts, CartIndex.from_carts(rivendell_carts)
+
+
+def test_get(setup_index):
+    rivendell_carts, cart_index = setup_index
+
+    assert cart_index.get(12, 3) is rivendell_carts[2]
+    assert cart_index.get("012", "003") is rivendell_carts[2]
+    assert cart_index.get("3", 1) is rivendell_carts[3]
+    assert cart_index.get(12, 4) is None
+    assert cart_index.get(13, 1) is None
+    assert len(cart_index) == 7
+
+
+def test_range_queries(setup_index):
+    rivendell_carts, cart_index = setup_index
+
+    assert cart_index.in_range(10, 100) == [*rivendell_carts[0:3], rivendell_carts[6], rivendell_carts[5]]
+    assert cart_index.in_range(first_cart_number=101) == [rivendell_carts[4]]
+    assert cart_index.in_range(last_cart_number=11) == [rivendell_carts[3]]
+    assert cart_index.in_range(13, 44) == []
+    assert cart_index.cuts_of(12) == rivendell_carts[0:3]
+    assert cart_index.cuts_of(13) == []
+
+
+def test_secondary_indexes(setup_index):
+    rivendell_carts, cart_index = setup_index
+
+    assert cart_index.in_group("talk") == [rivendell_carts[3]]
+    assert cart_index.by_artist("THE BAND") == [*rivendell_carts[0:3], rivendell_carts[4]]
+    assert cart_index.with_sched_code("Rock") == [*rivendell_carts[0:3], rivendell_carts[4]]
+    assert cart_index.with_sched_code("rock") == []
+    assert cart_index.in_group("NEWS") == []
+
+
+def test_find(setup_index):
+    rivendell_carts, cart_index = setup_index
+
+    assert cart_index.find(artist="the band", group_name="MUSIC", sched_codes=["1990s"]) == [rivendell_carts[4]]
+    assert cart_index.find(artist="the band", first_cart_number=100) == [rivendell_carts[4]]
+    assert cart_index.find(cart_number=12) == rivendell_carts[0:3]
+    assert cart_index.find(cart_number=12, cut_number=2) == [rivendell_carts[1]]
+    assert cart_index.find(cart_number=12, cut_number=2, group_name="TALK") == []
+    assert cart_index.find(sched_codes=["2010s", "Rock"]) == rivendell_carts[0:3]
+    assert cart_index.find(sched_codes=["Unknown"], group_name="MUSIC") == []
+    assert cart_index.find() == rivendell_carts
+
+
+def test_find_cut_without_cart(setup_index):
+    _, cart_index = setup_index
+
+    with pytest.raises(ValueError):
+        cart_index.find(cut_number=1)
+
+
+def test_duplicate_cuts_keep_the_earliest(caplog):
+    first_cart = _record(5, 1, artist="First")
+    second_cart = _record(5, 1, artist="Second")
+
+    cart_index = CartIndex.from_carts([first_cart, second_cart])
+
+    assert cart_index.get(5, 1) is first_cart
+    assert cart_index.cuts_of(5) == [first_cart, second_cart]
+    assert "1 cuts have the same cart number and cut number as an earlier cut." in caplog.text
+
+
+def test_from_cart_table(setup_index):
+    rivendell_carts, _ = setup_index
+
+    cart_index = CartIndex.from_cart_table(CartTable.from_records(rivendell_carts))
+
+    assert cart_index.get(250, 1) == rivendell_carts[4]
+    assert cart_index.by_artist("host") == [rivendell_carts[3]]
+
+
+def test_carts_from_the_database_with_a_macro():
+    # Rows of LoadCartDatabase._CARTS_QUERY: an audio cart with a cut, and a macro cart, which has no cuts.
+    database_rows = [
+        (100001, "100001_001", 1, "MUSIC", "Title", "Artist", *[None] * 14, 262000, *[-1] * 10),
+        (100002, None, 2, "MUSIC", "Macro", None, *[None] * 14, None, *[None] * 10)
+    ]
+    rivendell_carts = [
+        RivendellCart.from_dict(dict(zip(_DUMP_FIELD_NAMES, _format_row(database_row, {}))))
+        for database_row in database_rows
+    ]
+    # A cart without a cut number, as older snapshots have for macro carts.
+    rivendell_carts.append(_record(100003, ""))
+
+    cart_index = CartIndex.from_carts(rivendell_carts)
+
+    assert cart_index.get(100001, 1) is rivendell_carts[0]
+    assert cart_index.get(100002, 1) is rivendell_carts[1]
+    assert cart_index.get(100003, "") is rivendell_carts[2]
+    assert cart_index.cuts_of(100002) == [rivendell_carts[1]]
@@ -0,0 +1,85 @@
+"""
+@Author = 'Michael Stanley'
+
+============ Change Log ============
+2026-Oct-18 = Created.
+
+============ License ============
+Copyright (C) 2026 Michael Stanley
+
+This file is part of wmul_rivendell.
+
+wmul_rivendell is free software: you can redistribute it and/or modify it
+under the terms of the GNU General Public License as published by the Free
+Software Foundation, either version 3 of the License, or (at your option) any
+later version.
+
+wmul_rivendell is distributed in the hope that it will be useful, but WITHOUT
+ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License along with
+wmul_rivendell. If not, see <https://www.gnu.org/licenses/>.
+"""
+import pytest
+
+from click.testing import CliRunner
+
+from wmul_rivendell import cli
+
+DUMP_HEADER = "CART_NUMBER,CUT_NUMBER,TYPE,GROUP_NAME,TITLE,ARTIST,ALBUM,YEAR,ISRC,ISCI,LABEL,CLIENT,AGENCY," \
+    "PUBLISHER,COMPOSER,CONDUCTOR,SONG_ID,USER_DEFINED,DESCRIPTION,OUTCUE,FILENAME,LENGTH,START_POINT,END_POINT," \
+    "SEGUE_START_POINT,SEGUE_END_POINT,HOOK_START_POINT,HOOK_END_POINT,TALK_START_POINT,TALK_END_POINT," \
+    "FADEUP_POINT,FADEDOWN_POINT,SCHED_CODES\r\n"
+
+
+@pytest.fixture(scope="function")
+def setup_dump(tmp_path):
+    lines = [
+        f"{cart_number},{cut_number},audio,{'MUSIC' if cart_number % 2 else 'TALK'},Title {cart_number},"
+        f"Artist {cart_number % 3},,1990,,,,,,,,,,,,,{cart_number:06}_{cut_number:03}.wav,3:{cart_number:02},,,,,,,,,,,"
+        f"{'Rock' if cart_number % 5 else 'Pop'}\r\n"
+        for cart_number in range(1, 21) for cut_number in range(1, 3)
+    ]
+    rivendell_cart_data_filename = tmp_path / "cart_data_dump.csv"
+    rivendell_cart_data_filename.write_text(DUMP_HEADER + "".join(lines), newline="")
+    return rivendell_cart_data_filename
+
+
+@pytest.mark.parametrize("trusted_dump", [False, True], ids=["validated", "trusted"])
+def test_lookup_cut(setup_dump, trusted_dump):
+    cli_args = [str(setup_dump), "--cart_number", "7", "--cut_number", "2"]
+    if trusted_dump:
+        cli_args.append("--trusted_dump")
+
+    result = CliRunner().invoke(cli.lookup, cli_args)
+
+    assert result.exit_code == 0, result.output
+    assert result.output.splitlines() == [
+        "Cart_Number,Cut_Number,Group_Name,Title,Artist,Length,Sched_Codes",
+        "7,2,MUSIC,Title 7,Artist 1,3:07,Rock",
+    ]
+
+
+def test_lookup_query(setup_dump, tmp_path):
+    desired_fields_filename = tmp_path / "desired.txt"
+    desired_fields_filename.write_text("Cart_Number\nCut_Number\n")
+
+    result = CliRunner().invoke(
+        cli.lookup, 
+        [str(setup_dump), "--group_name", "music", "--artist", "ARTIST 1", "--sched_code", "Rock", 
+         "--first_cart_number", "2", "--last_cart_number", "19", "--desired_fields_filename", 
+         str(desired_fields_filename)]
+    )
+
+    assert result.exit_code == 0, result.output
+    assert result.output.splitlines() == [
+        "Cart_Number,Cut_Number", "7,1", "7,2", "13,1", "13,2", "19,1", "19,2"
+    ]
+
+
+def test_lookup_cut_needs_cart(setup_dump):
+    result = CliRunner().invoke(cli.lookup, [str(setup_dump), "--cut_number", "2"])
+
+    assert result.exit_code != 0
+    assert "cart_number is required when cut_number is supplied" in result.output
@@ -2,10 +2,16 @@
 @Author = 'Michael Stanley'
 
 ============ Change Log ============
+2026-Oct-18 = Pass trusted_dump, dump_cache, and parse_workers through to LoadCartDataDump.
+              Pass the desired fields to LoadCartDataDump as projected_fields.
+              Pass memory_map through to LoadCartDataDump.
+              Pass the scheduler code filters through to LoadCartDataDump.
+              Test from_database.
+
 2025-Jun-17 = Created.
 
 ============ License ============
-Copyright (C) 2025 Michael Stanley
+Copyright (C) 2025-2026 Michael Stanley
 
 This file is part of wmul_rivendell.
 
@@ -35,6 +41,12 @@ def test_convert_cart_database(mocker):
     mock_include_all_cuts = mocker.Mock()
     mock_excluded_groups_filename = mocker.Mock()
     mock_excluded_groups = mocker.Mock()
+    mock_trusted_dump = mocker.Mock()
+    mock_dump_cache = mocker.Mock()
+    mock_parse_workers = mocker.Mock()
+    mock_memory_map = mocker.Mock()
+    mock_required_sched_codes = mocker.Mock()
+    mock_excluded_sched_codes = mocker.Mock()
     mock_run_script = mocker.Mock()
     mock_converter_object = mocker.Mock(run_script=mock_run_script)
     mock_converter_function = mocker.Mock(return_value=mock_converter_object)
@@ -70,13 +82,19 @@ def test_convert_cart_database(mocker):
     ]
 
     convert_cart_database(
-        rivendell_cart_filename=mock_rivendell_cart_filename,
+        rivendell_cart_filenames=(mock_rivendell_cart_filename,),
         output_filename=mock_output_filename,
         desired_fields_filename=mock_desired_fields_filename,
         include_macros=mock_include_macros,
         include_all_cuts=mock_include_all_cuts,
         excluded_groups_file_name=mock_excluded_groups_filename,
-        converter=mock_converter_function
+        converter=mock_converter_function,
+        trusted_dump=mock_trusted_dump,
+        dump_cache=mock_dump_cache,
+        parse_workers=mock_parse_workers,
+        memory_map=mock_memory_map,
+        required_sched_codes=mock_required_sched_codes,
+        excluded_sched_codes=mock_excluded_sched_codes
     )
 
     assert_has_only_these_calls(
@@ -85,10 +103,18 @@ def test_convert_cart_database(mocker):
     )
 
     mock_load_cart_data_dump.assert_called_once_with(
+        instrumentation=None,
         rivendell_cart_data_filename=mock_rivendell_cart_filename,
         include_all_cuts=mock_include_all_cuts,
         include_macros=mock_include_macros,
-        excluded_group_list=mock_excluded_groups
+        excluded_group_list=mock_excluded_groups,
+        trusted_dump=mock_trusted_dump,
+        dump_cache=mock_dump_cache,
+        parse_workers=mock_parse_workers,
+        projected_fields=mock_desired_fields,
+        memory_map=mock_memory_map,
+        required_sched_codes=mock_required_sched_codes,
+        excluded_sched_codes=mock_excluded_sched_codes
     )
 
     mock_load_carts_function.assert_called_once_with()
@@ -100,3 +126,57 @@ def test_convert_cart_database(mocker):
     )
 
     mock_run_script.assert_called_once_with()
+
+
+def test_convert_cart_database_from_database(mocker):
+    mock_rd_conf_filename = mocker.Mock()
+    mock_desired_fields = mocker.Mock()
+    mock_rivendell_carts = mocker.Mock()
+    mock_run_script = mocker.Mock()
+    mock_converter_function = mocker.Mock(return_value=mocker.Mock(run_script=mock_run_script))
+
+    mocker.patch(
+        "wmul_rivendell.cli.get_items_from_file", 
+        mocker.Mock(side_effect=lambda file_name: mock_desired_fields if file_name else [])
+    )
+    mock_database_settings_from_rd_conf = mocker.patch(
+        "wmul_rivendell.cli.database_settings_from_rd_conf",
+        mocker.Mock(return_value={"sql_host": "db.example.com", "sql_pass": "letmein"})
+    )
+    mock_load_cart_database = mocker.patch(
+        "wmul_rivendell.cli.LoadCartDatabase",
+        mocker.Mock(return_value=mocker.Mock(load_carts=mocker.Mock(return_value=mock_rivendell_carts)))
+    )
+    mock_load_cart_data_dump = mocker.patch("wmul_rivendell.cli.LoadCartDataDump")
+
+    convert_cart_database(
+        rivendell_cart_filenames=(mock_rd_conf_filename,),
+        output_filename="/temp/mock_output_filename.txt",
+        desired_fields_filename="/temp/desired_fields.txt",
+        include_macros=True,
+        include_all_cuts=False,
+        excluded_groups_file_name=None,
+        converter=mock_converter_function,
+        from_database=True
+    )
+
+    mock_database_settings_from_rd_conf.assert_called_once_with(mock_rd_conf_filename)
+    mock_load_cart_database.assert_called_once_with(
+        instrumentation=None,
+        sql_host="db.example.com",
+        sql_pass="letmein",
+        include_all_cuts=False,
+        include_macros=True,
+        excluded_group_list=[],
+        trusted_dump=False,
+        projected_fields=mock_desired_fields,
+        required_sched_codes=None,
+        excluded_sched_codes=None
+    )
+    mock_load_cart_data_dump.assert_not_called()
+    mock_converter_function.assert_called_once_with(
+        rivendell_carts=mock_rivendell_carts,
+        desired_field_list=mock_desired_fields,
+        output_filename=Path("/temp/mock_output_filename.txt")
+    )
+    mock_run_script.assert_called_once_with()
@@ -0,0 +1,388 @@
+"""
+@Author = 'Michael Stanley'
+
+============ Change Log ============
+2026-Oct-18 = Created.
+              Add a test for leaving out the lengths that cannot be parsed.
+
+============ License ============
+Copyright (C) 2026 Michael Stanley
+
+This file is part of wmul_rivendell.
+
+wmul_rivendell is free software: you can redistribute it and/or modify it
+under the terms of the GNU General Public License as published by the Free
+Software Foundation, either version 3 of the License, or (at your option) any
+later version.
+
+wmul_rivendell is distributed in the hope that it will be useful, but WITHOUT
+ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License along with
+wmul_rivendell. If not, see <https://www.gnu.org/licenses/>.
+"""
+import itertools
+import numpy as np
+import pandas as pd
+import pytest
+
+from types import SimpleNamespace
+
+from wmul_rivendell.DatabaseStatistics import (
+    DatabaseStatistics, LengthHistograms, RivendellGroupStatistics, StatisticsLimits, _split_into_batches, 
+    calculate_all_group_statistics, sweep_all_group_statistics
+)
+from wmul_rivendell.LoadCartDataDump import UNPARSEABLE_LENGTH_IN_SECONDS
+
+
+def _expected_statistics(group_names, group_codes, lengths, stats_limits):
+    return {
+        group_name: vars(RivendellGroupStatistics(
+            group_name=group_name, songs_in_group=lengths[group_codes == group_code], stats_limits=stats_limits
+        ))
+        for group_code, group_name in enumerate(group_names)
+    }
+
+
+def _calculated_statistics(group_names, group_codes, lengths, stats_limits):
+    statistics_per_group = calculate_all_group_statistics(
+        group_names=group_names, group_codes=group_codes, lengths=lengths, stats_limits=stats_limits
+    )
+    return {group_name: vars(group_statistics) for group_name, group_statistics in statistics_per_group.items()}
+
+
+def _random_groups(randomizer, number_of_groups):
+    lengths_per_group = []
+    for _ in range(number_of_groups):
+        number_of_songs = int(randomizer.integers(1, 80))
+        kind = randomizer.integers(0, 4)
+        if kind == 0:
+            # Every song is the same length.
+            lengths_of_group = np.full(number_of_songs, randomizer.integers(0, 400))
+        elif kind == 1:
+            # Very little variance.
+            lengths_of_group = randomizer.integers(170, 200, number_of_songs)
+        else:
+            lengths_of_group = np.maximum(0, randomizer.normal(220, randomizer.uniform(5, 150), number_of_songs))
+            lengths_of_group = np.append(lengths_of_group, randomizer.integers(600, 1500, 2)).astype(np.int64)
+        lengths_per_group.append(lengths_of_group)
+    group_codes = np.repeat(np.arange(number_of_groups), [lengths.size for lengths in lengths_per_group])
+    lengths = np.concatenate(lengths_per_group)
+    shuffled = randomizer.permutation(lengths.size)
+    return [f"GROUP{group_code}" for group_code in range(number_of_groups)], group_codes[shuffled], lengths[shuffled]
+
+
+@pytest.mark.parametrize("stats_limits", [
+    StatisticsLimits(),
+    StatisticsLimits(smallest_stdev=5, minimum_population_for_outliers=2, lower_bound_multiple=1.0, 
+                     upper_bound_multiple=2.0),
+    StatisticsLimits(smallest_stdev=1, minimum_population_for_outliers=1, lower_bound_multiple=2.5, 
+                     upper_bound_multiple=2.5),
+    StatisticsLimits(smallest_stdev=60, minimum_population_for_outliers=10)
+], ids=["default", "small_limits", "tiny_limits", "large_limits"])
+@pytest.mark.parametrize("seed", range(5))
+def test_matches_rivendellgroupstatistics(stats_limits, seed):
+    group_names, group_codes, lengths = _random_groups(np.random.default_rng(seed), number_of_groups=40)
+
+    result = _calculated_statistics(group_names, group_codes, lengths, stats_limits)
+
+    assert result == _expected_statistics(group_names, group_codes, lengths, stats_limits)
+
+
+def test_small_groups():
+    group_names = ["ONE_SONG", "TWO_SONGS", "HALF_SECOND_STDEV", "SAME_LENGTH"]
+    group_codes = np.array([0, 1, 1, 2, 2, 3, 3, 3, 3, 3, 3])
+    lengths = np.array([262, 148, 283, 100, 101, 240, 240, 240, 240, 240, 240])
+    stats_limits = StatisticsLimits(smallest_stdev=1, minimum_population_for_outliers=1)
+
+    result = _calculated_statistics(group_names, group_codes, lengths, stats_limits)
+
+    assert result == _expected_statistics(group_names, group_codes, lengths, stats_limits)
+    assert result["ONE_SONG"]["stdev"] == 0
+    assert result["SAME_LENGTH"]["adjusted_mean"] == 240
+
+
+def test_lower_bound_is_less_than_zero():
+    group_names = ["VOLUPTATIB"]
+    lengths = np.array([8, 9, 9, 7, 10, 7, 7, 5, 6, 7, 4, 5, 5, 9, 8, 8, 8, 11, 8, 300, 2])
+    group_codes = np.zeros(lengths.size, dtype=np.int64)
+    stats_limits = StatisticsLimits(smallest_stdev=1)
+
+    result = _calculated_statistics(group_names, group_codes, lengths, stats_limits)
+
+    assert result == _expected_statistics(group_names, group_codes, lengths, stats_limits)
+    assert result["VOLUPTATIB"]["lower_bound"] == 0
+
+
+def test_no_songs_left_after_outliers_raises_like_rivendellgroupstatistics():
+    # The lower and upper quartiles are both 0, so every song is an outlier.
+    group_names = ["DOLORES"]
+    lengths = np.array([0, 0, 0, 0, 0, 0, 100])
+    group_codes = np.zeros(lengths.size, dtype=np.int64)
+
+    with pytest.raises(ValueError), pytest.warns(RuntimeWarning):
+        calculate_all_group_statistics(
+            group_names=group_names, group_codes=group_codes, lengths=lengths, 
+            stats_limits=StatisticsLimits(smallest_stdev=1)
+        )
+
+
+def test_no_songs():
+    result = calculate_all_group_statistics(
+        group_names=[], group_codes=np.array([], dtype=np.int64), lengths=np.array([], dtype=np.int64), 
+        stats_limits=StatisticsLimits()
+    )
+
+    assert result == dict()
+
+
+def test_to_pandas_series_matches(write_full_statistics):
+    group_names, group_codes, lengths = _random_groups(np.random.default_rng(7), number_of_groups=10)
+    stats_limits = StatisticsLimits()
+
+    statistics_per_group = calculate_all_group_statistics(
+        group_names=group_names, group_codes=group_codes, lengths=lengths, stats_limits=stats_limits
+    )
+
+    for group_code, group_name in enumerate(group_names):
+        expected = RivendellGroupStatistics(
+            group_name=group_name, songs_in_group=lengths[group_codes == group_code], stats_limits=stats_limits
+        )
+        result = statistics_per_group[group_name]
+        assert result.to_pandas_series(write_full_statistics).equals(
+            expected.to_pandas_series(write_full_statistics)
+        )
+
+
+@pytest.fixture(scope="function", params=[True, False], ids=["full_statistics", "short_statistics"])
+def write_full_statistics(request):
+    return request.param
+
+
+@pytest.mark.parametrize("statistics_workers", [2, 3, 50])
+def test_statistics_workers_matches_serial(statistics_workers):
+    group_names, group_codes, lengths = _random_groups(np.random.default_rng(11), number_of_groups=25)
+    organized_lengths = {
+        group_name: lengths[group_codes == group_code] for group_code, group_name in enumerate(group_names)
+    }
+
+    def calculate(statistics_workers):
+        database_statistics = DatabaseStatistics(
+            rivendell_carts=[], output_filename=None, stats_limits=StatisticsLimits(), write_limits=False,
+            write_full_statistics=True, statistics_workers=statistics_workers
+        )
+        return database_statistics._calculate_statistics_per_group(organized_lengths)
+
+    expected = calculate(statistics_workers=1)
+    result = calculate(statistics_workers=statistics_workers)
+
+    assert list(result) == list(expected) == group_names
+    assert {group_name: vars(group_statistics) for group_name, group_statistics in result.items()} == \
+        {group_name: vars(group_statistics) for group_name, group_statistics in expected.items()}
+
+
+def test_split_into_batches():
+    group_names = ["A", "B", "C", "D", "E"]
+    lengths_per_group = [np.arange(size) for size in (10, 60, 30, 25, 5)]
+
+    batches = _split_into_batches(group_names, lengths_per_group, 2, StatisticsLimits())
+
+    assert [batch_group_names for batch_group_names, *_ in batches] == [["B", "E"], ["C", "D", "A"]]
+    _, group_codes, lengths, _ = batches[0]
+    assert group_codes.tolist() == [0] * 60 + [1] * 5
+    assert lengths.tolist() == list(range(60)) + list(range(5))
+
+
+def _histograms_of(group_names, group_codes, lengths):
+    return LengthHistograms().add_carts(
+        SimpleNamespace(group_name=group_names[group_code], length_in_seconds=length)
+        for group_code, length in zip(group_codes.tolist(), lengths.tolist())
+    )
+
+
+@pytest.mark.parametrize("stats_limits", [
+    StatisticsLimits(),
+    StatisticsLimits(smallest_stdev=5, minimum_population_for_outliers=2, lower_bound_multiple=1.0, 
+                     upper_bound_multiple=2.0)
+], ids=["default", "small_limits"])
+@pytest.mark.parametrize("seed", range(3))
+def test_length_histograms_match_rivendellgroupstatistics(stats_limits, seed):
+    group_names, group_codes, lengths = _random_groups(np.random.default_rng(seed), number_of_groups=30)
+
+    length_histograms = _histograms_of(group_names, group_codes, lengths)
+    result = {
+        group_name: vars(group_statistics) 
+        for group_name, group_statistics in length_histograms.calculate_statistics(stats_limits).items()
+    }
+
+    assert length_histograms.number_of_songs() == lengths.size
+    assert result == _expected_statistics(group_names, group_codes, lengths, stats_limits)
+
+
+def test_length_histograms_merge():
+    group_names, group_codes, lengths = _random_groups(np.random.default_rng(3), number_of_groups=12)
+    halfway = lengths.size // 2
+    first_half = _histograms_of(group_names, group_codes[:halfway], lengths[:halfway])
+    second_half = _histograms_of(group_names, group_codes[halfway:], lengths[halfway:])
+
+    merged = LengthHistograms().merge(first_half).merge(second_half)
+
+    assert merged == _histograms_of(group_names, group_codes, lengths)
+    assert first_half.number_of_songs() == halfway
+
+
+def test_unparseable_lengths_are_left_out():
+    rivendell_carts = [
+        SimpleNamespace(group_name="EXPLICABO", length_in_seconds=262),
+        SimpleNamespace(group_name="EXPLICABO", length_in_seconds=UNPARSEABLE_LENGTH_IN_SECONDS),
+        SimpleNamespace(group_name="VOLUPTATIB", length_in_seconds=UNPARSEABLE_LENGTH_IN_SECONDS),
+        SimpleNamespace(group_name="VOLUPTATIB", length_in_seconds=8)
+    ]
+    database_statistics = DatabaseStatistics(
+        rivendell_carts=rivendell_carts, output_filename=None, stats_limits=StatisticsLimits(), write_limits=False,
+        write_full_statistics=True
+    )
+
+    organized_carts = database_statistics._organize_by_rivendell_group(unorganized_carts=rivendell_carts)
+    length_histograms = LengthHistograms().add_carts(rivendell_carts)
+
+    assert {group_name: len(carts) for group_name, carts in organized_carts.items()} == \
+        {"EXPLICABO": 1, "VOLUPTATIB": 1}
+    assert length_histograms.histograms == {"EXPLICABO": {262: 1}, "VOLUPTATIB": {8: 1}}
+
+
+def test_counts():
+    group_names = ["EXPLICABO", "VOLUPTATIB"]
+    group_codes = np.array([0, 0, 0, 1, 1, 0, 1])
+    lengths = np.array([262, 148, 283, 8, 300, 239, 9])
+    counts = np.array([3, 1, 0, 10, 1, 8, 10])
+    stats_limits = StatisticsLimits(smallest_stdev=1)
+
+    result = calculate_all_group_statistics(
+        group_names=group_names, group_codes=group_codes, lengths=lengths, stats_limits=stats_limits, counts=counts
+    )
+
+    expected = _calculated_statistics(group_names, np.repeat(group_codes, counts), np.repeat(lengths, counts), 
+                                      stats_limits)
+    assert {group_name: vars(group_statistics) for group_name, group_statistics in result.items()} == expected
+    assert result["EXPLICABO"].number_of_songs == 12
+
+
+def test_database_statistics_length_histograms():
+    group_names, group_codes, lengths = _random_groups(np.random.default_rng(5), number_of_groups=8)
+    length_histograms = _histograms_of(group_names, group_codes, lengths)
+    database_statistics = DatabaseStatistics(
+        rivendell_carts=length_histograms, output_filename=None, stats_limits=StatisticsLimits(), write_limits=False,
+        write_full_statistics=True, statistics_workers=4
+    )
+
+    organized_carts = database_statistics._organize_by_rivendell_group(unorganized_carts=length_histograms)
+    result = database_statistics._calculate_statistics_per_group(organized_carts=organized_carts)
+
+    assert organized_carts is length_histograms
+    assert {group_name: vars(group_statistics) for group_name, group_statistics in result.items()} == \
+        _expected_statistics(group_names, group_codes, lengths, StatisticsLimits())
+
+
+STATS_LIMITS_GRID = [
+    StatisticsLimits(
+        smallest_stdev=smallest_stdev, minimum_population_for_outliers=minimum_population_for_outliers, 
+        lower_bound_multiple=lower_bound_multiple, upper_bound_multiple=upper_bound_multiple
+    )
+    for smallest_stdev, minimum_population_for_outliers, lower_bound_multiple, upper_bound_multiple in 
+    itertools.product([1, 15, 60], [1, 4, 10], [1.0, 1.5, 2.5], [2.0, 3.0])
+]
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_sweep_matches_rivendellgroupstatistics(seed):
+    group_names, group_codes, lengths = _random_groups(np.random.default_rng(seed), number_of_groups=30)
+
+    result = sweep_all_group_statistics(
+        group_names=group_names, group_codes=group_codes, lengths=lengths, stats_limits_grid=STATS_LIMITS_GRID
+    )
+
+    assert len(result) == len(STATS_LIMITS_GRID)
+    for stats_limits, statistics_per_group in zip(STATS_LIMITS_GRID, result):
+        assert {group_name: vars(group_statistics) for group_name, group_statistics in statistics_per_group.items()} \
+            == _expected_statistics(group_names, group_codes, lengths, stats_limits)
+
+
+def test_sweep_counts():
+    group_names, group_codes, lengths = _random_groups(np.random.default_rng(13), number_of_groups=12)
+    length_histograms = _histograms_of(group_names, group_codes, lengths)
+    histogram_group_names, histogram_group_codes, distinct_lengths, counts = length_histograms.to_arrays()
+
+    result = sweep_all_group_statistics(
+        group_names=histogram_group_names, group_codes=histogram_group_codes, lengths=distinct_lengths, 
+        stats_limits_grid=STATS_LIMITS_GRID, counts=counts
+    )
+
+    for stats_limits, statistics_per_group in zip(STATS_LIMITS_GRID, result):
+        assert {group_name: vars(group_statistics) for group_name, group_statistics in statistics_per_group.items()} \
+            == _expected_statistics(group_names, group_codes, lengths, stats_limits)
+
+
+def test_sweep_no_songs():
+    result = sweep_all_group_statistics(
+        group_names=[], group_codes=np.array([], dtype=np.int64), lengths=np.array([], dtype=np.int64), 
+        stats_limits_grid=STATS_LIMITS_GRID[:2]
+    )
+
+    assert result == [dict(), dict()]
+
+
+@pytest.fixture(scope="function")
+def setup_sweep():
+    group_names, group_codes, lengths = _random_groups(np.random.default_rng(17), number_of_groups=6)
+    rivendell_carts = [
+        SimpleNamespace(group_name=group_names[group_code], length_in_seconds=length)
+        for group_code, length in zip(group_codes.tolist(), lengths.tolist())
+    ]
+    stats_limits_grid = STATS_LIMITS_GRID[:3]
+
+    def make_database_statistics(output_filename, stats_limits_grid=stats_limits_grid, stats_limits=None):
+        return DatabaseStatistics(
+            rivendell_carts=rivendell_carts, output_filename=output_filename, 
+            stats_limits=stats_limits or StatisticsLimits(), write_limits=True, write_full_statistics=True, 
+            stats_limits_grid=stats_limits_grid
+        )
+
+    return stats_limits_grid, make_database_statistics
+
+
+def test_sweep_csv_has_one_table_for_each_limits(setup_sweep, tmp_path):
+    stats_limits_grid, make_database_statistics = setup_sweep
+    output_filename = tmp_path / "sweep.csv"
+
+    make_database_statistics(output_filename).run_script()
+
+    expected_contents = ""
+    for stats_limits in stats_limits_grid:
+        single_filename = tmp_path / "single.csv"
+        make_database_statistics(single_filename, stats_limits_grid=None, stats_limits=stats_limits).run_script()
+        expected_contents += single_filename.read_text()
+    assert output_filename.read_text() == expected_contents
+
+
+def test_sweep_excel_has_one_sheet_for_each_limits(setup_sweep, tmp_path):
+    stats_limits_grid, make_database_statistics = setup_sweep
+    output_filename = tmp_path / "sweep.xlsx"
+
+    make_database_statistics(output_filename).run_script()
+
+    with pd.ExcelFile(output_filename) as xlsx:
+        assert xlsx.sheet_names == ["Data 1", "Data 2", "Data 3", "Limits"]
+        df_limits = pd.read_excel(xlsx, sheet_name="Limits", index_col=0)
+        assert df_limits.index.tolist() == ["Data 1", "Data 2", "Data 3"]
+        assert df_limits["Minimum Population for Outliers"].tolist() == [
+            stats_limits.minimum_population_for_outliers for stats_limits in stats_limits_grid
+        ]
+        for number, stats_limits in enumerate(stats_limits_grid, start=1):
+            single_filename = output_filename.parent / f"single_{number}.xlsx"
+            make_database_statistics(single_filename, stats_limits_grid=None, stats_limits=stats_limits).run_script()
+            with pd.ExcelFile(single_filename) as single_xlsx:
+                assert pd.read_excel(xlsx, sheet_name=f"Data {number}", index_col=0).equals(
+                    pd.read_excel(single_xlsx, sheet_name="Data", index_col=0)
+                )
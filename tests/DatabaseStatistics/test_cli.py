@@ -2,10 +2,21 @@
 @Author = 'Michael Stanley'
 
 ============ Change Log ============
+2026-Oct-18 = Add trusted_dump to the expected LoadCartDataDump call and test --trusted_dump.
+              Add dump_cache to the expected LoadCartDataDump call and test --cache_directory.
+              Add parse_workers to the expected LoadCartDataDump call and test --parse_workers.
+              Add memory_map to the expected LoadCartDataDump call and test --memory_map.
+              Add the scheduler code filters to the expected LoadCartDataDump call and test them.
+              Test --from_database.
+              Test --snapshot_file.
+              Add statistics_workers to the expected DatabaseStatistics call and test --statistics_workers.
+              Test --streaming.
+              Add statistics_cache to the expected DatabaseStatistics call and test --statistics_cache_file.
+
 2025-Jan-03 = Created
 
 ============ License ============
-Copyright (C) 2025 Michael Stanley
+Copyright (C) 2025-2026 Michael Stanley
 
 This file is part of wmul_rivendell.
 
@@ -147,10 +158,17 @@ def test_database_statistics(fs, params, mocker, caplog):
     )
 
     mock_load_cart_data_dump_constructor.assert_called_once_with(
+        instrumentation=None,
         rivendell_cart_data_filename=mock_rivendell_cart_filename,
         include_macros=False,
         include_all_cuts=params.include_all_cuts,
         excluded_group_list=expected_exclude_groups,
+        trusted_dump=False,
+        dump_cache=None,
+        parse_workers=1,
+        memory_map=False,
+        required_sched_codes=[],
+        excluded_sched_codes=[]
     )
 
     mock_load_carts.assert_called_once_with()
@@ -160,7 +178,444 @@ def test_database_statistics(fs, params, mocker, caplog):
         output_filename=expected_output_filename,
         stats_limits=mock_stats_limits_object,
         write_limits=expected_write_limits,
-        write_full_statistics=expected_write_full_statistics
+        write_full_statistics=expected_write_full_statistics,
+        statistics_workers=1,
+        statistics_cache=None,
+        stats_limits_grid=None
     )
 
     mock_database_statistics_object.run_script.assert_called_once_with()
+
+
+def test_database_statistics_trusted_dump(fs, mocker):
+    from pathlib import Path
+    mock_rivendell_cart_filename = "/test/mock_rivendell_cart_filename.txt"
+    fs.create_file(mock_rivendell_cart_filename)
+    mock_output_filename = "/test/mock_output_filename"
+
+    mock_rivendell_carts = "mock_rivendell_carts"
+    mock_load_carts = mocker.Mock(return_value=mock_rivendell_carts)
+
+    mock_load_cart_data_dump_object = mocker.Mock(load_carts=mock_load_carts)
+    mock_load_cart_data_dump_constructor = mocker.patch(
+        "wmul_rivendell.cli.LoadCartDataDump",
+        return_value=mock_load_cart_data_dump_object,
+        autospec=True
+    )
+
+    mock_database_statistics_object = mocker.Mock()
+    mock_database_statistics_constructor = mocker.patch(
+        "wmul_rivendell.cli.DatabaseStatistics",
+        return_value=mock_database_statistics_object,
+        autospec=True
+    )
+
+    runner = CliRunner()
+    result = runner.invoke(
+        cli.database_statistics,
+        [mock_rivendell_cart_filename, mock_output_filename, "--trusted_dump"]
+    )
+
+    assert result.exit_code == 0
+
+    mock_load_cart_data_dump_constructor.assert_called_once_with(
+        instrumentation=None,
+        rivendell_cart_data_filename=mock_rivendell_cart_filename,
+        include_macros=False,
+        include_all_cuts=False,
+        excluded_group_list=[],
+        trusted_dump=True,
+        dump_cache=None,
+        parse_workers=1,
+        memory_map=False,
+        required_sched_codes=[],
+        excluded_sched_codes=[]
+    )
+
+    mock_database_statistics_constructor.assert_called_once_with(
+        rivendell_carts=mock_rivendell_carts,
+        output_filename=Path(mock_output_filename),
+        stats_limits=mocker.ANY,
+        write_limits=False,
+        write_full_statistics=False,
+        statistics_workers=1,
+        statistics_cache=None,
+        stats_limits_grid=None
+    )
+    mock_database_statistics_object.run_script.assert_called_once_with()
+
+
+def test_database_statistics_cache_directory_parse_workers_and_memory_map(fs, mocker):
+    from pathlib import Path
+    from wmul_rivendell.DumpCache import DumpCache
+    mock_rivendell_cart_filename = "/test/mock_rivendell_cart_filename.txt"
+    fs.create_file(mock_rivendell_cart_filename)
+    mock_output_filename = "/test/mock_output_filename"
+    mock_cache_directory = "/test/cache"
+
+    mock_load_cart_data_dump_object = mocker.Mock(load_carts=mocker.Mock(return_value="mock_rivendell_carts"))
+    mock_load_cart_data_dump_constructor = mocker.patch(
+        "wmul_rivendell.cli.LoadCartDataDump",
+        return_value=mock_load_cart_data_dump_object,
+        autospec=True
+    )
+    mocker.patch("wmul_rivendell.cli.DatabaseStatistics", autospec=True)
+
+    runner = CliRunner()
+    result = runner.invoke(
+        cli.database_statistics,
+        [mock_rivendell_cart_filename, mock_output_filename, "--cache_directory", mock_cache_directory, 
+         "--cache_size_limit", "5", "--parse_workers", "3", "--memory_map"]
+    )
+
+    assert result.exit_code == 0
+
+    mock_load_cart_data_dump_constructor.assert_called_once_with(
+        instrumentation=None,
+        rivendell_cart_data_filename=mock_rivendell_cart_filename,
+        include_macros=False,
+        include_all_cuts=False,
+        excluded_group_list=[],
+        trusted_dump=False,
+        dump_cache=DumpCache(cache_directory=Path(mock_cache_directory), size_limit=5 * 1024 * 1024),
+        parse_workers=3,
+        memory_map=True,
+        required_sched_codes=[],
+        excluded_sched_codes=[]
+    )
+
+
+def test_database_statistics_sched_codes(fs, mocker):
+    mock_rivendell_cart_filename = "/test/mock_rivendell_cart_filename.txt"
+    fs.create_file(mock_rivendell_cart_filename)
+    mock_output_filename = "/test/mock_output_filename"
+
+    mock_load_cart_data_dump_object = mocker.Mock(load_carts=mocker.Mock(return_value="mock_rivendell_carts"))
+    mock_load_cart_data_dump_constructor = mocker.patch(
+        "wmul_rivendell.cli.LoadCartDataDump",
+        return_value=mock_load_cart_data_dump_object,
+        autospec=True
+    )
+    mocker.patch("wmul_rivendell.cli.DatabaseStatistics", autospec=True)
+
+    runner = CliRunner()
+    result = runner.invoke(
+        cli.database_statistics,
+        [mock_rivendell_cart_filename, mock_output_filename, "--required_sched_code", "2000s", 
+         "--required_sched_code", "Rock", "--excluded_sched_code", "Slow"]
+    )
+
+    assert result.exit_code == 0
+
+    mock_load_cart_data_dump_constructor.assert_called_once_with(
+        instrumentation=None,
+        rivendell_cart_data_filename=mock_rivendell_cart_filename,
+        include_macros=False,
+        include_all_cuts=False,
+        excluded_group_list=[],
+        trusted_dump=False,
+        dump_cache=None,
+        parse_workers=1,
+        memory_map=False,
+        required_sched_codes=["2000s", "Rock"],
+        excluded_sched_codes=["Slow"]
+    )
+
+
+def test_database_statistics_from_database(fs, mocker):
+    mock_rd_conf_filename = "/etc/rd.conf"
+    fs.create_file(
+        mock_rd_conf_filename, 
+        contents="[mySQL]\nHostname=db.example.com\nLoginname=rduser\nPassword=letmein\nDatabase=Rivendell\n"
+    )
+    mock_output_filename = "/test/mock_output_filename"
+
+    mock_load_cart_database_object = mocker.Mock(load_carts=mocker.Mock(return_value="mock_rivendell_carts"))
+    mock_load_cart_database_constructor = mocker.patch(
+        "wmul_rivendell.cli.LoadCartDatabase",
+        return_value=mock_load_cart_database_object,
+        autospec=True
+    )
+    mock_load_cart_data_dump_constructor = mocker.patch("wmul_rivendell.cli.LoadCartDataDump", autospec=True)
+    mock_database_statistics_constructor = mocker.patch("wmul_rivendell.cli.DatabaseStatistics", autospec=True)
+
+    runner = CliRunner()
+    result = runner.invoke(
+        cli.database_statistics,
+        [mock_rd_conf_filename, mock_output_filename, "--from_database", "--trusted_dump"]
+    )
+
+    assert result.exit_code == 0
+
+    mock_load_cart_database_constructor.assert_called_once_with(
+        instrumentation=None,
+        sql_host="db.example.com",
+        sql_user="rduser",
+        sql_pass="letmein",
+        sql_database_name="Rivendell",
+        include_macros=False,
+        include_all_cuts=False,
+        excluded_group_list=[],
+        trusted_dump=True,
+        required_sched_codes=[],
+        excluded_sched_codes=[]
+    )
+    mock_load_cart_data_dump_constructor.assert_not_called()
+    mock_database_statistics_constructor.assert_called_once_with(
+        rivendell_carts="mock_rivendell_carts",
+        output_filename=mocker.ANY,
+        stats_limits=mocker.ANY,
+        write_limits=False,
+        write_full_statistics=False,
+        statistics_workers=1,
+        statistics_cache=None,
+        stats_limits_grid=None
+    )
+
+
+def test_database_statistics_snapshot_file(fs, mocker):
+    from pathlib import Path
+    mock_rd_conf_filename = "/etc/rd.conf"
+    fs.create_file(
+        mock_rd_conf_filename, 
+        contents="[mySQL]\nHostname=db.example.com\nLoginname=rduser\nPassword=letmein\nDatabase=Rivendell\n"
+    )
+    mock_output_filename = "/test/mock_output_filename"
+    mock_snapshot_filename = "/test/snapshot.sqlite"
+
+    mock_load_cart_snapshot_object = mocker.Mock(load_carts=mocker.Mock(return_value="mock_rivendell_carts"))
+    mock_load_cart_snapshot_constructor = mocker.patch(
+        "wmul_rivendell.cli.LoadCartSnapshot",
+        return_value=mock_load_cart_snapshot_object,
+        autospec=True
+    )
+    mock_load_cart_database_constructor = mocker.patch("wmul_rivendell.cli.LoadCartDatabase", autospec=True)
+    mocker.patch("wmul_rivendell.cli.DatabaseStatistics", autospec=True)
+
+    runner = CliRunner()
+    result = runner.invoke(
+        cli.database_statistics,
+        [mock_rd_conf_filename, mock_output_filename, "--from_database", "--snapshot_file", mock_snapshot_filename]
+    )
+
+    assert result.exit_code == 0
+
+    mock_load_cart_snapshot_constructor.assert_called_once_with(
+        instrumentation=None,
+        snapshot_filename=Path(mock_snapshot_filename),
+        sql_host="db.example.com",
+        sql_user="rduser",
+        sql_pass="letmein",
+        sql_database_name="Rivendell",
+        include_macros=False,
+        include_all_cuts=False,
+        excluded_group_list=[],
+        trusted_dump=False,
+        required_sched_codes=[],
+        excluded_sched_codes=[]
+    )
+    mock_load_cart_database_constructor.assert_not_called()
+
+
+def test_database_statistics_statistics_workers(fs, mocker):
+    mock_rivendell_cart_filename = "/test/mock_rivendell_cart_filename.txt"
+    fs.create_file(mock_rivendell_cart_filename)
+    mock_output_filename = "/test/mock_output_filename"
+
+    mock_load_cart_data_dump_object = mocker.Mock(load_carts=mocker.Mock(return_value="mock_rivendell_carts"))
+    mocker.patch(
+        "wmul_rivendell.cli.LoadCartDataDump",
+        return_value=mock_load_cart_data_dump_object,
+        autospec=True
+    )
+    mock_database_statistics_constructor = mocker.patch("wmul_rivendell.cli.DatabaseStatistics", autospec=True)
+
+    runner = CliRunner()
+    result = runner.invoke(
+        cli.database_statistics,
+        [mock_rivendell_cart_filename, mock_output_filename, "--statistics_workers", "4"]
+    )
+
+    assert result.exit_code == 0
+
+    mock_database_statistics_constructor.assert_called_once_with(
+        rivendell_carts="mock_rivendell_carts",
+        output_filename=mocker.ANY,
+        stats_limits=mocker.ANY,
+        write_limits=False,
+        write_full_statistics=False,
+        statistics_workers=4,
+        statistics_cache=None,
+        stats_limits_grid=None
+    )
+
+
+def test_database_statistics_streaming(fs, mocker):
+    from collections import Counter
+    from types import SimpleNamespace
+    from wmul_rivendell.DatabaseStatistics import LengthHistograms
+    mock_rivendell_cart_filename = "/test/mock_rivendell_cart_filename.txt"
+    fs.create_file(mock_rivendell_cart_filename)
+    mock_output_filename = "/test/mock_output_filename"
+
+    streamed_carts = [
+        SimpleNamespace(group_name="LAUDANTIUM", length_in_seconds=184),
+        SimpleNamespace(group_name="ASPERIORES", length_in_seconds=152),
+        SimpleNamespace(group_name="LAUDANTIUM", length_in_seconds=184),
+    ]
+    mock_load_carts = mocker.Mock()
+    mock_load_cart_data_dump_object = mocker.Mock(
+        load_carts=mock_load_carts, iter_carts=mocker.Mock(return_value=iter(streamed_carts))
+    )
+    mocker.patch(
+        "wmul_rivendell.cli.LoadCartDataDump",
+        return_value=mock_load_cart_data_dump_object,
+        autospec=True
+    )
+    mock_database_statistics_constructor = mocker.patch("wmul_rivendell.cli.DatabaseStatistics", autospec=True)
+
+    runner = CliRunner()
+    result = runner.invoke(
+        cli.database_statistics,
+        [mock_rivendell_cart_filename, mock_output_filename, "--streaming"]
+    )
+
+    assert result.exit_code == 0
+
+    mock_load_carts.assert_not_called()
+    mock_database_statistics_constructor.assert_called_once_with(
+        rivendell_carts=LengthHistograms(
+            histograms={"LAUDANTIUM": Counter({184: 2}), "ASPERIORES": Counter({152: 1})}
+        ),
+        output_filename=mocker.ANY,
+        stats_limits=mocker.ANY,
+        write_limits=False,
+        write_full_statistics=False,
+        statistics_workers=1,
+        statistics_cache=None,
+        stats_limits_grid=None
+    )
+
+
+def test_stream_length_histograms_several_stations(mocker):
+    from collections import Counter
+    from types import SimpleNamespace
+    from wmul_rivendell.LoadCartSources import LoadCartSources
+    station_carts = {
+        "wxyz": [SimpleNamespace(group_name="LAUDANTIUM", length_in_seconds=184)],
+        "wabc": [SimpleNamespace(group_name="LAUDANTIUM", length_in_seconds=184),
+                 SimpleNamespace(group_name="ASPERIORES", length_in_seconds=3723)],
+    }
+    cart_loader = LoadCartSources(cart_loaders={
+        station_name: mocker.Mock(iter_carts=mocker.Mock(return_value=iter(carts)))
+        for station_name, carts in station_carts.items()
+    })
+
+    length_histograms = cli.stream_length_histograms(cart_loader)
+
+    assert length_histograms.histograms == {"LAUDANTIUM": Counter({184: 2}), "ASPERIORES": Counter({3723: 1})}
+
+
+@pytest.mark.parametrize("bypass", [False, True], ids=["use_cache", "bypass_cache"])
+def test_database_statistics_statistics_cache_file(fs, mocker, bypass):
+    from pathlib import Path
+    from wmul_rivendell.StatisticsCache import StatisticsCache
+    mock_rivendell_cart_filename = "/test/mock_rivendell_cart_filename.txt"
+    fs.create_file(mock_rivendell_cart_filename)
+    mock_output_filename = "/test/mock_output_filename"
+    statistics_cache_filename = "/test/statistics_cache.json"
+    fs.create_file(statistics_cache_filename, contents="{}")
+
+    mock_load_cart_data_dump_object = mocker.Mock(load_carts=mocker.Mock(return_value="mock_rivendell_carts"))
+    mocker.patch(
+        "wmul_rivendell.cli.LoadCartDataDump",
+        return_value=mock_load_cart_data_dump_object,
+        autospec=True
+    )
+    mock_database_statistics_constructor = mocker.patch("wmul_rivendell.cli.DatabaseStatistics", autospec=True)
+
+    runner = CliRunner()
+    result = runner.invoke(
+        cli.database_statistics,
+        [mock_rivendell_cart_filename, mock_output_filename, "--statistics_cache_file", statistics_cache_filename] +
+        (["--bypass_statistics_cache"] if bypass else [])
+    )
+
+    assert result.exit_code == 0
+
+    mock_database_statistics_constructor.assert_called_once_with(
+        rivendell_carts="mock_rivendell_carts",
+        output_filename=mocker.ANY,
+        stats_limits=mocker.ANY,
+        write_limits=False,
+        write_full_statistics=False,
+        statistics_workers=1,
+        statistics_cache=StatisticsCache(cache_filename=Path(statistics_cache_filename), bypass=bypass),
+        stats_limits_grid=None
+    )
+    assert Path(statistics_cache_filename).exists()
+
+
+def test_database_statistics_clear_statistics_cache(fs, mocker):
+    from pathlib import Path
+    mock_rivendell_cart_filename = "/test/mock_rivendell_cart_filename.txt"
+    fs.create_file(mock_rivendell_cart_filename)
+    statistics_cache_filename = "/test/statistics_cache.json"
+    fs.create_file(statistics_cache_filename, contents="{}")
+
+    mocker.patch(
+        "wmul_rivendell.cli.LoadCartDataDump",
+        return_value=mocker.Mock(load_carts=mocker.Mock(return_value="mock_rivendell_carts")),
+        autospec=True
+    )
+    mocker.patch("wmul_rivendell.cli.DatabaseStatistics", autospec=True)
+
+    runner = CliRunner()
+    result = runner.invoke(
+        cli.database_statistics,
+        [mock_rivendell_cart_filename, "/test/mock_output_filename", "--statistics_cache_file", 
+         statistics_cache_filename, "--clear_statistics_cache"]
+    )
+
+    assert result.exit_code == 0
+    assert not Path(statistics_cache_filename).exists()
+
+
+def test_database_statistics_sweep(fs, mocker):
+    from wmul_rivendell.DatabaseStatistics import StatisticsLimits
+    mock_rivendell_cart_filename = "/test/mock_rivendell_cart_filename.txt"
+    fs.create_file(mock_rivendell_cart_filename)
+    mock_output_filename = "/test/mock_output_filename"
+
+    mocker.patch(
+        "wmul_rivendell.cli.LoadCartDataDump",
+        return_value=mocker.Mock(load_carts=mocker.Mock(return_value="mock_rivendell_carts")),
+        autospec=True
+    )
+    mock_database_statistics_constructor = mocker.patch("wmul_rivendell.cli.DatabaseStatistics", autospec=True)
+
+    runner = CliRunner()
+    result = runner.invoke(
+        cli.database_statistics,
+        [mock_rivendell_cart_filename, mock_output_filename, "--minimum_population", "6", 
+         "--sweep_smallest_stdev", "10", "--sweep_smallest_stdev", "20", "--sweep_upper_bound_multiple", "2.5", 
+         "--sweep_upper_bound_multiple", "3.5"]
+    )
+
+    assert result.exit_code == 0
+
+    mock_database_statistics_constructor.assert_called_once_with(
+        rivendell_carts="mock_rivendell_carts",
+        output_filename=mocker.ANY,
+        stats_limits=StatisticsLimits(minimum_population_for_outliers=6),
+        write_limits=False,
+        write_full_statistics=False,
+        statistics_workers=1,
+        statistics_cache=None,
+        stats_limits_grid=[
+            StatisticsLimits(smallest_stdev=10, minimum_population_for_outliers=6, upper_bound_multiple=2.5),
+            StatisticsLimits(smallest_stdev=10, minimum_population_for_outliers=6, upper_bound_multiple=3.5),
+            StatisticsLimits(smallest_stdev=20, minimum_population_for_outliers=6, upper_bound_multiple=2.5),
+            StatisticsLimits(smallest_stdev=20, minimum_population_for_outliers=6, upper_bound_multiple=3.5),
+        ]
+    )
@@ -2,10 +2,12 @@
 @Author = 'Michael Stanley'
 
 ============ Change Log ============
+2026-Oct-18 = Add test for organizing a CartTable by group.
+
 2025-Jan-03 = Created. 
 
 ============ License ============
-Copyright (C) 2025 Michael Stanley
+Copyright (C) 2025-2026 Michael Stanley
 
 This file is part of wmul_rivendell.
 
@@ -25,7 +27,7 @@ import pandas as pd
 import pytest
 from pathlib import Path
 
-from wmul_rivendell.LoadCartDataDump import RivendellCart, CartType
+from wmul_rivendell.LoadCartDataDump import CartTable, RivendellCart, CartType
 from wmul_rivendell.DatabaseStatistics import DatabaseStatistics, StatisticsLimits
 
 from wmul_test_utils import generate_true_false_matrix_from_list_of_strings, make_namedtuple
@@ -124,6 +126,38 @@ def test__organize_by_rivendell_group():
     assert len(POSSIMUS_carts) == 20
 
 
+def test__organize_by_rivendell_group_cart_table():
+    lengths_and_groups = [
+        ("3:04", "LAUDANTIUM"), ("2:32", "ASPERIORES"), (":15", "LAUDANTIUM"), ("10:53", "LAUDANTIUM"), 
+        ("1:02:03", "ASPERIORES")
+    ]
+    cart_table = CartTable.from_carts(
+        RivendellCart(
+            cart_number=str(cart_number), cut_number="1", type=CartType.Audio, group_name=group_name, title="", 
+            artist="", album="", year="", isrc="", isci="", label="", client="", agency="", publisher="", composer="", 
+            conductor="", song_id="", user_defined="", description="", outcue="", filename="", length=length, 
+            start_point="", end_point="", segue_start_point="", segue_end_point="", hook_start_point="", 
+            hook_end_point="", talk_start_point="", talk_end_point="", fadeup_point="", fadedown_point="", 
+            sched_codes=""
+        ) for cart_number, (length, group_name) in enumerate(lengths_and_groups, start=1)
+    )
+
+    database_statistics = DatabaseStatistics(
+        rivendell_carts=cart_table,
+        output_filename=Path("/test/output.csv"),
+        stats_limits=StatisticsLimits(),
+        write_limits=False,
+        write_full_statistics=False
+    )
+
+    result = database_statistics._organize_by_rivendell_group(unorganized_carts=cart_table)
+
+    assert list(result.keys()) == ["LAUDANTIUM", "ASPERIORES"]
+    assert result["LAUDANTIUM"].tolist() == [184, 15, 653]
+    assert result["ASPERIORES"].tolist() == [152, 3723]
+
+
+
 write_file_params, write_file_ids = \
     generate_true_false_matrix_from_list_of_strings(
         "write_file",
@@ -388,7 +422,8 @@ def test_run_script(fs, params, mocker):
         _organize_by_rivendell_group=mock_organize_by_rivendell_groups_function,
         _calculate_statistics_per_group=mock_calculate_statistics_per_group_function,
         _write_excel=mock_write_excel,
-        _write_csv=mock_write_csv
+        _write_csv=mock_write_csv,
+        stats_limits_grid=None
     )
 
     result = DatabaseStatistics.run_script(ds)
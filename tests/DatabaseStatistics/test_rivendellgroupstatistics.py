@@ -2,10 +2,12 @@
 @Author = 'Michael Stanley'
 
 ============ Change Log ============
+2026-Oct-18 = Run the main calculation tests with the songs given as a list of carts and as an array of lengths.
+
 2025-Jan-13 = Created. 
 
 ============ License ============
-Copyright (C) 2025 Michael Stanley
+Copyright (C) 2025-2026 Michael Stanley
 
 This file is part of wmul_rivendell.
 
@@ -21,14 +23,15 @@ FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
 You should have received a copy of the GNU General Public License along with 
 wmul_rivendell. If not, see <https://www.gnu.org/licenses/>. 
 """
+import numpy as np
 import pytest
 from wmul_rivendell.LoadCartDataDump import RivendellCart, CartType
 from wmul_rivendell.DatabaseStatistics import RivendellGroupStatistics, StatisticsLimits, _remove_outliers
 from wmul_test_utils import make_namedtuple, generate_true_false_matrix_from_list_of_strings
 
 
-@pytest.fixture(scope="function")
-def setup_rivendellgroupstatistics():
+@pytest.fixture(scope="function", params=["songs_as_carts", "songs_as_lengths"])
+def setup_rivendellgroupstatistics(request):
     carts = [
         RivendellCart(cart_number='', cut_number='1', type=CartType.Audio, group_name='EXPLICABO', title='perferendis enim harum repudiandae', artist='nisi ipsum', album='', year='', isrc='', isci='', label='', client='', agency='', publisher='', composer='', conductor='', song_id='', user_defined='', description='', outcue='', filename='', length='4:22', start_point='', end_point='', segue_start_point='', segue_end_point='', hook_start_point='', hook_end_point='', talk_start_point='', talk_end_point='', fadeup_point='', fadedown_point='', sched_codes=''),
         RivendellCart(cart_number='', cut_number='1', type=CartType.Audio, group_name='EXPLICABO', title='sapiente praesentium voluptates expedita', artist='tenetur assumenda', album='', year='', isrc='', isci='', label='', client='', agency='', publisher='', composer='', conductor='', song_id='', user_defined='', description='', outcue='', filename='', length='2:28', start_point='', end_point='', segue_start_point='', segue_end_point='', hook_start_point='', hook_end_point='', talk_start_point='', talk_end_point='', fadeup_point='', fadedown_point='', sched_codes=''),
@@ -59,8 +62,17 @@ def setup_rivendellgroupstatistics():
 
     stats_limits = StatisticsLimits(smallest_stdev=15)
 
+    if request.param == "songs_as_lengths":
+        songs_in_group = np.array([cart.length_in_seconds for cart in carts])
+    else:
+        songs_in_group = carts
+
     group_name = "EXPLICABO"
-    group_stats = RivendellGroupStatistics(group_name=group_name, songs_in_group=carts, stats_limits=stats_limits)
+    group_stats = RivendellGroupStatistics(
+        group_name=group_name, 
+        songs_in_group=songs_in_group, 
+        stats_limits=stats_limits
+    )
 
     expected_number_of_songs = 25
     expected_shortest_song_length = 14 # 0:15
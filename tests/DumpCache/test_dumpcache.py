@@ -0,0 +1,197 @@
+"""
+@Author = 'Michael Stanley'
+
+============ Change Log ============
+2026-Oct-18 = Created.
+              Add tests for evict keeping the entry of a touched dump, and removing that of a changed one.
+
+============ License ============
+Copyright (C) 2026 Michael Stanley
+
+This file is part of wmul_rivendell.
+
+wmul_rivendell is free software: you can redistribute it and/or modify it
+under the terms of the GNU General Public License as published by the Free
+Software Foundation, either version 3 of the License, or (at your option) any
+later version.
+
+wmul_rivendell is distributed in the hope that it will be useful, but WITHOUT
+ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License along with
+wmul_rivendell. If not, see <https://www.gnu.org/licenses/>.
+"""
+import os
+import pytest
+import wmul_test_utils
+from pathlib import Path
+
+from wmul_rivendell.DumpCache import DumpCache
+
+
+@pytest.fixture(scope="function")
+def setup_dump_cache(fs):
+    dump_filename = Path("/dumps/cart_data_dump.csv")
+    fs.create_file(dump_filename, contents="CART_NUMBER,CUT_NUMBER\r\n1,1\r\n")
+    cache_directory = Path("/cache")
+    dump_cache = DumpCache(cache_directory=cache_directory)
+
+    return wmul_test_utils.make_namedtuple(
+        "setup_dump_cache",
+        dump_filename=dump_filename,
+        cache_directory=cache_directory,
+        dump_cache=dump_cache
+    )
+
+
+def _store(dump_cache, dump_filename, data):
+    fingerprint = dump_cache.fingerprint(dump_filename)
+    dump_cache.store(fingerprint, data)
+
+
+def test_load_empty_cache(setup_dump_cache):
+    assert setup_dump_cache.dump_cache.load(setup_dump_cache.dump_filename) is None
+
+
+def test_load_after_store(setup_dump_cache):
+    dump_cache = setup_dump_cache.dump_cache
+    data = {"carts": [1, 2, 3]}
+
+    _store(dump_cache, setup_dump_cache.dump_filename, data)
+
+    assert dump_cache.load(setup_dump_cache.dump_filename) == data
+
+
+def test_load_after_dump_changed(setup_dump_cache):
+    dump_cache = setup_dump_cache.dump_cache
+    dump_filename = setup_dump_cache.dump_filename
+    _store(dump_cache, dump_filename, "old data")
+
+    dump_filename.write_text("CART_NUMBER,CUT_NUMBER\r\n1,1\r\n2,1\r\n")
+
+    assert dump_cache.load(dump_filename) is None
+    assert not list(setup_dump_cache.cache_directory.iterdir())
+
+
+def test_load_after_dump_changed_same_size(setup_dump_cache):
+    dump_cache = setup_dump_cache.dump_cache
+    dump_filename = setup_dump_cache.dump_filename
+    _store(dump_cache, dump_filename, "old data")
+
+    dump_filename.write_text("CART_NUMBER,CUT_NUMBER\r\n2,1\r\n")
+    dump_stat = dump_filename.stat()
+    os.utime(dump_filename, ns=(dump_stat.st_atime_ns, dump_stat.st_mtime_ns + 1_000_000_000))
+
+    assert dump_cache.load(dump_filename) is None
+
+
+def test_load_after_dump_touched(setup_dump_cache):
+    dump_cache = setup_dump_cache.dump_cache
+    dump_filename = setup_dump_cache.dump_filename
+    _store(dump_cache, dump_filename, "data")
+
+    dump_stat = dump_filename.stat()
+    os.utime(dump_filename, ns=(dump_stat.st_atime_ns, dump_stat.st_mtime_ns + 1_000_000_000))
+
+    assert dump_cache.load(dump_filename) == "data"
+    # The new modification time is recorded, so the entry is no longer stale.
+    dump_cache.evict()
+    assert dump_cache.load(dump_filename) == "data"
+
+
+def test_load_corrupt_entry(setup_dump_cache):
+    dump_cache = setup_dump_cache.dump_cache
+    dump_filename = setup_dump_cache.dump_filename
+    _store(dump_cache, dump_filename, "data")
+
+    for data_path in setup_dump_cache.cache_directory.glob("*.pickle"):
+        data_path.write_bytes(b"not a pickle")
+
+    assert dump_cache.load(dump_filename) is None
+    assert not list(setup_dump_cache.cache_directory.iterdir())
+
+
+def test_load_corrupt_metadata(setup_dump_cache):
+    dump_cache = setup_dump_cache.dump_cache
+    dump_filename = setup_dump_cache.dump_filename
+    _store(dump_cache, dump_filename, "data")
+
+    for metadata_path in setup_dump_cache.cache_directory.glob("*.json"):
+        metadata_path.write_text("{")
+
+    assert dump_cache.load(dump_filename) is None
+    assert not list(setup_dump_cache.cache_directory.iterdir())
+
+
+def test_evict_removes_entry_of_deleted_dump(fs, setup_dump_cache):
+    dump_cache = setup_dump_cache.dump_cache
+    other_dump_filename = Path("/dumps/other_dump.csv")
+    fs.create_file(other_dump_filename, contents="CART_NUMBER\r\n")
+    _store(dump_cache, setup_dump_cache.dump_filename, "data")
+    _store(dump_cache, other_dump_filename, "other data")
+
+    other_dump_filename.unlink()
+    dump_cache.evict()
+
+    assert len(list(setup_dump_cache.cache_directory.glob("*.json"))) == 1
+    assert dump_cache.load(setup_dump_cache.dump_filename) == "data"
+
+
+def test_evict_keeps_entry_of_touched_dump(setup_dump_cache, mocker):
+    dump_cache = setup_dump_cache.dump_cache
+    dump_filename = setup_dump_cache.dump_filename
+    _store(dump_cache, dump_filename, "data")
+
+    dump_stat = dump_filename.stat()
+    os.utime(dump_filename, ns=(dump_stat.st_atime_ns, dump_stat.st_mtime_ns + 1_000_000_000))
+    dump_cache.evict()
+
+    assert len(list(setup_dump_cache.cache_directory.glob("*.json"))) == 1
+    # The new modification time is recorded, so the content is not hashed again.
+    mock_content_hash = mocker.patch("wmul_rivendell.DumpCache._content_hash")
+    dump_cache.evict()
+    assert dump_cache.load(dump_filename) == "data"
+    mock_content_hash.assert_not_called()
+
+
+def test_evict_removes_entry_of_dump_changed_same_size(setup_dump_cache):
+    dump_cache = setup_dump_cache.dump_cache
+    dump_filename = setup_dump_cache.dump_filename
+    _store(dump_cache, dump_filename, "old data")
+
+    dump_filename.write_text("CART_NUMBER,CUT_NUMBER\r\n2,1\r\n")
+    dump_stat = dump_filename.stat()
+    os.utime(dump_filename, ns=(dump_stat.st_atime_ns, dump_stat.st_mtime_ns + 1_000_000_000))
+    dump_cache.evict()
+
+    assert not list(setup_dump_cache.cache_directory.iterdir())
+
+
+def test_evict_removes_orphaned_data(setup_dump_cache):
+    dump_cache = setup_dump_cache.dump_cache
+    _store(dump_cache, setup_dump_cache.dump_filename, "data")
+    orphaned_data_path = setup_dump_cache.cache_directory / "orphan.pickle"
+    orphaned_data_path.write_bytes(b"leftover")
+
+    dump_cache.evict()
+
+    assert not orphaned_data_path.exists()
+    assert dump_cache.load(setup_dump_cache.dump_filename) == "data"
+
+
+def test_store_evicts_least_recently_used(fs, setup_dump_cache):
+    dump_filenames = [Path(f"/dumps/dump_{index}.csv") for index in range(3)]
+    for dump_filename in dump_filenames:
+        fs.create_file(dump_filename, contents="CART_NUMBER\r\n")
+    data = "x" * 1000
+    dump_cache = DumpCache(cache_directory=setup_dump_cache.cache_directory, size_limit=2500)
+
+    _store(dump_cache, dump_filenames[0], data)
+    _store(dump_cache, dump_filenames[1], data)
+    assert dump_cache.load(dump_filenames[0]) == data
+    _store(dump_cache, dump_filenames[2], data)
+
+    assert dump_cache.load(dump_filenames[0]) == data
+    assert dump_cache.load(dump_filenames[1]) is None
+    assert dump_cache.load(dump_filenames[2]) == data
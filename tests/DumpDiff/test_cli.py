@@ -0,0 +1,117 @@
+"""
+@Author = 'Michael Stanley'
+
+============ Change Log ============
+2026-Oct-18 = Created.
+
+============ License ============
+Copyright (C) 2026 Michael Stanley
+
+This file is part of wmul_rivendell.
+
+wmul_rivendell is free software: you can redistribute it and/or modify it
+under the terms of the GNU General Public License as published by the Free
+Software Foundation, either version 3 of the License, or (at your option) any
+later version.
+
+wmul_rivendell is distributed in the hope that it will be useful, but WITHOUT
+ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License along with
+wmul_rivendell. If not, see <https://www.gnu.org/licenses/>.
+"""
+from click.testing import CliRunner
+from pathlib import Path
+import pytest
+
+from wmul_rivendell import cli
+
+
+@pytest.mark.parametrize("previous", ["none", "previous_dump", "previous_index"])
+@pytest.mark.parametrize("write_index", [False, True], ids=["no_index", "write_index"])
+@pytest.mark.parametrize("trusted_dump", [False, True], ids=["validated", "trusted"])
+def test_diff_dumps(fs, mocker, previous, write_index, trusted_dump):
+    mock_rivendell_cart_filename = "/test/current.csv"
+    mock_previous_dump_filename = "/test/previous.csv"
+    mock_previous_index_filename = "/test/previous_index.json"
+    mock_index_output_filename = "/test/current_index.json"
+    mock_output_filename = "/test/differences.csv"
+    for file_name in (mock_rivendell_cart_filename, mock_previous_dump_filename, mock_previous_index_filename):
+        fs.create_file(file_name)
+
+    mock_current_carts = mocker.Mock()
+    mock_previous_carts = mocker.Mock()
+
+    def make_load_cart_data_dump(rivendell_cart_data_filename, **kwargs):
+        if rivendell_cart_data_filename == mock_rivendell_cart_filename:
+            return mocker.Mock(iter_carts=mocker.Mock(return_value=mock_current_carts))
+        return mocker.Mock(iter_carts=mocker.Mock(return_value=mock_previous_carts))
+
+    mock_load_cart_data_dump_constructor = mocker.patch(
+        "wmul_rivendell.cli.LoadCartDataDump",
+        side_effect=make_load_cart_data_dump
+    )
+    mock_fingerprint_index = mocker.patch("wmul_rivendell.cli.FingerprintIndex", autospec=True)
+    mock_diff_dumps_object = mocker.Mock()
+    mock_diff_dumps_constructor = mocker.patch(
+        "wmul_rivendell.cli.DiffDumps", 
+        return_value=mock_diff_dumps_object
+    )
+
+    cli_args = [mock_rivendell_cart_filename, mock_output_filename]
+    if previous == "previous_dump":
+        cli_args.extend(["--previous_dump", mock_previous_dump_filename])
+        expected_previous_index = mock_fingerprint_index.from_carts.return_value
+    elif previous == "previous_index":
+        cli_args.extend(["--previous_index", mock_previous_index_filename])
+        expected_previous_index = mock_fingerprint_index.load.return_value
+    else:
+        expected_previous_index = mock_fingerprint_index.return_value
+    if write_index:
+        cli_args.extend(["--write_index", mock_index_output_filename])
+        expected_index_output_filename = Path(mock_index_output_filename)
+    else:
+        expected_index_output_filename = None
+    if trusted_dump:
+        cli_args.append("--trusted_dump")
+
+    runner = CliRunner()
+    result = runner.invoke(cli.diff_dumps, cli_args)
+
+    assert result.exit_code == 0
+
+    mock_load_cart_data_dump_constructor.assert_any_call(
+        instrumentation=None,
+        rivendell_cart_data_filename=mock_rivendell_cart_filename,
+        include_all_cuts=True,
+        include_macros=True,
+        excluded_group_list=[],
+        trusted_dump=trusted_dump
+    )
+    if previous == "previous_dump":
+        mock_fingerprint_index.from_carts.assert_called_once_with(mock_previous_carts)
+    elif previous == "previous_index":
+        mock_fingerprint_index.load.assert_called_once_with(Path(mock_previous_index_filename))
+
+    mock_diff_dumps_constructor.assert_called_once_with(
+        previous_index=expected_previous_index,
+        current_carts=mock_current_carts,
+        output_filename=Path(mock_output_filename),
+        index_output_filename=expected_index_output_filename
+    )
+    mock_diff_dumps_object.run_script.assert_called_once_with()
+
+
+def test_diff_dumps_previous_dump_and_index_are_exclusive(fs):
+    for file_name in ("/test/current.csv", "/test/previous.csv", "/test/previous_index.json"):
+        fs.create_file(file_name)
+
+    runner = CliRunner()
+    result = runner.invoke(
+        cli.diff_dumps, 
+        ["/test/current.csv", "/test/differences.csv", "--previous_dump", "/test/previous.csv", 
+         "--previous_index", "/test/previous_index.json"]
+    )
+
+    assert result.exit_code != 0
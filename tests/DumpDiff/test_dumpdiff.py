@@ -0,0 +1,158 @@
+"""
+@Author = 'Michael Stanley'
+
+============ Change Log ============
+2026-Oct-18 = Created.
+
+============ License ============
+Copyright (C) 2026 Michael Stanley
+
+This file is part of wmul_rivendell.
+
+wmul_rivendell is free software: you can redistribute it and/or modify it
+under the terms of the GNU General Public License as published by the Free
+Software Foundation, either version 3 of the License, or (at your option) any
+later version.
+
+wmul_rivendell is distributed in the hope that it will be useful, but WITHOUT
+ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License along with
+wmul_rivendell. If not, see <https://www.gnu.org/licenses/>.
+"""
+import csv
+import json
+import pytest
+from pathlib import Path
+
+from wmul_rivendell.DumpDiff import DiffDumps, FingerprintIndex, diff_dump
+from wmul_rivendell.LoadCartDataDump import CartType, RivendellCart, RivendellCartRecord
+
+
+def _make_record(cart_number, cut_number="1", **changed_fields):
+    fields = {field_name: "" for field_name in RivendellCartRecord._fields}
+    fields.update(
+        cart_number=cart_number,
+        cut_number=cut_number,
+        type=CartType.Audio,
+        group_name="MUSIC",
+        title=f"Title {cart_number}",
+        length="3:30",
+        length_in_seconds=210
+    )
+    fields.update(changed_fields)
+    return RivendellCartRecord(**fields)
+
+
+@pytest.fixture(scope="function")
+def previous_carts():
+    return [_make_record("1"), _make_record("2"), _make_record("2", cut_number="2"), _make_record("3")]
+
+
+def test_diff_dump_no_changes(previous_carts):
+    previous_index = FingerprintIndex.from_carts(previous_carts)
+
+    differences, current_index = diff_dump(previous_index=previous_index, current_carts=iter(previous_carts))
+
+    assert differences.added == []
+    assert differences.modified == {}
+    assert differences.removed == []
+    assert current_index == previous_index
+
+
+def test_diff_dump_added_modified_removed(previous_carts):
+    previous_index = FingerprintIndex.from_carts(previous_carts)
+    current_carts = [
+        _make_record("1", title="New Title", length="3:31", length_in_seconds=211),
+        _make_record("2"),
+        _make_record("3", type=CartType.Macro),
+        _make_record("4")
+    ]
+
+    differences, current_index = diff_dump(previous_index=previous_index, current_carts=iter(current_carts))
+
+    assert differences.added == [("4", "1")]
+    assert differences.modified == {("1", "1"): ["title", "length"], ("3", "1"): ["type"]}
+    assert differences.removed == [("2", "2")]
+    assert current_index == FingerprintIndex.from_carts(current_carts)
+
+
+def test_diff_dump_empty_previous_index(previous_carts):
+    differences, _ = diff_dump(previous_index=FingerprintIndex(), current_carts=previous_carts)
+
+    assert differences.added == [("1", "1"), ("2", "1"), ("2", "2"), ("3", "1")]
+    assert differences.modified == {}
+    assert differences.removed == []
+
+
+def test_diff_dump_duplicate_cuts(previous_carts, caplog):
+    previous_index = FingerprintIndex.from_carts(previous_carts)
+    current_carts = previous_carts + [
+        _make_record("1", title="Repeated Title"),
+        _make_record("4"),
+        _make_record("4", title="Repeated Title"),
+        _make_record("4")
+    ]
+
+    differences, current_index = diff_dump(previous_index=previous_index, current_carts=iter(current_carts))
+
+    assert differences.added == [("4", "1")]
+    assert differences.modified == {}
+    assert differences.removed == []
+    assert current_index == FingerprintIndex.from_carts(previous_carts + [_make_record("4")])
+    duplicate_warnings = [record for record in caplog.records if "same cart number and cut number" in record.message]
+    assert len(duplicate_warnings) == 1
+    assert duplicate_warnings[0].message.startswith("3 cuts")
+
+
+def test_fingerprint_index_records_match_carts(previous_carts):
+    rivendell_carts = [
+        RivendellCart(**{field_name: getattr(record, field_name) for field_name in RivendellCartRecord._fields})
+        for record in previous_carts
+    ]
+
+    assert FingerprintIndex.from_carts(rivendell_carts) == FingerprintIndex.from_carts(previous_carts)
+
+
+def test_fingerprint_index_save_and_load(fs, previous_carts):
+    index_filename = Path("/test/index.json")
+    fs.create_dir(index_filename.parent)
+    fingerprint_index = FingerprintIndex.from_carts(previous_carts)
+
+    fingerprint_index.save(index_filename)
+
+    assert FingerprintIndex.load(index_filename) == fingerprint_index
+
+
+def test_fingerprint_index_load_incompatible(fs, previous_carts):
+    index_filename = Path("/test/index.json")
+    fs.create_file(index_filename, contents=json.dumps({"format_version": 0, "field_names": [], "fingerprints": []}))
+
+    with pytest.raises(ValueError, match="incompatible version"):
+        FingerprintIndex.load(index_filename)
+
+
+def test_diff_dumps_run_script(fs, previous_carts):
+    output_filename = Path("/test/differences.csv")
+    index_output_filename = Path("/test/index.json")
+    fs.create_dir(output_filename.parent)
+    current_carts = [_make_record("1", artist="New Artist"), _make_record("2"), _make_record("3"), _make_record("5")]
+
+    x = DiffDumps(
+        previous_index=FingerprintIndex.from_carts(previous_carts),
+        current_carts=iter(current_carts),
+        output_filename=output_filename,
+        index_output_filename=index_output_filename
+    )
+    x.run_script()
+
+    with open(output_filename, newline="") as differences_file:
+        rows = list(csv.reader(differences_file))
+    assert rows == [
+        ["CHANGE", "CART_NUMBER", "CUT_NUMBER", "CHANGED_FIELDS"],
+        ["added", "5", "1", ""],
+        ["modified", "1", "1", "ARTIST"],
+        ["removed", "2", "2", ""]
+    ]
+    assert FingerprintIndex.load(index_output_filename) == FingerprintIndex.from_carts(current_carts)
@@ -2,12 +2,18 @@
 @Author = 'Michael Stanley'
 
 ============ Change Log ============
+2026-Oct-18 = Add trusted_dump to the test matrix.
+              Add dump_cache and parse_workers to the expected LoadCartDataDump call.
+              Expect the desired fields to be passed to LoadCartDataDump as projected_fields.
+              Add memory_map to the expected LoadCartDataDump call.
+              Add the scheduler code filters to the expected LoadCartDataDump call.
+
 2023-Jan-20 = Change license from GPLv2 to GPLv3.
 
 2023-Jan-19 = Created.
 
 ============ License ============
-Copyright (C) 2023, 2025 Michael Stanley
+Copyright (C) 2023, 2025-2026 Michael Stanley
 
 This file is part of wmul_rivendell.
 
@@ -37,7 +43,8 @@ filter_cart_report_params, filter_cart_report_ids = \
             "include_macros",
             "include_all_cuts",
             "use_trailing_comma",
-            "exclude_groups"
+            "exclude_groups",
+            "trusted_dump"
         ]
 
     )
@@ -103,6 +110,9 @@ def test_filter_cart_report(fs, params, mocker, caplog):
     if params.use_trailing_comma:
         cli_args.append("--use_trailing_comma")
 
+    if params.trusted_dump:
+        cli_args.append("--trusted_dump")
+
     if params.exclude_groups:
         exclude_groups_file_contents = "LAUDANTIUM\nASPERIORES\n"
         mock_exclude_groups_filename = "/test/mock_exclude_groups_filename.txt"
@@ -122,10 +132,18 @@ def test_filter_cart_report(fs, params, mocker, caplog):
     assert result.exit_code == 0
 
     mock_load_cart_data_dump_constructor.assert_called_once_with(
+        instrumentation=None,
         rivendell_cart_data_filename=mock_rivendell_cart_filename,
         include_macros=params.include_macros,
         include_all_cuts=params.include_all_cuts,
         excluded_group_list=expected_exclude_groups,
+        trusted_dump=params.trusted_dump,
+        dump_cache=None,
+        parse_workers=1,
+        projected_fields=expected_desired_fields,
+        memory_map=False,
+        required_sched_codes=[],
+        excluded_sched_codes=[]
     )
 
     mock_load_carts.assert_called_once_with()
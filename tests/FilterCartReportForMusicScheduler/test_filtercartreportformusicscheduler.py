@@ -2,6 +2,9 @@
 @Author = 'Michael Stanley'
 
 ============ Change Log ============
+2026-Oct-18 = Add tests for converting a CartTable.
+              Add a test for converting projected records.
+
 2023-Jan-20 = Change license from GPLv2 to GPLv3.
 
 2023-Jan-11 = Added tests that deal with a bug introduced in version 3.6.4. 
@@ -12,7 +15,7 @@
 2021-Jan-29 = Created.
 
 ============ License ============
-Copyright (C) 2021, 2023, 2025 Michael Stanley
+Copyright (C) 2021, 2023, 2025-2026 Michael Stanley
 
 This file is part of wmul_rivendell.
 
@@ -33,7 +36,7 @@ import pytest
 import wmul_test_utils
 
 from wmul_rivendell.FilterCartReportForMusicScheduler import ConvertDatabaseToCSV
-from wmul_rivendell.LoadCartDataDump import RivendellCart, CartType
+from wmul_rivendell.LoadCartDataDump import CartTable, RivendellCart, CartType, _projected_field_names
 
 
 cart_filter_params, cart_filter_ids = \
@@ -400,3 +403,75 @@ def test_run_script_remove_unwanted_fields_called_correctly(setup_run_script):
 
 def test_run_script_export_carts_to_csv_called_correctly(setup_run_script):
     setup_run_script.mock_export_carts.assert_called_once_with(setup_run_script.mock_music_scheduler_carts)
+
+
+@pytest.mark.parametrize("use_trailing_comma", [True, False])
+def test_run_script_cart_table_matches_list(fs, defined_rivendell_carts, use_trailing_comma):
+    import pathlib
+    rivendell_carts_for_test = [
+        defined_rivendell_carts.rivendell_cart_1_1,
+        defined_rivendell_carts.rivendell_cart_2_1,
+        defined_rivendell_carts.rivendell_cart_2_2,
+        defined_rivendell_carts.rivendell_cart_6_2,
+        defined_rivendell_carts.rivendell_cart_101_1,
+        defined_rivendell_carts.rivendell_cart_500_1
+    ]
+    cart_table = CartTable.from_carts(rivendell_carts_for_test)
+    desired_field_list = ["Cart_Number", "Type", "Title", "Length", "Length_In_Seconds", "Not_A_Field"]
+
+    list_output_path = pathlib.Path(r"\list_output_file.csv")
+    table_output_path = pathlib.Path(r"\table_output_file.csv")
+
+    ConvertDatabaseToCSV(
+        rivendell_carts=rivendell_carts_for_test,
+        output_filename=list_output_path,
+        desired_field_list=desired_field_list,
+        use_trailing_comma=use_trailing_comma
+    ).run_script()
+
+    ConvertDatabaseToCSV(
+        rivendell_carts=cart_table,
+        output_filename=table_output_path,
+        desired_field_list=desired_field_list,
+        use_trailing_comma=use_trailing_comma
+    ).run_script()
+
+    list_file_contents = open(list_output_path, newline="", mode="rt", errors="replace").read()
+    table_file_contents = open(table_output_path, newline="", mode="rt", errors="replace").read()
+
+    assert table_file_contents == list_file_contents
+
+
+@pytest.mark.parametrize("use_trailing_comma", [True, False])
+def test_run_script_projected_records_match_list(fs, defined_rivendell_carts, use_trailing_comma):
+    import pathlib
+    rivendell_carts_for_test = [
+        defined_rivendell_carts.rivendell_cart_1_1,
+        defined_rivendell_carts.rivendell_cart_2_2,
+        defined_rivendell_carts.rivendell_cart_500_1
+    ]
+    desired_field_list = ["Title", "Cart_Number", "Length", "Length_In_Seconds", "Not_A_Field"]
+    projected_carts = CartTable.from_carts(rivendell_carts_for_test)\
+        .to_projected_records(_projected_field_names(desired_field_list))
+
+    list_output_path = pathlib.Path(r"\list_output_file.csv")
+    projected_output_path = pathlib.Path(r"\projected_output_file.csv")
+
+    ConvertDatabaseToCSV(
+        rivendell_carts=rivendell_carts_for_test,
+        output_filename=list_output_path,
+        desired_field_list=desired_field_list,
+        use_trailing_comma=use_trailing_comma
+    ).run_script()
+
+    ConvertDatabaseToCSV(
+        rivendell_carts=projected_carts,
+        output_filename=projected_output_path,
+        desired_field_list=desired_field_list,
+        use_trailing_comma=use_trailing_comma
+    ).run_script()
+
+    list_file_contents = open(list_output_path, newline="", mode="rt", errors="replace").read()
+    projected_file_contents = open(projected_output_path, newline="", mode="rt", errors="replace").read()
+
+    assert projected_file_contents == list_file_contents
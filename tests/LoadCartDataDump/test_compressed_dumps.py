@@ -0,0 +1,122 @@
+"""
+@Author = 'Michael Stanley'
+
+============ Change Log ============
+2026-Oct-18 = Created.
+
+============ License ============
+Copyright (C) 2026 Michael Stanley
+
+This file is part of wmul_rivendell.
+
+wmul_rivendell is free software: you can redistribute it and/or modify it
+under the terms of the GNU General Public License as published by the Free
+Software Foundation, either version 3 of the License, or (at your option) any
+later version.
+
+wmul_rivendell is distributed in the hope that it will be useful, but WITHOUT
+ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License along with
+wmul_rivendell. If not, see <https://www.gnu.org/licenses/>.
+"""
+import bz2
+import gzip
+import logging
+import lzma
+import pytest
+
+import wmul_rivendell.LoadCartDataDump as LoadCartDataDumpModule
+from wmul_rivendell.DumpCache import DumpCache
+from wmul_rivendell.LoadCartDataDump import LoadCartDataDump
+
+DUMP_HEADER = "CART_NUMBER,CUT_NUMBER,TYPE,GROUP_NAME,TITLE,ARTIST,ALBUM,YEAR,ISRC,ISCI,LABEL,CLIENT,AGENCY," \
+    "PUBLISHER,COMPOSER,CONDUCTOR,SONG_ID,USER_DEFINED,DESCRIPTION,OUTCUE,FILENAME,LENGTH,START_POINT,END_POINT," \
+    "SEGUE_START_POINT,SEGUE_END_POINT,HOOK_START_POINT,HOOK_END_POINT,TALK_START_POINT,TALK_END_POINT," \
+    "FADEUP_POINT,FADEDOWN_POINT,SCHED_CODES\r\n"
+
+COMPRESSORS = {".gz": gzip.compress, ".bz2": bz2.compress, ".xz": lzma.compress, ".GZ": gzip.compress}
+
+
+def _dump_contents() -> bytes:
+    lines = [
+        f"{cart_number},{cut_number},{'macro' if cart_number % 7 == 0 else 'audio'},GROUP{cart_number % 3}, "
+        f"Title {cart_number} ,Artist,,1990,,,,,,,,,,,a description,,{cart_number:06}_{cut_number:03}.wav,"
+        f"3:{cart_number:02},,,,,,,,,,,2010s\r\n"
+        for cart_number in range(1, 40) for cut_number in range(1, 3)
+    ]
+    lines[3] = lines[3].replace("a description", '"a description, quoted"')
+    lines[7] = lines[7].replace("a description", "a broken\r\ndescription")
+    lines[9] = lines[9].replace("a description", "café")
+    return "".join([DUMP_HEADER, *lines]).encode()
+
+
+@pytest.fixture(scope="function")
+def small_chunks(monkeypatch):
+    # So that the small test dumps are large enough to be split.
+    monkeypatch.setattr(LoadCartDataDumpModule, "_MINIMUM_CHUNK_SIZE", 1)
+
+
+@pytest.fixture(scope="function")
+def setup_dumps(tmp_path):
+    dump_contents = _dump_contents()
+    plain_filename = tmp_path / "cart_data_dump.csv"
+    plain_filename.write_bytes(dump_contents)
+
+    def write_compressed(suffix):
+        compressed_filename = tmp_path / f"cart_data_dump.csv{suffix}"
+        compressed_filename.write_bytes(COMPRESSORS[suffix](dump_contents))
+        return compressed_filename
+
+    return plain_filename, write_compressed
+
+
+def _make_cart_filter(rivendell_cart_data_filename, **options):
+    return LoadCartDataDump(
+        rivendell_cart_data_filename=rivendell_cart_data_filename,
+        excluded_group_list=["GROUP0"],
+        include_macros=False,
+        include_all_cuts=False,
+        **options
+    )
+
+
+@pytest.mark.parametrize("suffix", list(COMPRESSORS))
+@pytest.mark.parametrize("options", [
+    {}, {"trusted_dump": True}, {"memory_map": True}, {"parse_workers": 2}, {"projected_fields": ["TITLE"]}
+], ids=["validated", "trusted", "memory_map", "parse_workers", "projected"])
+def test_compressed_dump_matches_plain_dump(setup_dumps, small_chunks, suffix, options):
+    plain_filename, write_compressed = setup_dumps
+    compressed_filename = write_compressed(suffix)
+
+    expected_carts = _make_cart_filter(plain_filename, **options).load_carts()
+    result_carts = _make_cart_filter(compressed_filename, **options).load_carts()
+
+    assert result_carts == expected_carts
+    assert list(_make_cart_filter(compressed_filename, **options).iter_carts()) == expected_carts
+
+
+def test_compressed_dump_cart_table(setup_dumps, small_chunks, caplog):
+    plain_filename, write_compressed = setup_dumps
+    caplog.set_level(logging.INFO)
+
+    expected_data = _make_cart_filter(plain_filename).load_cart_table().data
+    result_data = _make_cart_filter(write_compressed(".xz"), parse_workers=2).load_cart_table().data
+
+    assert result_data.equals(expected_data)
+    assert "A compressed cart data dump can not be parsed in parallel." in caplog.text
+
+
+def test_compressed_dump_cache(setup_dumps, tmp_path):
+    plain_filename, write_compressed = setup_dumps
+    compressed_filename = write_compressed(".gz")
+    dump_cache = DumpCache(cache_directory=tmp_path / "cache")
+
+    expected_carts = _make_cart_filter(plain_filename).load_carts()
+    first_carts = _make_cart_filter(compressed_filename, dump_cache=dump_cache).load_carts()
+    second_carts = _make_cart_filter(compressed_filename, dump_cache=dump_cache).load_carts()
+
+    assert first_carts == expected_carts
+    assert second_carts == expected_carts
+    assert dump_cache.load(compressed_filename) is not None
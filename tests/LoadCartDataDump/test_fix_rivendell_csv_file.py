@@ -2,10 +2,13 @@
 @Author = 'Michael Stanley'
 
 ============ Change Log ============
+2026-Oct-18 = _fix_rivendell_csv_file is now a generator. Join its results before comparing them.
+              Add tests for records split across many lines and for quoted fields split across lines.
+
 2025-Jan-08 = Created. 
 
 ============ License ============
-Copyright (C) 2025 Michael Stanley
+Copyright (C) 2025-2026 Michael Stanley
 
 This file is part of wmul_rivendell.
 
@@ -66,8 +69,9 @@ def test_no_extra_new_lines(fs, expected_result):
 
     with open(file_name, newline="", mode="rt", errors="replace") as rivendell_file:
         result = _fix_rivendell_csv_file(rivendell_source_file=rivendell_file)
+        result = "".join(result)
 
-    assert expected_result == result.getvalue()
+    assert expected_result == result
 
 
 def test_one_with_extra_new_line(fs, expected_result):
@@ -93,8 +97,9 @@ def test_one_with_extra_new_line(fs, expected_result):
 
     with open(file_name, newline="", mode="rt", errors="replace") as rivendell_file:
         result = _fix_rivendell_csv_file(rivendell_source_file=rivendell_file)
+        result = "".join(result)
 
-    assert expected_result == result.getvalue()
+    assert expected_result == result
 
 def test_two_with_extra_new_line(fs, expected_result):
     source_file_contents = \
@@ -119,8 +124,9 @@ def test_two_with_extra_new_line(fs, expected_result):
 
     with open(file_name, newline="", mode="rt", errors="replace") as rivendell_file:
         result = _fix_rivendell_csv_file(rivendell_source_file=rivendell_file)
+        result = "".join(result)
 
-    assert expected_result == result.getvalue()
+    assert expected_result == result
 
 
 def test_multiple_extra_new_line(fs, expected_result):
@@ -146,8 +152,9 @@ def test_multiple_extra_new_line(fs, expected_result):
 
     with open(file_name, newline="", mode="rt", errors="replace") as rivendell_file:
         result = _fix_rivendell_csv_file(rivendell_source_file=rivendell_file)
+        result = "".join(result)
 
-    assert expected_result == result.getvalue()
+    assert expected_result == result
 
 def test_cant_be_fixed(fs, expected_result):
     source_file_contents = \
@@ -172,4 +179,57 @@ def test_cant_be_fixed(fs, expected_result):
 
     with open(file_name, newline="", mode="rt", errors="replace") as rivendell_file:
         with pytest.raises(ValueError, match="There are errors in the csv file that cannot be automatically fixed. "):
-            result = _fix_rivendell_csv_file(rivendell_source_file=rivendell_file)
+            result = list(_fix_rivendell_csv_file(rivendell_source_file=rivendell_file))
+
+
+def test_many_extra_new_lines_in_one_record(fs):
+    header = 'CART_NUMBER,CUT_NUMBER,TYPE,DESCRIPTION,SCHED_CODES\r\n'
+    description_lines = [f"Line {line_number} of the description." for line_number in range(500)]
+    source_file_contents = \
+        header + \
+        '1,1,audio,' + "\r\n".join(description_lines) + ',2010s\r\n' + \
+        '2,1,audio,Short description.,2010s\r\n'
+
+    expected_result = \
+        header + \
+        '1,1,audio,' + " ".join(description_lines) + ',2010s\r\n' + \
+        '2,1,audio,Short description.,2010s\r\n'
+
+    file_name = pathlib.Path(r"\fakepath\source_file.csv")
+
+    fs.create_file(
+        file_name,
+        contents=source_file_contents
+    )
+
+    with open(file_name, newline="", mode="rt", errors="replace") as rivendell_file:
+        result = _fix_rivendell_csv_file(rivendell_source_file=rivendell_file)
+        result = "".join(result)
+
+    assert expected_result == result
+
+
+def test_quoted_field_with_commas_and_new_lines(fs):
+    header = 'CART_NUMBER,CUT_NUMBER,TYPE,DESCRIPTION,OUTCUE,SCHED_CODES\r\n'
+    source_file_contents = \
+        header + \
+        '1,1,audio,"Commas, ""quotes"",\r\nand new lines,\r\nall in one field.",Outcue,2010s\r\n' + \
+        '2,1,audio,"Short, description.",Outcue,2010s\r\n'
+
+    expected_result = \
+        header + \
+        '1,1,audio,"Commas, ""quotes"", and new lines, all in one field.",Outcue,2010s\r\n' + \
+        '2,1,audio,"Short, description.",Outcue,2010s\r\n'
+
+    file_name = pathlib.Path(r"\fakepath\source_file.csv")
+
+    fs.create_file(
+        file_name,
+        contents=source_file_contents
+    )
+
+    with open(file_name, newline="", mode="rt", errors="replace") as rivendell_file:
+        result = _fix_rivendell_csv_file(rivendell_source_file=rivendell_file)
+        result = "".join(result)
+
+    assert expected_result == result
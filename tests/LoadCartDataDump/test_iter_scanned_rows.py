@@ -0,0 +1,146 @@
+"""
+@Author = 'Michael Stanley'
+
+============ Change Log ============
+2026-Oct-18 = Created. 
+
+============ License ============
+Copyright (C) 2026 Michael Stanley
+
+This file is part of wmul_rivendell.
+
+wmul_rivendell is free software: you can redistribute it and/or modify it 
+under the terms of the GNU General Public License as published by the Free 
+Software Foundation, either version 3 of the License, or (at your option) any 
+later version.
+
+wmul_rivendell is distributed in the hope that it will be useful, but WITHOUT 
+ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS 
+FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License along with 
+wmul_rivendell. If not, see <https://www.gnu.org/licenses/>. 
+"""
+import io
+import mmap
+import pytest
+from itertools import chain
+
+from wmul_rivendell.LoadCartDataDump import LoadCartDataDump, _IncompleteRecordError, _iter_scanned_rows, \
+    _iter_text_rows
+
+
+# The tests use real files, because a memory map needs a real file descriptor.
+
+HEADER = b"CART_NUMBER,CUT_NUMBER,TYPE,TITLE\r\n"
+
+
+def _scanned_rows(tmp_path, dump_contents, start=0, end=None, raise_on_incomplete_record=False):
+    dump_filename = tmp_path / "dump.csv"
+    dump_filename.write_bytes(dump_contents)
+    with open(dump_filename, mode="rb") as dump_file, \
+            mmap.mmap(dump_file.fileno(), 0, access=mmap.ACCESS_READ) as dump_map:
+        return list(_iter_scanned_rows(dump_map, start, end, raise_on_incomplete_record))
+
+
+def _text_rows(dump_contents, start=0, end=None, raise_on_incomplete_record=False):
+    text_lines = io.TextIOWrapper(io.BytesIO(dump_contents[start:end]), newline="", errors="replace")
+    if start > 0:
+        text_lines = chain([HEADER.decode()], text_lines)
+    return list(_iter_text_rows(text_lines, raise_on_incomplete_record))
+
+
+@pytest.mark.parametrize(
+    "records",
+    [
+        [b"1,1,audio,Plain\r\n", b"2,1,macro,\r\n"],
+        [b'1,1,audio,"Quoted, with a comma"\r\n', b'2,1,audio,"Doubled ""quotes"""\r\n'],
+        [b"1,1,audio,Broken\r\n", b"across lines\r\n", b"2,1,audio,After\r\n"],
+        [b"1,1,\r\n", b"\r\n", b"audio,Blank line inside\r\n"],
+        [b"1,1,audio,Bare\rcarriage return\r\n", b"2,1,audio,After\r\n"],
+        [b"1,1,audio,Bad \xff\xe2\x82 bytes \xc3\xa9\r\n"],
+        [b"1,1,audio,Unix line ends\n", b"2,1,audio,No final line end"],
+        [b'1,1,audio,"Open quote\r\n', b"2,1,audio,After\r\n"],
+        [b"1,1,audio,Too,many,fields\r\n"],
+        [b"1,1,audio,Incomplete final\r\n", b"2,1,"],
+    ],
+    ids=["plain", "quoted", "broken", "blank", "bare_cr", "bad_bytes", "unix", "open_quote", "too_many", "incomplete"]
+)
+def test_scanned_rows_match_text_rows(tmp_path, records):
+    dump_contents = HEADER + b"".join(records)
+
+    assert _scanned_rows(tmp_path, dump_contents) == _text_rows(dump_contents)
+
+
+def test_scanned_rows_header_only(tmp_path):
+    assert _scanned_rows(tmp_path, HEADER) == [["CART_NUMBER", "CUT_NUMBER", "TYPE", "TITLE"]]
+
+
+def test_scanned_rows_byte_range(tmp_path):
+    records = [b"1,1,audio,One\r\n", b"2,1,audio,Two\r\n", b"3,1,audio,Three\r\n"]
+    dump_contents = HEADER + b"".join(records)
+    start = len(HEADER) + len(records[0])
+    end = start + len(records[1])
+
+    result = _scanned_rows(tmp_path, dump_contents, start, end)
+
+    assert result == _text_rows(dump_contents, start, end)
+    assert result == [["CART_NUMBER", "CUT_NUMBER", "TYPE", "TITLE"], ["2", "1", "audio", "Two"]]
+
+
+def test_scanned_rows_byte_range_ends_inside_record(tmp_path):
+    records = [b"1,1,audio,One\r\n", b"2,1,\r\n", b"audio,Two\r\n"]
+    dump_contents = HEADER + b"".join(records)
+    end = len(HEADER) + len(records[0]) + len(records[1])
+
+    with pytest.raises(_IncompleteRecordError):
+        _scanned_rows(tmp_path, dump_contents, end=end, raise_on_incomplete_record=True)
+
+
+@pytest.mark.parametrize("trusted_dump", [False, True], ids=["validated", "trusted"])
+@pytest.mark.parametrize("projected_fields", [None, ["TITLE", "LENGTH"]], ids=["whole", "projected"])
+def test_load_carts_memory_map_matches_text(tmp_path, trusted_dump, projected_fields):
+    dump_header = "CART_NUMBER,CUT_NUMBER,TYPE,GROUP_NAME,TITLE,ARTIST,ALBUM,YEAR,ISRC,ISCI,LABEL,CLIENT,AGENCY," \
+        "PUBLISHER,COMPOSER,CONDUCTOR,SONG_ID,USER_DEFINED,DESCRIPTION,OUTCUE,FILENAME,LENGTH,START_POINT,END_POINT," \
+        "SEGUE_START_POINT,SEGUE_END_POINT,HOOK_START_POINT,HOOK_END_POINT,TALK_START_POINT,TALK_END_POINT," \
+        "FADEUP_POINT,FADEDOWN_POINT,SCHED_CODES\r\n"
+    lines = [
+        f"{cart_number},1,{'macro' if cart_number % 7 == 0 else 'audio'},GROUP{cart_number % 3}, Title {cart_number} ,"
+        f"Artist,,1990,,,,,,,,,,,a description,,{cart_number:06}_001.wav,3:{cart_number:02},,,,,,,,,,,2010s\r\n"
+        for cart_number in range(1, 20)
+    ]
+    lines[3] = lines[3].replace("a description", '"a description, quoted"')
+    lines[7] = lines[7].replace("a description", "a broken\r\ndescription")
+    rivendell_cart_data_filename = tmp_path / "cart_data_dump.csv"
+    rivendell_cart_data_filename.write_bytes("".join([dump_header, *lines]).encode())
+
+    def make_cart_filter(memory_map):
+        return LoadCartDataDump(
+            rivendell_cart_data_filename=rivendell_cart_data_filename,
+            excluded_group_list=["GROUP0"],
+            include_macros=False,
+            include_all_cuts=True,
+            trusted_dump=trusted_dump,
+            projected_fields=projected_fields,
+            memory_map=memory_map
+        )
+
+    expected_carts = make_cart_filter(memory_map=False).load_carts()
+
+    assert make_cart_filter(memory_map=True).load_carts() == expected_carts
+    assert list(make_cart_filter(memory_map=True).iter_carts()) == expected_carts
+
+
+def test_load_carts_memory_map_empty_dump(tmp_path):
+    rivendell_cart_data_filename = tmp_path / "empty.csv"
+    rivendell_cart_data_filename.write_bytes(b"")
+
+    cart_filter = LoadCartDataDump(
+        rivendell_cart_data_filename=rivendell_cart_data_filename,
+        excluded_group_list=[],
+        include_macros=True,
+        include_all_cuts=True,
+        memory_map=True
+    )
+
+    assert cart_filter.load_carts() == []
@@ -0,0 +1,84 @@
+"""
+@Author = 'Michael Stanley'
+
+============ Change Log ============
+2026-Oct-18 = Created. 
+              Add tests for unparseable_seconds.
+
+============ License ============
+Copyright (C) 2026 Michael Stanley
+
+This file is part of wmul_rivendell.
+
+wmul_rivendell is free software: you can redistribute it and/or modify it 
+under the terms of the GNU General Public License as published by the Free 
+Software Foundation, either version 3 of the License, or (at your option) any 
+later version.
+
+wmul_rivendell is distributed in the hope that it will be useful, but WITHOUT 
+ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS 
+FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License along with 
+wmul_rivendell. If not, see <https://www.gnu.org/licenses/>. 
+"""
+import numpy as np
+import pytest
+
+from wmul_rivendell.LoadCartDataDump import lengths_to_seconds, _length_to_seconds, UNPARSEABLE_LENGTH_IN_SECONDS
+
+
+length_params = [
+    (":07", 7),
+    ("0:00", 0),
+    ("7:14", 434),
+    ("10:53", 653),
+    ("1:07:14", 4034),
+    ("12:00:01", 43201),
+    ("", 0),
+    (" 7:14", 434),
+    ("-1:05", -55)
+]
+
+
+@pytest.mark.parametrize("length, expected_seconds", length_params)
+def test_lengths_to_seconds_single(length, expected_seconds):
+    result = lengths_to_seconds([length])
+    assert result.dtype == np.int64
+    assert result.tolist() == [expected_seconds]
+
+
+def test_lengths_to_seconds_column():
+    lengths = [length for length, _ in length_params]
+    expected_seconds = [expected for _, expected in length_params]
+    assert lengths_to_seconds(lengths).tolist() == expected_seconds
+
+
+def test_lengths_to_seconds_matches_length_to_seconds():
+    rng = np.random.default_rng(0)
+    seconds = rng.integers(0, 100_000, size=1_000)
+    lengths = [
+        f"{value // 3600}:{(value // 60) % 60:02d}:{value % 60:02d}" if value >= 3600 else 
+        f"{value // 60}:{value % 60:02d}" if value >= 60 else 
+        f":{value:02d}" 
+        for value in seconds.tolist()
+    ]
+    assert lengths_to_seconds(lengths).tolist() == [_length_to_seconds(length) for length in lengths]
+    assert lengths_to_seconds(lengths).tolist() == seconds.tolist()
+
+
+def test_lengths_to_seconds_empty_column():
+    assert lengths_to_seconds([]).tolist() == []
+    assert lengths_to_seconds(["", ""]).tolist() == [0, 0]
+
+
+@pytest.mark.parametrize("length", ["7", "1::", "::5", "1:2:3:4", "a:07"])
+def test_lengths_to_seconds_invalid_length(length):
+    with pytest.raises(ValueError):
+        lengths_to_seconds([":07", length])
+
+
+@pytest.mark.parametrize("length", ["7", "1::", "::5", "1:2:3:4", "a:07", "bad"])
+def test_lengths_to_seconds_unparseable_seconds(length):
+    result = lengths_to_seconds([":07", length, "7:14", length], unparseable_seconds=UNPARSEABLE_LENGTH_IN_SECONDS)
+    assert result.tolist() == [7, UNPARSEABLE_LENGTH_IN_SECONDS, 434, UNPARSEABLE_LENGTH_IN_SECONDS]
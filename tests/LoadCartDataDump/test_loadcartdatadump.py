@@ -2,13 +2,21 @@
 @Author = 'Michael Stanley'
 
 ============ Change Log ============
+2026-Oct-18 = Add tests for _iter_lowest_cuts and iter_carts.
+              Add tests for trusted_dump.
+              Add tests for load_cart_table.
+              Add tests for dump_cache.
+              Add tests for the interned fields.
+              Add tests for the scheduler code filters.
+              Add tests for LENGTHs that cannot be parsed.
+
 2023-May-25 = Created. Most of this module was refactored from 
                 tests/FilterCartReportForMusicScheduler/
                 test_filtercartreportformusicscheduler.py when the code under 
                 test was refactored into LoadCartDataDump.
 
 ============ License ============
-Copyright (C) 2021, 2023, 2025 Michael Stanley
+Copyright (C) 2021, 2023, 2025-2026 Michael Stanley
 
 This file is part of wmul_rivendell.
 
@@ -24,10 +32,12 @@ FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
 You should have received a copy of the GNU General Public License along with 
 wmul_rivendell. If not, see <https://www.gnu.org/licenses/>. 
 """
+import pandas as pd
 import pytest
 import wmul_test_utils
 
-from wmul_rivendell.LoadCartDataDump import LoadCartDataDump, RivendellCart, CartType
+from wmul_rivendell.LoadCartDataDump import LoadCartDataDump, RivendellCart, RivendellCartRecord, CartTable, CartType, \
+    RowFilterCounts, UNPARSEABLE_LENGTH_IN_SECONDS, _DUMP_FIELD_NAMES, _INTERNED_FIELD_NAMES
 
 @pytest.fixture(scope="function")
 def setup_standard_cart_filter(cart_source_file_contents):
@@ -504,3 +514,592 @@ def test_run_script_returns_correct_item(setup_run_script):
         assert setup_run_script.results == setup_run_script.mock_rivendell_carts_without_excluded_groups
     else:
         assert setup_run_script.results == setup_run_script.mock_rivendell_carts
+
+
+def test__iter_lowest_cuts_no_cuts(setup_standard_cart_filter):
+    rivendell_carts = []
+    result_carts = setup_standard_cart_filter.cart_filter.\
+        _iter_lowest_cuts(rivendell_carts=rivendell_carts)
+
+    assert list(result_carts) == []
+
+
+def test__iter_lowest_cuts_extra_cuts_in_order(setup_standard_cart_filter, defined_rivendell_carts):
+    rivendell_carts_for_test = [
+        defined_rivendell_carts.rivendell_cart_1_1,
+        defined_rivendell_carts.rivendell_cart_2_1,
+        defined_rivendell_carts.rivendell_cart_2_2,
+        defined_rivendell_carts.rivendell_cart_6_2,
+        defined_rivendell_carts.rivendell_cart_101_1,
+    ]
+
+    expected_carts = [
+        defined_rivendell_carts.rivendell_cart_1_1,
+        defined_rivendell_carts.rivendell_cart_2_1,
+        defined_rivendell_carts.rivendell_cart_6_2,
+        defined_rivendell_carts.rivendell_cart_101_1,
+    ]
+
+    result_carts = setup_standard_cart_filter.cart_filter\
+        ._iter_lowest_cuts(rivendell_carts=rivendell_carts_for_test)
+
+    assert list(result_carts) == expected_carts
+
+
+def test__iter_lowest_cuts_extra_cuts_out_of_order(setup_standard_cart_filter, defined_rivendell_carts):
+    rivendell_carts_for_test = [
+        defined_rivendell_carts.rivendell_cart_1_1,
+        defined_rivendell_carts.rivendell_cart_2_2,
+        defined_rivendell_carts.rivendell_cart_2_1,
+        defined_rivendell_carts.rivendell_cart_6_2,
+        defined_rivendell_carts.rivendell_cart_101_1,
+    ]
+
+    expected_carts = [
+        defined_rivendell_carts.rivendell_cart_1_1,
+        defined_rivendell_carts.rivendell_cart_2_1,
+        defined_rivendell_carts.rivendell_cart_6_2,
+        defined_rivendell_carts.rivendell_cart_101_1,
+    ]
+
+    result_carts = setup_standard_cart_filter.cart_filter\
+        ._iter_lowest_cuts(rivendell_carts=rivendell_carts_for_test)
+
+    assert list(result_carts) == expected_carts
+
+
+def test__iter_lowest_cuts_carts_out_of_order(setup_standard_cart_filter, defined_rivendell_carts):
+    rivendell_carts_for_test = [
+        defined_rivendell_carts.rivendell_cart_1_1,
+        defined_rivendell_carts.rivendell_cart_6_2,
+        defined_rivendell_carts.rivendell_cart_2_1,
+    ]
+
+    result_carts = setup_standard_cart_filter.cart_filter\
+        ._iter_lowest_cuts(rivendell_carts=rivendell_carts_for_test)
+
+    with pytest.raises(ValueError, match="The cart data dump is not ordered by cart number."):
+        list(result_carts)
+
+
+@pytest.mark.parametrize("params", load_carts_params, ids=rload_carts_ids)
+def test_iter_carts_matches_load_carts(fs, params, cart_source_file_contents):
+    import pathlib
+    rivendell_cart_data_filename = pathlib.Path(r"\fakepath\source_file.csv")
+
+    fs.create_file(
+        rivendell_cart_data_filename, 
+        contents=cart_source_file_contents.source_file_contents
+    )
+
+    if params.exclude_groups:
+        excluded_group_list = ["VOLUPTATIB"]
+    else:
+        excluded_group_list = []
+
+    cart_filter = LoadCartDataDump(
+        rivendell_cart_data_filename=rivendell_cart_data_filename,
+        include_macros=params.include_macros,
+        excluded_group_list=excluded_group_list,
+        include_all_cuts=params.include_all_cuts
+    )
+
+    result_carts = cart_filter.iter_carts()
+
+    assert not isinstance(result_carts, list)
+    assert list(result_carts) == cart_filter.load_carts()
+
+
+def _as_record_fields(carts):
+    return [tuple(getattr(cart, field_name) for field_name in RivendellCartRecord._fields) for cart in carts]
+
+
+def test__load_rivendell_carts_trusted_dump(fs, setup_standard_cart_filter, defined_rivendell_carts):
+    cart_filter = setup_standard_cart_filter.cart_filter
+    import pathlib
+    rivendell_cart_data_filename = pathlib.Path(r"\fakepath\source_file.csv")
+
+    fs.create_file(
+        rivendell_cart_data_filename, 
+        contents=setup_standard_cart_filter.cart_source_file_contents
+    )
+
+    cart_filter.rivendell_cart_data_filename = rivendell_cart_data_filename
+    cart_filter.trusted_dump = True
+
+    result_carts = cart_filter._load_rivendell_carts()
+
+    expected_carts = [
+        defined_rivendell_carts.rivendell_cart_1_1,
+        defined_rivendell_carts.rivendell_cart_2_1,
+        defined_rivendell_carts.rivendell_cart_2_2,
+        defined_rivendell_carts.rivendell_cart_6_2,
+        defined_rivendell_carts.rivendell_cart_101_1,
+        defined_rivendell_carts.rivendell_cart_500_1,
+        defined_rivendell_carts.rivendell_cart_970000_1,
+        defined_rivendell_carts.rivendell_cart_970001_1
+    ]
+
+    assert all(isinstance(cart, RivendellCartRecord) for cart in result_carts)
+    assert _as_record_fields(result_carts) == _as_record_fields(expected_carts)
+    assert [cart.length_in_seconds for cart in result_carts] == \
+        [cart.length_in_seconds for cart in expected_carts]
+
+
+def test__load_rivendell_carts_trusted_dump_blank_rows(fs, setup_standard_cart_filter):
+    cart_filter = setup_standard_cart_filter.cart_filter
+    import pathlib
+    rivendell_cart_data_filename = pathlib.Path(r"\fakepath\source_file.csv")
+
+    header, first_row = setup_standard_cart_filter.cart_source_file_contents.split("\r\n")[:2]
+
+    fs.create_file(
+        rivendell_cart_data_filename, 
+        contents=f"{header}\r\n{first_row}\r\n\r\n"
+    )
+
+    cart_filter.rivendell_cart_data_filename = rivendell_cart_data_filename
+    cart_filter.trusted_dump = True
+
+    result_carts = cart_filter._load_rivendell_carts()
+
+    assert len(result_carts) == 1
+    assert result_carts[0].cart_number == "1"
+    assert result_carts[0].sched_codes == "2010s"
+
+
+@pytest.mark.parametrize("params", load_carts_params, ids=rload_carts_ids)
+def test_load_carts_trusted_dump_matches_validated(fs, params, cart_source_file_contents):
+    import pathlib
+    rivendell_cart_data_filename = pathlib.Path(r"\fakepath\source_file.csv")
+
+    fs.create_file(
+        rivendell_cart_data_filename, 
+        contents=cart_source_file_contents.source_file_contents
+    )
+
+    if params.exclude_groups:
+        excluded_group_list = ["VOLUPTATIB"]
+    else:
+        excluded_group_list = []
+
+    validated_filter = LoadCartDataDump(
+        rivendell_cart_data_filename=rivendell_cart_data_filename,
+        include_macros=params.include_macros,
+        excluded_group_list=excluded_group_list,
+        include_all_cuts=params.include_all_cuts
+    )
+
+    trusted_filter = LoadCartDataDump(
+        rivendell_cart_data_filename=rivendell_cart_data_filename,
+        include_macros=params.include_macros,
+        excluded_group_list=excluded_group_list,
+        include_all_cuts=params.include_all_cuts,
+        trusted_dump=True
+    )
+
+    expected_fields = _as_record_fields(validated_filter.load_carts())
+
+    assert _as_record_fields(trusted_filter.load_carts()) == expected_fields
+    assert _as_record_fields(trusted_filter.iter_carts()) == expected_fields
+
+
+@pytest.mark.parametrize("params", load_carts_params, ids=rload_carts_ids)
+def test_load_cart_table_matches_load_carts(fs, params, cart_source_file_contents):
+    import pathlib
+    rivendell_cart_data_filename = pathlib.Path(r"\fakepath\source_file.csv")
+
+    fs.create_file(
+        rivendell_cart_data_filename, 
+        contents=cart_source_file_contents.source_file_contents
+    )
+
+    if params.exclude_groups:
+        excluded_group_list = ["VOLUPTATIB"]
+    else:
+        excluded_group_list = []
+
+    cart_filter = LoadCartDataDump(
+        rivendell_cart_data_filename=rivendell_cart_data_filename,
+        include_macros=params.include_macros,
+        excluded_group_list=excluded_group_list,
+        include_all_cuts=params.include_all_cuts
+    )
+
+    expected_carts = cart_filter.load_carts()
+
+    result_table = cart_filter.load_cart_table()
+
+    assert isinstance(result_table, CartTable)
+    result_data = result_table.data
+    assert result_data["group_name"].dtype == "category"
+    assert result_data["type"].dtype == "category"
+    assert result_data["length_in_seconds"].dtype == "int64"
+    assert list(result_data.index) == list(range(len(expected_carts)))
+
+    result_rows = [tuple(row) for row in result_data[list(RivendellCartRecord._fields)].itertuples(index=False)]
+    assert result_rows == _as_record_fields(expected_carts)
+    assert result_data["length_in_seconds"].tolist() == [cart.length_in_seconds for cart in expected_carts]
+
+
+def test__remove_extra_cuts_from_table_no_cuts(setup_standard_cart_filter):
+    cart_filter = setup_standard_cart_filter.cart_filter
+    cart_table = CartTable.from_carts([])
+    result_data = cart_filter._remove_extra_cuts_from_table(cart_table.data)
+    assert len(result_data) == 0
+
+
+def test__remove_extra_cuts_from_table_extra_cuts_out_of_order(setup_standard_cart_filter, defined_rivendell_carts):
+    cart_filter = setup_standard_cart_filter.cart_filter
+
+    rivendell_carts_for_test = [
+        defined_rivendell_carts.rivendell_cart_2_2,
+        defined_rivendell_carts.rivendell_cart_1_1,
+        defined_rivendell_carts.rivendell_cart_6_2,
+        defined_rivendell_carts.rivendell_cart_2_1,
+        defined_rivendell_carts.rivendell_cart_101_1,
+        defined_rivendell_carts.rivendell_cart_2_1
+    ]
+    cart_table = CartTable.from_carts(rivendell_carts_for_test)
+
+    result_data = cart_filter._remove_extra_cuts_from_table(cart_table.data)
+
+    expected_carts = list(cart_filter._remove_extra_cuts(rivendell_carts_for_test))
+    assert list(result_data.index) == [3, 1, 2, 4]
+    assert result_data["cart_number"].tolist() == [cart.cart_number for cart in expected_carts]
+    assert result_data["cut_number"].tolist() == [cart.cut_number for cart in expected_carts]
+
+
+def _unparseable_length_contents(cart_source_file_contents):
+    """The standard source file, with a LENGTH of "bad" for cart 101."""
+    source_file_contents = cart_source_file_contents.source_file_contents
+    assert source_file_contents.count(",000101_001.wav,:05,") == 1
+    return source_file_contents.replace(",000101_001.wav,:05,", ",000101_001.wav,bad,")
+
+
+@pytest.mark.parametrize("load_method", ["load_carts", "load_cart_table", "iter_carts"])
+def test_trusted_dump_unparseable_length(fs, load_method, cart_source_file_contents, caplog):
+    import pathlib
+    rivendell_cart_data_filename = pathlib.Path(r"\fakepath\source_file.csv")
+
+    fs.create_file(
+        rivendell_cart_data_filename, 
+        contents=_unparseable_length_contents(cart_source_file_contents)
+    )
+
+    def make_cart_filter(trusted_dump):
+        return LoadCartDataDump(
+            rivendell_cart_data_filename=rivendell_cart_data_filename,
+            include_macros=True,
+            excluded_group_list=[],
+            include_all_cuts=True,
+            trusted_dump=trusted_dump
+        )
+
+    expected_carts = make_cart_filter(trusted_dump=False).load_carts()
+    result = getattr(make_cart_filter(trusted_dump=True), load_method)()
+
+    if load_method == "load_cart_table":
+        result_data = result.data
+        result_lengths = result_data["length"].tolist()
+        result_lengths_in_seconds = result_data["length_in_seconds"].tolist()
+    else:
+        result = list(result)
+        field_names = RivendellCartRecord._fields[:-1]
+        assert [tuple(getattr(cart, field_name) for field_name in field_names) for cart in result] == \
+            [tuple(getattr(cart, field_name) for field_name in field_names) for cart in expected_carts]
+        result_lengths = [cart.length for cart in result]
+        result_lengths_in_seconds = [cart.length_in_seconds for cart in result]
+    assert result_lengths == [cart.length for cart in expected_carts]
+    assert result_lengths_in_seconds == [7, 7, 11, 11, UNPARSEABLE_LENGTH_IN_SECONDS, 8, 0, 0]
+    assert "1 cuts have a LENGTH that cannot be parsed" in caplog.text
+
+
+def test_cart_table_from_carts_unparseable_length(defined_rivendell_carts, caplog):
+    rivendell_carts_for_test = [
+        defined_rivendell_carts.rivendell_cart_1_1,
+        defined_rivendell_carts.rivendell_cart_101_1.model_copy(update={"length": "bad"}),
+        defined_rivendell_carts.rivendell_cart_500_1
+    ]
+
+    cart_table = CartTable.from_carts(rivendell_carts_for_test)
+
+    assert cart_table.data["length"].tolist() == [":07", "bad", ":08"]
+    assert cart_table.data["length_in_seconds"].tolist() == [7, UNPARSEABLE_LENGTH_IN_SECONDS, 8]
+    assert cart_table.data["length_in_seconds"].dtype == "int64"
+    assert {
+        group_name: lengths.tolist() for group_name, lengths in cart_table.lengths_by_group().items()
+    } == {"TEMPORIBUS": [7], "VOLUPTATIB": [8]}
+    assert "1 cuts have a LENGTH that cannot be parsed" in caplog.text
+    assert [cart.length for cart in cart_table.to_carts()] == [":07", "bad", ":08"]
+
+
+@pytest.mark.parametrize("params", load_carts_params, ids=rload_carts_ids)
+@pytest.mark.parametrize("trusted_dump", [False, True], ids=["validated", "trusted"])
+def test_load_carts_dump_cache_matches_uncached(fs, params, trusted_dump, cart_source_file_contents):
+    import pathlib
+    from wmul_rivendell.DumpCache import DumpCache
+    rivendell_cart_data_filename = pathlib.Path(r"\fakepath\source_file.csv")
+
+    fs.create_file(
+        rivendell_cart_data_filename, 
+        contents=cart_source_file_contents.source_file_contents
+    )
+
+    if params.exclude_groups:
+        excluded_group_list = ["VOLUPTATIB"]
+    else:
+        excluded_group_list = []
+
+    def make_cart_filter(dump_cache=None):
+        return LoadCartDataDump(
+            rivendell_cart_data_filename=rivendell_cart_data_filename,
+            include_macros=params.include_macros,
+            excluded_group_list=excluded_group_list,
+            include_all_cuts=params.include_all_cuts,
+            trusted_dump=trusted_dump,
+            dump_cache=dump_cache
+        )
+
+    dump_cache = DumpCache(cache_directory=pathlib.Path("/cache"))
+    expected_carts = make_cart_filter().load_carts()
+    expected_table = make_cart_filter().load_cart_table()
+
+    cold_carts = make_cart_filter(dump_cache).load_carts()
+    assert dump_cache.load(rivendell_cart_data_filename) is not None
+    warm_carts = make_cart_filter(dump_cache).load_carts()
+    warm_table = make_cart_filter(dump_cache).load_cart_table()
+
+    assert cold_carts == expected_carts
+    assert warm_carts == expected_carts
+    assert all(type(cart) is type(expected_cart) for cart, expected_cart in zip(warm_carts, expected_carts))
+    pd.testing.assert_frame_equal(warm_table.data, expected_table.data)
+
+
+@pytest.mark.parametrize("trusted_dump", [False, True], ids=["validated", "trusted"])
+def test_load_carts_dump_cache_unparseable_length(fs, trusted_dump, cart_source_file_contents):
+    import pathlib
+    from wmul_rivendell.DumpCache import DumpCache
+    rivendell_cart_data_filename = pathlib.Path(r"\fakepath\source_file.csv")
+
+    fs.create_file(
+        rivendell_cart_data_filename, 
+        contents=_unparseable_length_contents(cart_source_file_contents)
+    )
+
+    def make_cart_filter(dump_cache=None):
+        return LoadCartDataDump(
+            rivendell_cart_data_filename=rivendell_cart_data_filename,
+            include_macros=False,
+            excluded_group_list=[],
+            include_all_cuts=False,
+            trusted_dump=trusted_dump,
+            dump_cache=dump_cache
+        )
+
+    dump_cache = DumpCache(cache_directory=pathlib.Path("/cache"))
+    expected_carts = make_cart_filter().load_carts()
+
+    cold_carts = make_cart_filter(dump_cache).load_carts()
+    assert dump_cache.load(rivendell_cart_data_filename) is not None
+    warm_carts = make_cart_filter(dump_cache).load_carts()
+
+    assert cold_carts == expected_carts
+    assert warm_carts == expected_carts
+    assert [cart.length for cart in warm_carts] == [":07", ":07", ":11", "bad", ":08"]
+
+
+@pytest.mark.parametrize("trusted_dump", [False, True], ids=["validated", "trusted"])
+@pytest.mark.parametrize("load_method", ["load_carts", "load_cart_table", "iter_carts"])
+def test_row_filters_pushed_down(fs, mocker, trusted_dump, load_method, cart_source_file_contents):
+    import pathlib
+    rivendell_cart_data_filename = pathlib.Path(r"\fakepath\source_file.csv")
+
+    fs.create_file(
+        rivendell_cart_data_filename, 
+        contents=cart_source_file_contents.source_file_contents
+    )
+    mock_from_dict = mocker.spy(RivendellCart, "from_dict")
+
+    cart_filter = LoadCartDataDump(
+        rivendell_cart_data_filename=rivendell_cart_data_filename,
+        include_macros=False,
+        excluded_group_list=["VOLUPTATIB"],
+        include_all_cuts=True,
+        trusted_dump=trusted_dump
+    )
+
+    result = getattr(cart_filter, load_method)()
+    result_cart_numbers = list(result.data["cart_number"]) if load_method == "load_cart_table" else \
+        [cart.cart_number for cart in result]
+
+    assert result_cart_numbers == ["1", "2", "2", "6", "101"]
+    assert cart_filter.row_filter_counts == RowFilterCounts(rows_read=8, excluded_group_rows=1, macro_rows=2)
+    assert cart_filter.row_filter_counts.rows_kept == 5
+    if load_method != "load_cart_table" and not trusted_dump:
+        assert mock_from_dict.call_count == 5
+
+
+def test_row_filters_not_pushed_down_with_dump_cache(fs, cart_source_file_contents):
+    import pathlib
+    from wmul_rivendell.DumpCache import DumpCache
+    rivendell_cart_data_filename = pathlib.Path(r"\fakepath\source_file.csv")
+
+    fs.create_file(
+        rivendell_cart_data_filename, 
+        contents=cart_source_file_contents.source_file_contents
+    )
+    dump_cache = DumpCache(cache_directory=pathlib.Path("/cache"))
+
+    cart_filter = LoadCartDataDump(
+        rivendell_cart_data_filename=rivendell_cart_data_filename,
+        include_macros=False,
+        excluded_group_list=["VOLUPTATIB"],
+        include_all_cuts=True,
+        dump_cache=dump_cache
+    )
+
+    assert len(cart_filter.load_carts()) == 5
+    assert cart_filter.row_filter_counts is None
+    assert len(CartTable.from_compact(dump_cache.load(rivendell_cart_data_filename)).data) == 8
+
+
+@pytest.mark.parametrize("params", load_carts_params, ids=rload_carts_ids)
+@pytest.mark.parametrize("trusted_dump", [False, True], ids=["validated", "trusted"])
+def test_load_carts_projected_fields_match_whole_carts(fs, params, trusted_dump, cart_source_file_contents):
+    import pathlib
+    rivendell_cart_data_filename = pathlib.Path(r"\fakepath\source_file.csv")
+
+    fs.create_file(
+        rivendell_cart_data_filename, 
+        contents=cart_source_file_contents.source_file_contents
+    )
+
+    if params.exclude_groups:
+        excluded_group_list = ["VOLUPTATIB"]
+    else:
+        excluded_group_list = []
+
+    def make_cart_filter(projected_fields=None):
+        return LoadCartDataDump(
+            rivendell_cart_data_filename=rivendell_cart_data_filename,
+            include_macros=params.include_macros,
+            excluded_group_list=excluded_group_list,
+            include_all_cuts=params.include_all_cuts,
+            trusted_dump=trusted_dump,
+            projected_fields=projected_fields
+        )
+
+    expected_carts = make_cart_filter().load_carts()
+    projected_cart_filter = make_cart_filter(["TITLE", "Artist", "length_in_seconds", "NOT_A_FIELD"])
+
+    result_carts = projected_cart_filter.load_carts()
+    iterated_carts = list(projected_cart_filter.iter_carts())
+
+    expected_field_names = ("cart_number", "cut_number", "type", "group_name", "title", "artist", "length_in_seconds")
+    assert all(cart._fields == expected_field_names for cart in result_carts)
+    assert result_carts == [
+        tuple(getattr(cart, field_name) for field_name in expected_field_names) for cart in expected_carts
+    ]
+    assert iterated_carts == result_carts
+
+
+@pytest.mark.parametrize("trusted_dump, projected_fields", [
+    (False, None), (True, None), (False, ["Artist", "Album", "Label", "Publisher", "Sched_Codes"])
+], ids=["validated", "trusted", "projected"])
+def test_load_carts_interns_repetitive_fields(fs, trusted_dump, projected_fields, cart_source_file_contents):
+    import pathlib
+    rivendell_cart_data_filename = pathlib.Path(r"\fakepath\source_file.csv")
+
+    fs.create_file(
+        rivendell_cart_data_filename, 
+        contents=cart_source_file_contents.source_file_contents
+    )
+
+    cart_filter = LoadCartDataDump(
+        rivendell_cart_data_filename=rivendell_cart_data_filename,
+        include_macros=True,
+        excluded_group_list=[],
+        include_all_cuts=True,
+        trusted_dump=trusted_dump,
+        projected_fields=projected_fields
+    )
+
+    result_carts = cart_filter.load_carts()
+
+    group_names = [cart.group_name for cart in result_carts]
+    assert len(set(group_names)) < len(group_names)
+    for field_name in _INTERNED_FIELD_NAMES:
+        values = [getattr(cart, field_name) for cart in result_carts]
+        # Every cart with the same value holds the same string.
+        assert len({id(value) for value in values}) == len(set(values))
+
+
+def _write_sched_codes_dump(rivendell_cart_data_filename, fs):
+    header = ",".join(_DUMP_FIELD_NAMES)
+    rows = []
+    for cart_number, cut_number, group_name, sched_codes in [
+        ("1", "1", "MUSIC", "2000s|Flashback"), 
+        ("2", "1", "MUSIC", "2000s"), 
+        ("2", "2", "MUSIC", "2000s"), 
+        ("3", "1", "MUSIC", ""), 
+        ("4", "1", "LEGAL", "2000s|Flashback"), 
+        ("5", "1", "MUSIC", "Flashback|Slow"), 
+        ("6", "1", "MUSIC", "Rock       2000s      .")
+    ]:
+        fields = dict.fromkeys(_DUMP_FIELD_NAMES, "")
+        fields.update(
+            CART_NUMBER=cart_number, CUT_NUMBER=cut_number, TYPE="audio", GROUP_NAME=group_name, 
+            TITLE=f"Title {cart_number}", LENGTH="3:30", SCHED_CODES=sched_codes
+        )
+        rows.append(",".join(fields.values()))
+    fs.create_file(rivendell_cart_data_filename, contents="\r\n".join([header, *rows]) + "\r\n")
+
+
+@pytest.mark.parametrize("trusted_dump, projected_fields", [
+    (False, None), (True, None), (False, ["Title"])
+], ids=["validated", "trusted", "projected"])
+@pytest.mark.parametrize("load_method", ["load_carts", "load_cart_table", "iter_carts"])
+@pytest.mark.parametrize("include_all_cuts", [True, False], ids=["all_cuts", "lowest_cut"])
+def test_sched_code_filters(fs, trusted_dump, projected_fields, load_method, include_all_cuts):
+    import pathlib
+    rivendell_cart_data_filename = pathlib.Path(r"\fakepath\source_file.csv")
+    _write_sched_codes_dump(rivendell_cart_data_filename, fs)
+
+    cart_filter = LoadCartDataDump(
+        rivendell_cart_data_filename=rivendell_cart_data_filename,
+        include_macros=True,
+        excluded_group_list=["LEGAL"],
+        include_all_cuts=include_all_cuts,
+        trusted_dump=trusted_dump,
+        projected_fields=projected_fields,
+        required_sched_codes=["2000s"],
+        excluded_sched_codes=["Flashback"]
+    )
+
+    if load_method == "load_cart_table":
+        data = cart_filter.load_cart_table().data
+        result = list(zip(data["cart_number"], data["cut_number"]))
+    else:
+        result = [(cart.cart_number, cart.cut_number) for cart in getattr(cart_filter, load_method)()]
+
+    if include_all_cuts:
+        assert result == [("2", "1"), ("2", "2"), ("6", "1")]
+    else:
+        assert result == [("2", "1"), ("6", "1")]
+
+
+def test_cart_table_sched_code_index(fs):
+    import pathlib
+    rivendell_cart_data_filename = pathlib.Path(r"\fakepath\source_file.csv")
+    _write_sched_codes_dump(rivendell_cart_data_filename, fs)
+    cart_filter = LoadCartDataDump(
+        rivendell_cart_data_filename=rivendell_cart_data_filename,
+        include_macros=True,
+        excluded_group_list=[],
+        include_all_cuts=True
+    )
+
+    sched_code_index = cart_filter.load_cart_table().sched_code_index()
+
+    assert sched_code_index.code_counts() == {"2000s": 5, "Flashback": 3, "Slow": 1, "Rock": 1}
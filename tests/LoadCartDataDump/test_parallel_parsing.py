@@ -0,0 +1,176 @@
+"""
+@Author = 'Michael Stanley'
+
+============ Change Log ============
+2026-Oct-18 = Created. 
+
+============ License ============
+Copyright (C) 2026 Michael Stanley
+
+This file is part of wmul_rivendell.
+
+wmul_rivendell is free software: you can redistribute it and/or modify it 
+under the terms of the GNU General Public License as published by the Free 
+Software Foundation, either version 3 of the License, or (at your option) any 
+later version.
+
+wmul_rivendell is distributed in the hope that it will be useful, but WITHOUT 
+ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS 
+FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License along with 
+wmul_rivendell. If not, see <https://www.gnu.org/licenses/>. 
+"""
+import io
+import pandas as pd
+import pytest
+
+import wmul_rivendell.LoadCartDataDump as LoadCartDataDumpModule
+from wmul_rivendell.LoadCartDataDump import LoadCartDataDump, _find_chunk_boundaries
+
+
+HEADER = "CART_NUMBER,CUT_NUMBER,TYPE,GROUP_NAME,TITLE,ARTIST,ALBUM,YEAR,ISRC,ISCI,LABEL,CLIENT,AGENCY,PUBLISHER," \
+    "COMPOSER,CONDUCTOR,SONG_ID,USER_DEFINED,DESCRIPTION,OUTCUE,FILENAME,LENGTH,START_POINT,END_POINT," \
+    "SEGUE_START_POINT,SEGUE_END_POINT,HOOK_START_POINT,HOOK_END_POINT,TALK_START_POINT,TALK_END_POINT," \
+    "FADEUP_POINT,FADEDOWN_POINT,SCHED_CODES\r\n"
+
+
+def _make_line(cart_number, cut_number, group_name="MUSIC", cart_type="audio", description="a description"):
+    return f"{cart_number},{cut_number},{cart_type},{group_name},Title {cart_number},Artist,,1990,,,,,,,,,,," \
+           f"{description},,{cart_number:06}_{cut_number:03}.wav,3:{cart_number % 60:02},,,,,,,,,,,2010s\r\n"
+
+
+@pytest.fixture(scope="function")
+def small_chunks(monkeypatch):
+    # Let every line be its own chunk, so that the tests can use small dumps.
+    monkeypatch.setattr(LoadCartDataDumpModule, "_MINIMUM_CHUNK_SIZE", 1)
+
+
+def _write_dump(tmp_path, lines):
+    rivendell_cart_data_filename = tmp_path / "cart_data_dump.csv"
+    rivendell_cart_data_filename.write_bytes("".join([HEADER, *lines]).encode())
+    return rivendell_cart_data_filename
+
+
+def _make_loader(rivendell_cart_data_filename, parse_workers, trusted_dump=False, include_all_cuts=True):
+    return LoadCartDataDump(
+        rivendell_cart_data_filename=rivendell_cart_data_filename,
+        excluded_group_list=["EXCLUDED"],
+        include_macros=False,
+        include_all_cuts=include_all_cuts,
+        trusted_dump=trusted_dump,
+        parse_workers=parse_workers
+    )
+
+
+def test__find_chunk_boundaries_at_record_starts(small_chunks):
+    lines = [_make_line(cart_number, 1) for cart_number in range(1, 9)]
+    dump = io.BytesIO("".join([HEADER, *lines]).encode())
+    line_starts = [len(HEADER)]
+    for line in lines:
+        line_starts.append(line_starts[-1] + len(line))
+
+    boundaries = _find_chunk_boundaries(dump, 4)
+
+    assert boundaries[0] == 0
+    assert boundaries[-1] == line_starts[-1]
+    assert len(boundaries) == 5
+    assert all(boundary in line_starts for boundary in boundaries[1:-1])
+    assert boundaries == sorted(set(boundaries))
+
+
+def test__find_chunk_boundaries_skips_lines_that_do_not_start_a_record(small_chunks):
+    lines = [_make_line(1, 1, description="first half"), "second half,of a broken line\r\n", _make_line(2, 1)]
+    dump = io.BytesIO("".join([HEADER, *lines]).encode())
+
+    boundaries = _find_chunk_boundaries(dump, 3)
+
+    assert len(HEADER) + len(lines[0]) not in boundaries
+
+
+def test__find_chunk_boundaries_small_file():
+    dump = io.BytesIO("".join([HEADER, _make_line(1, 1)]).encode())
+
+    assert _find_chunk_boundaries(dump, 4) == [0, len(dump.getvalue())]
+
+
+@pytest.mark.parametrize("trusted_dump", [False, True], ids=["validated", "trusted"])
+@pytest.mark.parametrize("include_all_cuts", [False, True], ids=["lowest_cuts", "all_cuts"])
+def test_load_carts_parallel_matches_serial(tmp_path, small_chunks, trusted_dump, include_all_cuts):
+    lines = []
+    for cart_number in range(1, 40):
+        group_name = "EXCLUDED" if cart_number % 7 == 0 else f"GROUP{cart_number % 3}"
+        cart_type = "macro" if cart_number % 11 == 0 else "audio"
+        lines.append(_make_line(cart_number, 2, group_name=group_name, cart_type=cart_type))
+        lines.append(_make_line(cart_number, 1, group_name=group_name, cart_type=cart_type))
+    # A record broken by an un-escaped newline, that is repaired by _fix_rivendell_csv_file.
+    lines[10] = lines[10].replace("a description", "a broken\r\ndescription")
+    rivendell_cart_data_filename = _write_dump(tmp_path, lines)
+
+    serial_loader = _make_loader(rivendell_cart_data_filename, 1, trusted_dump, include_all_cuts)
+    expected_carts = serial_loader.load_carts()
+    parallel_loader = _make_loader(rivendell_cart_data_filename, 3, trusted_dump, include_all_cuts)
+
+    assert parallel_loader._parse_chunks_in_parallel() is not None
+    assert parallel_loader.load_carts() == expected_carts
+    assert parallel_loader.row_filter_counts == serial_loader.row_filter_counts
+    assert parallel_loader.row_filter_counts.rows_kept < parallel_loader.row_filter_counts.rows_read
+
+
+def test_load_cart_table_parallel_matches_serial(tmp_path, small_chunks):
+    lines = [_make_line(cart_number, 1, group_name=f"GROUP{cart_number % 4}") for cart_number in range(1, 30)]
+    rivendell_cart_data_filename = _write_dump(tmp_path, lines)
+
+    expected_table = _make_loader(rivendell_cart_data_filename, 1).load_cart_table()
+    result_table = _make_loader(rivendell_cart_data_filename, 4).load_cart_table()
+
+    pd.testing.assert_frame_equal(result_table.data, expected_table.data)
+
+
+@pytest.mark.parametrize("trusted_dump", [False, True], ids=["validated", "trusted"])
+def test_load_carts_parallel_falls_back_when_a_chunk_starts_inside_a_record(tmp_path, small_chunks, trusted_dump):
+    lines = [_make_line(cart_number, 1) for cart_number in range(1, 10)]
+    # The year of this record is broken across two lines, and the second line looks like the start of a record, so a 
+    # chunk may start there.
+    lines[4] = lines[4].replace(",1990,,", ",19\r\n90,123,")
+    rivendell_cart_data_filename = _write_dump(tmp_path, lines)
+
+    expected_carts = _make_loader(rivendell_cart_data_filename, 1, trusted_dump).load_carts()
+    parallel_loader = _make_loader(rivendell_cart_data_filename, 20, trusted_dump)
+
+    assert parallel_loader._parse_chunks_in_parallel() is None
+    assert parallel_loader.load_carts() == expected_carts
+
+
+def test_load_carts_projected_fields_parallel_matches_serial(tmp_path, small_chunks):
+    lines = [
+        _make_line(cart_number, 1, group_name="EXCLUDED" if cart_number % 5 == 0 else "MUSIC") 
+        for cart_number in range(1, 30)
+    ]
+    rivendell_cart_data_filename = _write_dump(tmp_path, lines)
+    serial_loader = _make_loader(rivendell_cart_data_filename, 1)
+    serial_loader.projected_fields = ["TITLE", "DESCRIPTION"]
+    parallel_loader = _make_loader(rivendell_cart_data_filename, 4)
+    parallel_loader.projected_fields = ["TITLE", "DESCRIPTION"]
+
+    expected_carts = serial_loader.load_carts()
+    result_carts = parallel_loader.load_carts()
+
+    assert len(expected_carts) == 24
+    assert result_carts == expected_carts
+    assert [cart._fields for cart in result_carts] == [cart._fields for cart in expected_carts]
+    assert parallel_loader.row_filter_counts == serial_loader.row_filter_counts
+
+
+@pytest.mark.parametrize("trusted_dump", [False, True], ids=["validated", "trusted"])
+def test_load_carts_parallel_memory_map_matches_serial(tmp_path, small_chunks, trusted_dump):
+    lines = [_make_line(cart_number, 1, group_name=f"GROUP{cart_number % 3}") for cart_number in range(1, 30)]
+    lines[5] = lines[5].replace("a description", '"a description, quoted"')
+    lines[12] = lines[12].replace("a description", "a broken\r\ndescription")
+    rivendell_cart_data_filename = _write_dump(tmp_path, lines)
+    expected_carts = _make_loader(rivendell_cart_data_filename, 1, trusted_dump).load_carts()
+    parallel_loader = _make_loader(rivendell_cart_data_filename, 4, trusted_dump)
+    parallel_loader.memory_map = True
+
+    assert parallel_loader._parse_chunks_in_parallel() is not None
+    assert parallel_loader.load_carts() == expected_carts
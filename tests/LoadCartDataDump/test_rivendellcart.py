@@ -2,6 +2,8 @@
 @Author = 'Michael Stanley'
 
 ============ Change Log ============
+2026-Oct-18 = Add tests for length_in_seconds being derived from length, and parsed once for each distinct length.
+
 2023-May-25 = Moved from tests/FilterCartReportForMusicScheduler when the 
                 code under test was refactored into LoadCartDataDump.
 
@@ -10,7 +12,7 @@
 2020-Oct-21 = Created.
 
 ============ License ============
-Copyright (C) 2020, 2023, 2025 Michael Stanley
+Copyright (C) 2020, 2023, 2025-2026 Michael Stanley
 
 This file is part of wmul_rivendell.
 
@@ -27,6 +29,7 @@ You should have received a copy of the GNU General Public License along with
 wmul_rivendell. If not, see <https://www.gnu.org/licenses/>. 
 """
 from collections import namedtuple
+from pydantic import ValidationError
 from wmul_rivendell.LoadCartDataDump import CartType, RivendellCart
 import pytest
 import wmul_test_utils
@@ -373,3 +376,38 @@ def test_length_in_seconds_longer_than_one_hour():
     expected_length_in_seconds = 4034
 
     assert result_rivendell_cart.length_in_seconds == expected_length_in_seconds
+
+
+def _make_cart_with_length(length):
+    return RivendellCart(cart_number='100340', cut_number='1', type=CartType.Audio, group_name='ALTERNATIV', title='', artist='', album='', year='', isrc='', isci='', label='', client='', agency='', publisher='', composer='', conductor='', song_id='', user_defined='', description='', outcue='', filename='', length=length, start_point='', end_point='', segue_start_point='', segue_end_point='', hook_start_point='', hook_end_point='', talk_start_point='', talk_end_point='', fadeup_point='', fadedown_point='', sched_codes='')
+
+
+def test_length_in_seconds_is_derived_from_length():
+    result_rivendell_cart = _make_cart_with_length('7:14')
+    assert "length_in_seconds" not in RivendellCart.model_fields
+    assert result_rivendell_cart.length_in_seconds == 434
+    assert result_rivendell_cart.model_copy(update={"length": "1:00:05"}).length_in_seconds == 3605
+
+
+def test_length_in_seconds_is_not_taken_as_input():
+    result_rivendell_cart = RivendellCart(
+        **_make_cart_with_length('7:14').model_dump(exclude={"length_in_seconds"}), length_in_seconds=5
+    )
+    assert result_rivendell_cart.length_in_seconds == 434
+
+
+def test_length_in_seconds_empty_length():
+    result_rivendell_cart = _make_cart_with_length('')
+    assert result_rivendell_cart.length_in_seconds == 0
+
+
+def test_length_in_seconds_invalid_length():
+    # The cart is still created, so that the commands that do not use the lengths can load it.
+    result_rivendell_cart = _make_cart_with_length('714')
+    with pytest.raises(ValueError):
+        result_rivendell_cart.length_in_seconds
+
+
+def test_length_is_required():
+    with pytest.raises(ValidationError):
+        _make_cart_with_length(None)
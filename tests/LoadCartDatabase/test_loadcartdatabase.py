@@ -0,0 +1,294 @@
+"""
+@Author = 'Michael Stanley'
+
+The database is stood in for by an in-memory SQLite database with the columns of Rivendell's CART, CUTS, and 
+CART_SCHED_CODES tables that LoadCartDatabase reads.
+
+============ Change Log ============
+2026-Oct-18 = Created.
+              The SCHED_CODES of _DUMP_ROWS are in the fixed width format of the Cart Data Dump. Add a test of 
+              _format_row.
+
+============ License ============
+Copyright (C) 2026 Michael Stanley
+
+This file is part of wmul_rivendell.
+
+wmul_rivendell is free software: you can redistribute it and/or modify it
+under the terms of the GNU General Public License as published by the Free
+Software Foundation, either version 3 of the License, or (at your option) any
+later version.
+
+wmul_rivendell is distributed in the hope that it will be useful, but WITHOUT
+ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License along with
+wmul_rivendell. If not, see <https://www.gnu.org/licenses/>.
+"""
+import csv
+import datetime
+import sqlite3
+import pytest
+import wmul_test_utils
+
+from wmul_rivendell.DumpCache import DumpCache
+from wmul_rivendell.LoadCartDataDump import LoadCartDataDump, _DUMP_FIELD_NAMES
+from wmul_rivendell.LoadCartDatabase import LoadCartDatabase, database_settings_from_rd_conf, _format_row, \
+    _length_text
+
+_CART_COLUMNS = (
+    "NUMBER", "TYPE", "GROUP_NAME", "TITLE", "ARTIST", "ALBUM", "YEAR", "LABEL", "CLIENT", "AGENCY", "PUBLISHER", 
+    "COMPOSER", "CONDUCTOR", "SONG_ID", "USER_DEFINED"
+)
+
+_CUT_COLUMNS = (
+    "CUT_NAME", "CART_NUMBER", "DESCRIPTION", "OUTCUE", "ISRC", "ISCI", "LENGTH", "START_POINT", "END_POINT", 
+    "SEGUE_START_POINT", "SEGUE_END_POINT", "HOOK_START_POINT", "HOOK_END_POINT", "TALK_START_POINT", 
+    "TALK_END_POINT", "FADEUP_POINT", "FADEDOWN_POINT"
+)
+
+
+def _cart(number, cart_type, group_name, title, year=None, **cart_fields):
+    values = dict.fromkeys(_CART_COLUMNS)
+    values.update(NUMBER=number, TYPE=cart_type, GROUP_NAME=group_name, TITLE=title, YEAR=year)
+    values.update(cart_fields)
+    return tuple(values.values())
+
+
+def _cut(cart_number, cut_number, length, **cut_fields):
+    values = dict.fromkeys(_CUT_COLUMNS, -1)
+    values.update(
+        CUT_NAME=f"{cart_number:06d}_{cut_number:03d}", CART_NUMBER=cart_number, DESCRIPTION=f"Cut {cut_number}", 
+        OUTCUE="", ISRC="", ISCI="", LENGTH=length, START_POINT=0, END_POINT=length
+    )
+    values.update(cut_fields)
+    return tuple(values.values())
+
+
+_CARTS = [
+    _cart(100001, 1, "MUSIC", "There's a Star", year="2004-01-01", ARTIST="Ash", ALBUM="", LABEL="", CLIENT=""),
+    _cart(100002, 1, "MUSIC", " Six Feet Under ", ARTIST="No Doubt", COMPOSER="Imported from WOAFR: A00/0002"),
+    _cart(100003, 2, "MUSIC", "Macro"),
+    _cart(200001, 1, "LEGAL", "Legal ID", ARTIST=""),
+    _cart(200002, 1, "PROMOS", "Promo", ARTIST="Station")
+]
+
+_CUTS = [
+    _cut(100001, 1, 262000, TALK_END_POINT=10000),
+    # Out of order, the query sorts the cuts.
+    _cut(100002, 2, 149999),
+    _cut(100002, 1, 148000, DESCRIPTION="Six Feet Under, \"radio edit\""),
+    _cut(200001, 1, 7000),
+    _cut(200002, 1, 3723000)
+]
+
+_SCHED_CODES = [(100001, "2000s"), (100001, "Flashback"), (100002, "2000s")]
+
+# The Cart Data Dump that RD Library writes for the same carts.
+_DUMP_ROWS = [
+    ["100001", "1", "audio", "MUSIC", "There's a Star", "Ash", "", "2004", "", "", "", "", "", "", "", "", "", "", 
+     "Cut 1", "", "100001_001.wav", "4:22", "0", "262000", "-1", "-1", "-1", "-1", "-1", "10000", "-1", "-1", 
+     "2000s      Flashback  ."],
+    ["100002", "1", "audio", "MUSIC", " Six Feet Under ", "No Doubt", "", "", "", "", "", "", "", "", 
+     "Imported from WOAFR: A00/0002", "", "", "", "Six Feet Under, \"radio edit\"", "", "100002_001.wav", "2:28", 
+     "0", "148000", "-1", "-1", "-1", "-1", "-1", "-1", "-1", "-1", "2000s      ."],
+    ["100002", "2", "audio", "MUSIC", " Six Feet Under ", "No Doubt", "", "", "", "", "", "", "", "", 
+     "Imported from WOAFR: A00/0002", "", "", "", "Cut 2", "", "100002_002.wav", "2:29", "0", "149999", "-1", "-1", 
+     "-1", "-1", "-1", "-1", "-1", "-1", "2000s      ."],
+    ["100003", "1", "macro", "MUSIC", "Macro", "", "", "", "", "", "", "", "", "", "", "", "", "", "", "", "", ":00", 
+     "", "", "", "", "", "", "", "", "", "", "."],
+    ["200001", "1", "audio", "LEGAL", "Legal ID", "", "", "", "", "", "", "", "", "", "", "", "", "", "Cut 1", "", 
+     "200001_001.wav", ":07", "0", "7000", "-1", "-1", "-1", "-1", "-1", "-1", "-1", "-1", "."],
+    ["200002", "1", "audio", "PROMOS", "Promo", "Station", "", "", "", "", "", "", "", "", "", "", "", "", "Cut 1", 
+     "", "200002_001.wav", "1:02:03", "0", "3723000", "-1", "-1", "-1", "-1", "-1", "-1", "-1", "-1", "."]
+]
+
+
+class _StandInCursor:
+    """Takes the mysql.connector paramstyle and cursor arguments, and runs the queries on SQLite."""
+
+    def __init__(self, sqlite_cursor):
+        self.sqlite_cursor = sqlite_cursor
+        self.fetch_sizes = []
+
+    def execute(self, query, parameters=()):
+        self.sqlite_cursor.execute(query.replace("%s", "?"), parameters)
+
+    def fetchmany(self, size):
+        self.fetch_sizes.append(size)
+        return self.sqlite_cursor.fetchmany(size)
+
+    def close(self):
+        self.sqlite_cursor.close()
+
+
+class _StandInConnection:
+
+    def __init__(self, sqlite_connection):
+        self.sqlite_connection = sqlite_connection
+        self.cursors = []
+        self.is_closed = False
+
+    def cursor(self, buffered=False):
+        assert not buffered
+        cursor = _StandInCursor(self.sqlite_connection.cursor())
+        self.cursors.append(cursor)
+        return cursor
+
+    def close(self):
+        self.is_closed = True
+
+
+@pytest.fixture(scope="function")
+def setup_stand_in_database(mocker, tmp_path):
+    sqlite_connection = sqlite3.connect(":memory:")
+    sqlite_connection.execute(f"CREATE TABLE CART ({', '.join(_CART_COLUMNS)})")
+    sqlite_connection.execute(f"CREATE TABLE CUTS ({', '.join(_CUT_COLUMNS)})")
+    sqlite_connection.execute("CREATE TABLE CART_SCHED_CODES (CART_NUMBER, SCHED_CODE)")
+    sqlite_connection.executemany(f"INSERT INTO CART VALUES ({', '.join('?' * len(_CART_COLUMNS))})", _CARTS)
+    sqlite_connection.executemany(f"INSERT INTO CUTS VALUES ({', '.join('?' * len(_CUT_COLUMNS))})", _CUTS)
+    sqlite_connection.executemany("INSERT INTO CART_SCHED_CODES VALUES (?, ?)", _SCHED_CODES)
+    stand_in_connection = _StandInConnection(sqlite_connection)
+    mock_connect = mocker.patch(
+        "wmul_rivendell.LoadCartDatabase.mysql.connector.connect", 
+        mocker.Mock(return_value=stand_in_connection)
+    )
+
+    rivendell_cart_data_filename = tmp_path / "cart_data_dump.csv"
+    with open(rivendell_cart_data_filename, "wt", newline="") as dump_file:
+        writer = csv.writer(dump_file, lineterminator="\r\n")
+        writer.writerow(_DUMP_FIELD_NAMES)
+        writer.writerows(_DUMP_ROWS)
+
+    yield wmul_test_utils.make_namedtuple(
+        "setup_stand_in_database",
+        stand_in_connection=stand_in_connection,
+        mock_connect=mock_connect,
+        rivendell_cart_data_filename=rivendell_cart_data_filename
+    )
+    sqlite_connection.close()
+
+
+load_carts_params, load_carts_ids = wmul_test_utils.generate_true_false_matrix_from_list_of_strings(
+    "load_carts_options",
+    [
+        "include_macros",
+        "include_all_cuts",
+        "exclude_groups",
+        "trusted_dump"
+    ]
+)
+
+
+@pytest.mark.parametrize("params", load_carts_params, ids=load_carts_ids)
+def test_load_carts_matches_cart_data_dump(setup_stand_in_database, params):
+    excluded_group_list = ["LEGAL", "PROMOS"] if params.exclude_groups else []
+    options = dict(
+        excluded_group_list=excluded_group_list,
+        include_macros=params.include_macros,
+        include_all_cuts=params.include_all_cuts,
+        trusted_dump=params.trusted_dump
+    )
+    expected_carts = LoadCartDataDump(
+        rivendell_cart_data_filename=setup_stand_in_database.rivendell_cart_data_filename,
+        **options
+    ).load_carts()
+    cart_loader = LoadCartDatabase(
+        sql_host="rivendell.example.com", 
+        sql_user="reader", 
+        sql_pass="secret", 
+        sql_database_name="Rivendell", 
+        fetch_size=2,
+        **options
+    )
+
+    result_carts = cart_loader.load_carts()
+
+    assert result_carts == expected_carts
+    assert cart_loader.row_filter_counts is None
+    setup_stand_in_database.mock_connect.assert_called_once_with(
+        host="rivendell.example.com",
+        database="Rivendell",
+        user="reader",
+        password="secret",
+        consume_results=True
+    )
+    stand_in_connection = setup_stand_in_database.stand_in_connection
+    assert stand_in_connection.is_closed
+    assert all(fetch_size == 2 for cursor in stand_in_connection.cursors for fetch_size in cursor.fetch_sizes)
+
+
+@pytest.mark.parametrize("load_method", ["iter_carts", "load_cart_table"])
+def test_iter_carts_and_load_cart_table_match_cart_data_dump(setup_stand_in_database, load_method):
+    options = dict(excluded_group_list=["LEGAL"], include_macros=False, include_all_cuts=False)
+    expected_cart_loader = LoadCartDataDump(
+        rivendell_cart_data_filename=setup_stand_in_database.rivendell_cart_data_filename,
+        **options
+    )
+    cart_loader = LoadCartDatabase(**options)
+
+    if load_method == "iter_carts":
+        assert list(cart_loader.iter_carts()) == list(expected_cart_loader.iter_carts())
+    else:
+        result_data = cart_loader.load_cart_table().data
+        expected_data = expected_cart_loader.load_cart_table().data
+        assert result_data.equals(expected_data)
+
+
+def test__format_row_matches_cart_data_dump():
+    database_row = (
+        100001, "100001_001", 1, "MUSIC", "There's a Star", "Ash", "", datetime.date(2004, 1, 1), "", "", "", "", 
+        None, None, None, None, None, None, "Cut 1", "", 262000, 0, 262000, -1, -1, -1, -1, -1, 10000, -1, -1
+    )
+    sched_codes = {100001: ["2000s", "Flashback"]}
+
+    result_row = _format_row(database_row, sched_codes)
+
+    assert result_row == _DUMP_ROWS[0]
+    assert result_row[-1] == "2000s      Flashback  ."
+    assert _format_row(database_row, {})[-1] == "."
+
+
+def test_password_not_in_repr():
+    assert "secret" not in repr(LoadCartDatabase(excluded_group_list=[], include_macros=False, include_all_cuts=False, 
+                                                 sql_pass="secret"))
+
+
+@pytest.mark.parametrize("dump_option", [
+    {"dump_cache": DumpCache(cache_directory="/cache")}, {"parse_workers": 2}, {"memory_map": True}
+], ids=["dump_cache", "parse_workers", "memory_map"])
+def test_dump_options_rejected(dump_option):
+    with pytest.raises(ValueError, match="only apply to a Cart Data Dump"):
+        LoadCartDatabase(excluded_group_list=[], include_macros=False, include_all_cuts=False, **dump_option)
+
+
+@pytest.mark.parametrize("milliseconds, expected_length", [
+    (None, ""), (0, ":00"), (7000, ":07"), (7999, ":07"), (60000, "1:00"), (262000, "4:22"), (3723000, "1:02:03")
+])
+def test__length_text(milliseconds, expected_length):
+    assert _length_text(milliseconds) == expected_length
+
+
+def test_database_settings_from_rd_conf(tmp_path):
+    rd_conf_filename = tmp_path / "rd.conf"
+    rd_conf_filename.write_text(
+        "[Identity]\nAudioOwner=rivendell\n\n"
+        "[mySQL]\nHostname=db.example.com\nLoginname=rduser\nPassword=pass%word\nDatabase=Rivendell\n"
+        "Driver=QMYSQL3\n"
+    )
+
+    assert database_settings_from_rd_conf(rd_conf_filename) == {
+        "sql_host": "db.example.com",
+        "sql_user": "rduser",
+        "sql_pass": "pass%word",
+        "sql_database_name": "Rivendell"
+    }
+
+
+def test_database_settings_from_rd_conf_no_mysql_section(tmp_path):
+    rd_conf_filename = tmp_path / "rd.conf"
+    rd_conf_filename.write_text("[Identity]\nAudioOwner=rivendell\n")
+
+    with pytest.raises(ValueError, match=r"does not have a \[mySQL\] section"):
+        database_settings_from_rd_conf(rd_conf_filename)
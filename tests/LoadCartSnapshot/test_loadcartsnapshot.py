@@ -0,0 +1,193 @@
+"""
+@Author = 'Michael Stanley'
+
+The database is stood in for by the in-memory SQLite database of the LoadCartDatabase tests, with the timestamp columns
+that LoadCartSnapshot reads added to it.
+
+============ Change Log ============
+2026-Oct-18 = Created.
+
+============ License ============
+Copyright (C) 2026 Michael Stanley
+
+This file is part of wmul_rivendell.
+
+wmul_rivendell is free software: you can redistribute it and/or modify it
+under the terms of the GNU General Public License as published by the Free
+Software Foundation, either version 3 of the License, or (at your option) any
+later version.
+
+wmul_rivendell is distributed in the hope that it will be useful, but WITHOUT
+ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License along with
+wmul_rivendell. If not, see <https://www.gnu.org/licenses/>.
+"""
+import sqlite3
+import pytest
+import wmul_test_utils
+
+from wmul_rivendell.LoadCartDatabase import LoadCartDatabase
+from wmul_rivendell.LoadCartSnapshot import LoadCartSnapshot, SnapshotSyncCounts
+from tests.LoadCartDatabase.test_loadcartdatabase import _CART_COLUMNS, _CUT_COLUMNS, _CARTS, _CUTS, _SCHED_CODES, \
+    _StandInConnection, _cart, _cut
+
+_BEFORE_FIRST_SYNC = "2000-01-01 00:00:00"
+_AFTER_FIRST_SYNC = "2999-01-01 00:00:00"
+
+
+@pytest.fixture(scope="function")
+def setup_stand_in_database(mocker, tmp_path):
+    sqlite_connection = sqlite3.connect(":memory:")
+    sqlite_connection.execute(f"CREATE TABLE CART ({', '.join(_CART_COLUMNS)}, METADATA_DATETIME)")
+    sqlite_connection.execute(f"CREATE TABLE CUTS ({', '.join(_CUT_COLUMNS)}, ORIGIN_DATETIME)")
+    sqlite_connection.execute("CREATE TABLE CART_SCHED_CODES (CART_NUMBER, SCHED_CODE)")
+    sqlite_connection.executemany(
+        f"INSERT INTO CART VALUES ({', '.join('?' * (len(_CART_COLUMNS) + 1))})",
+        [(*cart, _BEFORE_FIRST_SYNC) for cart in _CARTS]
+    )
+    sqlite_connection.executemany(
+        f"INSERT INTO CUTS VALUES ({', '.join('?' * (len(_CUT_COLUMNS) + 1))})",
+        [(*cut, _BEFORE_FIRST_SYNC) for cut in _CUTS]
+    )
+    sqlite_connection.executemany("INSERT INTO CART_SCHED_CODES VALUES (?, ?)", _SCHED_CODES)
+    mock_connect = mocker.patch(
+        "wmul_rivendell.LoadCartDatabase.mysql.connector.connect",
+        side_effect=lambda **connect_arguments: _StandInConnection(sqlite_connection)
+    )
+
+    def make_cart_loader(cart_loader_class=LoadCartSnapshot, **options):
+        if cart_loader_class is LoadCartSnapshot:
+            options.setdefault("snapshot_filename", tmp_path / "snapshot.sqlite")
+        options.setdefault("excluded_group_list", [])
+        options.setdefault("include_macros", True)
+        options.setdefault("include_all_cuts", True)
+        return cart_loader_class(fetch_size=2, **options)
+
+    yield wmul_test_utils.make_namedtuple(
+        "setup_stand_in_database",
+        sqlite_connection=sqlite_connection,
+        mock_connect=mock_connect,
+        make_cart_loader=make_cart_loader
+    )
+    sqlite_connection.close()
+
+
+load_carts_params, load_carts_ids = wmul_test_utils.generate_true_false_matrix_from_list_of_strings(
+    "load_carts_options",
+    [
+        "include_macros",
+        "include_all_cuts",
+        "exclude_groups",
+        "trusted_dump"
+    ]
+)
+
+
+@pytest.mark.parametrize("params", load_carts_params, ids=load_carts_ids)
+def test_load_carts_matches_load_cart_database(setup_stand_in_database, params):
+    options = dict(
+        excluded_group_list=["LEGAL", "PROMOS"] if params.exclude_groups else [],
+        include_macros=params.include_macros,
+        include_all_cuts=params.include_all_cuts,
+        trusted_dump=params.trusted_dump
+    )
+    make_cart_loader = setup_stand_in_database.make_cart_loader
+    expected_carts = make_cart_loader(LoadCartDatabase, **options).load_carts()
+
+    # The first load builds the snapshot, the second one loads from it.
+    first_carts = make_cart_loader(**options).load_carts()
+    second_carts = make_cart_loader(**options).load_carts()
+
+    assert first_carts == expected_carts
+    assert second_carts == expected_carts
+
+
+def test_first_sync_is_full(setup_stand_in_database):
+    sync_counts = setup_stand_in_database.make_cart_loader().sync()
+
+    assert sync_counts == SnapshotSyncCounts(full_sync=True, carts_refreshed=len(_CARTS))
+
+
+def test_sync_without_changes(setup_stand_in_database):
+    cart_loader = setup_stand_in_database.make_cart_loader()
+    cart_loader.sync()
+
+    assert cart_loader.sync() == SnapshotSyncCounts()
+
+
+def test_incremental_sync(setup_stand_in_database):
+    cart_loader = setup_stand_in_database.make_cart_loader()
+    cart_loader.sync()
+
+    sqlite_connection = setup_stand_in_database.sqlite_connection
+    # Metadata changed.
+    sqlite_connection.execute(
+        "UPDATE CART SET TITLE = 'There Is a Star', METADATA_DATETIME = ? WHERE NUMBER = 100001", (_AFTER_FIRST_SYNC,)
+    )
+    # Cut re-recorded.
+    sqlite_connection.execute(
+        "UPDATE CUTS SET LENGTH = 7500, ORIGIN_DATETIME = ? WHERE CUT_NAME = '200001_001'", (_AFTER_FIRST_SYNC,)
+    )
+    # Cut deleted, without a timestamp.
+    sqlite_connection.execute("DELETE FROM CUTS WHERE CUT_NAME = '100002_002'")
+    # Cart deleted.
+    sqlite_connection.execute("DELETE FROM CART WHERE NUMBER = 100003")
+    # Cart added, without a timestamp.
+    sqlite_connection.execute(
+        f"INSERT INTO CART VALUES ({', '.join('?' * (len(_CART_COLUMNS) + 1))})",
+        (*_cart(300001, 1, "MUSIC", "New Song", ARTIST="New Artist"), None)
+    )
+    sqlite_connection.execute(
+        f"INSERT INTO CUTS VALUES ({', '.join('?' * (len(_CUT_COLUMNS) + 1))})", (*_cut(300001, 1, 180000), None)
+    )
+    # Scheduler codes changed.
+    sqlite_connection.execute("INSERT INTO CART_SCHED_CODES VALUES (200002, 'Promo')")
+
+    sync_counts = cart_loader.sync()
+
+    assert sync_counts == SnapshotSyncCounts(carts_refreshed=4, carts_deleted=1, sched_codes_updated=1)
+    assert cart_loader.load_carts() == setup_stand_in_database.make_cart_loader(LoadCartDatabase).load_carts()
+
+
+def test_change_without_timestamp_waits_for_full_sync(setup_stand_in_database, tmp_path):
+    setup_stand_in_database.make_cart_loader().sync()
+    setup_stand_in_database.sqlite_connection.execute("UPDATE CUTS SET START_POINT = 500 WHERE CUT_NAME = '200002_001'")
+
+    stale_carts = setup_stand_in_database.make_cart_loader().load_carts()
+    (tmp_path / "snapshot.sqlite").unlink()
+    rebuilt_carts = setup_stand_in_database.make_cart_loader().load_carts()
+
+    expected_carts = setup_stand_in_database.make_cart_loader(LoadCartDatabase).load_carts()
+    assert stale_carts != expected_carts
+    assert rebuilt_carts == expected_carts
+
+
+def test_other_database_is_full_sync(setup_stand_in_database):
+    setup_stand_in_database.make_cart_loader().sync()
+
+    sync_counts = setup_stand_in_database.make_cart_loader(sql_database_name="Rivendell2").sync()
+
+    assert sync_counts.full_sync
+
+
+def test_failed_sync_leaves_snapshot(setup_stand_in_database, mocker, tmp_path):
+    cart_loader = setup_stand_in_database.make_cart_loader()
+    cart_loader.sync()
+    expected_carts = cart_loader.load_carts()
+    setup_stand_in_database.sqlite_connection.execute(
+        "UPDATE CART SET TITLE = 'Changed', METADATA_DATETIME = ? WHERE NUMBER = 100001", (_AFTER_FIRST_SYNC,)
+    )
+
+    failing_cart_loader = setup_stand_in_database.make_cart_loader()
+    failing_cart_loader._store_carts = mocker.Mock(side_effect=RuntimeError("Connection lost"))
+    with pytest.raises(RuntimeError):
+        failing_cart_loader.sync()
+
+    # The changed cart was not deleted from the snapshot, and it is still refreshed by the next sync.
+    with sqlite3.connect(tmp_path / "snapshot.sqlite") as snapshot:
+        assert snapshot.execute("SELECT title FROM cuts WHERE cart_key = 100001").fetchall() == [("There's a Star",)]
+    sync_counts = cart_loader.sync()
+    assert sync_counts.carts_refreshed == 1
+    assert cart_loader.load_carts() != expected_carts
@@ -0,0 +1,215 @@
+"""
+@Author = 'Michael Stanley'
+
+============ Change Log ============
+2026-Oct-18 = Created.
+              Add a test for a station with a LENGTH that cannot be parsed.
+
+============ License ============
+Copyright (C) 2026 Michael Stanley
+
+This file is part of wmul_rivendell.
+
+wmul_rivendell is free software: you can redistribute it and/or modify it
+under the terms of the GNU General Public License as published by the Free
+Software Foundation, either version 3 of the License, or (at your option) any
+later version.
+
+wmul_rivendell is distributed in the hope that it will be useful, but WITHOUT
+ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License along with
+wmul_rivendell. If not, see <https://www.gnu.org/licenses/>.
+"""
+import logging
+import pytest
+
+from click.testing import CliRunner
+
+from wmul_rivendell import cli
+from wmul_rivendell.LoadCartDataDump import CartTable, LoadCartDataDump, UNPARSEABLE_LENGTH_IN_SECONDS
+from wmul_rivendell.LoadCartSources import LoadCartSources
+
+DUMP_HEADER = "CART_NUMBER,CUT_NUMBER,TYPE,GROUP_NAME,TITLE,ARTIST,ALBUM,YEAR,ISRC,ISCI,LABEL,CLIENT,AGENCY," \
+    "PUBLISHER,COMPOSER,CONDUCTOR,SONG_ID,USER_DEFINED,DESCRIPTION,OUTCUE,FILENAME,LENGTH,START_POINT,END_POINT," \
+    "SEGUE_START_POINT,SEGUE_END_POINT,HOOK_START_POINT,HOOK_END_POINT,TALK_START_POINT,TALK_END_POINT," \
+    "FADEUP_POINT,FADEDOWN_POINT,SCHED_CODES\r\n"
+
+
+def _dump_line(cart_number, group_name, title):
+    return f"{cart_number},1,audio,{group_name},{title},Artist,,1990,,,,,,,,,,,,,{cart_number:06}_001.wav," \
+        f"3:{cart_number % 60:02},,,,,,,,,,,2010s\r\n"
+
+
+@pytest.fixture(scope="function")
+def setup_station_dumps(tmp_path):
+    wxyz_filename = tmp_path / "wxyz.csv"
+    wxyz_filename.write_text(DUMP_HEADER + "".join([
+        _dump_line(1, "MUSIC", "Shared Song"),
+        _dump_line(2, "MUSIC", "Only At WXYZ"),
+        _dump_line(3, "MUSIC", "Edited At WXYZ"),
+    ]))
+    wabc_filename = tmp_path / "wabc.csv"
+    wabc_filename.write_text(DUMP_HEADER + "".join([
+        _dump_line(1, "MUSIC", "Shared Song"),
+        _dump_line(3, "MUSIC", "Edited At WABC"),
+        _dump_line(4, "TALK", "Only At WABC"),
+    ]))
+    return wxyz_filename, wabc_filename
+
+
+def _make_cart_loader(rivendell_cart_data_filename, **options):
+    return LoadCartDataDump(
+        rivendell_cart_data_filename=rivendell_cart_data_filename,
+        excluded_group_list=[],
+        include_macros=False,
+        include_all_cuts=False,
+        **options
+    )
+
+
+def _make_cart_sources(wxyz_filename, wabc_filename, **options):
+    loader_options = {key: options.pop(key) for key in ["trusted_dump"] if key in options}
+    return LoadCartSources(
+        cart_loaders={
+            "WXYZ": _make_cart_loader(wxyz_filename, **loader_options),
+            "WABC": _make_cart_loader(wabc_filename, **loader_options),
+        },
+        **options
+    )
+
+
+def _stations_and_titles(cart_table):
+    return list(zip(
+        cart_table.data["source_station"].astype(str), cart_table.data["cart_number"], cart_table.data["title"]
+    ))
+
+
+@pytest.mark.parametrize("trusted_dump", [False, True], ids=["validated", "trusted"])
+def test_load_cart_table_merges_stations_in_order(setup_station_dumps, trusted_dump, caplog):
+    caplog.set_level(logging.INFO)
+    cart_sources = _make_cart_sources(*setup_station_dumps, trusted_dump=trusted_dump)
+
+    result_table = cart_sources.load_cart_table()
+
+    assert isinstance(result_table, CartTable)
+    assert _stations_and_titles(result_table) == [
+        ("WXYZ", "1", "Shared Song"),
+        ("WXYZ", "2", "Only At WXYZ"),
+        ("WXYZ", "3", "Edited At WXYZ"),
+        ("WABC", "3", "Edited At WABC"),
+        ("WABC", "4", "Only At WABC"),
+    ]
+    assert list(result_table.data["source_station"].cat.categories) == ["WXYZ", "WABC"]
+    assert sorted(result_table.data["group_name"].cat.categories) == ["MUSIC", "TALK"]
+    assert "Removed 1 carts that are the same at more than one station." in caplog.text
+
+
+@pytest.mark.parametrize("trusted_dump", [False, True], ids=["validated", "trusted"])
+@pytest.mark.parametrize("max_workers", [1, 2])
+def test_load_cart_table_station_with_unparseable_length(setup_station_dumps, trusted_dump, max_workers):
+    wxyz_filename, wabc_filename = setup_station_dumps
+    wabc_contents = wabc_filename.read_text()
+    assert wabc_contents.count(",3:03,") == 1
+    wabc_filename.write_text(wabc_contents.replace(",3:03,", ",bad,"))
+    cart_sources = _make_cart_sources(
+        wxyz_filename, wabc_filename, trusted_dump=trusted_dump, max_workers=max_workers
+    )
+
+    result_table = cart_sources.load_cart_table()
+
+    assert _stations_and_titles(result_table) == [
+        ("WXYZ", "1", "Shared Song"),
+        ("WXYZ", "2", "Only At WXYZ"),
+        ("WXYZ", "3", "Edited At WXYZ"),
+        ("WABC", "3", "Edited At WABC"),
+        ("WABC", "4", "Only At WABC"),
+    ]
+    assert result_table.data["length"].tolist() == ["3:01", "3:02", "3:03", "bad", "3:04"]
+    assert result_table.data["length_in_seconds"].tolist() == [181, 182, 183, UNPARSEABLE_LENGTH_IN_SECONDS, 184]
+
+
+def test_load_cart_table_without_dedupe(setup_station_dumps):
+    cart_sources = _make_cart_sources(*setup_station_dumps, dedupe=False)
+
+    result_table = cart_sources.load_cart_table()
+
+    assert len(result_table.data) == 6
+    assert ("WABC", "1", "Shared Song") in _stations_and_titles(result_table)
+
+
+def test_load_cart_table_in_parallel_matches_serial(setup_station_dumps):
+    serial_table = _make_cart_sources(*setup_station_dumps, max_workers=1).load_cart_table()
+    parallel_table = _make_cart_sources(*setup_station_dumps, max_workers=2).load_cart_table()
+
+    assert parallel_table.data.equals(serial_table.data)
+
+
+def test_load_cart_table_uses_the_filters_of_each_loader(setup_station_dumps):
+    wxyz_filename, wabc_filename = setup_station_dumps
+    cart_sources = LoadCartSources(cart_loaders={
+        "WXYZ": _make_cart_loader(wxyz_filename),
+        "WABC": LoadCartDataDump(
+            rivendell_cart_data_filename=wabc_filename,
+            excluded_group_list=["TALK"],
+            include_macros=False,
+            include_all_cuts=False
+        ),
+    })
+
+    result_table = cart_sources.load_cart_table()
+
+    assert ("WABC", "4", "Only At WABC") not in _stations_and_titles(result_table)
+    assert len(result_table.data) == 4
+
+
+def test_cart_table_matches_single_station(setup_station_dumps):
+    wxyz_filename, _ = setup_station_dumps
+    expected_carts = _make_cart_loader(wxyz_filename).load_carts()
+
+    result_table = LoadCartSources(cart_loaders={"WXYZ": _make_cart_loader(wxyz_filename)}).load_cart_table()
+
+    assert result_table.to_carts() == expected_carts
+
+
+def test_get_cart_sources_loader_names_stations(setup_station_dumps, tmp_path):
+    wxyz_filename, wabc_filename = setup_station_dumps
+    options = dict(from_database=False, dump_cache=None, parse_workers=1, memory_map=False, include_all_cuts=False,
+                   include_macros=False, excluded_group_list=[], trusted_dump=False)
+
+    single_loader = cli.get_cart_sources_loader(rivendell_cart_filenames=(str(wxyz_filename),), **options)
+    cart_sources = cli.get_cart_sources_loader(
+        rivendell_cart_filenames=(str(wxyz_filename), str(wabc_filename)), **options
+    )
+    (tmp_path / "other").mkdir()
+    same_name_filename = tmp_path / "other" / "wxyz.csv"
+    same_name_filename.write_text(DUMP_HEADER)
+    same_name_sources = cli.get_cart_sources_loader(
+        rivendell_cart_filenames=(str(wxyz_filename), str(same_name_filename)), **options
+    )
+
+    assert isinstance(single_loader, LoadCartDataDump)
+    assert list(cart_sources.cart_loaders) == ["wxyz", "wabc"]
+    assert list(same_name_sources.cart_loaders) == [str(wxyz_filename), str(same_name_filename)]
+
+
+def test_filter_cart_report_with_several_dumps(setup_station_dumps, tmp_path):
+    wxyz_filename, wabc_filename = setup_station_dumps
+    desired_fields_filename = tmp_path / "desired.txt"
+    desired_fields_filename.write_text("Cart_Number\nTitle\nSource_Station\n")
+    output_filename = tmp_path / "output.csv"
+
+    result = CliRunner().invoke(
+        cli.filter_cart_report,
+        [str(wxyz_filename), str(wabc_filename), str(output_filename), str(desired_fields_filename)]
+    )
+
+    assert result.exit_code == 0, result.output
+    assert output_filename.read_text().splitlines() == [
+        "1,Shared Song,wxyz",
+        "2,Only At WXYZ,wxyz",
+        "3,Edited At WXYZ,wxyz",
+        "3,Edited At WABC,wabc",
+        "4,Only At WABC,wabc",
+    ]
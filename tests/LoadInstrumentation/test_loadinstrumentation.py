@@ -0,0 +1,271 @@
+"""
+@Author = 'Michael Stanley'
+
+============ Change Log ============
+2026-Oct-18 = Created.
+
+============ License ============
+Copyright (C) 2026 Michael Stanley
+
+This file is part of wmul_rivendell.
+
+wmul_rivendell is free software: you can redistribute it and/or modify it
+under the terms of the GNU General Public License as published by the Free
+Software Foundation, either version 3 of the License, or (at your option) any
+later version.
+
+wmul_rivendell is distributed in the hope that it will be useful, but WITHOUT
+ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License along with
+wmul_rivendell. If not, see <https://www.gnu.org/licenses/>.
+"""
+import json
+import logging
+import pytest
+import time
+import tracemalloc
+
+from click.testing import CliRunner
+
+import wmul_rivendell.LoadCartDataDump as LoadCartDataDumpModule
+from wmul_rivendell import cli
+from wmul_rivendell.LoadCartDataDump import LoadCartDataDump
+from wmul_rivendell.LoadInstrumentation import LoadInstrumentation, StageMetrics
+
+DUMP_HEADER = "CART_NUMBER,CUT_NUMBER,TYPE,GROUP_NAME,TITLE,ARTIST,ALBUM,YEAR,ISRC,ISCI,LABEL,CLIENT,AGENCY," \
+    "PUBLISHER,COMPOSER,CONDUCTOR,SONG_ID,USER_DEFINED,DESCRIPTION,OUTCUE,FILENAME,LENGTH,START_POINT,END_POINT," \
+    "SEGUE_START_POINT,SEGUE_END_POINT,HOOK_START_POINT,HOOK_END_POINT,TALK_START_POINT,TALK_END_POINT," \
+    "FADEUP_POINT,FADEDOWN_POINT,SCHED_CODES\r\n"
+
+
+@pytest.fixture(scope="function")
+def setup_dump(tmp_path):
+    # 30 carts of two cuts. Every third cart is in GROUP0, and every seventh is a macro. One record is broken across 
+    # two lines.
+    lines = [
+        f"{cart_number},{cut_number},{'macro' if cart_number % 7 == 0 else 'audio'},GROUP{cart_number % 3},"
+        f"Title {cart_number},Artist,,1990,,,,,,,,,,,a description,,{cart_number:06}_{cut_number:03}.wav,"
+        f"3:{cart_number:02},,,,,,,,,,,2010s\r\n"
+        for cart_number in range(1, 31) for cut_number in range(1, 3)
+    ]
+    lines[5] = lines[5].replace("a description", "a broken\r\ndescription")
+    rivendell_cart_data_filename = tmp_path / "cart_data_dump.csv"
+    rivendell_cart_data_filename.write_text(DUMP_HEADER + "".join(lines), newline="")
+    return rivendell_cart_data_filename
+
+
+def _make_cart_loader(rivendell_cart_data_filename, instrumentation=None, **options):
+    return LoadCartDataDump(
+        rivendell_cart_data_filename=rivendell_cart_data_filename,
+        excluded_group_list=["GROUP0"],
+        include_macros=False,
+        include_all_cuts=False,
+        instrumentation=instrumentation,
+        **options
+    )
+
+
+def _stage_rows(instrumentation):
+    return {
+        stage_name: (stage_metrics.rows_in, stage_metrics.rows_out) 
+        for stage_name, stage_metrics in instrumentation.stages.items()
+    }
+
+
+def test_load_carts_instrumented(setup_dump, tmp_path, caplog):
+    caplog.set_level(logging.INFO)
+    json_filename = tmp_path / "instrumentation.jsonl"
+    instrumentation = LoadInstrumentation(json_filename=json_filename)
+
+    expected_carts = _make_cart_loader(setup_dump).load_carts()
+    result_carts = _make_cart_loader(setup_dump, instrumentation).load_carts()
+
+    assert result_carts == expected_carts
+    # The raw rows are filtered as they are read, so the later group and macro filters have nothing left to remove. 
+    # 20 of the 60 rows are in GROUP0, and 6 of the others are macros.
+    assert _stage_rows(instrumentation) == {
+        "repair_records": (None, 61),
+        "csv_rows": (None, 61),
+        "read_rows": (None, 61),
+        "row_dicts": (None, 60),
+        "raw_row_filters": (60, 34),
+        "validate_carts": (None, 34),
+        "excluded_groups": (34, 34),
+        "macros": (34, 34),
+        "extra_cuts": (34, 17),
+    }
+    assert instrumentation.row_filter_counts == {
+        "rows_read": 60, "excluded_group_rows": 20, "macro_rows": 6, "rows_kept": 34
+    }
+    assert all(stage_metrics.peak_mib > 0 for stage_metrics in instrumentation.stages.values())
+    assert sum(stage_metrics.seconds for stage_metrics in instrumentation.stages.values()) <= \
+        instrumentation.total_seconds
+    assert not tracemalloc.is_tracing()
+
+    summary = json.loads(json_filename.read_text())
+    assert summary == instrumentation.summary()
+    assert summary["load"] == f"LoadCartDataDump.load_carts {setup_dump}"
+    assert summary["stages"][-1]["rows_dropped"] == 17
+    assert f"Load instrumentation: {json.dumps(summary)}" in caplog.text
+
+
+@pytest.mark.parametrize("load_method", ["load_carts", "load_cart_table"])
+def test_trusted_loads_instrumented(setup_dump, load_method):
+    instrumentation = LoadInstrumentation(trace_memory=False)
+
+    result = getattr(_make_cart_loader(setup_dump, instrumentation, trusted_dump=True), load_method)()
+
+    stage_rows = _stage_rows(instrumentation)
+    assert stage_rows["build_records"] == (None, 34)
+    if load_method == "load_cart_table":
+        assert stage_rows["build_cart_table"] == (None, 34)
+        assert stage_rows["filter_cart_table"] == (None, 17)
+    assert len(result) == 17
+    assert all(stage_metrics.peak_mib is None for stage_metrics in instrumentation.stages.values())
+    assert instrumentation.peak_mib is None
+
+
+def test_memory_mapped_load_instrumented(setup_dump):
+    instrumentation = LoadInstrumentation(trace_memory=False)
+
+    result_carts = _make_cart_loader(setup_dump, instrumentation, memory_map=True).load_carts()
+
+    stage_rows = _stage_rows(instrumentation)
+    assert stage_rows["scan_rows"] == (None, 61)
+    assert stage_rows["read_rows"] == (None, 61)
+    assert "repair_records" not in stage_rows
+    assert len(result_carts) == 17
+
+
+@pytest.mark.parametrize("trusted_dump", [False, True], ids=["validated", "trusted"])
+def test_parallel_load_records_each_chunk(setup_dump, monkeypatch, trusted_dump):
+    # So that the small test dump is large enough to be split.
+    monkeypatch.setattr(LoadCartDataDumpModule, "_MINIMUM_CHUNK_SIZE", 1)
+    instrumentation = LoadInstrumentation(trace_memory=False)
+
+    result_carts = _make_cart_loader(
+        setup_dump, instrumentation, parse_workers=2, trusted_dump=trusted_dump
+    ).load_carts()
+
+    chunk_stages = [
+        stage_metrics for stage_name, stage_metrics in instrumentation.stages.items() 
+        if stage_name.startswith("parse_chunk_")
+    ]
+    assert [stage_metrics.stage for stage_metrics in chunk_stages] == ["parse_chunk_1", "parse_chunk_2"]
+    assert all(stage_metrics.seconds > 0 for stage_metrics in chunk_stages)
+    # The chunks keep every cut of the carts that pass the raw row filters, the extra cuts are removed afterwards.
+    assert sum(stage_metrics.rows_out for stage_metrics in chunk_stages) == 34
+    assert len(result_carts) == 17
+
+
+def test_record_adds_to_the_stage():
+    instrumentation = LoadInstrumentation(trace_memory=False)
+    instrumentation.start("test")
+
+    instrumentation.record("worker", 0.5, 10)
+    instrumentation.record("worker", 0.25, 5)
+    instrumentation.finish()
+
+    assert instrumentation.stages["worker"] == StageMetrics(stage="worker", seconds=0.75, rows_out=15)
+
+
+def test_each_load_starts_a_new_summary(setup_dump, tmp_path):
+    json_filename = tmp_path / "instrumentation.jsonl"
+    instrumentation = LoadInstrumentation(json_filename=json_filename, trace_memory=False)
+    cart_loader = _make_cart_loader(setup_dump, instrumentation)
+
+    cart_loader.load_carts()
+    first_stage_rows = _stage_rows(instrumentation)
+    cart_loader.load_carts()
+
+    assert _stage_rows(instrumentation) == first_stage_rows
+    summaries = [json.loads(line) for line in json_filename.read_text().splitlines()]
+    assert len(summaries) == 2
+    assert summaries[0]["stages"][-1]["rows_out"] == summaries[1]["stages"][-1]["rows_out"] == 17
+
+
+def test_iter_carts_stopped_early_is_still_summarized(setup_dump):
+    instrumentation = LoadInstrumentation(trace_memory=False)
+
+    rivendell_carts = _make_cart_loader(setup_dump, instrumentation).iter_carts()
+    first_carts = [next(rivendell_carts) for _ in range(3)]
+    rivendell_carts.close()
+
+    assert len(first_carts) == 3
+    assert instrumentation.description.startswith("LoadCartDataDump.iter_carts")
+    assert instrumentation.stages["extra_cuts"].rows_out == 3
+    assert instrumentation.total_seconds > 0
+
+
+def test_stream_charges_each_stage_only_its_own_time():
+    instrumentation = LoadInstrumentation(trace_memory=False)
+
+    def slow_rows():
+        for row in range(5):
+            time.sleep(0.02)
+            yield row
+
+    instrumentation.start("test")
+    rows = instrumentation.stream("slow", slow_rows())
+    rows = instrumentation.stream_filter("even", lambda rows_in: (row for row in rows_in if row % 2 == 0), rows)
+    assert list(rows) == [0, 2, 4]
+    instrumentation.finish()
+
+    assert instrumentation.stages["slow"].seconds >= 0.1
+    assert instrumentation.stages["even"].seconds < 0.05
+    assert instrumentation.stages["even"].rows_dropped == 2
+    assert instrumentation.stages["slow"].rows_dropped is None
+
+
+def test_measure_counts_the_result():
+    instrumentation = LoadInstrumentation(trace_memory=False)
+
+    instrumentation.start("test")
+    result = instrumentation.measure("sort", sorted, [3, 1, 2])
+    instrumentation.measure("nothing", lambda: None)
+    instrumentation.finish()
+
+    assert result == [1, 2, 3]
+    assert instrumentation.stages["sort"] == StageMetrics(
+        stage="sort", seconds=instrumentation.stages["sort"].seconds, rows_out=3
+    )
+    assert instrumentation.stages["nothing"].rows_out == 0
+
+
+def test_cli_instrumentation_file(setup_dump, tmp_path, monkeypatch):
+    # So that the instrumentation set up by the command group does not outlive the test.
+    monkeypatch.setattr(cli, "_load_instrumentation", None)
+    json_filename = tmp_path / "instrumentation.jsonl"
+    desired_fields_filename = tmp_path / "desired.txt"
+    desired_fields_filename.write_text("Cart_Number\nTitle\n")
+
+    result = CliRunner().invoke(
+        cli.wmul_rivendell_cli,
+        ["--instrumentation_file", str(json_filename), "filter-cart-report", str(setup_dump), 
+         str(tmp_path / "output.csv"), str(desired_fields_filename)]
+    )
+
+    assert result.exit_code == 0, result.output
+    summary = json.loads(json_filename.read_text())
+    assert summary["load"] == f"LoadCartDataDump.load_carts {setup_dump}"
+    assert summary["stages"][-1]["stage"] == "extra_cuts"
+
+
+def test_cli_instrumentation_is_reset_by_each_call(setup_dump, tmp_path, monkeypatch):
+    monkeypatch.setattr(cli, "_load_instrumentation", None)
+    json_filename = tmp_path / "instrumentation.jsonl"
+    desired_fields_filename = tmp_path / "desired.txt"
+    desired_fields_filename.write_text("Cart_Number\nTitle\n")
+    command = ["filter-cart-report", str(setup_dump), str(tmp_path / "output.csv"), str(desired_fields_filename)]
+
+    first_result = CliRunner().invoke(
+        cli.wmul_rivendell_cli, ["--instrumentation_file", str(json_filename)] + command
+    )
+    second_result = CliRunner().invoke(cli.wmul_rivendell_cli, command)
+
+    assert first_result.exit_code == 0, first_result.output
+    assert second_result.exit_code == 0, second_result.output
+    assert cli._load_instrumentation is None
+    assert len(json_filename.read_text().splitlines()) == 1
@@ -0,0 +1,88 @@
+"""
+@Author = 'Michael Stanley'
+
+============ Change Log ============
+2026-Oct-18 = Created.
+
+============ License ============
+Copyright (C) 2026 Michael Stanley
+
+This file is part of wmul_rivendell.
+
+wmul_rivendell is free software: you can redistribute it and/or modify it
+under the terms of the GNU General Public License as published by the Free
+Software Foundation, either version 3 of the License, or (at your option) any
+later version.
+
+wmul_rivendell is distributed in the hope that it will be useful, but WITHOUT
+ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License along with
+wmul_rivendell. If not, see <https://www.gnu.org/licenses/>.
+"""
+import numpy as np
+import pytest
+
+from wmul_rivendell.SchedulerCodes import SchedulerCodeIndex, make_sched_codes_predicate, split_sched_codes
+
+
+@pytest.mark.parametrize("sched_codes, expected_codes", [
+    ("", []),
+    (None, []),
+    ("2000s", ["2000s"]),
+    ("2000s|Flashback", ["2000s", "Flashback"]),
+    ("Rock       Pop        .", ["Rock", "Pop"]),
+    ("Rock Pop Rock", ["Rock", "Pop"]),
+    (".", [])
+])
+def test_split_sched_codes(sched_codes, expected_codes):
+    assert split_sched_codes(sched_codes) == expected_codes
+
+
+@pytest.fixture(scope="function")
+def sched_codes():
+    return ["2000s|Flashback", "2000s", "", "Flashback|Slow", "2000s|Flashback", None, "2000s|Slow"]
+
+
+def test_from_sched_codes(sched_codes):
+    sched_code_index = SchedulerCodeIndex.from_sched_codes(sched_codes)
+
+    assert sched_code_index.codes == ["2000s", "Flashback", "Slow"]
+    assert sched_code_index.has_code.tolist() == [
+        [True, True, False],
+        [True, False, False],
+        [False, False, False],
+        [False, True, True],
+        [True, True, False],
+        [False, False, False],
+        [True, False, True]
+    ]
+    assert sched_code_index.code_counts() == {"2000s": 4, "Flashback": 3, "Slow": 2}
+
+
+def test_from_sched_codes_empty():
+    sched_code_index = SchedulerCodeIndex.from_sched_codes([])
+
+    assert len(sched_code_index) == 0
+    assert sched_code_index.select(required_codes=["2000s"]).tolist() == []
+
+
+@pytest.mark.parametrize("required_codes, excluded_codes, expected_selected", [
+    ((), (), [True] * 7),
+    (["2000s"], (), [True, True, False, False, True, False, True]),
+    (["2000s", "Flashback"], (), [True, False, False, False, True, False, False]),
+    (["2000s"], ["Flashback"], [False, True, False, False, False, False, True]),
+    ((), ["Slow", "Flashback"], [False, True, True, False, False, True, False]),
+    (["NOT_A_CODE"], (), [False] * 7),
+    ((), ["NOT_A_CODE"], [True] * 7)
+])
+def test_select_matches_predicate(sched_codes, required_codes, excluded_codes, expected_selected):
+    sched_code_index = SchedulerCodeIndex.from_sched_codes(sched_codes)
+    has_sched_codes = make_sched_codes_predicate(required_codes=required_codes, excluded_codes=excluded_codes)
+
+    selected = sched_code_index.select(required_codes=required_codes, excluded_codes=excluded_codes)
+
+    assert selected.dtype == np.bool_
+    assert selected.tolist() == expected_selected
+    assert [has_sched_codes(value) for value in sched_codes] == expected_selected
@@ -0,0 +1,169 @@
+"""
+@Author = 'Michael Stanley'
+
+============ Change Log ============
+2026-Oct-18 = Created.
+
+============ License ============
+Copyright (C) 2026 Michael Stanley
+
+This file is part of wmul_rivendell.
+
+wmul_rivendell is free software: you can redistribute it and/or modify it
+under the terms of the GNU General Public License as published by the Free
+Software Foundation, either version 3 of the License, or (at your option) any
+later version.
+
+wmul_rivendell is distributed in the hope that it will be useful, but WITHOUT
+ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+FOR A PARTICULAR PURPOSE. See the GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License along with
+wmul_rivendell. If not, see <https://www.gnu.org/licenses/>.
+"""
+import json
+import logging
+import numpy as np
+import pytest
+
+from wmul_rivendell.DatabaseStatistics import DatabaseStatistics, LengthHistograms, StatisticsLimits
+from wmul_rivendell.StatisticsCache import CACHE_FORMAT_VERSION, StatisticsCache, group_key
+
+
+def _group_lengths():
+    randomizer = np.random.default_rng(0)
+    return {
+        f"GROUP{group_number}": np.maximum(0, randomizer.normal(220, 60, 50 + 10 * group_number)).astype(np.int64)
+        for group_number in range(6)
+    }
+
+
+def _run(organized_lengths, statistics_cache, stats_limits=None):
+    database_statistics = DatabaseStatistics(
+        rivendell_carts=[], output_filename=None, stats_limits=stats_limits or StatisticsLimits(), write_limits=False,
+        write_full_statistics=True, statistics_cache=statistics_cache
+    )
+    return database_statistics._calculate_statistics_per_group(organized_carts=organized_lengths)
+
+
+def _as_values(statistics_per_group):
+    return {group_name: vars(group_statistics) for group_name, group_statistics in statistics_per_group.items()}
+
+
+def test_group_key():
+    lengths, counts = np.array([120, 184, 250]), np.array([1, 3, 2])
+    key = group_key(lengths, counts, StatisticsLimits())
+
+    assert key == group_key(lengths.astype(np.int32), counts, StatisticsLimits())
+    assert key != group_key(lengths, np.array([1, 3, 3]), StatisticsLimits())
+    assert key != group_key(np.array([120, 184, 251]), counts, StatisticsLimits())
+    assert key != group_key(lengths, counts, StatisticsLimits(upper_bound_multiple=2.5))
+
+
+def test_load_and_store(tmp_path, caplog):
+    caplog.set_level(logging.INFO)
+    cache_filename = tmp_path / "statistics" / "cache.json"
+    first_cache = StatisticsCache(cache_filename=cache_filename)
+
+    assert first_cache.load(["a", "b"]) == {}
+    first_cache.store({"a": {"mean": 184}})
+
+    second_cache = StatisticsCache(cache_filename=cache_filename)
+    assert second_cache.load(["a", "b"]) == {"a": {"mean": 184}}
+    assert "Statistics cache: 0 hits, 2 misses." in caplog.text
+    assert "Statistics cache: 1 hits, 1 misses." in caplog.text
+
+
+def test_bypass(tmp_path, caplog):
+    caplog.set_level(logging.INFO)
+    cache_filename = tmp_path / "cache.json"
+    StatisticsCache(cache_filename=cache_filename).store({"a": {"mean": 184}})
+
+    bypassed_cache = StatisticsCache(cache_filename=cache_filename, bypass=True)
+    assert bypassed_cache.load(["a"]) == {}
+    bypassed_cache.store({"b": {"mean": 152}})
+
+    assert StatisticsCache(cache_filename=cache_filename).load(["a", "b"]) == {"a": {"mean": 184}, "b": {"mean": 152}}
+    assert "Statistics cache bypassed, calculating all 1 groups." in caplog.text
+
+
+def test_clear(tmp_path):
+    cache_filename = tmp_path / "cache.json"
+    StatisticsCache(cache_filename=cache_filename).store({"a": {"mean": 184}})
+
+    StatisticsCache(cache_filename=cache_filename).clear()
+
+    assert not cache_filename.exists()
+    assert StatisticsCache(cache_filename=cache_filename).load(["a"]) == {}
+
+
+def test_evicts_least_recently_used(tmp_path):
+    cache_filename = tmp_path / "cache.json"
+    StatisticsCache(cache_filename=cache_filename).store({"a": {"mean": 1}, "b": {"mean": 2}})
+    statistics_cache = StatisticsCache(cache_filename=cache_filename, max_entries=2)
+    statistics_cache.load(["b"])
+    statistics_cache.store({"c": {"mean": 3}})
+
+    assert StatisticsCache(cache_filename=cache_filename).load(["a", "b", "c"]) == {"b": {"mean": 2}, "c": {"mean": 3}}
+
+
+@pytest.mark.parametrize("contents", ["not json", json.dumps({"format_version": CACHE_FORMAT_VERSION + 1, 
+                                                              "entries": {"a": {"last_used": 0, "statistics": {}}}})],
+                         ids=["unreadable", "other_version"])
+def test_unusable_cache_file(tmp_path, contents):
+    cache_filename = tmp_path / "cache.json"
+    cache_filename.write_text(contents)
+    statistics_cache = StatisticsCache(cache_filename=cache_filename)
+
+    assert statistics_cache.load(["a"]) == {}
+    statistics_cache.store({"b": {"mean": 2}})
+    assert StatisticsCache(cache_filename=cache_filename).load(["a", "b"]) == {"b": {"mean": 2}}
+
+
+def test_database_statistics_only_calculates_changed_groups(tmp_path, mocker, caplog):
+    caplog.set_level(logging.INFO)
+    cache_filename = tmp_path / "cache.json"
+    organized_lengths = _group_lengths()
+    expected = _as_values(_run(organized_lengths, statistics_cache=None))
+
+    first_run = _as_values(_run(organized_lengths, StatisticsCache(cache_filename=cache_filename)))
+    calculate_spy = mocker.spy(DatabaseStatistics, "_calculate_statistics")
+    second_run = _as_values(_run(organized_lengths, StatisticsCache(cache_filename=cache_filename)))
+
+    assert first_run == expected
+    assert second_run == expected
+    assert list(second_run) == list(expected)
+    assert list(calculate_spy.call_args.args[1]) == []
+    assert "Statistics cache: 0 hits, 6 misses." in caplog.text
+    assert "Statistics cache: 6 hits, 0 misses." in caplog.text
+
+    organized_lengths["GROUP2"] = np.append(organized_lengths["GROUP2"], 3723)
+    # The same lengths in a different order are the same group.
+    organized_lengths["GROUP4"] = organized_lengths["GROUP4"][::-1]
+    third_run = _as_values(_run(organized_lengths, StatisticsCache(cache_filename=cache_filename)))
+
+    assert list(calculate_spy.call_args.args[1]) == ["GROUP2"]
+    assert third_run == _as_values(_run(organized_lengths, statistics_cache=None))
+    assert "Statistics cache: 5 hits, 1 misses." in caplog.text
+
+
+def test_database_statistics_cache_limits_and_histograms(tmp_path, caplog):
+    caplog.set_level(logging.INFO)
+    cache_filename = tmp_path / "cache.json"
+    organized_lengths = _group_lengths()
+    length_histograms = LengthHistograms()
+    for group_name, lengths in organized_lengths.items():
+        for length in lengths.tolist():
+            length_histograms.add(group_name, length)
+    other_limits = StatisticsLimits(smallest_stdev=5, lower_bound_multiple=1.0)
+
+    _run(organized_lengths, StatisticsCache(cache_filename=cache_filename))
+    from_histograms = _run(length_histograms, StatisticsCache(cache_filename=cache_filename))
+    with_other_limits = _run(organized_lengths, StatisticsCache(cache_filename=cache_filename), other_limits)
+
+    assert _as_values(from_histograms) == _as_values(_run(organized_lengths, statistics_cache=None))
+    assert _as_values(with_other_limits) == _as_values(_run(organized_lengths, None, other_limits))
+    assert len(json.loads(cache_filename.read_text())["entries"]) == 12
+    # The histograms are the same groups as the lengths, with the same keys.
+    assert caplog.text.count("Statistics cache: 6 hits, 0 misses.") == 1
+    assert caplog.text.count("Statistics cache: 0 hits, 6 misses.") == 2